@@ -0,0 +1,17 @@
+import io, contextlib
+from common import generate_loop_program, silence_shoot, timed
+from ludus.ast import check
+
+if __name__ == "__main__":
+    silence_shoot()
+    text = generate_loop_program(200)
+    for backend in ("tree", "closure"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = check("<bench>", text, True, backend=backend)
+        assert result == "Code Gen successful!", result
+    tree = timed(lambda: check("<bench>", text, True, backend="tree"), repeat=1)
+    closure = timed(lambda: check("<bench>", text, True, backend="closure"), repeat=1)
+    print(f"iterations       : {200 * 200}")
+    print(f"tree-walker      : {tree * 1000:.1f} ms")
+    print(f"closure backend  : {closure * 1000:.1f} ms")
+    print(f"speedup          : {tree / closure:.2f}x")
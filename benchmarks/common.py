@@ -0,0 +1,106 @@
+import os, sys, io, time, contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+def generate_program(lines=5000):
+    # straight-line play() body, roughly one statement per source line
+    body = []
+    for i in range(lines // 4):
+        body.append(f"    a{i}: {i} + 2 * 3")
+        body.append(f"    a{i} += {i % 7} - 1")
+        body.append(f"    total += a{i} * 2")
+        body.append(f"    f{i}: a{i} > total")
+    return "total: 0\n\nplay() {\n" + "\n".join(body) + "\n}\n\ngameOver"
+
+def generate_loop_program(n=200):
+    # nested loops over arithmetic, comparisons, array reads and a format string
+    return f"""total: 0
+
+play() {{
+    arr[]: [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    hp i, j
+    for i: 0, i < {n}, i += 1 {{
+        for j: 0, j < {n}, j += 1 {{
+            total += (i * j + arr[j % 10]) % 7
+            if total > 1000 && j != i {{
+                total -= 1000
+            }}
+        }}
+    }}
+    shoot("total: {{total}}")
+}}
+
+gameOver"""
+
+def generate_nested_loop_program(n=200, live=0):
+    # nested loops writing into arrays, with block-local declarations and an
+    # if entered on every inner iteration; `live` extra play() locals
+    locals_ = "".join(f"    v{i}: {i}\n" for i in range(live))
+    return f"""total: 0
+
+play() {{
+{locals_}    row[]: [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    grid[2][5]: [0, 0, 0, 0, 0], [0, 0, 0, 0, 0]
+    hp i, j
+    for i: 0, i < {n}, i += 1 {{
+        base: i % 5
+        for j: 0, j < {n}, j += 1 {{
+            row[j % 10] += j
+            if j % 2 == 0 {{
+                cell: base + j
+                grid[j % 2][base]: cell % 11
+            }}
+        }}
+    }}
+    total: row[3] + grid[0][2]
+    shoot("total: {{total}}")
+}}
+
+gameOver"""
+
+def generate_recursion_program(n=15, live=0):
+    # recursive fib() and fact() with `live` extra globals and play() locals
+    # that a call has no reason to touch
+    globals_ = "".join(f"g{i}: {i}\n" for i in range(live))
+    locals_ = "".join(f"    v{i}: {i}\n" for i in range(live))
+    return f"""{globals_}total: 0
+generate fib(n)
+generate fact(n)
+
+play() {{
+{locals_}    total: fib({n}) + fact(10)
+    shoot("total: {{total}}")
+}}
+
+generate fib(n) {{
+    if n < 2 {{
+        recall n
+    }}
+    recall fib(n - 1) + fib(n - 2)
+}}
+
+generate fact(n) {{
+    if n <= 1 {{
+        recall 1
+    }}
+    recall n * fact(n - 1)
+}}
+
+gameOver"""
+
+def silence_shoot():
+    # shoot() normally goes to the eel frontend
+    from ludus.runtime import traverser
+    traverser.print_shoot = lambda element: None
+
+def timed(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
@@ -0,0 +1,18 @@
+import os, io, tempfile, contextlib
+from common import generate_program, generate_loop_program, timed
+from ludus.compile_cache import CompileCache
+from ludus.pipeline import Compilation
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        cache = CompileCache(directory)
+        for name, text in (("straight-line, 2000 lines", generate_program(2000)), ("nested loops", generate_loop_program())):
+            cold = timed(lambda: Compilation("<bench>", text).front_end())
+            with contextlib.redirect_stdout(io.StringIO()):
+                Compilation("<bench>", text, cache=cache).front_end()
+            warm = timed(lambda: Compilation("<bench>", text, cache=cache).front_end())
+            size = os.path.getsize(cache.path(text))
+            print(f"{name}")
+            print(f"  front end                 : {cold * 1000:8.2f} ms")
+            print(f"  compile cache hit         : {warm * 1000:8.2f} ms  ({cold / warm:.1f}x)")
+            print(f"  entry size                : {size:8,} bytes  (source {len(text.encode('utf-8')):,} bytes)")
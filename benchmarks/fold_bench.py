@@ -0,0 +1,44 @@
+import io, contextlib
+from common import generate_loop_program, silence_shoot, timed
+from ludus import ast
+from ludus.fold import fold
+from ludus.pipeline import Compilation
+
+def generate_constant_program(n=200):
+    # nested loops whose expressions are mostly written-out constants
+    return f"""total: 0
+hp i, j
+
+play() {{
+    for i: 0, i < {n}, i += 1 {{
+        for j: 0, j < {n}, j += 1 {{
+            total += (j * (60 * 60) + 24 * 7 - 2 ^ 3) % (1000 + 7)
+            if 1 < 2 && !(!(total > 10 * 100 * 1000)) {{
+                total -= 100 * 1000 * 10
+            }} elif 2 > 3 {{
+                total += 1
+            }}
+            msg: "{{10 / 4}} of " + "the " + "total"
+        }}
+    }}
+    shoot("total: {{total}}")
+}}
+
+gameOver"""
+
+if __name__ == "__main__":
+    silence_shoot()
+    programs = (
+        ("constant expressions, 120x120", generate_constant_program(120)),
+        ("nested loops, 120x120", generate_loop_program(120)),
+    )
+    for name, text in programs:
+        with contextlib.redirect_stdout(io.StringIO()):
+            program, _ = Compilation("<bench>", text).front_end()
+        removed = fold(program)
+        print(f"{name}  ({removed} nodes folded away)")
+        for backend in ("tree", "closure", "vm"):
+            plain = timed(lambda: ast.check("<bench>", text, True, backend=backend, optimize=False))
+            folded = timed(lambda: ast.check("<bench>", text, True, backend=backend))
+            print(f"  {backend:7} run, unfolded : {plain * 1000:8.2f} ms")
+            print(f"  {backend:7} run, folded   : {folded * 1000:8.2f} ms  ({plain / folded:.2f}x)")
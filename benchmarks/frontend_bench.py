@@ -0,0 +1,33 @@
+from common import generate_program, timed
+from ludus.lexer import Lexer
+from ludus.parser import parse
+from ludus.ast import Semantic
+from ludus.pipeline import Compilation
+
+def legacy_front_end(text):
+    # the pre-pipeline check(): lex, re-lex inside parse(), then build the AST
+    tokens, _ = Lexer("<bench>", text).make_tokens()
+    parse("<bench>", text)
+    Semantic(tokens).produce_ast()
+
+def long_line_program(reads=600):
+    # one statement summing array reads; each read looks ahead for a
+    # drop/seek before the end of the line
+    return ("play() {\n    a[]: [1, 2, 3]\n    total: "
+            + " + ".join(f"a[{i % 3}]" for i in range(reads)) + "\n}\n\ngameOver")
+
+def pipeline_front_end(text):
+    Compilation("<bench>", text).front_end()
+
+if __name__ == "__main__":
+    text = generate_program(5000)
+    legacy = timed(lambda: legacy_front_end(text))
+    single = timed(lambda: pipeline_front_end(text))
+    print(f"lines: {text.count(chr(10)) + 1}")
+    print(f"legacy check front end : {legacy * 1000:.1f} ms")
+    print(f"single-lex pipeline    : {single * 1000:.1f} ms")
+    print(f"speedup                : {legacy / single:.2f}x")
+
+    text = long_line_program()
+    tokens, _ = Lexer("<bench>", text).make_tokens()
+    print(f"AST, 600 reads on one line  : {timed(lambda: Semantic(tokens).produce_ast()) * 1000:.1f} ms")
@@ -0,0 +1,32 @@
+import random, time
+from common import generate_program, timed
+from ludus.incremental import Document
+from ludus.parser import parse
+
+def keystrokes(text, count=200, seed=1):
+    # type a digit next to a random one, in a literal or a name, and delete it again
+    random.seed(seed)
+    digits = [i for i, char in enumerate(text) if char.isdigit()]
+    for _ in range(count):
+        i = random.choice(digits)
+        typed = text[:i] + "7" + text[i:]
+        yield typed
+        yield text
+
+if __name__ == "__main__":
+    text = generate_program(20000)
+    full = timed(lambda: parse("<bench>", text), repeat=1)
+    document = Document("<bench>", text)
+    document.syntax_report()
+    times = []
+    for edited in keystrokes(text):
+        start = time.perf_counter()
+        document.update(edited)
+        report = document.syntax_report()
+        times.append(time.perf_counter() - start)
+    assert report == parse("<bench>", text)
+    times.sort()
+    print(f"lines: {text.count(chr(10)) + 1}")
+    print(f"full lex + LL(1) check     : {full * 1000:.1f} ms")
+    print(f"incremental, median edit   : {times[len(times) // 2] * 1000:.2f} ms")
+    print(f"incremental, 95th pct edit : {times[int(len(times) * 0.95)] * 1000:.2f} ms")
@@ -0,0 +1,33 @@
+import glob, os, tracemalloc
+from common import ROOT, generate_program, timed
+from ludus.lexer import make_lexer, LEXER_MODES
+
+def test_script_corpus(copies=20):
+    # every sample program, repeated, as one large source
+    texts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "Ludus test scripts", "**", "*.lds"), recursive=True)):
+        with open(path, encoding="utf-8", errors="replace") as file:
+            texts.append(file.read())
+    return "\n".join(texts * copies)
+
+def lex(text, mode):
+    return make_lexer("<bench>", text, mode).make_tokens()
+
+def allocated(fn):
+    # bytes still held by the result of fn()
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+if __name__ == "__main__":
+    for name, text in (("generated", generate_program(20000)), ("test scripts", test_script_corpus())):
+        tokens, _ = lex(text, "nested")
+        print(f"{name}: {len(text):,} chars, {len(tokens):,} tokens")
+        for mode in LEXER_MODES:
+            elapsed = timed(lambda: lex(text, mode))
+            print(f"  {mode:<8}: {elapsed * 1000:8.1f} ms  {len(tokens) / elapsed:12,.0f} tokens/sec")
+        store, store_size = allocated(lambda: lex(text, LEXER_MODES[0])[0])
+        _, objects_size = allocated(lambda: list(store))
+        print(f"  token store {store_size / 1e6:.1f} MB, as Token objects {objects_size / 1e6:.1f} MB")
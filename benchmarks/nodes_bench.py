@@ -0,0 +1,52 @@
+import gc, io, sys, contextlib, tracemalloc
+from common import generate_program, timed
+from ludus.pipeline import Compilation
+from ludus.runtime.closures import iter_nodes
+from ludus.typecheck import TypeChecker
+
+class Plain:
+    # what a node cost as a plain __dict__ object with list positions
+    pass
+
+def as_plain(node):
+    plain = Plain()
+    plain.kind = node.kind
+    for name, value in zip(node.fields, node.field_values()):
+        setattr(plain, name, list(value) if isinstance(value, tuple) else value)
+    return plain
+
+def plain_size(plain):
+    size = sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)
+    return size + sum(sys.getsizeof(value) for value in plain.__dict__.values() if isinstance(value, list) and len(value) == 2)
+
+def node_size(node):
+    size = sys.getsizeof(node)
+    return size + sum(sys.getsizeof(value) for value in node.field_values() if isinstance(value, tuple))
+
+class GetattrChecker(TypeChecker):
+    # the type checker dispatching with a name lookup per visit, as before
+    def visit(self, node):
+        return getattr(self, f"visit_{node.kind}", self.generic_visit)(node)
+
+if __name__ == "__main__":
+    text = generate_program(20000)
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        program, _ = Compilation("<bench>", text).front_end()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    nodes = list(iter_nodes(program))
+    gc.collect()
+    walk = timed(lambda: sum(1 for _ in iter_nodes(program)))
+    lookup = timed(lambda: GetattrChecker().check(program))
+    table = timed(lambda: TypeChecker().check(program))
+
+    slotted = sum(node_size(node) for node in nodes)
+    plain = sum(plain_size(as_plain(node)) for node in nodes)
+    print(f"straight-line, 20000 lines: {len(nodes):,} nodes")
+    print(f"  front end peak memory     : {peak / 2**20:8.2f} MB")
+    print(f"  nodes with __slots__      : {slotted / 2**20:8.2f} MB  ({slotted / len(nodes):.0f} bytes/node)")
+    print(f"  same nodes with __dict__  : {plain / 2**20:8.2f} MB  ({plain / len(nodes):.0f} bytes/node)")
+    print(f"  walk every node           : {walk * 1000:8.2f} ms")
+    print(f"  type check, getattr       : {lookup * 1000:8.2f} ms")
+    print(f"  type check, dispatch table: {table * 1000:8.2f} ms  ({lookup / table:.2f}x)")
@@ -0,0 +1,30 @@
+import os, subprocess, sys
+from common import ROOT, generate_program, timed
+from ludus.cfg import cfg
+from ludus.tablegen import build_tables
+from ludus.lexer import make_lexer
+from ludus.parser import Parser
+
+IMPORT = "import time; start = time.perf_counter(); import ludus.parser; print(time.perf_counter() - start)"
+
+def import_time(runs=5):
+    # best fresh-interpreter import of the parser, precompiled tables
+    # included; bytecode is written so later runs load ll1_table.py cached
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", IMPORT], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        times.append(float(result.stdout))
+    return min(times)
+
+if __name__ == "__main__":
+    print(f"import ludus.parser          : {import_time() * 1000:8.1f} ms")
+    print(f"build tables from cfg        : {timed(lambda: build_tables(cfg)) * 1000:8.1f} ms")
+
+    text = generate_program(20000)
+    tokens, _ = make_lexer("<bench>", text).make_tokens()
+    print(f"LL(1) check, {len(tokens):,} tokens")
+    for label, check in (("table-driven", Parser.drive), ("generated validator", Parser.validate)):
+        elapsed = timed(lambda: check(Parser(tokens, text)))
+        print(f"  {label:26} : {elapsed * 1000:8.1f} ms  {len(tokens) / elapsed:12,.0f} tokens/sec")
@@ -0,0 +1,32 @@
+import io, contextlib
+from common import generate_recursion_program, silence_shoot, timed
+from ludus.ast import check
+
+N = 15
+BASE_N = 5
+LIVE = (0, 100, 400)
+
+def fib_calls(n):
+    a, b = 1, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return 2 * a - 1
+
+def run_time(backend, n, live):
+    text = generate_recursion_program(n, live)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = check("<bench>", text, True, backend=backend)
+    assert result == "Code Gen successful!", result
+    return timed(lambda: check("<bench>", text, True, backend=backend), repeat=1)
+
+if __name__ == "__main__":
+    silence_shoot()
+    # compile time is taken out by subtracting a run with a smaller fib();
+    # with call frames the cost of a call should not grow with the number of
+    # variables alive in the caller
+    calls = fib_calls(N) - fib_calls(BASE_N)
+    print(f"fib({N}) calls    : {fib_calls(N)}")
+    for backend in ("tree", "closure", "vm"):
+        for live in LIVE:
+            elapsed = run_time(backend, N, live) - run_time(backend, BASE_N, live)
+            print(f"{backend:<8} live={live:<4}: {elapsed * 1000:8.1f} ms  {elapsed / calls * 1e6:7.1f} us/call")
@@ -0,0 +1,20 @@
+import io, contextlib
+from common import generate_nested_loop_program, silence_shoot, timed
+from ludus.ast import check
+
+N = 200
+LIVE = (0, 200)
+
+if __name__ == "__main__":
+    silence_shoot()
+    # every inner iteration enters and leaves the if block; entering a block
+    # should cost the same however many variables are alive around it
+    print(f"iterations       : {N * N}")
+    for backend in ("tree", "closure", "vm"):
+        for live in LIVE:
+            text = generate_nested_loop_program(N, live)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = check("<bench>", text, True, backend=backend)
+            assert result == "Code Gen successful!", result
+            elapsed = timed(lambda: check("<bench>", text, True, backend=backend), repeat=1)
+            print(f"{backend:<8} live={live:<4}: {elapsed * 1000:8.1f} ms  {elapsed / (N * N) * 1e6:6.2f} us/iteration")
@@ -0,0 +1,31 @@
+import io, contextlib
+from common import generate_loop_program, generate_nested_loop_program, generate_recursion_program, silence_shoot, timed
+from ludus import ast
+from ludus.pipeline import Compilation
+from ludus.runtime.closures import iter_nodes
+from ludus.typecheck import annotate
+
+def tagged(text):
+    # (binary expressions with proven operand types, all binary expressions)
+    with contextlib.redirect_stdout(io.StringIO()):
+        program, _ = Compilation("<bench>", text).front_end()
+    annotate(program)
+    binaries = [node for node in iter_nodes(program) if node.kind == 'BinaryExpr']
+    return sum(1 for node in binaries if node.operands), len(binaries)
+
+if __name__ == "__main__":
+    silence_shoot()
+    programs = (
+        ("nested loops, 150x150", generate_loop_program(150)),
+        ("array loops, 150x150", generate_nested_loop_program(150)),
+        ("fib(18) + fact(10)", generate_recursion_program(18)),
+    )
+    for name, text in programs:
+        proven, total = tagged(text)
+        print(f"{name}  ({proven} of {total} binary expressions specialized)")
+        for backend in ("closure", "vm"):
+            # none of these have anything to fold, optimize=False only drops the tags
+            generic = timed(lambda: ast.check("<bench>", text, True, backend=backend, optimize=False))
+            fast = timed(lambda: ast.check("<bench>", text, True, backend=backend))
+            print(f"  {backend:7} generic binary_op : {generic * 1000:8.2f} ms")
+            print(f"  {backend:7} specialized       : {fast * 1000:8.2f} ms  ({generic / fast:.2f}x)")
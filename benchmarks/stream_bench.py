@@ -0,0 +1,31 @@
+import os, tempfile, tracemalloc
+from common import generate_program, timed
+from ludus.parser import parse, parse_stream
+
+def parse_file(path):
+    with open(path, encoding="utf-8") as file:
+        return parse(path, file.read())
+
+def stream_file(path):
+    with open(path, encoding="utf-8") as file:
+        return parse_stream(path, file)
+
+def peak(fn):
+    # highest traced allocation while fn() runs
+    tracemalloc.start()
+    result = fn()
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, size
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "big.lds")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(generate_program(100000))
+        print(f"source: {os.path.getsize(path) / 1e6:.1f} MB")
+        for name, fn in (("parse        ", parse_file), ("parse_stream ", stream_file)):
+            elapsed = timed(lambda: fn(path), repeat=1)
+            result, size = peak(lambda: fn(path))
+            assert result == "No lexical errors found!\nValid syntax."
+            print(f"  {name}: {elapsed * 1000:8.1f} ms   peak {size / 1e6:6.1f} MB")
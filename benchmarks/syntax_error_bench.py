@@ -0,0 +1,60 @@
+import random, time
+from common import generate_program, timed
+from ludus import parser
+from ludus.incremental import Document
+from ludus.lexer import make_lexer
+
+def break_lines(text, count, seed=1):
+    # drop the ':' of `count` declarations spread over the program
+    random.seed(seed)
+    lines = text.split("\n")
+    targets = sorted(random.sample([i for i, line in enumerate(lines) if ": " in line and "play" not in line], count))
+    for i in targets:
+        lines[i] = lines[i].replace(": ", " ", 1)
+    return lines, targets
+
+if __name__ == "__main__":
+    text = generate_program(4000)
+    lines, targets = break_lines(text, 20)
+    broken = "\n".join(lines)
+    tokens, _ = make_lexer("<bench>", broken).make_tokens()
+
+    # the expected-token list of an error, built from FIRST sets or found
+    # in parser.EXPECTED
+    check = parser.Parser(tokens, broken)
+    check.drive()
+    def expected(cold, count=1000):
+        for _ in range(count):
+            if cold:
+                parser.EXPECTED.clear()
+            check.expected_tokens(check.top, check.stack)
+    print(f"expected tokens, computed           : {timed(lambda: expected(True)) * 1000:8.2f} us")
+    print(f"expected tokens, cached             : {timed(lambda: expected(False)) * 1000:8.2f} us")
+
+    # fixing the errors one at a time, re-checking after each fix, against
+    # one pass that reports them all
+    def one_by_one():
+        fixed = list(lines)
+        original = text.split("\n")
+        for i in targets:
+            parser.parse("<bench>", "\n".join(fixed))
+            fixed[i] = original[i]
+    recovered = parser.parse("<bench>", broken, recover=True)
+    print(f"{len(targets)} errors, one check per fix        : {timed(one_by_one, repeat=1) * 1000:8.2f} ms")
+    print(f"{recovered.count('Syntax Error:')} errors, one recovering check     : {timed(lambda: parser.parse('<bench>', broken, recover=True)) * 1000:8.2f} ms")
+
+    # the editor's syntax tab while the program is broken
+    document = Document("<bench>", broken)
+    document.syntax_report()
+    times = []
+    random.seed(2)
+    digits = [i for i, char in enumerate(broken) if char.isdigit()]
+    for _ in range(200):
+        i = random.choice(digits)
+        for edited in (broken[:i] + "7" + broken[i:], broken):
+            start = time.perf_counter()
+            document.update(edited)
+            document.syntax_report()
+            times.append(time.perf_counter() - start)
+    times.sort()
+    print(f"editor, median edit with errors     : {times[len(times) // 2] * 1000:8.2f} ms")
@@ -0,0 +1,26 @@
+from collections import Counter
+from common import generate_nested_loop_program, generate_recursion_program, silence_shoot, timed
+from ludus import ast
+from ludus.runtime import trace
+
+if __name__ == "__main__":
+    silence_shoot()
+    programs = (
+        ("array loops, 100x100", generate_nested_loop_program(100)),
+        ("fib(16) + fact(10)", generate_recursion_program(16)),
+    )
+    for name, text in programs:
+        trace.enable()
+        trace.clear()
+        ast.check("<bench>", text, True, backend="tree")
+        counts = Counter(category for category, _ in trace.records())
+        trace.disable()
+        print(f"{name}  ({', '.join(f'{category} {count}' for category, count in counts.most_common())} records kept)")
+        for backend in ("tree", "closure", "vm"):
+            off = timed(lambda: ast.check("<bench>", text, True, backend=backend))
+            trace.enable()
+            on = timed(lambda: ast.check("<bench>", text, True, backend=backend))
+            trace.disable()
+            trace.clear()
+            print(f"  {backend:7} tracing off : {off * 1000:8.2f} ms")
+            print(f"  {backend:7} tracing all : {on * 1000:8.2f} ms  ({on / off:.2f}x)")
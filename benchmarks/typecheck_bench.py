@@ -0,0 +1,25 @@
+import io, contextlib
+from common import generate_program, generate_loop_program, generate_recursion_program, silence_shoot, timed
+from ludus import ast
+from ludus.pipeline import Compilation
+from ludus.typecheck import TypeChecker
+
+if __name__ == "__main__":
+    silence_shoot()
+    programs = (
+        ("straight-line, 2000 lines", generate_program(2000)),
+        ("nested loops, 200x200", generate_loop_program(200)),
+        ("nested loops, 400x400", generate_loop_program(400)),
+        ("fib(20) + fact(10)", generate_recursion_program(20)),
+    )
+    for name, text in programs:
+        # the semantic tab's whole check, and the type checker on its own
+        old = timed(lambda: ast.check("<bench>", text, checker="exec"), repeat=1)
+        new = timed(lambda: ast.check("<bench>", text))
+        with contextlib.redirect_stdout(io.StringIO()):
+            program, _ = Compilation("<bench>", text).front_end()
+        alone = timed(lambda: TypeChecker().check(program))
+        print(f"{name}")
+        print(f"  check, executing analyzer : {old * 1000:8.2f} ms")
+        print(f"  check, type checker       : {new * 1000:8.2f} ms  ({old / new:.1f}x)")
+        print(f"  type checker alone        : {alone * 1000:8.2f} ms")
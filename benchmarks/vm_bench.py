@@ -0,0 +1,27 @@
+import io, contextlib
+from common import generate_loop_program, silence_shoot, timed
+from ludus.ast import check
+from ludus.runtime.vm import VM
+
+N = 150
+
+if __name__ == "__main__":
+    silence_shoot()
+    text = generate_loop_program(N)
+    for backend in ("tree", "closure", "vm"):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = check("<bench>", text, True, backend=backend)
+        assert result == "Code Gen successful!", result
+
+    times = {}
+    for backend in ("tree", "closure", "vm"):
+        VM.ops_executed = 0
+        times[backend] = timed(lambda: check("<bench>", text, True, backend=backend), repeat=1)
+    ops = VM.ops_executed
+
+    print(f"iterations       : {N * N}")
+    print(f"bytecode ops     : {ops}")
+    print(f"vm throughput    : {ops / times['vm']:,.0f} ops/sec")
+    for backend, elapsed in times.items():
+        print(f"{backend:<17}: {elapsed * 1000:.1f} ms")
+    print(f"vm vs tree       : {times['tree'] / times['vm']:.2f}x")
@@ -0,0 +1,156 @@
+import argparse, os, sys
+
+# Headless entry point:  python -m ludus run file.lds
+# Runs lexer, parser, semantic analysis and the runtime without the eel GUI.
+# shoot output goes to stdout, load/loadNum read lines from stdin and errors
+# go to stderr. --trace scopes,calls records those trace categories (see
+# ludus/runtime/trace.py) and writes them to stderr after the run.
+#
+#   python -m ludus grade folder/ --report report.json
+# runs every .lds file under a folder in parallel, see ludus/batch.py.
+#
+#   python -m ludus check file.lds
+# lexes and syntax-checks a file a block of lines at a time, for sources too
+# large to load whole.
+
+EXIT_OK = 0
+EXIT_ERROR = 1      # lexical, syntax, semantic or runtime error in the program
+EXIT_USAGE = 2      # bad arguments or unreadable file
+
+SUCCESS = "Code Gen successful!"
+
+CACHE_HELP = "reuse front end results from the compile cache ($LUDUS_CACHE_DIR, default ~/.cache/ludus)"
+TRACE_HELP = "comma separated trace categories to write to stderr after the run, or 'all'"
+
+def read_error(e):
+    if isinstance(e, UnicodeDecodeError):
+        return f"not UTF-8 text (invalid byte 0x{e.object[e.start]:02x})"
+    return e.strerror
+
+def run_file(path, backend="closure", stdin=None, stdout=None, stderr=None, cache=None, trace_categories=None):
+    from .ast import check
+    from .runtime import output, interpreter, inputs, trace
+
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            text = file.read()
+    except (OSError, UnicodeDecodeError) as e:
+        stderr.write(f"ludus: cannot read '{path}': {read_error(e)}\n")
+        return EXIT_USAGE
+
+    sink = output.StreamSink(stdout)
+    previous_sink = output.set_sink(sink)
+    previous_provider = interpreter.input_provider
+    interpreter.input_provider = inputs.StreamInput(stdin, echo=sink)
+    if trace_categories:
+        trace.clear()
+        trace.enable(*trace_categories)
+    try:
+        result = check(path, text, True, backend=backend, cache=cache)
+    finally:
+        output.set_sink(previous_sink)
+        interpreter.input_provider = previous_provider
+        stdout.flush()
+        if trace_categories:
+            trace.disable()
+            trace.dump(stderr)
+
+    if result != SUCCESS:
+        stderr.write(str(result).rstrip("\n") + "\n")
+        return EXIT_ERROR
+    return EXIT_OK
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog="python -m ludus", description="Run Ludus programs without the GUI.")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run a .lds file")
+    run.add_argument("file")
+    run.add_argument("--backend", choices=("closure", "vm", "tree"), default="closure")
+    run.add_argument("--cache", action="store_true", help=CACHE_HELP)
+    run.add_argument("--trace", default=None, metavar="CATEGORIES", help=TRACE_HELP)
+    grade = commands.add_parser("grade", help="run every .lds file in a folder and report the results")
+    grade.add_argument("folder")
+    grade.add_argument("--jobs", type=int, default=None, help="programs run at once (default: CPU count)")
+    grade.add_argument("--timeout", type=float, default=10.0, help="wall-clock seconds per program")
+    grade.add_argument("--cpu-limit", type=float, default=None, help="CPU seconds per program (default: timeout)")
+    grade.add_argument("--report", default=None, help="report file, .json or .csv (default: JSON on stdout)")
+    grade.add_argument("--backend", choices=("closure", "vm", "tree"), default="closure")
+    grade.add_argument("--cache", action="store_true", help=CACHE_HELP)
+    check = commands.add_parser("check", help="lexical and syntax check of a .lds file, streamed from disk")
+    check.add_argument("file")
+
+    try:
+        args = arg_parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    if args.command == "run":
+        cache = None
+        if args.cache:
+            from .compile_cache import CompileCache
+            cache = CompileCache()
+        trace_categories = None
+        if args.trace:
+            from .runtime import trace
+            trace_categories = trace.CATEGORIES if args.trace == "all" else args.trace.split(",")
+            unknown = [category for category in trace_categories if category not in trace.CATEGORIES]
+            if unknown:
+                sys.stderr.write(f"ludus: unknown trace category '{unknown[0]}', expected {', '.join(trace.CATEGORIES)} or all\n")
+                return EXIT_USAGE
+        return run_file(args.file, args.backend, cache=cache, trace_categories=trace_categories)
+    if args.command == "grade":
+        return grade_folder(args)
+    if args.command == "check":
+        return check_file(args.file)
+    return EXIT_USAGE
+
+def check_file(path, stdout=None, stderr=None):
+    from .parser import parse_stream
+
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            result = parse_stream(path, file)
+    except (OSError, UnicodeDecodeError) as e:
+        stderr.write(f"ludus: cannot read '{path}': {read_error(e)}\n")
+        return EXIT_USAGE
+
+    if not result.endswith("Valid syntax."):
+        stderr.write(result.rstrip("\n") + "\n")
+        return EXIT_ERROR
+    stdout.write(result + "\n")
+    return EXIT_OK
+
+def grade_folder(args):
+    from . import batch
+
+    if not os.path.isdir(args.folder):
+        sys.stderr.write(f"ludus: '{args.folder}' is not a folder\n")
+        return EXIT_USAGE
+
+    paths = batch.find_programs(args.folder)
+    cache_dir = None
+    if args.cache:
+        from .compile_cache import default_directory
+        cache_dir = default_directory()
+    results = batch.run_batch(paths, args.jobs, args.timeout, args.cpu_limit, args.backend, cache_dir)
+
+    if args.report:
+        fmt = "csv" if args.report.endswith(".csv") else "json"
+        with open(args.report, "w", encoding="utf-8", newline="") as report:
+            batch.write_report(results, report, fmt)
+    else:
+        batch.write_report(results, sys.stdout)
+    sys.stderr.write(f"{len(results)} programs - {batch.summary(results)}\n")
+
+    if all(result["status"] in ("ok", "pass") for result in results):
+        return EXIT_OK
+    return EXIT_ERROR
+
+if __name__ == "__main__":
+    sys.exit(main())
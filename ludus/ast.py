@@ -1,11 +1,17 @@
-from .lexer import Lexer
+from .lexer import make_lexer
 from .nodes import *
-from .parser import parse
+from .pipeline import Compilation
 import re
 from typing import Union
 from .runtime.traverser import ASTVisitor, SemanticAnalyzer
+from .runtime.closures import compile_program
+from .runtime.bytecode import compile_bytecode
+from .runtime import output, trace
 from .error import SemanticError
 from .helper_parser import Helper
+from .resolver import resolve
+from .typecheck import TypeChecker, annotate
+from .fold import fold
 
 class Semantic:
     def __init__(self, tokens):
@@ -100,45 +106,33 @@ class Semantic:
         return None
     
     def skip_whitespace(self):
-        while self.current_token and self.current_token.token in {"newline", "space"}:
+        if self.current_token and self.current_token.token in {"newline", "space"}:
+            self.current_token_index = self.tokens.skip(self.current_token_index, ("newline", "space"))
             self.current_token = self.get_next_token()
 
     def skip_spaces(self):
-        while self.current_token and self.current_token.token == "space":
+        if self.current_token and self.current_token.token == "space":
+            self.current_token_index = self.tokens.next_solid(self.current_token_index)
             self.current_token = self.get_next_token()
 
     def expect(self, token_type, error_message):
         prev_token = self.current_token
-        start = [prev_token.line, prev_token.column]
-        end = [prev_token.line, prev_token.column]
+        start = (prev_token.line, prev_token.column)
+        end = (prev_token.line, prev_token.column)
         self.current_token = self.get_next_token()
         if not prev_token or prev_token.token != token_type:
             raise SemanticError(f"ParserError: {error_message}", start, end)
         
     def look_ahead(self):
-        la_token_index = self.current_token_index 
-        while la_token_index < len(self.tokens):
-            la_token = self.tokens[la_token_index]
-            if la_token.token != "space": 
-                return la_token
-            la_token_index += 1  
-
+        la_token_index = self.tokens.next_solid(self.current_token_index)
+        if la_token_index < len(self.tokens):
+            return self.tokens[la_token_index]
         return None  
     
     def find_token_in_line(self, target_token):
-        la_token_index = self.current_token_index
-
-        while la_token_index < len(self.tokens):
-            la_token = self.tokens[la_token_index]
-
-            if la_token.token == target_token:
-                return la_token
-
-            if la_token.token in {':', 'newline', 'EOF'}:  
-                break
-
-            la_token_index += 1
-
+        la_token_index = self.tokens.find_in_line(self.current_token_index, target_token)
+        if la_token_index >= 0:
+            return self.tokens[la_token_index]
         return None  
     
     def produce_ast(self) -> Program:
@@ -149,8 +143,8 @@ class Semantic:
                 if self.current_token and re.match(r'^id\d+$', self.current_token.token):
                     la_token = self.look_ahead()
                     name = self.current_token.lexeme
-                    name_start = [self.current_token.line, self.current_token.column]
-                    name_end = [self.current_token.line, self.current_token.column + len(name) - 1]
+                    name_start = (self.current_token.line, self.current_token.column)
+                    name_end = (self.current_token.line, self.current_token.column + len(name) - 1)
                     name_node = Identifier(name, name_start, name_end)
                     if la_token is not None and la_token.token in [':',',']: 
                         if self.lookup_identifier(name):
@@ -165,8 +159,8 @@ class Semantic:
                                                 f"already declared as {info["type"]}.", name_start, name_end)
                         program.body.append(self.parse_array("global"))
                     else:
-                        start = [la_token.line, la_token.column]
-                        end = [la_token.line, la_token.column]
+                        start = (la_token.line, la_token.column)
+                        end = (la_token.line, la_token.column)
                         raise SemanticError(f"ParserError: 1 Unexpected token found during parsing: {la_token.token}", start, end)
                 elif self.current_token and self.current_token.token in ['hp','xp','comms','flag']:
                     program.body.append(self.var_or_arr("global"))
@@ -181,8 +175,8 @@ class Semantic:
                 elif self.current_token and self.current_token.token == 'gameOver':
                     break
                 else:
-                    start = [self.current_toke.line, self.current_toke.column]
-                    end = [self.current_toke.line, self.current_toke.column]
+                    start = (self.current_toke.line, self.current_toke.column)
+                    end = (self.current_toke.line, self.current_toke.column)
                     raise SemanticError(f"ParserError: 2 Unexpected token found during parsing: {self.current_token.token}", self.current_token.line)
             if self.global_func:
                 first_func = next(iter(self.global_func))
@@ -197,17 +191,17 @@ class Semantic:
         
         except SemanticError as e:
             return e
-        return program
+        return resolve(program)
                 
     def parse_func(self) -> Union[GlobalFuncDec, GlobalFuncBody]: 
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         self.current_token = self.get_next_token() # eat generate
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ParserError: Expected function name after 'generate'.", self.current_token.line)
         name = self.current_token.lexeme
-        name_start = [self.current_token.line, self.current_token.column]
-        name_end = [self.current_token.line, self.current_token.column + len(name)- 1]
+        name_start = (self.current_token.line, self.current_token.column)
+        name_end = (self.current_token.line, self.current_token.column + len(name)- 1)
         func_name = Identifier(name, name_start, name_end) 
         
         if self.lookup_identifier(func_name.symbol):
@@ -228,13 +222,13 @@ class Semantic:
             param_name = self.current_token.lexeme
             if param_name in param_names:
                 raise SemanticError(f"ParamaterError: Duplicate parameter names: '{param_name}'",
-                                    [self.current_token.line, self.current_token.column], 
-                                    [self.current_token.line, self.current_token.column + len(param_name) - 1])
+                                    (self.current_token.line, self.current_token.column), 
+                                    (self.current_token.line, self.current_token.column + len(param_name) - 1))
             param_names.append(param_name)
             if self.lookup_identifier(param_name):
                 raise SemanticError("ParamaneterError: Parameter's name cannot be the same with a global element.",
-                                    [self.current_token.line, self.current_token.column], 
-                                    [self.current_token.line, self.current_token.column + len(param_name) - 1])
+                                    (self.current_token.line, self.current_token.column), 
+                                    (self.current_token.line, self.current_token.column + len(param_name) - 1))
             self.current_token = self.get_next_token() # eat id
             self.skip_spaces()
             if self.current_token.token == ':':
@@ -250,7 +244,7 @@ class Semantic:
                 self.current_token = self.get_next_token() # eat ,
                 self.skip_spaces()
 
-        pos_end = [self.current_token.line, self.current_token.column]
+        pos_end = (self.current_token.line, self.current_token.column)
         self.current_token = self.get_next_token() # eat )
         self.skip_whitespace()
 
@@ -323,7 +317,7 @@ class Semantic:
     
     def parse_stmt(self, scope) -> Stmt:
         self.skip_whitespace()
-        line_start = [self.current_token.line, self.current_token.column]
+        line_start = (self.current_token.line, self.current_token.column)
 
         ###### decs and ass ######
         if self.current_token and re.match(r'^id\d+$', self.current_token.token):
@@ -360,7 +354,7 @@ class Semantic:
         
         ###### loop control ######
         elif self.current_token and self.current_token.token == 'resume':
-            line = [self.current_token.line, self.current_token.column]
+            line = (self.current_token.line, self.current_token.column)
 
             in_flank = self.flank_flag_stack and self.flank_flag_stack[-1]
             in_loop = self.loop_flag_stack and self.loop_flag_stack[-1]
@@ -372,12 +366,13 @@ class Semantic:
                 return ResumeStmt()
             else:
                 raise SemanticError(f"ResumeError: Cannot use resume statement if not within a flank choice body or loop body.",
-                                    line, [self.current_token.line, self.current_token.column + 5])
+                                    line, (self.current_token.line, self.current_token.column + 5))
         
         elif self.current_token and self.current_token.token == 'checkpoint':
-            line = [self.current_token.line, self.current_token.column]
+            line = (self.current_token.line, self.current_token.column)
             in_loop = self.loop_flag_stack and self.loop_flag_stack[-1]
-            print(f"loop flag = {in_loop}")
+            if trace.parse:
+                trace.record("parse", f"checkpoint at {line}, in loop {bool(in_loop)}")
 
             if in_loop:
                 self.current_token = self.get_next_token()
@@ -386,7 +381,7 @@ class Semantic:
                 return CheckpointStmt()
             else:
                 raise SemanticError(f"CheckpointError: Cannot use checkpoint statement if not within a loop body.",
-                                    line, [self.current_token.line, self.current_token.column + 9])
+                                    line, (self.current_token.line, self.current_token.column + 9))
        
        ###### loops ######
         elif self.current_token and self.current_token.token == 'for':
@@ -397,12 +392,12 @@ class Semantic:
              return self.parse_while(scope)
         
         elif self.current_token and self.current_token.token == 'recall':
-             line = [self.current_token.line, self.current_token.column]
+             line = (self.current_token.line, self.current_token.column)
              if self.func_flag:
                 return self.parse_recall(scope)
              else:
                 raise SemanticError(f"RecallError: Cannot use recall if not within a user-defined function body.",
-                                    line, [self.current_token.line, self.current_token.column + 5])
+                                    line, (self.current_token.line, self.current_token.column + 5))
         
         ###### built-in funcs ######
         elif self.current_token and self.current_token.token in ['shoot', 'shootNxt']:
@@ -446,18 +441,18 @@ class Semantic:
         return RecallStmt(stmt)
 
     def parse_func_call(self, scope) -> FuncCallStmt:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         func_name = Identifier(self.current_token.lexeme, pos_start, id_pos_end)
         if not self.lookup_id_type(func_name.symbol, "a function", func_name):
             raise SemanticError(f"NameError: Function '{func_name.symbol}' does not exist.", pos_start, id_pos_end)
         self.current_token = self.get_next_token() # eat id
-        arg_pos_start = [self.current_token.line, self.current_token.column]
+        arg_pos_start = (self.current_token.line, self.current_token.column)
         self.expect("(", "Expects '(' after function name.")
         args = []
         self.skip_spaces()
-        arg_pos = [self.current_token.line, self.current_token.column]
+        arg_pos = (self.current_token.line, self.current_token.column)
         while self.current_token.token != ')':
             la_token = self.look_ahead()
             if la_token.token == ',' or la_token.token == ')':
@@ -469,13 +464,13 @@ class Semantic:
             if self.current_token.token == ',':
                 self.current_token = self.get_next_token() # eat ,
                 self.skip_spaces()
-        pos_end = [self.current_token.line, self.current_token.column]
+        pos_end = (self.current_token.line, self.current_token.column)
         self.current_token = self.get_next_token() # eat )
         return FuncCallStmt(func_name, args, pos_start, pos_end, arg_pos_start, pos_end)
     
     ######### ARRAYS AND VARIABLES #########    
     def var_or_arr(self, scope) -> Union[VarDec, ArrayDec]:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         datatype = self.current_token.token  
         self.current_token = self.get_next_token()
         self.skip_spaces()
@@ -485,8 +480,8 @@ class Semantic:
     
         la_token = self.look_ahead()
         name = self.current_token.lexeme
-        name_start = [self.current_token.line, self.current_token.column]
-        name_end = [self.current_token.line, self.current_token.column + len(name) - 1]
+        name_start = (self.current_token.line, self.current_token.column)
+        name_end = (self.current_token.line, self.current_token.column + len(name) - 1)
         name_node = Identifier(name, name_start, name_end)
         if la_token is not None and la_token.token == '[':  
             if self.lookup_identifier(name):
@@ -503,9 +498,9 @@ class Semantic:
     
     def parse_var_init(self, scope) -> Union[VarDec, BatchVarDec, VarAssignment]:
         name = self.current_token.lexeme
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         var_names = [Identifier(self.current_token.lexeme, pos_start, id_pos_end)]  
 
         if self.is_array(name, var_names[0]): 
@@ -521,9 +516,9 @@ class Semantic:
             if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ParserError: Expected variable name after ','.", self.current_token.line)
 
-            id_pos_start = [self.current_token.line, self.current_token.column]
+            id_pos_start = (self.current_token.line, self.current_token.column)
             var_name_size = len(self.current_token.lexeme)
-            id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+            id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
             var_names.append(Identifier(self.current_token.lexeme ,id_pos_start, id_pos_end))
             self.current_token = self.get_next_token() # eat id
             self.skip_spaces()
@@ -572,7 +567,7 @@ class Semantic:
                         self.expect("[", "Expected '[' for array values.")
                         self.skip_spaces()
                         inner_values = self.parse_inner_arr_values(scope)
-                        pos_end = [self.current_token.line, self.current_token.column]
+                        pos_end = (self.current_token.line, self.current_token.column)
                         self.expect("]", "Expected ']' to close array values.")
                         self.skip_spaces()
                         if self.current_token.token == ',':
@@ -596,9 +591,9 @@ class Semantic:
             if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ParserError: Expected variable name after ','.", self.current_token.line)
             
-            id_pos_start = [self.current_token.line, self.current_token.column]
+            id_pos_start = (self.current_token.line, self.current_token.column)
             var_name_size = len(self.current_token.lexeme)
-            id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+            id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
             
             var_names.append(Identifier(self.current_token.lexeme, id_pos_start, id_pos_end))
             variable_name = self.current_token.lexeme
@@ -657,9 +652,9 @@ class Semantic:
     def parse_var_dec(self, datatype, scope, pos_start) -> Union[VarDec, BatchVarDec]:
         var_names = []
         while True:
-            id_pos_start = [self.current_token.line, self.current_token.column]
+            id_pos_start = (self.current_token.line, self.current_token.column)
             var_name_size = len(self.current_token.lexeme)
-            id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+            id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
             var_names.append(Identifier(self.current_token.lexeme, id_pos_start, id_pos_end))
             self.current_token = self.get_next_token() # eat id
             self.skip_spaces()
@@ -670,7 +665,7 @@ class Semantic:
             else:
                 break
         value = None
-        pos_end = [self.current_token.line, self.current_token.column]
+        pos_end = (self.current_token.line, self.current_token.column)
         if self.current_token and self.current_token.token == 'newline':
             if datatype == 'hp':
                 value = HpLiteral(0)
@@ -683,7 +678,7 @@ class Semantic:
             else:
                 raise SemanticError(f"Unknown data type '{datatype}'.")
         elif self.current_token and self.current_token.token == ':':
-            pos_end = [self.current_token.line, self.current_token.column + 3]
+            pos_end = (self.current_token.line, self.current_token.column + 3)
             self.current_token = self.get_next_token()
             self.skip_spaces()
             self.expect("dead", "Expected 'dead' keyword.")
@@ -716,9 +711,9 @@ class Semantic:
                 return VarDec(var, DeadLiteral(value, datatype), False, scope, pos_start, pos_end)
 
     def parse_empty_array(self, datatype, scope, pos_start) -> ArrayDec:
-        id_pos_start = [self.current_token.line, self.current_token.column]
+        id_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         arr_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
         name = arr_name.symbol
         self.current_token = self.get_next_token()
@@ -736,7 +731,7 @@ class Semantic:
                 dimensions.append(None)
             self.skip_spaces()
             self.expect("]", "Expected ']' to close array dimension declaration.")
-            pos_end = [self.current_token.line, self.current_token.column - 1]
+            pos_end = (self.current_token.line, self.current_token.column - 1)
             self.skip_spaces()
         if self.current_token and self.current_token.token == 'newline':
             default_value = {
@@ -766,7 +761,7 @@ class Semantic:
         elif self.current_token and self.current_token.token == ':':
             self.current_token = self.get_next_token() #eat :
             self.skip_spaces()
-            pos_end = [self.current_token.line, self.current_token.column + 3]
+            pos_end = (self.current_token.line, self.current_token.column + 3)
             self.expect("dead", "Expected 'dead' after ':'.")
             if len(dimensions) == 2:
                 if dimensions[0] is None and dimensions[1] is None:
@@ -794,7 +789,7 @@ class Semantic:
         dimensions.append(dim)
         self.skip_spaces()
         self.expect("]", "Expected ']' to close comms indexing.")
-        pos_end = [self.current_token.line, self.current_token.column - 1]
+        pos_end = (self.current_token.line, self.current_token.column - 1)
         self.skip_spaces()
 
         if self.current_token.token not in ['+=', '-=', '*=', '/=', '%=', ':']:
@@ -810,9 +805,9 @@ class Semantic:
         return StrArrAssignment(lhs, operator, value, pos_start, pos_end)
     
     def parse_array(self, scope) -> Union[ArrayDec, ArrAssignment]:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         arr_name = Identifier(self.current_token.lexeme, pos_start, id_pos_end)
         name = arr_name.symbol
         self.current_token = self.get_next_token() # eat id
@@ -843,7 +838,7 @@ class Semantic:
             if self.current_token and self.current_token.token == ']':
                 if arr_exist:
                     raise SemanticError("IndexError: Index must not be blank for array index assignment.", 
-                                        pos_start, [self.current_token.line, self.current_token.column])
+                                        pos_start, (self.current_token.line, self.current_token.column))
                 dimensions.append(None)
             else:
                 dim = self.parse_expr(scope)
@@ -854,11 +849,11 @@ class Semantic:
                         dimensions.append(dim.value)
                     else:
                         raise SemanticError("ArraySizeError: Array size must be an hp literal only.",
-                                            pos_start, [self.current_token.line, self.current_token.column])
+                                            pos_start, (self.current_token.line, self.current_token.column))
                 
             self.skip_spaces()
             self.expect("]", "Expected ']' to close array dimension declaration.")
-            pos_end = [self.current_token.line, self.current_token.column - 1]
+            pos_end = (self.current_token.line, self.current_token.column - 1)
             self.skip_spaces()
             
         if self.current_token.token == ':':
@@ -914,7 +909,7 @@ class Semantic:
                 inner_values = self.parse_inner_arr_values(scope)
                 values.append(inner_values)
                 self.expect("]", "Expected ']' to close array values.")
-                pos_end = [self.current_token.line, self.current_token.column - 1]
+                pos_end = (self.current_token.line, self.current_token.column - 1)
                 self.skip_spaces()
                 if self.current_token.token == ',':
                     self.current_token = self.get_next_token()  # eat ,
@@ -934,7 +929,7 @@ class Semantic:
             inner_values = self.parse_inner_arr_values(scope)
             values = inner_values
             self.expect("]", "Expected ']' to close array values.")
-            pos_end = [self.current_token.line, self.current_token.column - 1]
+            pos_end = (self.current_token.line, self.current_token.column - 1)
             self.skip_spaces()
             if self.current_token.token == ',':
                 raise SemanticError(
@@ -961,7 +956,7 @@ class Semantic:
         return inner_values
    
     def parse_arr_redec(self, name, scope):
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         dimensions=self.get_dimensions(name.symbol, name)
         self.current_token = self.get_next_token() # eat id
         self.skip_spaces()
@@ -977,10 +972,10 @@ class Semantic:
             self.expect("newline", "Expected 'newline' after every statements.")
             return ArrayRedec(name, dimensions, values, False, scope, pos_start, pos_end) 
         elif re.match(r'^id\d+$', self.current_token.token):
-            id_pos_start = [self.current_token.line, self.current_token.column]
+            id_pos_start = (self.current_token.line, self.current_token.column)
             rhs_name = self.current_token.lexeme
             rhs_name_size = len(rhs_name)
-            id_pos_end = [self.current_token.line, self.current_token.column + rhs_name_size - 1]
+            id_pos_end = (self.current_token.line, self.current_token.column + rhs_name_size - 1)
             rhs_name_node = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
             la_token = self.look_ahead()
             if la_token.token == '(':
@@ -1013,14 +1008,14 @@ class Semantic:
 
     ########## STRUCTS ##########
     def parse_globalstruct(self) -> Union[StructDec, GlobalStructDec]:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         self.current_token = self.get_next_token() # eat build
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ParserError: Expected struct name after 'build'.", self.current_token.line)
-        id_pos_start = [self.current_token.line, self.current_token.column]
+        id_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         struct_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
         self.current_token = self.get_next_token() # eat id
         node = GlobalStructDec(struct_name, pos_start, id_pos_end)
@@ -1046,9 +1041,9 @@ class Semantic:
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ParserError: Expected struct name after 'build'.", self.current_token.line)
-        id_pos_start = [self.current_token.line, self.current_token.column]
+        id_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1] 
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1) 
         struct_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
         if self.lookup_identifier(struct_name.symbol):
             info = self.get_identifier_info(struct_name.symbol, struct_name)
@@ -1068,9 +1063,9 @@ class Semantic:
             datatype = self.current_token.token
             self.current_token = self.get_next_token()  # eat datatype
             self.skip_spaces()
-            id_pos_start = [self.current_token.line, self.current_token.column]
+            id_pos_start = (self.current_token.line, self.current_token.column)
             var_name_size = len(self.current_token.lexeme)
-            id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+            id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
             field_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)  
             self.current_token = self.get_next_token()  # eat id
             self.skip_spaces()
@@ -1111,7 +1106,7 @@ class Semantic:
         return StructDec(struct_name, fields, scope)
 
     def parse_struct_inst(self, scope) -> StructInst:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         self.current_token = self.get_next_token()  # eat 'access'
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
@@ -1122,16 +1117,16 @@ class Semantic:
                 pass
             else:
                 raise SemanticError(f"NameError: Struct '{struct_parent}' is not defined.",
-                                    [self.current_token.line, self.current_token.column],
-                                    [self.current_token.line, self.current_token.column + len(struct_parent)-1])
+                                    (self.current_token.line, self.current_token.column),
+                                    (self.current_token.line, self.current_token.column + len(struct_parent)-1))
         
         self.current_token = self.get_next_token()  # eat id
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
             raise SemanticError("ParserError: Expected struct instance name after struct name.", self.current_token.line)
-        id_pos_start = [self.current_token.line, self.current_token.column]
+        id_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         inst_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
         if self.lookup_identifier(inst_name.symbol):
             info = self.get_identifier_info(inst_name.symbol, inst_name)
@@ -1159,9 +1154,9 @@ class Semantic:
         return StructInst(inst_name, struct_parent, values, False, pos_start, pos_end)
 
     def parse_inst_ass(self, scope) -> InstAssignment:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         struct_inst_name = Identifier(self.current_token.lexeme, pos_start, id_pos_end)
         self.current_token = self.get_next_token() # eat id
         
@@ -1188,9 +1183,9 @@ class Semantic:
         self.current_token = self.get_next_token() # eat .
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
             raise SemanticError("ParserError: Expected struct instance field name after struct instance name.", self.current_token.line)
-        id_pos_start = [self.current_token.line, self.current_token.column]
+        id_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         inst_field_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
         left = StructInstField(struct_inst_name, inst_field_name)
         self.current_token = self.get_next_token() # eat id
@@ -1225,9 +1220,9 @@ class Semantic:
                 raise SemanticError(f"ParserError: 5 Unexpected token found during parsing: {la_token}", self.current_token.line)  
             
     def parse_immo_var(self, scope) -> Union[VarDec, BatchVarDec]:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         var_names = [Identifier(self.current_token.lexeme, pos_start, id_pos_end)]  
         name = self.current_token.lexeme
         self.current_token = self.get_next_token() # eat id
@@ -1239,9 +1234,9 @@ class Semantic:
             if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ParserError: Expected variable name after ','.", self.current_token.line)
             
-            id_pos_start = [self.current_token.line, self.current_token.column]
+            id_pos_start = (self.current_token.line, self.current_token.column)
             var_name_size = len(self.current_token.lexeme)
-            id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+            id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
             var_names.append(Identifier(self.current_token.lexeme, id_pos_start, id_pos_end))
             self.current_token = self.get_next_token() # eat id
             self.skip_spaces()
@@ -1275,9 +1270,9 @@ class Semantic:
             if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ParserError: Expected variable name after ','.", self.current_token.line)
             
-            id_pos_start = [self.current_token.line, self.current_token.column]
+            id_pos_start = (self.current_token.line, self.current_token.column)
             var_name_size = len(self.current_token.lexeme)
-            id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+            id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
             
             var_names.append(Identifier(self.current_token.lexeme, id_pos_start, id_pos_end))
             variable_name = self.current_token.lexeme
@@ -1316,9 +1311,9 @@ class Semantic:
             return VarDec(var, value, True, scope, pos_start, value.pos_end)
 
     def parse_immo_arr(self, scope) -> ArrayDec:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         arr_name = Identifier(self.current_token.lexeme, pos_start, id_pos_end)
         name=arr_name.symbol
         if self.lookup_identifier(name):
@@ -1348,7 +1343,7 @@ class Semantic:
         return ArrayDec(arr_name, dimensions, values, True, scope, None, pos_start, pos_end)
     
     def parse_immo_inst(self, scope) -> ImmoInstDec:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         self.current_token = self.get_next_token()  # eat 'access'
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
@@ -1359,15 +1354,15 @@ class Semantic:
                 pass
             else:
                 raise SemanticError(f"NameError: Struct '{struct_parent}' is not defined.", 
-                                    [self.current_token.line, self.current_token.column],
-                                    [self.current_token.line, self.current_token.column+len(struct_parent)-1])
+                                    (self.current_token.line, self.current_token.column),
+                                    (self.current_token.line, self.current_token.column+len(struct_parent)-1))
         self.current_token = self.get_next_token()  # eat id
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
             raise SemanticError("ParserError: Expected struct instance name after struct name.", self.current_token.line)
-        id_pos_start = [self.current_token.line, self.current_token.column]
+        id_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         inst_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
         self.current_token = self.get_next_token()  # eat id
         self.skip_spaces()
@@ -1394,9 +1389,9 @@ class Semantic:
 
     ########## ASS #############
     def parse_var_ass(self, scope) -> VarAssignment:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         var_name = Identifier(self.current_token.lexeme, pos_start, id_pos_end)
         name = self.current_token.lexeme
         if not self.lookup_identifier(name):
@@ -1415,18 +1410,18 @@ class Semantic:
     ########## EXPR ############
     def parse_expr(self, scope) -> Expr:
         self.skip_spaces()
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         return self.parse_or_expr(scope, pos_start)
     
     def parse_or_expr(self, scope, pos_start=None) -> Expr:
         self.skip_spaces()
-        expr_pos_start = [self.current_token.line, self.current_token.column]
+        expr_pos_start = (self.current_token.line, self.current_token.column)
         left = self.parse_and_expr(scope, pos_start)
         while self.current_token and self.current_token.token in ['OR', '||']:
             operator = self.current_token.token
             self.current_token = self.get_next_token()
             self.skip_spaces()
-            pos_start = [self.current_token.line, self.current_token.column]
+            pos_start = (self.current_token.line, self.current_token.column)
             right = self.parse_and_expr(scope, pos_start)
             expr_pos_end = right.pos_end
             left = BinaryExpr(left, operator, right, expr_pos_start, expr_pos_end)
@@ -1434,13 +1429,13 @@ class Semantic:
     
     def parse_and_expr(self, scope, pos_start=None) -> Expr:
         self.skip_spaces()
-        expr_pos_start = [self.current_token.line, self.current_token.column]
+        expr_pos_start = (self.current_token.line, self.current_token.column)
         left = self.parse_relat_expr(scope, expr_pos_start)
         while self.current_token and self.current_token.token in ['AND', '&&']:
             operator = self.current_token.token
             self.current_token = self.get_next_token()
             self.skip_spaces()
-            pos_start = [self.current_token.line, self.current_token.column]
+            pos_start = (self.current_token.line, self.current_token.column)
             right = self.parse_relat_expr(scope, pos_start)
             expr_pos_end = right.pos_end
             left = BinaryExpr(left, operator, right, expr_pos_start, expr_pos_end)
@@ -1448,7 +1443,7 @@ class Semantic:
     
     def parse_relat_expr(self, scope, pos_start=None) -> Expr:
         self.skip_spaces()
-        expr_pos_start = [self.current_token.line, self.current_token.column]
+        expr_pos_start = (self.current_token.line, self.current_token.column)
         left = self.parse_additive_expr(scope, expr_pos_start)
         if not self.current_token or self.current_token.token not in ['<', '>', '<=', '>=', '==', '!=']:
             return left
@@ -1458,7 +1453,7 @@ class Semantic:
             operator = self.current_token.token
             self.current_token = self.get_next_token()
             self.skip_spaces()
-            pos_start = [self.current_token.line, self.current_token.column]
+            pos_start = (self.current_token.line, self.current_token.column)
             right = self.parse_additive_expr(scope, pos_start)
             expr_pos_end = right.pos_end
             expr.append(BinaryExpr(left, operator, right, expr_pos_start, expr_pos_end))
@@ -1468,14 +1463,14 @@ class Semantic:
     
     def parse_additive_expr(self, scope, pos_start=None) -> Expr:
         self.skip_spaces()
-        expr_pos_start = [self.current_token.line, self.current_token.column]
+        expr_pos_start = (self.current_token.line, self.current_token.column)
         left = self.parse_multiplicative_expr(scope, expr_pos_start)
 
         while self.current_token and self.current_token.token in '+-':
             operator = self.current_token.token
             self.current_token = self.get_next_token()
             self.skip_spaces()
-            pos_start = [self.current_token.line, self.current_token.column]
+            pos_start = (self.current_token.line, self.current_token.column)
             right = self.parse_multiplicative_expr(scope, pos_start)
             expr_pos_end = right.pos_end
             left = BinaryExpr(left, operator, right, expr_pos_start, expr_pos_end)
@@ -1483,14 +1478,14 @@ class Semantic:
 
     def parse_multiplicative_expr(self, scope, pos_start=None) -> Expr:
         self.skip_spaces()
-        expr_pos_start = [self.current_token.line, self.current_token.column]
+        expr_pos_start = (self.current_token.line, self.current_token.column)
         left = self.parse_not_expr(scope, expr_pos_start)
 
         while self.current_token and self.current_token.token in "/*%":
             operator = self.current_token.token
             self.current_token = self.get_next_token()
             self.skip_spaces()
-            pos_start = [self.current_token.line, self.current_token.column]
+            pos_start = (self.current_token.line, self.current_token.column)
             right = self.parse_not_expr(scope, pos_start)
             expr_pos_end = right.pos_end
             left = BinaryExpr(left, operator, right, expr_pos_start, expr_pos_end)
@@ -1501,11 +1496,11 @@ class Semantic:
         self.skip_spaces()
 
         if self.current_token and self.current_token.token == '!':
-            expr_pos_start = [self.current_token.line, self.current_token.column]
+            expr_pos_start = (self.current_token.line, self.current_token.column)
             operator = self.current_token.token
             self.current_token = self.get_next_token()
             self.skip_spaces()
-            pos_start = [self.current_token.line, self.current_token.column]
+            pos_start = (self.current_token.line, self.current_token.column)
             operand = self.parse_exp_expr(scope, pos_start)
             expr_pos_end = operand.pos_end
             return UnaryExpr(operator, operand, expr_pos_start, expr_pos_end)
@@ -1514,14 +1509,14 @@ class Semantic:
     
     def parse_exp_expr(self, scope, pos_start=None) -> Expr:
         self.skip_spaces()
-        expr_pos_start = [self.current_token.line, self.current_token.column]
+        expr_pos_start = (self.current_token.line, self.current_token.column)
         left = self.parse_primary_expr(scope, None, expr_pos_start)
 
         while self.current_token and self.current_token.token == '^':
             operator = self.current_token.token
             self.current_token = self.get_next_token()
             self.skip_spaces()
-            pos_start = [self.current_token.line, self.current_token.column]
+            pos_start = (self.current_token.line, self.current_token.column)
             right = self.parse_exp_expr(scope, pos_start)
             expr_pos_end = right.pos_end
             left = BinaryExpr(left, operator, right, expr_pos_start, expr_pos_end)
@@ -1539,9 +1534,9 @@ class Semantic:
             tk= 'id'
 
         if tk == 'id':
-            new_pos_start = [self.current_token.line, self.current_token.column]
+            new_pos_start = (self.current_token.line, self.current_token.column)
             id_size = len(self.current_token.lexeme)
-            id_pos_end=[self.current_token.line, self.current_token.column + id_size - 1]
+            id_pos_end=(self.current_token.line, self.current_token.column + id_size - 1)
             identifier = Identifier(self.current_token.lexeme, new_pos_start, id_pos_end)
             self.current_token = self.get_next_token()
             self.skip_spaces()
@@ -1572,9 +1567,9 @@ class Semantic:
                 self.skip_spaces()
                 if not re.match(r'^id\d+$', self.current_token.token):
                     raise SemanticError("ParserError: Expected 'id' after '.' in accessing a struct instance field.", self.current_token.line)
-                field_start = [self.current_token.line, self.current_token.column]
+                field_start = (self.current_token.line, self.current_token.column)
                 field_size = len(self.current_token.lexeme)
-                pos_end = [self.current_token.line, self.current_token.column + field_size - 1]
+                pos_end = (self.current_token.line, self.current_token.column + field_size - 1)
                 field = Identifier(self.current_token.lexeme, field_start, pos_end)  
                 identifier = StructInstField(identifier, field, new_pos_start, pos_end)
                 self.current_token = self.get_next_token()
@@ -1620,7 +1615,7 @@ class Semantic:
                         self.skip_spaces()
                         self.expect("]", "Expected ']' to close array dimension.")
 
-                pos_end = [self.current_token.line, self.current_token.column - 1]
+                pos_end = (self.current_token.line, self.current_token.column - 1)
                 self.skip_spaces()
 
                 if error:
@@ -1635,10 +1630,10 @@ class Semantic:
             elif self.current_token.token == '(':
                 if not self.lookup_id_type(identifier.symbol, "a function", identifier):
                     raise SemanticError(f"NameError: Function '{identifier.symbol}' does not exist.", new_pos_start, id_pos_end)
-                arg_pos_start = [self.current_token.line, self.current_token.column]
+                arg_pos_start = (self.current_token.line, self.current_token.column)
                 self.current_token = self.get_next_token() # eat ( 
                 self.skip_spaces()
-                arg_pos = [self.current_token.line, self.current_token.column]
+                arg_pos = (self.current_token.line, self.current_token.column)
                 args = []     
                 while self.current_token.token != ')':
                     la_token = self.look_ahead()
@@ -1651,7 +1646,7 @@ class Semantic:
                     if self.current_token.token == ',':
                         self.current_token = self.get_next_token() # eat ,
                         self.skip_spaces()
-                pos_end = [self.current_token.line, self.current_token.column]
+                pos_end = (self.current_token.line, self.current_token.column)
                 self.current_token = self.get_next_token() # eat )
                 self.skip_spaces()
                 identifier = FuncCallStmt(identifier, args, pos_start, pos_end, arg_pos_start, pos_end)
@@ -1662,7 +1657,7 @@ class Semantic:
                 if not re.match(r'^\.\d+f$', value):
                     raise SemanticError(f"FormatError: Invalid format specifier '{value}'.")
                 digit = int(value[1])
-                xp_format_end = [self.current_token.line, self.current_token.column + 2]
+                xp_format_end = (self.current_token.line, self.current_token.column + 2)
                 self.current_token = self.get_next_token() # eat format 
                 self.skip_spaces()
                 return XpFormatting(identifier, digit, new_pos_start, xp_format_end)
@@ -1686,28 +1681,26 @@ class Semantic:
 
             return identifier
         elif tk == 'hp_ltr':
-            ltr_pos_start = [self.current_token.line, self.current_token.column]
+            ltr_pos_start = (self.current_token.line, self.current_token.column)
             ltr_size = len(self.current_token.lexeme)
-            ltr_pos_end = [self.current_token.line, self.current_token.column + ltr_size - 1]
+            ltr_pos_end = (self.current_token.line, self.current_token.column + ltr_size - 1)
             literal = HpLiteral(self.current_token.lexeme, ltr_pos_start, ltr_pos_end)
             self.current_token = self.get_next_token()
             self.skip_spaces()
             return literal
         elif tk == 'xp_ltr':
-            ltr_pos_start = [self.current_token.line, self.current_token.column]
+            ltr_pos_start = (self.current_token.line, self.current_token.column)
             ltr_size = len(self.current_token.lexeme)
-            ltr_pos_end = [self.current_token.line, self.current_token.column + ltr_size - 1]
+            ltr_pos_end = (self.current_token.line, self.current_token.column + ltr_size - 1)
             literal = XpLiteral(self.current_token.lexeme, ltr_pos_start, ltr_pos_end)
             self.current_token = self.get_next_token()
             self.skip_spaces()
             return literal
         elif re.match(r'^comms_ltr', tk) :
-            ltr_pos_start = [self.current_token.line, self.current_token.column]
+            ltr_pos_start = (self.current_token.line, self.current_token.column)
             ltr_size = len(self.current_token.lexeme) - 1
-            ltr_pos_end = [self.current_token.line, self.current_token.column + ltr_size]
-            print(f"value before {self.current_token.lexeme}")
+            ltr_pos_end = (self.current_token.line, self.current_token.column + ltr_size)
             value = re.sub(r'^"(.*)"$', r'\1', self.current_token.lexeme, flags=re.DOTALL)
-            print(value)
             open_braces = 0
             placeholders = []
             current_placeholder = ""
@@ -1754,16 +1747,15 @@ class Semantic:
             if open_braces > 0:
                 raise SemanticError("FormatError: Unclosed '{' found in string literal.", [ln, braces_char], [ln, braces_char])
 
-            print(f"Placeholders: {placeholders}")
-            print(f"Final string: {final_value}")
+            if trace.parse:
+                trace.record("parse", f"comms {final_value!r} at {ltr_pos_start}, placeholders {placeholders}")
             if placeholders:
                 results = []
                 for i, placeholder in enumerate(placeholders):
-                    lexer = Lexer("yo", placeholder)
+                    lexer = make_lexer("yo", placeholder)
                     tokens, error = lexer.make_tokens()
                     if error:
                         raise SemanticError(f"Lexical error in placeholder {i}: cannot proceed to parsing.\n\n" + "\n\n".join(error), ltr_pos_start, ltr_pos_end)
-                    print(tokens)
                     tokens.pop()
                     helper = Helper(tokens, self.scope_stack, self.func_flag, ltr_pos_start, ltr_pos_end)
                     result = helper.parse_expr(scope)
@@ -1771,7 +1763,7 @@ class Semantic:
                         raise SemanticError(f"Error in placeholder {i+1}: {str(result)}", ltr_pos_start, ltr_pos_end)
                     results.append(result)
                 ltr_size = len(self.current_token.lexeme) - 1
-                ltr_pos_end = [self.current_token.line, self.current_token.column + ltr_size]
+                ltr_pos_end = (self.current_token.line, self.current_token.column + ltr_size)
                 literal = FormattedCommsLiteral(value, placeholders, results, ltr_pos_start, ltr_pos_end)
                 self.current_token = self.get_next_token()
                 self.skip_spaces()
@@ -1782,20 +1774,20 @@ class Semantic:
             self.skip_spaces()
             return literal
         elif tk == 'flag_ltr':
-            ltr_pos_start = [self.current_token.line, self.current_token.column]
+            ltr_pos_start = (self.current_token.line, self.current_token.column)
             ltr_size = len(self.current_token.lexeme)
             lexeme = self.current_token.lexeme 
             if lexeme == 'true':
                 value = True
             else:
                 value = False
-            ltr_pos_end = [self.current_token.line, self.current_token.column + ltr_size - 1]
+            ltr_pos_end = (self.current_token.line, self.current_token.column + ltr_size - 1)
             literal = FlagLiteral(value, ltr_pos_start, ltr_pos_end)
             self.current_token = self.get_next_token()
             self.skip_spaces()
             return literal
         elif tk == '(':
-            expr_pos_start = [self.current_token.line, self.current_token.column]
+            expr_pos_start = (self.current_token.line, self.current_token.column)
             self.current_token = self.get_next_token()
             self.skip_spaces()
             value = self.parse_expr(scope)  
@@ -1808,16 +1800,16 @@ class Semantic:
                 format_str = re.sub(r'^"(.*)"$', r'\1', self.current_token.lexeme)
                 if not re.match(r'^\.\d+f$', format_str):
                     raise SemanticError(f"FormatError: Invalid format specifier '{format_str}'.",
-                                        [self.current_token.line, self.current_token.column],
-                                        [self.current_token.line, self.current_token.column]+2)
+                                        (self.current_token.line, self.current_token.column),
+                                        (self.current_token.line, self.current_token.column)+2)
                 digit = int(format_str[1])
-                expr_pos_end = [self.current_token.line, self.current_token.column + 2]
+                expr_pos_end = (self.current_token.line, self.current_token.column + 2)
                 self.current_token = self.get_next_token() # eat format 
                 self.skip_spaces()
                 return XpFormatting(value, digit, expr_pos_start, expr_pos_end)
             return value
         elif tk == '-':
-            ltr_pos_start = [self.current_token.line, self.current_token.column]
+            ltr_pos_start = (self.current_token.line, self.current_token.column)
             self.current_token = self.get_next_token()
             self.skip_spaces()
             if self.current_token and self.current_token.token == '(':
@@ -1825,7 +1817,7 @@ class Semantic:
                 self.skip_spaces()
                 expr = self.parse_expr(scope)
                 self.expect(')', "Unexpected token found inside parenthesized expression. Expected closing parenthesis.")
-                ltr_pos_end = [self.current_token.line, self.current_token.column-1]
+                ltr_pos_end = (self.current_token.line, self.current_token.column-1)
                 self.skip_spaces()
                 return UnaryExpr('-', expr, ltr_pos_start, ltr_pos_end)
             else:
@@ -1834,14 +1826,14 @@ class Semantic:
                     raise SemanticError("UnaryError: Invalid expression after unary operator.")
                 return UnaryExpr('-', expr, ltr_pos_start, expr.pos_end)
         elif tk == 'dead':
-            ltr_pos_start = [self.current_token.line, self.current_token.column]
-            ltr_pos_end = [self.current_token.line, self.current_token.column + 3]
+            ltr_pos_start = (self.current_token.line, self.current_token.column)
+            ltr_pos_end = (self.current_token.line, self.current_token.column + 3)
             self.current_token = self.get_next_token()
             self.skip_spaces()
             return DeadLiteral(None, None, ltr_pos_start, ltr_pos_end)
         elif tk == 'load' or tk == 'loadNum':
             prompt_msg = None
-            func_pos_start = [self.current_token.line, self.current_token.column]
+            func_pos_start = (self.current_token.line, self.current_token.column)
             #print(self.current_token.token)
             self.current_token = self.get_next_token() # eat load
             #print(self.current_token.token)
@@ -1859,7 +1851,7 @@ class Semantic:
                 self.skip_spaces()
             if self.current_token.token != ')':
                 raise SemanticError("ParserError: Missing parentheses.", self.current_token.line)
-            func_pos_end = [self.current_token.line, self.current_token.column]
+            func_pos_end = (self.current_token.line, self.current_token.column)
             self.current_token = self.get_next_token() # eat )
             self.skip_spaces()
             if tk == 'load':
@@ -1867,27 +1859,26 @@ class Semantic:
             else:
                 return LoadNum(prompt_msg, func_pos_start, func_pos_end)
         elif tk == 'rounds':
-            func_pos_start = [self.current_token.line, self.current_token.column]
+            func_pos_start = (self.current_token.line, self.current_token.column)
             self.current_token = self.get_next_token() # eat rounds
             self.expect('(', "Expected '(' after 'rounds'.")
             self.skip_spaces()
-            arg_pos = [self.current_token.line, self.current_token.column]
+            arg_pos = (self.current_token.line, self.current_token.column)
             value = self.parse_primary_expr(scope, 'rounds', arg_pos)
-            print("asdasd", value)
             if value.kind not in ['Identifier', 'StringIndexArr', 'ArrayElement', 'StructInstField', 'FuncCallStmt',
                                   'CommsLiteral', 'ToCommsStmt']: 
                 raise SemanticError("ArgumentError: Invalid rounds argument.", self.current_token.line)
             self.skip_spaces()
             self.expect(')', "Expected ')' after rounds arguments.")
-            func_pos_end = [self.current_token.line, self.current_token.column-1]
+            func_pos_end = (self.current_token.line, self.current_token.column-1)
             self.skip_spaces()
             return RoundStmt(value, func_pos_start, func_pos_end)
         elif tk in ('levelUp', 'levelDown'):
-            func_pos_start = [self.current_token.line, self.current_token.column]
+            func_pos_start = (self.current_token.line, self.current_token.column)
             self.current_token = self.get_next_token()  # consume levelUp or levelDown
             self.expect('(', f"Expected '(' after '{tk}'.")
             self.skip_spaces()
-            arg_pos = [self.current_token.line, self.current_token.column]
+            arg_pos = (self.current_token.line, self.current_token.column)
             value = self.parse_primary_expr(scope, None, arg_pos)
             valid_kinds = ['Identifier', 'ArrayElement', 'StructInstField', 'FuncCallStmt',
                            'ToCommsStmt']  
@@ -1895,37 +1886,37 @@ class Semantic:
                 raise SemanticError(f"ArgumentError: Invalid '{tk}' argument.", self.current_token.line)
             self.skip_spaces()
             self.expect(')', f"Expected ')' after '{tk}' arguments.")
-            func_pos_end = [self.current_token.line, self.current_token.column - 1]
+            func_pos_end = (self.current_token.line, self.current_token.column - 1)
             self.skip_spaces()
             return LevelStmt(value, tk == 'levelUp', func_pos_start, func_pos_end)
         elif tk in ('toHp', 'toXp'):
-            func_pos_start = [self.current_token.line, self.current_token.column]
+            func_pos_start = (self.current_token.line, self.current_token.column)
             self.current_token = self.get_next_token()  # consume toHp or toHp
             self.expect('(', f"Expected '(' after '{tk}'.")
             self.skip_spaces()
-            arg_pos = [self.current_token.line, self.current_token.column]
+            arg_pos = (self.current_token.line, self.current_token.column)
             value = self.parse_expr(scope)
             valid_kinds = ['Identifier', 'ArrayElement', 'StructInstField', 'BinaryExpr'] 
             if value.kind not in valid_kinds:
                 raise SemanticError(f"ArgumentError: Invalid '{tk}' argument.", self.current_token.line)
             self.skip_spaces()
             self.expect(')', f"Expected ')' after '{tk}' arguments.")
-            func_pos_end = [self.current_token.line, self.current_token.column - 1]
+            func_pos_end = (self.current_token.line, self.current_token.column - 1)
             self.skip_spaces()
             return ToNumStmt(value, tk == 'toHp', func_pos_start, func_pos_end)
         elif tk == 'toComms':
-            func_pos_start = [self.current_token.line, self.current_token.column]
+            func_pos_start = (self.current_token.line, self.current_token.column)
             self.current_token = self.get_next_token()  # consume toComms
             self.expect('(', f"Expected '(' after '{tk}'.")
             self.skip_spaces()
-            arg_pos = [self.current_token.line, self.current_token.column]
+            arg_pos = (self.current_token.line, self.current_token.column)
             value = self.parse_expr(scope)
             valid_kinds = ['Identifier', 'ArrayElement', 'StructInstField', 'BinaryExpr'] 
             if value.kind not in valid_kinds:
                 raise SemanticError(f"ArgumentError: Invalid '{tk}' argument.", self.current_token.line)
             self.skip_spaces()
             self.expect(')', f"Expected ')' after '{tk}' arguments.")
-            func_pos_end = [self.current_token.line, self.current_token.column - 1]
+            func_pos_end = (self.current_token.line, self.current_token.column - 1)
             self.skip_spaces()
             return ToCommsStmt(value, func_pos_start, func_pos_end)
         else:
@@ -2014,7 +2005,6 @@ class Semantic:
             self.flank_flag_stack = []
 
         self.flank_flag_stack.append(True)  
-        print(f"flank flag out of flank = {self.flank_flag_stack[-1]}.")
 
         while self.current_token and self.current_token.token == "choice":
             self.current_token = self.get_next_token()  # eat choice
@@ -2067,14 +2057,14 @@ class Semantic:
 
     ########## LOOPS #############
     def parse_for(self,scope) -> ForStmt:
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         self.current_token = self.get_next_token() # eat for
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ForError: Expected variable name after for keyword.", self.current_token.line)
-        init_pos_start = [self.current_token.line, self.current_token.column]
+        init_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         name = Identifier(self.current_token.lexeme, init_pos_start, id_pos_end)
         if not self.lookup_id_type(name.symbol, "a variable", name):
             raise SemanticError(f"NameError: Variable '{name.symbol}' is not defined.", init_pos_start, id_pos_end)
@@ -2094,9 +2084,9 @@ class Semantic:
         self.skip_spaces()
         if not self.current_token or not re.match(r'^id\d+$', self.current_token.token):
                 raise SemanticError("ForError: Expected variable name after loop condition.", self.current_token.line)
-        id_pos_start = [self.current_token.line, self.current_token.column]
+        id_pos_start = (self.current_token.line, self.current_token.column)
         var_name_size = len(self.current_token.lexeme)
-        id_pos_end = [self.current_token.line, self.current_token.column + var_name_size - 1]
+        id_pos_end = (self.current_token.line, self.current_token.column + var_name_size - 1)
         upd_name = Identifier(self.current_token.lexeme, id_pos_start, id_pos_end)
         if not self.lookup_id_type(upd_name.symbol, "a variable", upd_name):
             raise SemanticError(f"NameError: Variable '{upd_name.symbol}' is not defined.", id_pos_start, id_pos_end)
@@ -2117,10 +2107,8 @@ class Semantic:
             self.loop_flag_stack = []
 
         self.loop_flag_stack.append(True)  
-        print(f"loop flag out of loop = {self.loop_flag_stack[-1]}.")
 
         while self.current_token and self.current_token.token != "}":
-            print(f"loop flag in loop = {self.loop_flag_stack[-1]}.")
             stmt = self.parse_stmt(scope)
             body.append(stmt)
             self.skip_whitespace()
@@ -2129,7 +2117,7 @@ class Semantic:
 
 
         self.expect("}", "Expected '}' to close a for loop statement's body.")
-        pos_end = [self.current_token.line, self.current_token.column-1]
+        pos_end = (self.current_token.line, self.current_token.column-1)
         self.skip_whitespace()
         self.pop_scope()
         self.loop_flag_stack.pop()
@@ -2149,10 +2137,8 @@ class Semantic:
             self.loop_flag_stack = []
 
         self.loop_flag_stack.append(True)  
-        print(f"loop flag out of loop = {self.loop_flag_stack[-1]}.")
 
         while self.current_token and self.current_token.token != "}":
-            print(f"loop flag in loop = {self.loop_flag_stack[-1]}.")
             stmt = self.parse_stmt(scope)
             body.append(stmt)
             self.skip_whitespace()
@@ -2177,10 +2163,8 @@ class Semantic:
             self.loop_flag_stack = []
 
         self.loop_flag_stack.append(True)  
-        print(f"loop flag out of loop = {self.loop_flag_stack[-1]}.")
 
         while self.current_token and self.current_token.token != "}":
-            print(f"loop flag in loop = {self.loop_flag_stack[-1]}.")
             stmt = self.parse_stmt(scope)
             body.append(stmt)
             self.skip_whitespace()
@@ -2200,14 +2184,14 @@ class Semantic:
     ########## BUILT-IN FUNCS ###########
     def parse_shoot(self, scope) -> ShootStmt:
         is_Next = False
-        pos_start = [self.current_token.line, self.current_token.column]
+        pos_start = (self.current_token.line, self.current_token.column)
         if self.current_token.token == 'shootNxt':
             is_Next = True
         self.current_token = self.get_next_token() # eat shoot or shootNxt
         self.expect("(", "Expected opening parentheses after shoot keyword.")
         self.skip_spaces()
         if self.current_token.token == ')':
-            pos_end = [self.current_token.line, self.current_token.column]
+            pos_end = (self.current_token.line, self.current_token.column)
             self.expect(")", "Expected closing parentheses in function call.")
             self.skip_spaces()
             self.expect("newline", "Expected 'newline' after every statements.") 
@@ -2215,7 +2199,7 @@ class Semantic:
         value = self.parse_expr(scope)
         self.skip_spaces()
         self.expect(")", "Expected closing parentheses in function call.")
-        pos_end = [self.current_token.line, self.current_token.column-1]
+        pos_end = (self.current_token.line, self.current_token.column-1)
         self.skip_spaces()
         self.expect("newline", "Expected 'newline' after every statements.") 
         return ShootStmt(value, is_Next, pos_start, pos_end)
@@ -2248,7 +2232,7 @@ class Semantic:
             self.expect("]", "Expects ']' to close array row values.")
             self.skip_spaces()
             self.expect(")", "Expects ')' after to close join arguments.")
-            pos_end = [self.current_token.line, self.current_token.column-1]
+            pos_end = (self.current_token.line, self.current_token.column-1)
             self.skip_spaces()
             self.expect("newline", "Expected 'newline' after every statements.") 
             self.skip_whitespace()
@@ -2263,7 +2247,7 @@ class Semantic:
             value = self.parse_expr(scope)
             self.skip_spaces()
             self.expect(")", "Expects ')' after to close join arguments.")
-            pos_end = [self.current_token.line, self.current_token.column-1]
+            pos_end = (self.current_token.line, self.current_token.column-1)
             self.skip_spaces()
             self.expect("newline", "Expected 'newline' after every statements.") 
             self.skip_whitespace()
@@ -2296,7 +2280,7 @@ class Semantic:
         value = self.parse_expr(scope)
         self.skip_spaces()
         self.expect(")", "Expects ')' after to close join arguments.")
-        pos_end = [self.current_token.line, self.current_token.column-1]
+        pos_end = (self.current_token.line, self.current_token.column-1)
         self.skip_spaces()
         self.expect("newline", "Expected 'newline' after every statements.") 
         self.skip_whitespace()
@@ -2323,7 +2307,7 @@ class Semantic:
             index = value
             self.skip_spaces()
         self.expect(")", "Expects ')' after to close drop arguments.")
-        pos_end = [self.current_token.line, self.current_token.column-1]
+        pos_end = (self.current_token.line, self.current_token.column-1)
         self.skip_spaces()
         return DropStmt(name, index, dimensions, pos_start, pos_end)
     
@@ -2355,7 +2339,7 @@ class Semantic:
             index = value
             self.skip_spaces()
         self.expect(")", "Expects ')' after to close drop arguments.")
-        pos_end = [self.current_token.line, self.current_token.column-1]
+        pos_end = (self.current_token.line, self.current_token.column-1)
         self.skip_spaces()
         return DropStmt(arr_name, index, dimensions, pos_start, pos_end, dim)
 
@@ -2387,7 +2371,7 @@ class Semantic:
             self.expect("]", "Expects ']' to close array row values.")
             self.skip_spaces()
             self.expect(")", "Expects ')' after to close seek arguments.")
-            pos_end = [self.current_token.line, self.current_token.column-1]
+            pos_end = (self.current_token.line, self.current_token.column-1)
             self.skip_spaces()
             return SeekStmt(name, values, 2, pos_start, pos_end)
         else:
@@ -2400,7 +2384,7 @@ class Semantic:
             value = self.parse_expr(scope)
             self.skip_spaces()
             self.expect(")", "Expects ')' after to close seek arguments.")
-            pos_end = [self.current_token.line, self.current_token.column-1]
+            pos_end = (self.current_token.line, self.current_token.column-1)
             self.skip_spaces()
             return SeekStmt(name, value, 1, pos_start, pos_end)
         
@@ -2431,33 +2415,36 @@ class Semantic:
         value = self.parse_expr(scope)
         self.skip_spaces()
         self.expect(")", "Expects ')' after to close seek arguments.")
-        pos_end = [self.current_token.line, self.current_token.column-1]
+        pos_end = (self.current_token.line, self.current_token.column-1)
         self.skip_spaces()
         return SeekStmt(arr_name, value, 2, pos_start, pos_end, dim)
 
-def check(fn, text, isRuntime=False):
-    lexer = Lexer(fn, text)
-    if text == "":
-        return "No code in the module."  #, {}
-
-    tokens, error = lexer.make_tokens()
+def check(fn, text, isRuntime=False, backend="closure", cache=None, checker="static", optimize=True):
+    # backend="tree" keeps the plain tree-walking evaluator as a reference
+    # for differential testing against the closure and "vm" backends.
+    # cache: a compile_cache.CompileCache to look the front end result up in
+    # checker="exec" runs the semantic check as the old dry run of the
+    # program instead of typecheck.TypeChecker
+    # optimize=False runs the tree as built, without fold.fold or the
+    # operand types typecheck.annotate tags for the closure and vm backends
+    compilation = Compilation(fn, text, cache=cache)
+    result, error = compilation.front_end()
 
     if error:
-        return 'Lexical errors found, cannot continue with syntax analyzing. Please check lexer tab.\n\nLexical Errors:\n' + "\n\n".join(error)  #, {}
+        return error  #, {}
 
-    result = parse(fn, text)
+    if isRuntime and optimize:
+        removed = fold(result)
+        if trace.optimizer:
+            trace.record("optimizer", f"fold removed {removed} nodes from {fn}")
+        if backend in ("closure", "vm"):
+            annotate(result)
 
-    if result != 'No lexical errors found!\nValid syntax.':
-        result = result.split("\n", 1)[-1]
-        return f'Syntax errors found, cannot continue with semantic analyzing. Please check syntax tab.\n\n{result}'  #, {}
-
-    semantic = Semantic(tokens)
-    result = semantic.produce_ast()
-    #print(result)
-
-    if isinstance(result, SemanticError):
-        result.source_code = text.splitlines()
-        return str(result) 
+    if isRuntime or checker == "exec":
+        if backend in ("closure", "vm"):
+            compile_program(result)
+        if backend == "vm":
+            compile_bytecode(result)
 
     if isRuntime:
         try:
@@ -2469,8 +2456,18 @@ def check(fn, text, isRuntime=False):
         except SemanticError as e:
             e.source_code = text.splitlines()
             return str(e)
+        finally:
+            output.flush()
         
         return "Code Gen successful!"
+    elif checker == "static":
+        try:
+            TypeChecker().check(result)
+        except SemanticError as e:
+            e.source_code = text.splitlines()
+            return str(e)
+
+        return "Semantic analyzing successful, no lexical, syntax, and semantic errors found!"
     else:
         try:
             visitor = ASTVisitor()
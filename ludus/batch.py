@@ -0,0 +1,145 @@
+import csv, io, json, os, time
+import multiprocessing
+from multiprocessing.connection import wait
+
+# Batch runner for grading: every .lds file in a folder runs in its own
+# process (so interpreter.py's module-level input/run state starts fresh),
+# up to `jobs` at a time, each under a wall-clock timeout and, where the OS
+# supports it, a CPU-time limit.
+#
+# For a program `name.lds`, `name.in` next to it (if any) is fed to
+# load/loadNum and `name.out` (if any) is compared to its shoot output.
+
+REPORT_FIELDS = ["file", "status", "exit_code", "time", "output", "error", "expected"]
+
+def find_programs(folder):
+    paths = []
+    for root, _, files in os.walk(folder):
+        for name in files:
+            if name.endswith(".lds"):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+def read_optional(path):
+    if os.path.exists(path):
+        # a stray byte in an .in/.out file must not stop the whole batch
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            return file.read()
+    return None
+
+def limit_cpu(seconds):
+    try:
+        import resource
+    except ImportError:     # not available on Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    limit = int(seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+
+def worker(conn, path, input_text, backend, cpu_limit, cache_dir):
+    from .__main__ import run_file
+    cache = None
+    if cpu_limit:
+        limit_cpu(cpu_limit)
+    if cache_dir:
+        from .compile_cache import CompileCache
+        cache = CompileCache(cache_dir)
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    start = time.perf_counter()
+    code = run_file(path, backend, io.StringIO(input_text or ""), stdout, stderr, cache)
+    conn.send({
+        "exit_code": code,
+        "time": time.perf_counter() - start,
+        "output": stdout.getvalue(),
+        "error": stderr.getvalue(),
+    })
+    conn.close()
+
+def make_result(path, status, exit_code=None, elapsed=0.0, out="", error="", expected=None):
+    return {
+        "file": path,
+        "status": status,
+        "exit_code": exit_code,
+        "time": round(elapsed, 4),
+        "output": out,
+        "error": error,
+        "expected": expected,
+    }
+
+def finish(path, data, expected):
+    if data["exit_code"] != 0:
+        status = "error"
+    elif expected is None:
+        status = "ok"
+    elif data["output"] == expected:
+        status = "pass"
+    else:
+        status = "fail"
+    return make_result(path, status, data["exit_code"], data["time"], data["output"], data["error"], expected)
+
+def run_batch(paths, jobs=None, timeout=10.0, cpu_limit=None, backend="closure", cache_dir=None):
+    jobs = jobs or os.cpu_count() or 1
+    if cpu_limit is None:
+        cpu_limit = timeout
+    results = {}
+    pending = list(paths)
+    running = {}    # connection -> (process, path, expected, deadline, started)
+
+    while pending or running:
+        while pending and len(running) < jobs:
+            path = pending.pop(0)
+            base = os.path.splitext(path)[0]
+            input_text = read_optional(base + ".in")
+            expected = read_optional(base + ".out")
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=worker, args=(sender, path, input_text, backend, cpu_limit, cache_dir), daemon=True)
+            started = time.perf_counter()
+            process.start()
+            sender.close()
+            running[receiver] = (process, path, expected, started + timeout, started)
+
+        now = time.perf_counter()
+        next_deadline = min(entry[3] for entry in running.values())
+        for conn in wait(list(running), timeout=max(0.0, next_deadline - now)):
+            process, path, expected, _, started = running.pop(conn)
+            try:
+                data = conn.recv()
+            except EOFError:
+                # killed by the CPU limit or crashed before reporting back
+                process.join()
+                status = "cpu-limit" if process.exitcode is not None and process.exitcode < 0 else "crash"
+                results[path] = make_result(path, status, process.exitcode, time.perf_counter() - started, expected=expected)
+            else:
+                process.join()
+                results[path] = finish(path, data, expected)
+            conn.close()
+
+        now = time.perf_counter()
+        for conn, (process, path, expected, deadline, started) in list(running.items()):
+            if now >= deadline:
+                process.kill()
+                process.join()
+                conn.close()
+                del running[conn]
+                results[path] = make_result(path, "timeout", None, now - started, expected=expected)
+
+    return [results[path] for path in paths]
+
+def write_report(results, stream, fmt="json"):
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result)
+    else:
+        json.dump(results, stream, indent=2)
+        stream.write("\n")
+
+def summary(results):
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    return ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
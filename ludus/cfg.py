@@ -363,7 +363,6 @@ def compute_predict_set(cfg, first_set, follow_set):
 #     for i, item in enumerate(productions):
 #         print(f"{non_terminal} -> {productions[i]}")
 
-first_set = compute_first_set(cfg)
 # print("First Sets:")
 # for non_terminal, first in first_set.items():
 #     print(f"{first}")
@@ -378,13 +377,10 @@ first_set = compute_first_set(cfg)
 # unique_terminals = sorted(terminals)
 # print(unique_terminals)
 
-follow_set = compute_follow_set(cfg, "<program>", first_set)
 # print("\nFollow Sets:")
 # for non_terminal, follow in follow_set.items():
 #     print(f"{follow}")
 
-predict_set = compute_predict_set(cfg, first_set, follow_set)
-
 def display_predict_sets(predict_set):
     print("\nPredict Sets:")
     for (non_terminal, production), predict in predict_set.items():
@@ -393,7 +389,7 @@ def display_predict_sets(predict_set):
 
 # display_predict_sets(predict_set)
 
-def gen_parse_table():
+def gen_parse_table(predict_set):
     parse_table = {}
     for (non_terminal, production), predict in predict_set.items():
         if non_terminal not in parse_table:
@@ -402,8 +398,18 @@ def gen_parse_table():
             parse_table[non_terminal][terminal] = production
 
     return parse_table
-        
-parse_table = gen_parse_table()
+
+def __getattr__(name):
+    # the sets and string-keyed parse table are built on first use; the
+    # parser loads the precompiled ludus/ll1_table.py instead
+    if name not in ("first_set", "follow_set", "predict_set", "parse_table"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tables = globals()
+    tables["first_set"] = compute_first_set(cfg)
+    tables["follow_set"] = compute_follow_set(cfg, "<program>", tables["first_set"])
+    tables["predict_set"] = compute_predict_set(cfg, tables["first_set"], tables["follow_set"])
+    tables["parse_table"] = gen_parse_table(tables["predict_set"])
+    return tables[name]
 
 def save_parse_table(parse_table, filename="parse_table.txt"):
     with open(filename, "w", encoding="utf-8") as file:  
@@ -0,0 +1,113 @@
+import hashlib, os, pickle, sys, tempfile, zlib
+
+# On-disk cache of front end results. The Program that Semantic.produce_ast
+# builds for a source text is pickled, zlib-compressed and stored under a
+# hash of the text and of the compiler's own sources, so a rerun of an
+# unchanged file (or the same starter code in a batch) skips lexing,
+# parsing and AST building, and an edited compiler never reads a tree an
+# older one wrote. A hit touches the entry's mtime and stores evict the
+# least recently used entries once the directory outgrows its limit.
+# Failures to read or write the cache only ever cost the cache.
+
+MAGIC = b"LDSAST1\n"
+SUFFIX = ".ast"
+DEFAULT_LIMIT = 64 << 20    # bytes
+
+_compiler_version = None
+
+def default_directory():
+    if os.environ.get("LUDUS_CACHE_DIR"):
+        return os.environ["LUDUS_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "ludus")
+
+def compiler_version():
+    # hash of the Python version and the ludus/*.py sources the front end
+    # and the AST classes come from
+    global _compiler_version
+    if _compiler_version is None:
+        digest = hashlib.sha256(f"{sys.version_info[0]}.{sys.version_info[1]}".encode("ascii"))
+        package = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(package)):
+            if name.endswith(".py"):
+                digest.update(name.encode("utf-8"))
+                with open(os.path.join(package, name), "rb") as file:
+                    digest.update(file.read())
+        _compiler_version = digest.digest()
+    return _compiler_version
+
+class CompileCache:
+    def __init__(self, directory=None, limit=DEFAULT_LIMIT):
+        self.directory = directory or default_directory()
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, text):
+        digest = hashlib.sha256(compiler_version())
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return os.path.join(self.directory, digest.hexdigest() + SUFFIX)
+
+    def load(self, text):
+        # the cached Program for text, or None
+        path = self.path(text)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except OSError:
+            self.misses += 1
+            return None
+        try:
+            if not data.startswith(MAGIC):
+                raise ValueError("not a ludus cache entry")
+            program = pickle.loads(zlib.decompress(data[len(MAGIC):]))
+        except Exception:
+            # truncated, or written by a build whose classes no longer load
+            self.remove(path)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return program
+
+    def store(self, text, program):
+        # program has to be stored before the runtime lowers it, closures
+        # and bytecode don't pickle
+        data = MAGIC + zlib.compress(pickle.dumps(program, pickle.HIGHEST_PROTOCOL))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # written to a temporary file and renamed, graders store from
+            # several processes at once
+            fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temporary, self.path(text))
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith(SUFFIX):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.limit:
+                break
+            self.remove(path)
+            total -= size
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
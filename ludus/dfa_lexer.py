@@ -0,0 +1,123 @@
+from .lexer import *
+
+# Table-driven replacement for Lexer.lex_word. The nested keyword branches
+# only ever consume letters, digits and '_', so a word is the longest such run;
+# a DFA built from KEYWORDS walks it and the final state says whether the run
+# is a keyword (and which delimiters may follow it) or an identifier.
+
+WORD_CHARS = ALPHANUM + '_'
+MAX_ID_LEN = 30
+
+# keyword -> valid delimiters, as in the nested branches of Lexer.lex_word
+KEYWORDS = {
+    'AND': ' ',
+    'OR': ' ',
+    'access': ' ',
+    'backup': ':',
+    'build': ' ',
+    'checkpoint': whitespace,
+    'choice': ' ',
+    'comms': ' ',
+    'dead': delim1,
+    'drop': '(',
+    'elif': ' ',
+    'else': delim2,
+    'false': flag_delim,
+    'flag': ' ',
+    'flank': ' ',
+    'for': ' ',
+    'gameOver': whitespace,
+    'generate': ' ',
+    'grind': delim2,
+    'hp': ' ',
+    'if': ' ',
+    'immo': ' ',
+    'join': '(',
+    'levelDown': '(',
+    'levelUp': '(',
+    'load': '(',
+    'loadNum': '(',
+    'play': '(',
+    'recall': ' ',
+    'resume': whitespace,
+    'rounds': '(',
+    'seek': '(',
+    'shoot': '(',
+    'shootNxt': '(',
+    'toComms': '(',
+    'toHp': '(',
+    'toXp': '(',
+    'true': flag_delim,
+    'void': whitespace,
+    'while': ' ',
+    'wipe': '(',
+    'xp': ' ',
+}
+
+def build_tables(keywords):
+    # character classes: one per character used in a keyword, plus one shared
+    # class (0) for every other word character
+    char_class = {char: 0 for char in WORD_CHARS}
+    for word in keywords:
+        for char in word:
+            if char_class[char] == 0:
+                char_class[char] = max(char_class.values()) + 1
+    classes = max(char_class.values()) + 1
+
+    # state 0 is the dead "plain identifier" state, state 1 the start state
+    transitions = [[0] * classes, [0] * classes]
+    accept = [None, None]
+    for word, delims in keywords.items():
+        state = 1
+        for char in word:
+            cls = char_class[char]
+            if transitions[state][cls] == 0:
+                transitions.append([0] * classes)
+                accept.append(None)
+                transitions[state][cls] = len(transitions) - 1
+            state = transitions[state][cls]
+        accept[state] = (word, delims)
+    return char_class, transitions, accept
+
+CHAR_CLASS, TRANSITIONS, ACCEPT = build_tables(KEYWORDS)
+
+class DFALexer(Lexer):
+    def jump(self, idx):
+        # moves over word characters only, so no tab or newline bookkeeping
+        self.pos.col += idx - self.pos.idx
+        self.pos.idx = idx
+        self.prev_char = self.text[idx - 1]
+        self.current_char = self.text[idx] if idx < len(self.text) else None
+
+    def lex_word(self, cur_ln, cur_col, errors, tokens):
+        text = self.text
+        start = self.pos.idx
+        end = len(text)
+        idx = start
+        state = 1
+        char_class = CHAR_CLASS
+        transitions = TRANSITIONS
+        while idx < end:
+            cls = char_class.get(text[idx])
+            if cls is None:
+                break
+            state = transitions[state][cls]
+            idx += 1
+
+        keyword = ACCEPT[state]
+        if keyword is not None:
+            self.jump(idx)
+            self.process_token(cur_ln, cur_col, keyword[0], keyword[0], keyword[1], errors, tokens)
+            return
+
+        if idx - start > MAX_ID_LEN:
+            while idx < end and text[idx] not in id_delim:
+                idx += 1
+            self.jump(idx)
+            id_str = text[start:idx]
+            errors.append(f"Lexical Error: Maximum number characters reached in '{id_str}' at line {self.pos.ln + 1}, column {self.pos.col - len(id_str) + 1}")
+            return
+
+        self.jump(idx)
+        id_str = text[start:idx]
+        self.process_token(cur_ln, cur_col, id_str, self.identifiers(id_str), id_delim, errors, tokens)
@@ -0,0 +1,270 @@
+from .nodes import *
+from .runtime.interpreter import binary_op, unary_op, format_placeholder
+
+# Constant folding over the finished AST, run by check() before a program is
+# lowered for the runtime. Literal subexpressions are computed once with the
+# evaluator's own binary_op/unary_op/format_placeholder and replaced by a
+# literal at the same position. Anything those raise on (division by zero,
+# mixed types, a placeholder over 10 digits) is left in the tree, so the
+# error still comes from the run, where it always did. `!!e` and `--e` drop
+# to e when e can only be a flag or a number. An if/elif whose condition is
+# a constant false is dropped, and one that is constant true makes the
+# branches after it unreachable; because every condition of an if is
+# evaluated before a branch is chosen, later branches are only dropped when
+# their conditions are constants too. A while that is constant false and a
+# flank over a constant are cut down the same way. Bodies declaring arrays
+# or structs are never dropped, ASTVisitor checks those before anything runs.
+# fold(program) returns the number of nodes removed.
+
+LITERALS = {'HpLiteral', 'XpLiteral', 'CommsLiteral', 'FlagLiteral'}
+RELATIONAL = {'<', '>', '<=', '>=', '==', '!='}
+LOGICAL = {'AND', 'OR', '&&', '||'}
+ARITHMETIC = {'-', '*', '/', '%', '^'}      # no '+', comms concatenate
+DECLARATIONS = {'ArrayDec', 'StructDec'}   # checked by ASTVisitor in every branch
+RESUME = {'ResumeStmt'}
+STATEMENTS = {'IfStmt': 'if_stmt', 'FlankStmt': 'flank', 'GrindWhileStmt': 'while_stmt'}
+MAX_EXPONENT = 64       # larger powers are left to the run, which may never reach them
+
+def literal(value, node):
+    # a literal for value at node's position, None for values no literal holds
+    pos_start, pos_end = node.pos_start, node.pos_end
+    if isinstance(value, bool):
+        return FlagLiteral(value, pos_start, pos_end)
+    if isinstance(value, int):
+        return HpLiteral(value, pos_start, pos_end)
+    if isinstance(value, float):
+        return XpLiteral(value, pos_start, pos_end)
+    if isinstance(value, str):
+        return CommsLiteral(value, pos_start, pos_end)
+    return None
+
+def size(node):
+    # number of nodes in a subtree, or in a list of them
+    count = 0
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Stmt):
+            count += 1
+            stack.extend(item.field_values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return count
+
+def contains(node, kinds):
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Stmt):
+            if item.kind in kinds:
+                return True
+            stack.extend(item.field_values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return False
+
+def declares(body):
+    return contains(body, DECLARATIONS)
+
+def is_flag(node):
+    if node.kind in ('FlagLiteral', 'ChainRelatExpr'):
+        return True
+    if node.kind == 'BinaryExpr':
+        return node.operator in RELATIONAL or node.operator in LOGICAL
+    return node.kind == 'UnaryExpr' and node.operator == '!'
+
+def is_number(node):
+    if node.kind in ('HpLiteral', 'XpLiteral'):
+        return True
+    return node.kind == 'BinaryExpr' and node.operator in ARITHMETIC
+
+def constant_flag(node):
+    return node.kind == 'FlagLiteral'
+
+class Folder:
+    def __init__(self):
+        self.removed = 0
+
+    def fold(self, program):
+        self.visit(program)
+        return self.removed
+
+    def replace(self, node, value):
+        new = literal(value, node)
+        if new is None:
+            return node
+        self.removed += size(node) - 1
+        return new
+
+    def visit(self, node):
+        # folds node's children in place and returns what replaces node,
+        # None for a statement that is removed
+        if node.kind == 'ChainRelatExpr':
+            # the tree-walker evaluates chain members as BinaryExprs, they
+            # only fold together
+            for expr in node.expressions:
+                expr.left = self.visit(expr.left)
+                expr.right = self.visit(expr.right)
+            return self.chain(node)
+
+        for key, value in zip(node.fields, node.field_values()):
+            if key == 'recall_stmts':
+                continue    # the same RecallStmts as in the body
+            if isinstance(value, Stmt):
+                setattr(node, key, self.visit(value))
+            elif isinstance(value, list):
+                setattr(node, key, self.visit_list(value))
+
+        kind = node.kind
+        if kind in STATEMENTS:
+            before = size(node)
+            new = getattr(self, STATEMENTS[kind])(node)
+            self.removed += before - size(new)
+            return new
+        if kind == 'BinaryExpr':
+            return self.binary(node)
+        if kind == 'UnaryExpr':
+            return self.unary(node)
+        if kind == 'FormCommsLiteral':
+            return self.formatted(node)
+        if kind == 'XpFormatting':
+            return self.xp_format(node)
+        return node
+
+    def visit_list(self, items):
+        result = []
+        for item in items:
+            if isinstance(item, Stmt):
+                item = self.visit(item)
+                if item is None:
+                    continue
+            elif isinstance(item, list):
+                item = self.visit_list(item)
+            result.append(item)
+        return result
+
+    ###### EXPRESSIONS #########
+    def binary(self, node):
+        left, right = node.left, node.right
+        if left.kind not in LITERALS or right.kind not in LITERALS:
+            return node
+        if node.operator == '^' and isinstance(right.value, (int, float)) and abs(right.value) > MAX_EXPONENT:
+            return node
+        if node.operator == '+' and isinstance(left.value, str) and isinstance(right.value, str):
+            return self.replace(node, left.value + right.value)
+        try:
+            value = binary_op(node, left.value, right.value)
+        except Exception:
+            return node
+        return self.replace(node, value)
+
+    def unary(self, node):
+        operand = node.operand
+        if operand.kind in LITERALS:
+            try:
+                value = unary_op(node, operand.value)
+            except Exception:
+                return node
+            return self.replace(node, value)
+        if operand.kind == 'UnaryExpr' and operand.operator == node.operator:
+            inner = operand.operand
+            if (node.operator == '!' and is_flag(inner)) or (node.operator == '-' and is_number(inner)):
+                self.removed += 2
+                return inner
+        return node
+
+    def chain(self, node):
+        for expr in node.expressions:
+            if expr.left.kind not in LITERALS or expr.right.kind not in LITERALS:
+                return node
+            try:
+                value = binary_op(expr, expr.left.value, expr.right.value)
+            except Exception:
+                return node
+            if not value:
+                return self.replace(node, False)
+        return self.replace(node, True)
+
+    def formatted(self, node):
+        expressions = []
+        for expr in node.expressions:
+            if expr.kind in LITERALS and expr.kind != 'CommsLiteral':
+                # what the placeholder prints, format_placeholder leaves comms as they are
+                try:
+                    expr = CommsLiteral(str(format_placeholder(expr.value, expr)), expr.pos_start, expr.pos_end)
+                except Exception:
+                    pass
+            expressions.append(expr)
+        node.expressions = expressions
+        if any(expr.kind != 'CommsLiteral' for expr in expressions):
+            return node
+        formatted = node.value
+        for placeholder, expr in zip(node.placeholders, expressions):
+            formatted = formatted.replace(f"{{{placeholder}}}", expr.value, 1)
+        return self.replace(node, formatted)
+
+    def xp_format(self, node):
+        if node.lhs.kind != 'XpLiteral':
+            return node
+        return self.replace(node, f"{node.lhs.value:.{node.digits}f}")
+
+    ###### STATEMENTS #########
+    def if_stmt(self, node):
+        branches = [(node.condition, node.then_branch)]
+        branches += [(branch.condition, branch.body) for branch in node.elif_branches or []]
+        else_branch = node.else_branch
+
+        kept = []
+        taken = False
+        for condition, body in branches:
+            constant = constant_flag(condition)
+            if taken or (constant and condition.value is False):
+                # never taken, but a condition that isn't constant still runs
+                if declares(body):
+                    kept.append((condition, body))
+                elif not constant:
+                    kept.append((condition, []))
+                continue
+            kept.append((condition, body))
+            taken = constant and condition.value is True
+        if taken and else_branch is not None and not declares(else_branch):
+            else_branch = None
+
+        if not kept:
+            if else_branch is None:
+                return None
+            # only the else is left, it still runs in a block of its own
+            return IfStmt(FlagLiteral(True), else_branch)
+        condition, body = kept[0]
+        elifs = [ElifStmt(cond, branch_body) for cond, branch_body in kept[1:]]
+        return IfStmt(condition, body, elifs or None, else_branch)
+
+    def flank(self, node):
+        if node.expression.kind not in LITERALS:
+            return node
+        subject = node.expression.value
+        for choice in node.choices:
+            for value in choice.values:
+                if value.kind not in LITERALS:
+                    return node
+                if value.value == subject:
+                    # a resume in the taken choice goes on to the next ones
+                    others = [other.body for other in node.choices if other is not choice]
+                    if contains(choice.body, RESUME) or declares(others) or declares(node.backup_body):
+                        return node
+                    node.choices = [choice]
+                    node.backup_body = []
+                    return node
+        if declares([choice.body for choice in node.choices]):
+            return node
+        node.choices = []
+        return node
+
+    def while_stmt(self, node):
+        condition = node.condition
+        if node.is_grind or not constant_flag(condition) or condition.value is not False or declares(node.body):
+            return node
+        return None
+
+def fold(program):
+    return Folder().fold(program)
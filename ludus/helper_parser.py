@@ -68,7 +68,8 @@ class Helper:
         return None
     
     def skip_spaces(self):
-        while self.current_token and self.current_token.token == "space":
+        if self.current_token and self.current_token.token == "space":
+            self.current_token_index = self.tokens.next_solid(self.current_token_index)
             self.current_token = self.get_next_token()
     
     def expect(self, token_type, error_message):
@@ -78,29 +79,15 @@ class Helper:
             raise SemanticError(f"ParserError: {error_message}", self.start, self.end)
         
     def look_ahead(self):
-        la_token_index = self.current_token_index 
-        while la_token_index < len(self.tokens):
-            la_token = self.tokens[la_token_index]
-            if la_token.token != "space": 
-                return la_token
-            la_token_index += 1  
-
+        la_token_index = self.tokens.next_solid(self.current_token_index)
+        if la_token_index < len(self.tokens):
+            return self.tokens[la_token_index]
         return None  
     
     def find_token_in_line(self, target_token):
-        la_token_index = self.current_token_index
-
-        while la_token_index < len(self.tokens):
-            la_token = self.tokens[la_token_index]
-
-            if la_token.token == target_token:
-                return la_token
-
-            if la_token.token in {':', 'newline', 'EOF'}:  
-                break
-
-            la_token_index += 1
-
+        la_token_index = self.tokens.find_in_line(self.current_token_index, target_token)
+        if la_token_index >= 0:
+            return self.tokens[la_token_index]
         return None
     
     def parse_expr(self, scope) -> Expr:
@@ -108,7 +95,6 @@ class Helper:
         expr = self.parse_or_expr(scope)
         if self.current_token and self.current_token.token not in [')', ']']:
             raise SemanticError(f"ParserError: Unexpected token found during parsing: {self.current_token.token}", self.start, self.end)
-        print(expr)
         return expr
     
     def parse_or_expr(self, scope) -> Expr:
@@ -0,0 +1,266 @@
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from operator import add
+from .lexer import TokenStore, TT_EOF, TT_NEWLINE
+from .regex_lexer import RegexLexer
+from .parser import Parser
+from .pipeline import LEXICAL_ERROR_MSG
+
+# Incremental front end for the editor. A Document keeps the token stream,
+# lexical errors and LL(1) parser checkpoints of the last text it saw. An
+# edit re-lexes from the line before it until the new scan ends a line at
+# the same place as the old one did (so everything after it is unchanged
+# and only moves), and the syntax check restarts from the parser state
+# saved at the last line start before the edit, stopping as soon as it
+# reaches a later line start in the same state as before. The check goes on
+# past syntax errors in panic mode, so the states after an error are saved
+# too and every error in the text is reported.
+
+def find_edit(old, new):
+    # (offset, removed, inserted) of a single edit turning old into new
+    limit = min(len(old), len(new))
+    start = 0
+    for step in (4096, 64, 1):
+        while start + step <= limit and old[start:start + step] == new[start:start + step]:
+            start += step
+    limit -= start
+    end = 0
+    for step in (4096, 64, 1):
+        while end + step <= limit and old[len(old) - end - step:len(old) - end] == new[len(new) - end - step:len(new) - end]:
+            end += step
+    return start, len(old) - end - start, new[start:len(new) - end]
+
+class Document:
+    def __init__(self, fn, text=""):
+        self.fn = fn
+        self.load(text)
+
+    def load(self, text):
+        # lexes the whole text and forgets all parser state
+        self.text = text
+        self.checkpoints = None     # token index -> parser state, from the last parse
+        self.dirty = None           # [lo, hi) token range edited since the last parse
+        self.syntax_result = None
+        self.failures = []          # syntax errors of the last parse, as Parser.failures
+        self.ending = None          # Parser.ending of the last parse
+        self.terminals = []         # kind id -> grammar terminal, kept across parses
+        if text == "":
+            self.tokens = TokenStore(text)
+            self.errors = ["No code in the module."]
+            self.error_starts = [0]
+            lexer = None
+        else:
+            lexer = RegexLexer(self.fn, text)
+            self.tokens, self.errors = lexer.make_tokens()
+            self.error_starts = lexer.error_starts
+        # identifier_tokens maps each name to the id token its kind has in
+        # the store; new names take fresh numbers from next_id until
+        # renumber_identifiers() numbers them by first appearance again
+        self.identifier_tokens = lexer.identifier_map if lexer else {}
+        self.identifier_order = list(self.identifier_tokens)
+        self.identifier_starts = array('i', [lexer.identifier_starts[name] for name in self.identifier_order])
+        self.identifier_positions = dict(zip(self.identifier_order, range(len(self.identifier_order))))
+        self.next_id = len(self.identifier_order) + 1
+        self.renumbered = True
+
+    def update(self, text):
+        # takes the full editor text and applies it as one edit
+        if text != self.text:
+            if self.text == "" or text == "":
+                self.load(text)
+            else:
+                self.edit(*find_edit(self.text, text))
+
+    def lexical(self):
+        # the tokens and lexical errors a full lex of the text would give
+        if not self.renumbered:
+            self.renumber_identifiers()
+        return self.tokens, self.errors
+
+    def edit(self, offset, removed, inserted):
+        old_text = self.text
+        text = old_text[:offset] + inserted + old_text[offset + removed:]
+        if old_text == "" or text == "":
+            return self.load(text)
+        tokens = self.tokens
+        kinds = tokens.kinds
+        newline = tokens.kind_ids.get(TT_NEWLINE)
+        delta = len(inserted) - removed
+        line_delta = inserted.count('\n') - old_text.count('\n', offset, offset + removed)
+        edit_end = offset + len(inserted)
+
+        # restart after the last newline token that ends before the edit
+        first = tokens.index_at(offset)
+        while first > 0 and not (kinds[first - 1] == newline and tokens.span(first - 1)[1] < offset):
+            first -= 1
+        restart = tokens.span(first - 1)[1] if first > 0 else 0
+
+        lexer = RegexLexer(self.fn, text)
+        lexer.identifier_map = self.identifier_tokens
+        lexer.current_id = self.next_id
+        segment = TokenStore(text, kinds_from=tokens)
+        errors = []
+        tail = []   # [old index, old offset] where the old tokens take over
+
+        def resync(end):
+            if end < edit_end or end >= len(text):
+                return False
+            old_end = end - delta
+            index = tokens.index_at(old_end)
+            if kinds[index - 1] != newline or tokens.span(index - 1)[1] != old_end:
+                return False
+            if line_delta and self.error_starts and self.error_starts[-1] >= old_end:
+                return False    # error messages after this point name their lines
+            tail.extend((index, old_end))
+            return True
+
+        _, last = lexer.scan(segment, errors, restart, resync)
+        if tail:
+            last_index, old_stop = tail
+        else:
+            ln, col = lexer.line_col(last)
+            segment.add(TT_EOF, TT_EOF, ln + 1, col + 1, len(text), len(text))
+            last_index, old_stop = len(tokens), len(old_text) + 1
+
+        tokens.splice(first, last_index, segment, delta, line_delta)
+        self.next_id = lexer.current_id
+        if self.update_identifiers(lexer, restart, old_stop, delta, first + len(segment)):
+            return self.load(text)
+
+        kept = [i for i, start in enumerate(self.error_starts) if start < restart]
+        moved = [i for i, start in enumerate(self.error_starts) if start >= old_stop]
+        self.errors = [self.errors[i] for i in kept] + errors + [self.errors[i] for i in moved]
+        self.error_starts = [self.error_starts[i] for i in kept] + lexer.error_starts + [self.error_starts[i] + delta for i in moved]
+        self.text = text
+        self.mark_dirty(first, last_index, len(segment))
+
+    def update_identifiers(self, lexer, restart, old_stop, delta, tail_index):
+        # a full lex numbers ids by first appearance. identifier_order lists
+        # the names in that order and identifier_starts the offsets they
+        # were first seen at, so the names first seen in the replaced text
+        # are one slice of both. Returns True if the edit needs a full re-lex
+        # instead.
+        order, starts, positions = self.identifier_order, self.identifier_starts, self.identifier_positions
+        lo = bisect_left(starts, restart)
+        hi = bisect_left(starts, old_stop)
+        first_seen = [name for name in lexer.identifier_starts if positions.get(name, lo) >= lo]
+        region = array('i', [lexer.identifier_starts[name] for name in first_seen])
+        later_starts = array('i', map(add, starts[hi:], repeat(delta, len(starts) - hi)))
+        if first_seen == order[lo:hi]:
+            self.identifier_starts = starts[:lo] + region + later_starts
+            return False
+
+        # names first seen in the tail that now show up earlier move up, and
+        # names that were first seen in the replaced text but are no longer
+        # in it move down to their first use in the tail
+        lost = [name for name in order[lo:hi] if name not in lexer.identifier_starts]
+        if lost and self.error_starts and self.error_starts[-1] >= old_stop:
+            return True     # the name may sit in a token that failed its delimiter
+        later = order[hi:]
+        for position in sorted((positions[name] - hi for name in first_seen if positions.get(name, -1) >= hi), reverse=True):
+            del later[position], later_starts[position]
+        tokens = self.tokens
+        for name in lost:
+            kind = tokens.kind_ids.get(self.identifier_tokens[name])
+            if kind is None or kind not in tokens.kinds[tail_index:]:
+                continue
+            start = tokens.span(tokens.kinds.index(kind, tail_index))[0]
+            position = bisect_left(later_starts, start)
+            later.insert(position, name)
+            later_starts.insert(position, start)
+
+        self.identifier_order = order = order[:lo] + first_seen + later
+        self.identifier_starts = starts[:lo] + region + later_starts
+        self.identifier_positions = dict(zip(order, range(len(order))))
+        self.renumbered = False
+        return False
+
+    def renumber_identifiers(self):
+        # gives every id kind in the store its number by first appearance;
+        # kinds of names that no longer occur are renamed to ''
+        identifier_tokens = {name: f'id{number}' for number, name in enumerate(self.identifier_order, 1)}
+        kind_names = self.tokens.kind_names
+        kind_ids = self.tokens.kind_ids
+        for name, token in self.identifier_tokens.items():
+            kind = kind_ids.get(token)
+            if kind is not None:
+                kind_names[kind] = identifier_tokens.get(name, '')
+        kind_ids.clear()
+        kind_ids.update((token, kind) for kind, token in enumerate(kind_names) if token)
+        self.identifier_tokens = identifier_tokens
+        self.next_id = len(identifier_tokens) + 1
+        self.renumbered = True
+
+    def mark_dirty(self, first, last, count):
+        moved = first + count - last
+        self.syntax_result = None
+        if self.checkpoints is None:
+            return
+        if self.dirty is None:
+            lo, hi = first, first + count
+        else:
+            lo, hi = self.dirty
+            hi = hi + moved if hi >= last else max(hi, first)
+            lo, hi = min(lo, first), max(hi, first + count)
+        self.dirty = [lo, hi]
+        if moved:
+            self.checkpoints = {index if index < first else index + moved: state
+                                for index, state in self.checkpoints.items() if index < first or index >= last}
+        else:
+            for index in range(first, last):
+                self.checkpoints.pop(index, None)
+        self.failures = [failure if failure[0] < first else (failure[0] + moved,) + failure[1:]
+                         for failure in self.failures if failure[0] < first or failure[0] >= last]
+
+    def syntax(self):
+        # the LL(1) check result for the current text, every syntax error in
+        # it as Parser.parser() reports them with failures collected
+        if self.syntax_result is not None:
+            return self.syntax_result
+        parser = Parser(self.tokens, self.text, self.terminals)
+        parser.failures = []
+        resume = None
+        checkpoints = self.checkpoints
+        if checkpoints is None:
+            checkpoints = {}
+        elif self.dirty is not None:
+            lo, hi = self.dirty
+            # the parser states before the edit still hold, so restart from
+            # the last line start at or before it
+            index = lo
+            while index > 0 and index not in checkpoints:
+                index -= 1
+            if index in checkpoints:
+                resume = (index, checkpoints[index])
+
+            def resync(index, state):
+                return index >= hi and checkpoints.get(index) == state
+            parser.resync = resync
+        parser.checkpoints = checkpoints
+
+        parser.parser(resume)
+        start = resume[0] if resume is not None else 0
+        failures = [failure for failure in self.failures if failure[0] < start] + parser.failures
+        if parser.resynced_at is not None:
+            # reached a line start in the same state as the last parse, the
+            # rest of it holds
+            failures += [failure for failure in self.failures if failure[0] >= parser.resynced_at]
+        else:
+            self.ending = parser.ending
+            # states past where this parse ended are left over from an older one
+            for index in [index for index in checkpoints if index > parser.end]:
+                del checkpoints[index]
+        self.checkpoints = checkpoints
+        self.failures = failures
+        self.dirty = None
+        self.syntax_result = parser.report(failures) if failures else self.ending
+        return self.syntax_result
+
+    def syntax_report(self):
+        # same text as parser.parse(..., recover=True) for the GUI's syntax tab
+        if self.text == "":
+            return "No code in the module."
+        if self.errors:
+            return LEXICAL_ERROR_MSG + "\n\n".join(self.errors)
+        return f"No lexical errors found!\n{self.syntax()}"
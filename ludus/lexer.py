@@ -1,4 +1,6 @@
 import string
+from array import array
+from bisect import bisect_left
 
 ### CONSTANTS ###
 
@@ -149,6 +151,228 @@ class Token:
     def __repr__(self):
         return f'{self.lexeme}:{self.token}'
 
+# Columnar token list filled by the lexers. Token kinds are interned to small
+# ints and every token keeps its source span, line and column in parallel
+# array columns. A lexeme that is a plain slice of the source is read from
+# the span, newline and space runs always read '\\n' and ' ', and the few
+# others (unescaped strings, normalized numbers, EOF) go in a side dict.
+# Indexing or iterating builds a Token on demand; the parsers scan the kind
+# column directly.
+#
+# splice() lets ludus/incremental.py swap re-lexed tokens in. Moving the
+# tokens after an edit is recorded in `shifts` instead of rewriting their
+# spans and lines, and folded back in by compact().
+#
+# The AST builder looks ahead from the current token all the time: the
+# next token that isn't a space, and whether a keyword comes up before the
+# statement ends at a ':', newline or EOF. lookahead() builds an index for
+# both on first use, the next non-space index and the next stop index for
+# every position plus the sorted positions of each kind asked for, so a
+# lookahead is an array read or a bisect instead of a scan to the end of
+# the line. Appending tokens, pop() and splice() drop it.
+
+MAX_SHIFTS = 32
+FIXED_LEXEMES = {TT_NEWLINE: '\\n', TT_SPACE: ' '}
+LINE_STOPS = (TT_COLON, TT_NEWLINE, TT_EOF)
+
+class TokenStore:
+    def __init__(self, text, kinds_from=None):
+        self.text = text
+        if kinds_from is None:
+            self.kind_names = []    # kind id -> token type
+            self.kind_ids = {}
+        else:
+            # share the kind table so kind ids can be spliced between stores
+            self.kind_names = kinds_from.kind_names
+            self.kind_ids = kinds_from.kind_ids
+        self.kinds = array('I')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.lines = array('i')
+        self.columns = array('i')
+        self.lexemes = {}       # index -> lexeme that isn't a source slice
+        self.shifts = []        # (index, offset delta, line delta), by index
+        self.index = None       # (next solid, next stop, positions by kind), see lookahead()
+
+    def kind_id(self, token):
+        kind = self.kind_ids.get(token)
+        if kind is None:
+            kind = self.kind_ids[token] = len(self.kind_names)
+            self.kind_names.append(token)
+        return kind
+
+    def add(self, lexeme, token, line, column, start, end):
+        if token in FIXED_LEXEMES:
+            pass
+        elif end - start != len(lexeme) or not self.text.startswith(lexeme, start):
+            self.lexemes[len(self.kinds)] = lexeme
+        self.kinds.append(self.kind_id(token))
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def kind(self, index):
+        return self.kind_names[self.kinds[index]]
+
+    def shift_at(self, index):
+        offset = line = 0
+        for start, offset_delta, line_delta in self.shifts:
+            if start > index:
+                break
+            offset += offset_delta
+            line += line_delta
+        return offset, line
+
+    def span(self, index):
+        offset = self.shift_at(index)[0] if self.shifts else 0
+        return self.starts[index] + offset, self.ends[index] + offset
+
+    def line(self, index):
+        return self.lines[index] + (self.shift_at(index)[1] if self.shifts else 0)
+
+    def lexeme(self, index):
+        lexeme = self.lexemes.get(index) or FIXED_LEXEMES.get(self.kind(index))
+        if lexeme is None:
+            start, end = self.span(index)
+            return self.text[start:end]
+        return lexeme
+
+    def index_at(self, offset):
+        # first token starting at or after a source offset
+        return bisect_left(range(len(self.kinds)), offset, key=lambda index: self.span(index)[0])
+
+    def skip(self, index, names):
+        # first index at or after `index` whose kind is not in names
+        ids = {self.kind_ids[name] for name in names if name in self.kind_ids}
+        kinds = self.kinds
+        end = len(kinds)
+        while index < end and kinds[index] in ids:
+            index += 1
+        return index
+
+    def lookahead(self):
+        kinds = self.kinds
+        count = len(kinds)
+        if self.index is not None and len(self.index[0]) == count + 1:
+            return self.index
+        space = self.kind_ids.get(TT_SPACE)
+        stop_ids = {self.kind_ids[name] for name in LINE_STOPS if name in self.kind_ids}
+        solid = [count] * (count + 1)
+        stops = [count] * (count + 1)
+        next_solid = next_stop = count
+        for i in range(count - 1, -1, -1):
+            kind = kinds[i]
+            if kind != space:
+                next_solid = i
+            if kind in stop_ids:
+                next_stop = i
+            solid[i] = next_solid
+            stops[i] = next_stop
+        self.index = (array('i', solid), array('i', stops), {})
+        return self.index
+
+    def next_solid(self, index):
+        # first index at or after `index` that isn't a space
+        return self.lookahead()[0][index]
+
+    def find_in_line(self, index, target):
+        # index of the first `target` before the next ':', newline or EOF, or -1
+        _, stops, positions = self.lookahead()
+        kind = self.kind_ids.get(target)
+        if kind is None or index >= len(self.kinds):
+            return -1
+        found = positions.get(kind)
+        if found is None:
+            found = positions[kind] = array('i', (i for i, other in enumerate(self.kinds) if other == kind))
+        at = bisect_left(found, index)
+        # a target that is a stop itself is its own stop
+        if at < len(found) and found[at] <= stops[index]:
+            return found[at]
+        return -1
+
+    def splice(self, first, last, segment, offset_delta, line_delta):
+        # replaces tokens [first, last) with the tokens of `segment` (lexed
+        # from segment.text, sharing this store's kinds); the tokens from
+        # `last` on move by offset_delta characters and line_delta lines
+        count = len(segment)
+        moved = first + count - last
+        before = self.shift_at(first)
+        after = self.shift_at(last)
+
+        def unshift(column, delta):
+            # segment values are absolute, stored ones get shifts re-added
+            return array('i', (value - delta for value in column)) if delta else column
+
+        self.kinds = self.kinds[:first] + segment.kinds + self.kinds[last:]
+        self.starts = self.starts[:first] + unshift(segment.starts, before[0]) + self.starts[last:]
+        self.ends = self.ends[:first] + unshift(segment.ends, before[0]) + self.ends[last:]
+        self.lines = self.lines[:first] + unshift(segment.lines, before[1]) + self.lines[last:]
+        self.columns = self.columns[:first] + segment.columns + self.columns[last:]
+
+        lexemes = {index: lexeme for index, lexeme in self.lexemes.items() if index < first}
+        for index, lexeme in segment.lexemes.items():
+            lexemes[index + first] = lexeme
+        for index, lexeme in self.lexemes.items():
+            if index >= last:
+                lexemes[index + moved] = lexeme
+        self.lexemes = lexemes
+
+        shifts = [shift for shift in self.shifts if shift[0] <= first]
+        tail_offset = after[0] - before[0] + offset_delta
+        tail_line = after[1] - before[1] + line_delta
+        if tail_offset or tail_line:
+            shifts.append((first + count, tail_offset, tail_line))
+        shifts.extend((index + moved, o, l) for index, o, l in self.shifts if index > last)
+        self.shifts = shifts
+        self.text = segment.text
+        self.index = None
+        if len(self.shifts) > MAX_SHIFTS:
+            self.compact()
+
+    def compact(self):
+        if not self.shifts:
+            return
+        bounds = [index for index, _, _ in self.shifts] + [len(self.kinds)]
+        offset = line = 0
+        starts, ends, lines = array('i'), array('i'), array('i')
+        starts.extend(self.starts[:bounds[0]])
+        ends.extend(self.ends[:bounds[0]])
+        lines.extend(self.lines[:bounds[0]])
+        for (index, offset_delta, line_delta), stop in zip(self.shifts, bounds[1:]):
+            offset += offset_delta
+            line += line_delta
+            starts.extend(value + offset for value in self.starts[index:stop])
+            ends.extend(value + offset for value in self.ends[index:stop])
+            lines.extend(value + line for value in self.lines[index:stop])
+        self.starts, self.ends, self.lines = starts, ends, lines
+        self.shifts = []
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.kinds)
+        return Token(self.lexeme(index), self.kind(index), self.line(index), self.columns[index])
+
+    def __iter__(self):
+        self.compact()
+        for index in range(len(self.kinds)):
+            yield self[index]
+
+    def pop(self):
+        token = self[-1]
+        index = len(self.kinds) - 1
+        for column in (self.kinds, self.starts, self.ends, self.lines, self.columns):
+            column.pop()
+        self.lexemes.pop(index, None)
+        self.index = None
+        return token
+
+    def __repr__(self):
+        return repr(list(self))
+
 # lexer
 
 class Lexer:
@@ -157,7 +381,9 @@ class Lexer:
         self.text = text
         self.pos = Position(-1, 0, -1, fn, text)
         self.identifier_map = {}
+        self.identifier_starts = {}     # id -> offset of the step that first saw it
         self.current_id = 1
+        self.step_start = 0             # offset where the current token began
         self.current_char = None
         self.prev_char = None
         self.advance()
@@ -204,182 +430,382 @@ class Lexer:
                     newline_count = lexeme.count('\n') 
                     if newline_count > 0:
                         token += '\n' * newline_count
-                        tokens.append(Token(lexeme, token, cur_ln, cur_col)) 
+                        tokens.add(lexeme, token, cur_ln, cur_col, self.step_start, self.pos.idx)
                     else:
-                       tokens.append(Token(lexeme, token, cur_ln, cur_col))  
+                       tokens.add(lexeme, token, cur_ln, cur_col, self.step_start, self.pos.idx)
                 elif token == 'true' or token == 'false':
-                    tokens.append(Token(lexeme, TT_FLAG, cur_ln, cur_col))
+                    tokens.add(lexeme, TT_FLAG, cur_ln, cur_col, self.step_start, self.pos.idx)
                 else:
-                    tokens.append(Token(lexeme, token, cur_ln, cur_col)) 
+                    tokens.add(lexeme, token, cur_ln, cur_col, self.step_start, self.pos.idx)
 
                 #tokens.append(Token(lexeme, token, pos_start=self.pos))  -- use if not using webbased gui
 
     def make_tokens(self):
-        tokens = []
+        tokens = TokenStore(self.text)
         errors = []
-        lhs_space = ''
+        self.lhs_space = ''
     
         while self.current_char is not None:
             cur_ln = self.pos.ln + 1
             cur_col = self.pos.col + 1
+            self.step_start = self.pos.idx
+            self.lex_next(cur_ln, cur_col, errors, tokens)
+        
+        tokens.add(TT_EOF, TT_EOF, cur_ln, cur_col, len(self.text), len(self.text))
+
+        return tokens, errors
 
-            if self.current_char == '\t':
+    # one iteration of the scanning loop: lexes the token starting at the
+    # current character
+    def lex_next(self, cur_ln, cur_col, errors, tokens):
+        if self.current_char == '\t':
+            self.advance()
+        elif self.current_char == '\n': 
+            while self.current_char == '\n':
+                self.advance()
+            self.process_token(cur_ln, cur_col, '\\n', TT_NEWLINE, nl_delim, errors, tokens)
+
+        elif self.current_char == ' ':
+            self.lhs_space = self.prev_char
+            while self.current_char == ' ':
+                self.advance()
+            self.process_token(cur_ln, cur_col, ' ', TT_SPACE, space_delim, errors, tokens)
+        elif self.current_char in NUM:
+            result, error = self.make_number('')
+
+            if error:
+               errors.extend(error)
+               return  
+
+            self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)
+        elif self.current_char in ALPHA:
+            self.lex_word(cur_ln, cur_col, errors, tokens)
+        elif self.current_char == '_':
+            char_str = ''
+            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == '"':
+            result, error = self.make_string()
+
+            if error:
+               errors.extend(error)
+               return
+
+            self.process_token(cur_ln, cur_col, result.lexeme, result.token, commslit_delim, errors, tokens)
+        elif self.current_char == '+':
+            self.advance()
+            if self.current_char == '=':
                 self.advance()
-            elif self.current_char == '\n': 
-                while self.current_char == '\n':
+                self.process_token(cur_ln, cur_col, '+=', TT_PLUS_EQ, delim3, errors, tokens)
+            else:
+                self.process_token(cur_ln, cur_col, '+', TT_PLUS, delim3, errors, tokens)
+        elif self.current_char == '-':
+            lhs = self.prev_char
+            self.advance()
+            if self.current_char == '=':
+                self.advance()
+                self.process_token(cur_ln, cur_col, '-=', TT_MINUS_EQ, delim4, errors, tokens)
+            else:
+                # Check lhs if id, number, )
+                if lhs is not None and lhs in valid_lhs:
+                    self.process_token(cur_ln, cur_col, '-', TT_MINUS, delim4, errors, tokens)
+                elif lhs == ' ':
+                    if self.lhs_space is not None and self.lhs_space in valid_lhs:
+                        self.process_token(cur_ln, cur_col, '-', TT_MINUS, delim4, errors, tokens)
+                    else:
+                        if self.current_char is None:
+                            self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
+                        elif self.current_char in NUM or self.current_char == '.':
+                            result, error = self.make_number('-')
+
+                            if error:
+                                errors.extend(error)
+                                return  
+
+                            self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)
+                        else:
+                            self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
+
+                else:
+                    if self.current_char is None:
+                        self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
+                    elif self.current_char in NUM or self.current_char == '.':
+                        result, error = self.make_number('-')
+
+                        if error:
+                            errors.extend(error)
+                            return  
+
+                        self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)
+                    else:
+                        self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
+
+            
+        elif self.current_char in '*/%<>': 
+            token_map = {
+                '*': [(TT_MUL_EQ, '='), (TT_MUL, None)],
+                '/': [(TT_DIV_EQ, '='), (TT_DIV, None)],
+                '%': [(TT_MOD_EQ, '='), (TT_MOD, None)],
+                '<': [(TT_LTE, '='), (TT_LT, None)],
+                '>': [(TT_GTE, '='), (TT_GT, None)],
+            }
+            char = self.current_char
+            self.advance()
+            for token_type, next_char in token_map[char]:
+                if next_char is None:  
+                    self.process_token(cur_ln, cur_col, char, token_type, delim4, errors, tokens)
+                    break
+                elif self.current_char == '=':  
                     self.advance()
-                self.process_token(cur_ln, cur_col, '\\n', TT_NEWLINE, nl_delim, errors, tokens)
+                    self.process_token(cur_ln, cur_col, char + next_char, token_type, delim4, errors, tokens)
+                    break
+        elif self.current_char in '^:()[]{},':
+            token_map = {
+                '^': [(TT_POW, delim4)],
+                ':': [(TT_COLON, delim5)],
+                '(': [(TT_LPAREN, lparen_delim)],
+                ')': [(TT_RPAREN, rparen_delim)],
+                '[': [(TT_LSQUARE, lbracket_delim)],
+                ']': [(TT_RSQUARE, rbracket_delim)],
+                '{': [(TT_LCURLY, lcurly_delim)],
+                '}': [(TT_RCURLY, rcurly_delim)],
+                ',': [(TT_COMMA, comma_delim)],
+            }
+            char = self.current_char
+            self.advance()
+            for token_type, valid_delims in token_map[char]:
+                self.process_token(cur_ln, cur_col, char, token_type, valid_delims, errors, tokens)
+                break 
+        elif self.current_char == '.':
+            self.advance()
 
-            elif self.current_char == ' ':
-                lhs_space = self.prev_char
-                while self.current_char == ' ':
+            if self.current_char is not None and self.current_char in NUM_TO_6:
+                result = self.current_char
+                self.advance()
+                if self.current_char is not None and self.current_char == 'f':
+                    result = '.' + result + 'f'
                     self.advance()
-                self.process_token(cur_ln, cur_col, ' ', TT_SPACE, space_delim, errors, tokens)
-            elif self.current_char in NUM:
-                result, error = self.make_number('')
+                    self.process_token(cur_ln, cur_col, result, TT_XP_FORMATTING, delim7, errors, tokens)
+                else:
+                    result, error = self.make_number('.' + result)
+
+                    if error:
+                        errors.extend(error)
+                        return  
+
+                    self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens) 
+            elif self.current_char is not None and self.current_char in NUM:
+                result, error = self.make_number('.')
 
                 if error:
-                   errors.extend(error)
-                   continue  
-
-                self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)
-            elif self.current_char in ALPHA:
-                char_str = ''
-                if self.current_char == 'A':
-                    char_str += 'A'
+                    errors.extend(error)
+                    return  
+
+                self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)    
+
+            else:
+                self.process_token(cur_ln, cur_col, '.', TT_PERIOD, period_delim, errors, tokens)  
+        elif self.current_char in '=&|':
+            token_map = {
+                '=': [(TT_EE, delim3)],
+                '&': [('&&', ' ')],
+                '|': [('||', ' ')],
+            }
+            char = self.current_char
+            self.advance()
+            for token_type, valid_delims in token_map[char]:
+                if self.current_char == char:
                     self.advance()
-                    if self.current_char == 'N':
-                        char_str += 'N'
-                        self.advance()
-                        if self.current_char == 'D':
-                            char_str += 'D'
+                    self.process_token(cur_ln, cur_col, char + char, token_type, valid_delims, errors, tokens)     
+                else:
+                    errors.append(f"Lexical Error: Invalid character error at line {self.pos.ln+1}, column {self.pos.col}. Cause: ' {char} '")
+        elif self.current_char == '!':
+            char = self.current_char
+            self.advance()
+            if self.current_char == '=':
+                self.advance()
+                self.process_token(cur_ln, cur_col, '!=', TT_NE, delim3, errors, tokens)   
+            else:
+                self.process_token(cur_ln, cur_col, '!', TT_NOT, delim6, errors, tokens)   
+        elif self.current_char == '#':
+            comments = '#'
+            self.advance()
+            while self.current_char is not None:
+                if self.current_char == '\n':
+                    self.process_token(cur_ln, cur_col, comments, TT_COMMENTS1, '\n', errors, tokens) 
+                    break
+                comments += self.current_char
+                self.advance()
+                
+            if self.current_char is None:
+                self.process_token(cur_ln, cur_col, comments, TT_COMMENTS1, '\n', errors, tokens)
+                
+
+        elif self.current_char == '`':
+            backtick_count = 0
+            while self.current_char == '`' and backtick_count < 3:
+                backtick_count += 1
+                self.advance()
+
+            if backtick_count != 3:  
+                errors.append(f"Lexical Error: Incomplete comment delimiter at line {self.pos.ln + 1}, column {self.pos.col - backtick_count}")
+            else:
+                comment = ""
+                while True:
+                    if self.current_char is None: 
+                        errors.append(f"Lexical Error: Unclosed multi-line comment starting at line {self.pos.ln + 1}")
+                        break
+
+                    if self.current_char == '`':  
+                        close_count = 0
+                        while self.current_char == '`' and close_count < 3:
+                            close_count += 1
                             self.advance()
-                            self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+
+                        if close_count == 3:  
+                            break
+                        else:  
+                            comment += '`' * close_count
                     else:
-                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)        
-                elif self.current_char == 'O':
-                    char_str += 'O'
-                    self.advance()
-                    if self.current_char == 'R':
-                        char_str += 'R'
+                        comment += self.current_char
                         self.advance()
-                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                    else:
-                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)      
-                elif self.current_char == 'a':
-                    char_str += 'a'
+        else:
+            errors.append(f"Lexical Error: Unknown character ' {self.current_char} ' at line {self.pos.ln + 1}, column {self.pos.col + 1}")
+            self.advance()
+    
+    def lex_word(self, cur_ln, cur_col, errors, tokens):
+        # keywords and identifiers, one nested branch per keyword character
+        char_str = ''
+        if self.current_char == 'A':
+            char_str += 'A'
+            self.advance()
+            if self.current_char == 'N':
+                char_str += 'N'
+                self.advance()
+                if self.current_char == 'D':
+                    char_str += 'D'
                     self.advance()
-                    if self.current_char == 'c':
-                        char_str += 'c'
+                    self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)        
+        elif self.current_char == 'O':
+            char_str += 'O'
+            self.advance()
+            if self.current_char == 'R':
+                char_str += 'R'
+                self.advance()
+                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+            else:
+                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)      
+        elif self.current_char == 'a':
+            char_str += 'a'
+            self.advance()
+            if self.current_char == 'c':
+                char_str += 'c'
+                self.advance()
+                if self.current_char == 'c':
+                    char_str += 'c'
+                    self.advance()
+                    if self.current_char == 'e':
+                        char_str += 'e'
                         self.advance()
-                        if self.current_char == 'c':
-                            char_str += 'c'
+                        if self.current_char == 's':
+                            char_str += 's'
                             self.advance()
-                            if self.current_char == 'e':
-                                char_str += 'e'
+                            if self.current_char == 's':
+                                char_str += 's'
                                 self.advance()
-                                if self.current_char == 's':
-                                    char_str += 's'
-                                    self.advance()
-                                    if self.current_char == 's':
-                                        char_str += 's'
-                                        self.advance()
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                                    else:
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
-                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)  
-                elif self.current_char == 'b':
-                    char_str += 'b'
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)  
+        elif self.current_char == 'b':
+            char_str += 'b'
+            self.advance()
+            if self.current_char == 'a':
+                char_str += 'a'
+                self.advance()
+                if self.current_char == 'c':
+                    char_str += 'c'
                     self.advance()
-                    if self.current_char == 'a':
-                        char_str += 'a'
+                    if self.current_char == 'k':
+                        char_str += 'k'
                         self.advance()
-                        if self.current_char == 'c':
-                            char_str += 'c'
+                        if self.current_char == 'u':
+                            char_str += 'u'
                             self.advance()
-                            if self.current_char == 'k':
-                                char_str += 'k'
+                            if self.current_char == 'p':
+                                char_str += 'p'
                                 self.advance()
-                                if self.current_char == 'u':
-                                    char_str += 'u'
-                                    self.advance()
-                                    if self.current_char == 'p':
-                                        char_str += 'p'
-                                        self.advance()
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, ':', errors, tokens)
-                                    else:
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, ':', errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'u':
-                        char_str += 'u'
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'u':
+                char_str += 'u'
+                self.advance()
+                if self.current_char == 'i':
+                    char_str += 'i'
+                    self.advance()
+                    if self.current_char == 'l':
+                        char_str += 'l'
                         self.advance()
-                        if self.current_char == 'i':
-                            char_str += 'i'
+                        if self.current_char == 'd':
+                            char_str += 'd'
                             self.advance()
-                            if self.current_char == 'l':
-                                char_str += 'l'
-                                self.advance()
-                                if self.current_char == 'd':
-                                    char_str += 'd'
-                                    self.advance()
-                                    self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                            self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'c':
-                    char_str += 'c'
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'c':
+            char_str += 'c'
+            self.advance()
+            if self.current_char == 'h':
+                char_str += 'h'
+                self.advance()
+                if self.current_char == 'e':
+                    char_str += 'e'
                     self.advance()
-                    if self.current_char == 'h':
-                        char_str += 'h'
+                    if self.current_char == 'c':
+                        char_str += 'c'
                         self.advance()
-                        if self.current_char == 'e':
-                            char_str += 'e'
+                        if self.current_char == 'k':
+                            char_str += 'k'
                             self.advance()
-                            if self.current_char == 'c':
-                                char_str += 'c'
+                            if self.current_char == 'p':
+                                char_str += 'p'
                                 self.advance()
-                                if self.current_char == 'k':
-                                    char_str += 'k'
+                                if self.current_char == 'o':
+                                    char_str += 'o'
                                     self.advance()
-                                    if self.current_char == 'p':
-                                        char_str += 'p'
+                                    if self.current_char == 'i':
+                                        char_str += 'i'
                                         self.advance()
-                                        if self.current_char == 'o':
-                                            char_str += 'o'
+                                        if self.current_char == 'n':
+                                            char_str += 'n'
                                             self.advance()
-                                            if self.current_char == 'i':
-                                                char_str += 'i'
+                                            if self.current_char == 't':
+                                                char_str += 't'
                                                 self.advance()
-                                                if self.current_char == 'n':
-                                                    char_str += 'n'
-                                                    self.advance()
-                                                    if self.current_char == 't':
-                                                        char_str += 't'
-                                                        self.advance()
-                                                        self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
-                                                    else:
-                                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                                else:
-                                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                                self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
                                             else:
                                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                                         else:
@@ -390,194 +816,194 @@ class Lexer:
                                     self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        elif self.current_char == 'o':
-                            char_str += 'o'
-                            self.advance()
-                            if self.current_char == 'i':
-                                char_str += 'i'
-                                self.advance()
-                                if self.current_char == 'c':
-                                    char_str += 'c'
-                                    self.advance()
-                                    if self.current_char == 'e':
-                                        char_str += 'e'
-                                        self.advance()
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                                    else:
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'o':
-                        char_str += 'o'
-                        self.advance()
-                        if self.current_char == 'm':
-                            char_str += 'm'
-                            self.advance()
-                            if self.current_char == 'm':
-                                char_str += 'm'
-                                self.advance()
-                                if self.current_char == 's':
-                                    char_str += 's'
-                                    self.advance()
-                                    self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)    
-                elif self.current_char == 'd':
-                    char_str += 'd'
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                elif self.current_char == 'o':
+                    char_str += 'o'
                     self.advance()
-                    if self.current_char == 'e':
-                        char_str += 'e'
-                        self.advance()
-                        if self.current_char == 'a':
-                            char_str += 'a'
-                            self.advance()
-                            if self.current_char == 'd':
-                                char_str += 'd'
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, delim1, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'r':
-                        char_str += 'r'
+                    if self.current_char == 'i':
+                        char_str += 'i'
                         self.advance()
-                        if self.current_char == 'o':
-                            char_str += 'o'
+                        if self.current_char == 'c':
+                            char_str += 'c'
                             self.advance()
-                            if self.current_char == 'p':
-                                char_str += 'p'
+                            if self.current_char == 'e':
+                                char_str += 'e'
                                 self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'e':
-                    char_str += 'e'
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'o':
+                char_str += 'o'
+                self.advance()
+                if self.current_char == 'm':
+                    char_str += 'm'
                     self.advance()
-                    if self.current_char == 'l':
-                        char_str += 'l'
+                    if self.current_char == 'm':
+                        char_str += 'm'
                         self.advance()
-                        if self.current_char == 'i':
-                            char_str += 'i'
-                            self.advance()
-                            if self.current_char == 'f':
-                                char_str += 'f'
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        elif self.current_char == 's':
+                        if self.current_char == 's':
                             char_str += 's'
                             self.advance()
-                            if self.current_char == 'e':
-                                char_str += 'e'
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, delim2, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                            self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'f':
-                    char_str += 'f'
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)    
+        elif self.current_char == 'd':
+            char_str += 'd'
+            self.advance()
+            if self.current_char == 'e':
+                char_str += 'e'
+                self.advance()
+                if self.current_char == 'a':
+                    char_str += 'a'
                     self.advance()
-                    if self.current_char == 'a':
-                        char_str += 'a'
+                    if self.current_char == 'd':
+                        char_str += 'd'
                         self.advance()
-                        if self.current_char == 'l':
-                            char_str += 'l'
-                            self.advance()
-                            if self.current_char == 's':
-                                char_str += 's'
-                                self.advance()
-                                if self.current_char == 'e':
-                                    char_str += 'e' 
-                                    self.advance()
-                                    self.tokenize_keyword(cur_ln, cur_col, char_str, flag_delim, errors, tokens)
-                                else: 
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else: 
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'l':
-                        char_str += 'l'
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, delim1, errors, tokens)
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'r':
+                char_str += 'r'
+                self.advance()
+                if self.current_char == 'o':
+                    char_str += 'o'
+                    self.advance()
+                    if self.current_char == 'p':
+                        char_str += 'p'
                         self.advance()
-                        if self.current_char == 'a':
-                            char_str += 'a'
-                            self.advance()
-                            if self.current_char == 'g':
-                                char_str += 'g'
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                            elif self.current_char == 'n':
-                                char_str += 'n'
-                                self.advance()
-                                if self.current_char == 'k':
-                                    char_str += 'k'
-                                    self.advance()
-                                    self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else:
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'e':
+            char_str += 'e'
+            self.advance()
+            if self.current_char == 'l':
+                char_str += 'l'
+                self.advance()
+                if self.current_char == 'i':
+                    char_str += 'i'
+                    self.advance()
+                    if self.current_char == 'f':
+                        char_str += 'f'
+                        self.advance()
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                elif self.current_char == 's':
+                    char_str += 's'
+                    self.advance()
+                    if self.current_char == 'e':
+                        char_str += 'e'
+                        self.advance()
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, delim2, errors, tokens)
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'f':
+            char_str += 'f'
+            self.advance()
+            if self.current_char == 'a':
+                char_str += 'a'
+                self.advance()
+                if self.current_char == 'l':
+                    char_str += 'l'
+                    self.advance()
+                    if self.current_char == 's':
+                        char_str += 's'
+                        self.advance()
+                        if self.current_char == 'e':
+                            char_str += 'e' 
+                            self.advance()
+                            self.tokenize_keyword(cur_ln, cur_col, char_str, flag_delim, errors, tokens)
+                        else: 
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'o':
-                        char_str += 'o'
+                    else: 
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'l':
+                char_str += 'l'
+                self.advance()
+                if self.current_char == 'a':
+                    char_str += 'a'
+                    self.advance()
+                    if self.current_char == 'g':
+                        char_str += 'g'
                         self.advance()
-                        if self.current_char == 'r':
-                            char_str += 'r'
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+                    elif self.current_char == 'n':
+                        char_str += 'n'
+                        self.advance()
+                        if self.current_char == 'k':
+                            char_str += 'k'
                             self.advance()
                             self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
-                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)  
-                elif self.current_char == 'g':
-                    char_str += 'g'
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'o':
+                char_str += 'o'
+                self.advance()
+                if self.current_char == 'r':
+                    char_str += 'r'
                     self.advance()
-                    if self.current_char == 'a':
-                        char_str += 'a'
+                    self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)  
+        elif self.current_char == 'g':
+            char_str += 'g'
+            self.advance()
+            if self.current_char == 'a':
+                char_str += 'a'
+                self.advance()
+                if self.current_char == 'm':
+                    char_str += 'm'
+                    self.advance()
+                    if self.current_char == 'e':
+                        char_str += 'e'
                         self.advance()
-                        if self.current_char == 'm':
-                            char_str += 'm'
+                        if self.current_char == 'O':
+                            char_str += 'O'
                             self.advance()
-                            if self.current_char == 'e':
-                                char_str += 'e'
+                            if self.current_char == 'v':
+                                char_str += 'v'
                                 self.advance()
-                                if self.current_char == 'O':
-                                    char_str += 'O'
+                                if self.current_char == 'e':
+                                    char_str += 'e'
                                     self.advance()
-                                    if self.current_char == 'v':
-                                        char_str += 'v'
+                                    if self.current_char == 'r':
+                                        char_str += 'r'
                                         self.advance()
-                                        if self.current_char == 'e':
-                                            char_str += 'e'
-                                            self.advance()
-                                            if self.current_char == 'r':
-                                                char_str += 'r'
-                                                self.advance()
-                                                self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
-                                            else:
-                                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                        else:
-                                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                        self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
                                     else:
                                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                                 else:
@@ -586,32 +1012,32 @@ class Lexer:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'e':
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'e':
+                char_str += 'e'
+                self.advance()
+                if self.current_char == 'n':
+                    char_str += 'n'
+                    self.advance()
+                    if self.current_char == 'e':
                         char_str += 'e'
                         self.advance()
-                        if self.current_char == 'n':
-                            char_str += 'n'
+                        if self.current_char == 'r':
+                            char_str += 'r'
                             self.advance()
-                            if self.current_char == 'e':
-                                char_str += 'e'
+                            if self.current_char == 'a':
+                                char_str += 'a'
                                 self.advance()
-                                if self.current_char == 'r':
-                                    char_str += 'r'
+                                if self.current_char == 't':
+                                    char_str += 't'
                                     self.advance()
-                                    if self.current_char == 'a':
-                                        char_str += 'a'
+                                    if self.current_char == 'e':
+                                        char_str += 'e'
                                         self.advance()
-                                        if self.current_char == 't':
-                                            char_str += 't'
-                                            self.advance()
-                                            if self.current_char == 'e':
-                                                char_str += 'e'
-                                                self.advance()
-                                                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                                            else:
-                                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                        else:
-                                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                                     else:
                                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                                 else:
@@ -620,117 +1046,108 @@ class Lexer:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'r':
-                        char_str += 'r'
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'r':
+                char_str += 'r'
+                self.advance()
+                if self.current_char == 'i':
+                    char_str += 'i'
+                    self.advance()
+                    if self.current_char == 'n':
+                        char_str += 'n'
                         self.advance()
-                        if self.current_char == 'i':
-                            char_str += 'i'
+                        if self.current_char == 'd':
+                            char_str += 'd'
                             self.advance()
-                            if self.current_char == 'n':
-                                char_str += 'n'
-                                self.advance()
-                                if self.current_char == 'd':
-                                    char_str += 'd'
-                                    self.advance()
-                                    self.tokenize_keyword(cur_ln, cur_col, char_str, delim2, errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                            self.tokenize_keyword(cur_ln, cur_col, char_str, delim2, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'h':
-                    char_str += 'h' 
-                    self.advance()
-                    if self.current_char == 'p':
-                        char_str += 'p'
-                        self.advance()
-                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'i':
-                    char_str += 'i' 
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'h':
+            char_str += 'h' 
+            self.advance()
+            if self.current_char == 'p':
+                char_str += 'p'
+                self.advance()
+                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'i':
+            char_str += 'i' 
+            self.advance()
+            if self.current_char == 'f':
+                char_str += 'f'
+                self.advance()
+                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+            elif self.current_char == 'm':
+                char_str += 'm'
+                self.advance()
+                if self.current_char == 'm':
+                    char_str += 'm'
                     self.advance()
-                    if self.current_char == 'f':
-                        char_str += 'f'
+                    if self.current_char == 'o':
+                        char_str += 'o'
                         self.advance()
                         self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                    elif self.current_char == 'm':
-                        char_str += 'm'
-                        self.advance()
-                        if self.current_char == 'm':
-                            char_str += 'm'
-                            self.advance()
-                            if self.current_char == 'o':
-                                char_str += 'o'
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'j':
-                    char_str += 'j' 
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'j':
+            char_str += 'j' 
+            self.advance()
+            if self.current_char == 'o':
+                char_str += 'o' 
+                self.advance()
+                if self.current_char == 'i':
+                    char_str += 'i' 
                     self.advance()
-                    if self.current_char == 'o':
-                        char_str += 'o' 
+                    if self.current_char == 'n':
+                        char_str += 'n' 
                         self.advance()
-                        if self.current_char == 'i':
-                            char_str += 'i' 
-                            self.advance()
-                            if self.current_char == 'n':
-                                char_str += 'n' 
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'l':
-                    char_str += 'l' 
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'l':
+            char_str += 'l' 
+            self.advance()
+            if self.current_char == 'e':
+                char_str += 'e' 
+                self.advance()
+                if self.current_char == 'v':
+                    char_str += 'v' 
                     self.advance()
                     if self.current_char == 'e':
                         char_str += 'e' 
                         self.advance()
-                        if self.current_char == 'v':
-                            char_str += 'v' 
+                        if self.current_char == 'l':
+                            char_str += 'l' 
                             self.advance()
-                            if self.current_char == 'e':
-                                char_str += 'e' 
+                            if self.current_char == 'D':
+                                char_str += 'D' 
                                 self.advance()
-                                if self.current_char == 'l':
-                                    char_str += 'l' 
+                                if self.current_char == 'o':
+                                    char_str += 'o' 
                                     self.advance()
-                                    if self.current_char == 'D':
-                                        char_str += 'D' 
-                                        self.advance()
-                                        if self.current_char == 'o':
-                                            char_str += 'o' 
-                                            self.advance()
-                                            if self.current_char == 'w':
-                                                char_str += 'w' 
-                                                self.advance()
-                                                if self.current_char == 'n':
-                                                    char_str += 'n' 
-                                                    self.advance()
-                                                    self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                                else:
-                                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                            else:
-                                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                        else:
-                                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                    elif self.current_char == 'U':
-                                        char_str += 'U' 
+                                    if self.current_char == 'w':
+                                        char_str += 'w' 
                                         self.advance()
-                                        if self.current_char == 'p':
-                                            char_str += 'p' 
+                                        if self.current_char == 'n':
+                                            char_str += 'n' 
                                             self.advance()
                                             self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
                                         else:
@@ -739,524 +1156,342 @@ class Lexer:
                                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                                 else:
                                     self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'o':
-                        char_str += 'o'
-                        self.advance()
-                        if self.current_char == 'a':
-                            char_str += 'a' 
-                            self.advance()
-                            if self.current_char == 'd':
-                                char_str += 'd' 
+                            elif self.current_char == 'U':
+                                char_str += 'U' 
                                 self.advance()
-                                if self.current_char == 'N':
-                                    char_str += 'N'
+                                if self.current_char == 'p':
+                                    char_str += 'p' 
                                     self.advance()
-                                    if self.current_char == 'u':
-                                        char_str += 'u'
-                                        self.advance()
-                                        if self.current_char == 'm':
-                                            char_str += 'm'
-                                            self.advance()
-                                            self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                        else:
-                                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                    else:
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                elif self.current_char is None:
                                     self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                elif self.current_char in ALPHANUM or self.current_char == '_':
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                                 else:
-                                    self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens) 
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)    
-                        else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)   
-                    else:
-                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens) 
-      
-                elif self.current_char == 'p':
-                    char_str += 'p'
-                    self.advance() 
-                    if self.current_char == 'l':
-                        char_str += 'l'
-                        self.advance()
-                        if self.current_char == 'a':
-                            char_str += 'a'
-                            self.advance()
-                            if self.current_char == 'y':
-                                char_str += 'y'
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'r':
-                    char_str += 'r' 
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'o':
+                char_str += 'o'
+                self.advance()
+                if self.current_char == 'a':
+                    char_str += 'a' 
                     self.advance()
-                    if self.current_char == 'e':
-                        char_str += 'e' 
+                    if self.current_char == 'd':
+                        char_str += 'd' 
                         self.advance()
-                        if self.current_char == 'c':
-                            char_str += 'c' 
+                        if self.current_char == 'N':
+                            char_str += 'N'
                             self.advance()
-                            if self.current_char == 'a':
-                                char_str += 'a' 
+                            if self.current_char == 'u':
+                                char_str += 'u'
                                 self.advance()
-                                if self.current_char == 'l':
-                                    char_str += 'l' 
+                                if self.current_char == 'm':
+                                    char_str += 'm'
                                     self.advance()
-                                    if self.current_char == 'l':
-                                        char_str += 'l' 
-                                        self.advance()
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                                    else:
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                    self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
                                 else:
                                     self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        elif self.current_char == 's': 
-                            char_str += 's' 
-                            self.advance()  
-                            if self.current_char == 'u': 
-                                char_str += 'u' 
-                                self.advance()
-                                if self.current_char == 'm': 
-                                    char_str += 'm' 
-                                    self.advance()
-                                    if self.current_char == 'e': 
-                                        char_str += 'e' 
-                                        self.advance()
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
-                                    else:
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else:
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens) 
+                        elif self.current_char is None:
+                            self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                        elif self.current_char in ALPHANUM or self.current_char == '_':
+                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)  
-                    elif self.current_char == 'o':
-                        char_str += 'o' 
+                            self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens) 
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)    
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)   
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens) 
+
+        elif self.current_char == 'p':
+            char_str += 'p'
+            self.advance() 
+            if self.current_char == 'l':
+                char_str += 'l'
+                self.advance()
+                if self.current_char == 'a':
+                    char_str += 'a'
+                    self.advance()
+                    if self.current_char == 'y':
+                        char_str += 'y'
                         self.advance()
-                        if self.current_char == 'u': 
-                            char_str += 'u' 
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'r':
+            char_str += 'r' 
+            self.advance()
+            if self.current_char == 'e':
+                char_str += 'e' 
+                self.advance()
+                if self.current_char == 'c':
+                    char_str += 'c' 
+                    self.advance()
+                    if self.current_char == 'a':
+                        char_str += 'a' 
+                        self.advance()
+                        if self.current_char == 'l':
+                            char_str += 'l' 
                             self.advance()
-                            if self.current_char == 'n': 
-                                char_str += 'n' 
+                            if self.current_char == 'l':
+                                char_str += 'l' 
                                 self.advance()
-                                if self.current_char == 'd': 
-                                    char_str += 'd' 
-                                    self.advance()
-                                    if self.current_char == 's': 
-                                        char_str += 's' 
-                                        self.advance()
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                    else:
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 's':
-                    char_str += 's'
-                    self.advance()
-                    if self.current_char == 'e': 
-                        char_str += 'e' 
+                elif self.current_char == 's': 
+                    char_str += 's' 
+                    self.advance()  
+                    if self.current_char == 'u': 
+                        char_str += 'u' 
                         self.advance()
-                        if self.current_char == 'e': 
-                            char_str += 'e' 
+                        if self.current_char == 'm': 
+                            char_str += 'm' 
                             self.advance()
-                            if self.current_char == 'k': 
-                                char_str += 'k' 
+                            if self.current_char == 'e': 
+                                char_str += 'e' 
                                 self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'h':
-                        char_str += 'h'
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens) 
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)  
+            elif self.current_char == 'o':
+                char_str += 'o' 
+                self.advance()
+                if self.current_char == 'u': 
+                    char_str += 'u' 
+                    self.advance()
+                    if self.current_char == 'n': 
+                        char_str += 'n' 
                         self.advance()
-                        if self.current_char == 'o': 
-                            char_str += 'o' 
+                        if self.current_char == 'd': 
+                            char_str += 'd' 
                             self.advance()
-                            if self.current_char == 'o': 
-                                char_str += 'o' 
+                            if self.current_char == 's': 
+                                char_str += 's' 
                                 self.advance()
-                                if self.current_char == 't': 
-                                    char_str += 't' 
-                                    self.advance()
-                                    if self.current_char == 'N': 
-                                        char_str += 'N' 
-                                        self.advance()
-                                        if self.current_char == 'x': 
-                                            char_str += 'x' 
-                                            self.advance()
-                                            if self.current_char == 't': 
-                                                char_str += 't' 
-                                                self.advance()
-                                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                            else:
-                                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                        else:
-                                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                    elif self.current_char is None:
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                    elif self.current_char in ALPHANUM or self.current_char == '_':
-                                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                    else:
-                                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                else:
-                                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
                             else:
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else:
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 't':
-                    char_str += 't' 
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 's':
+            char_str += 's'
+            self.advance()
+            if self.current_char == 'e': 
+                char_str += 'e' 
+                self.advance()
+                if self.current_char == 'e': 
+                    char_str += 'e' 
+                    self.advance()
+                    if self.current_char == 'k': 
+                        char_str += 'k' 
+                        self.advance()
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'h':
+                char_str += 'h'
+                self.advance()
+                if self.current_char == 'o': 
+                    char_str += 'o' 
                     self.advance()
                     if self.current_char == 'o': 
                         char_str += 'o' 
                         self.advance()
-                        if self.current_char == 'H': 
-                            char_str += 'H' 
+                        if self.current_char == 't': 
+                            char_str += 't' 
                             self.advance()
-                            if self.current_char == 'p': 
-                                char_str += 'p' 
+                            if self.current_char == 'N': 
+                                char_str += 'N' 
                                 self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                            else: 
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        elif self.current_char == 'X':
-                            char_str += 'X' 
-                            self.advance()
-                            if self.current_char == 'p':
-                                char_str += 'p' 
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                            else: 
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        elif self.current_char == 'C':
-                            char_str += 'C' 
-                            self.advance()
-                            if self.current_char == 'o':
-                                char_str += 'o' 
-                                self.advance()
-                                if self.current_char == 'm':
-                                    char_str += 'm' 
+                                if self.current_char == 'x': 
+                                    char_str += 'x' 
                                     self.advance()
-                                    if self.current_char == 'm':
-                                        char_str += 'm' 
+                                    if self.current_char == 't': 
+                                        char_str += 't' 
                                         self.advance()
-                                        if self.current_char == 's':
-                                            char_str += 's' 
-                                            self.advance()
-                                            self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                                        else: 
-                                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                    else: 
+                                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                                    else:
                                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                                else: 
+                                else:
                                     self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                            else: 
+                            elif self.current_char is None:
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                            elif self.current_char in ALPHANUM or self.current_char == '_':
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else: 
+                            else:
+                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                        else:
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'r':
-                        char_str += 'r' 
+                    else:
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else:
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 't':
+            char_str += 't' 
+            self.advance()
+            if self.current_char == 'o': 
+                char_str += 'o' 
+                self.advance()
+                if self.current_char == 'H': 
+                    char_str += 'H' 
+                    self.advance()
+                    if self.current_char == 'p': 
+                        char_str += 'p' 
                         self.advance()
-                        if self.current_char == 'u':
-                            char_str += 'u' 
-                            self.advance()
-                            if self.current_char == 'e':
-                                char_str += 'e' 
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, flag_delim, errors, tokens)
-                            else: 
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else: 
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
                     else: 
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'v':
-                    char_str += 'v' 
+                elif self.current_char == 'X':
+                    char_str += 'X' 
                     self.advance()
-                    if self.current_char == 'o':
-                        char_str += 'o' 
+                    if self.current_char == 'p':
+                        char_str += 'p' 
                         self.advance()
-                        if self.current_char == 'i':
-                            char_str += 'i' 
-                            self.advance()
-                            if self.current_char == 'd':
-                                char_str += 'd' 
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
-                            else: 
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else: 
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
                     else: 
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'w':
-                    char_str += 'w' 
+                elif self.current_char == 'C':
+                    char_str += 'C' 
                     self.advance()
-                    if self.current_char == 'h':
-                        char_str += 'h' 
+                    if self.current_char == 'o':
+                        char_str += 'o' 
                         self.advance()
-                        if self.current_char == 'i':
-                            char_str += 'i' 
+                        if self.current_char == 'm':
+                            char_str += 'm' 
                             self.advance()
-                            if self.current_char == 'l':
-                                char_str += 'l' 
+                            if self.current_char == 'm':
+                                char_str += 'm' 
                                 self.advance()
-                                if self.current_char == 'e':
-                                    char_str += 'e' 
+                                if self.current_char == 's':
+                                    char_str += 's' 
                                     self.advance()
-                                    self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+                                    self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
                                 else: 
                                     self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                             else: 
                                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                         else: 
                             self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                    elif self.current_char == 'i':
-                        char_str += 'i'  
-                        self.advance()
-                        if self.current_char == 'p':
-                            char_str += 'p' 
-                            self.advance()
-                            if self.current_char == 'e':
-                                char_str += 'e' 
-                                self.advance()
-                                self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
-                            else: 
-                                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                        else: 
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
                     else: 
-                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                elif self.current_char == 'x':
-                    char_str += 'x' 
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else: 
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'r':
+                char_str += 'r' 
+                self.advance()
+                if self.current_char == 'u':
+                    char_str += 'u' 
                     self.advance()
-                    if self.current_char == 'p':
-                        char_str += 'p' 
+                    if self.current_char == 'e':
+                        char_str += 'e' 
                         self.advance()
-                        self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
-                    else:
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, flag_delim, errors, tokens)
+                    else: 
                         self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-                else:
-                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)    
-            elif self.current_char == '_':
-                char_str = ''
+                else: 
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else: 
                 self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
-            elif self.current_char == '"':
-                result, error = self.make_string()
-
-                if error:
-                   errors.extend(error)
-                   continue
-
-                self.process_token(cur_ln, cur_col, result.lexeme, result.token, commslit_delim, errors, tokens)
-            elif self.current_char == '+':
-                self.advance()
-                if self.current_char == '=':
-                    self.advance()
-                    self.process_token(cur_ln, cur_col, '+=', TT_PLUS_EQ, delim3, errors, tokens)
-                else:
-                    self.process_token(cur_ln, cur_col, '+', TT_PLUS, delim3, errors, tokens)
-            elif self.current_char == '-':
-                lhs = self.prev_char
+        elif self.current_char == 'v':
+            char_str += 'v' 
+            self.advance()
+            if self.current_char == 'o':
+                char_str += 'o' 
                 self.advance()
-                if self.current_char == '=':
+                if self.current_char == 'i':
+                    char_str += 'i' 
                     self.advance()
-                    self.process_token(cur_ln, cur_col, '-=', TT_MINUS_EQ, delim4, errors, tokens)
-                else:
-                    # Check lhs if id, number, )
-                    if lhs is not None and lhs in valid_lhs:
-                        self.process_token(cur_ln, cur_col, '-', TT_MINUS, delim4, errors, tokens)
-                    elif lhs == ' ':
-                        if lhs_space is not None and lhs_space in valid_lhs:
-                            self.process_token(cur_ln, cur_col, '-', TT_MINUS, delim4, errors, tokens)
-                        else:
-                            if self.current_char is None:
-                                self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
-                            elif self.current_char in NUM or self.current_char == '.':
-                                result, error = self.make_number('-')
-
-                                if error:
-                                    errors.extend(error)
-                                    continue  
-
-                                self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)
-                            else:
-                                self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
-
-                    else:
-                        if self.current_char is None:
-                            self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
-                        elif self.current_char in NUM or self.current_char == '.':
-                            result, error = self.make_number('-')
-
-                            if error:
-                                errors.extend(error)
-                                continue  
-
-                            self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)
-                        else:
-                            self.process_token(cur_ln, cur_col, '-', TT_NEG, delim4, errors, tokens)
-
-                
-            elif self.current_char in '*/%<>': 
-                token_map = {
-                    '*': [(TT_MUL_EQ, '='), (TT_MUL, None)],
-                    '/': [(TT_DIV_EQ, '='), (TT_DIV, None)],
-                    '%': [(TT_MOD_EQ, '='), (TT_MOD, None)],
-                    '<': [(TT_LTE, '='), (TT_LT, None)],
-                    '>': [(TT_GTE, '='), (TT_GT, None)],
-                }
-                char = self.current_char
-                self.advance()
-                for token_type, next_char in token_map[char]:
-                    if next_char is None:  
-                        self.process_token(cur_ln, cur_col, char, token_type, delim4, errors, tokens)
-                        break
-                    elif self.current_char == '=':  
+                    if self.current_char == 'd':
+                        char_str += 'd' 
                         self.advance()
-                        self.process_token(cur_ln, cur_col, char + next_char, token_type, delim4, errors, tokens)
-                        break
-            elif self.current_char in '^:()[]{},':
-                token_map = {
-                    '^': [(TT_POW, delim4)],
-                    ':': [(TT_COLON, delim5)],
-                    '(': [(TT_LPAREN, lparen_delim)],
-                    ')': [(TT_RPAREN, rparen_delim)],
-                    '[': [(TT_LSQUARE, lbracket_delim)],
-                    ']': [(TT_RSQUARE, rbracket_delim)],
-                    '{': [(TT_LCURLY, lcurly_delim)],
-                    '}': [(TT_RCURLY, rcurly_delim)],
-                    ',': [(TT_COMMA, comma_delim)],
-                }
-                char = self.current_char
-                self.advance()
-                for token_type, valid_delims in token_map[char]:
-                    self.process_token(cur_ln, cur_col, char, token_type, valid_delims, errors, tokens)
-                    break 
-            elif self.current_char == '.':
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, whitespace, errors, tokens)
+                    else: 
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else: 
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else: 
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'w':
+            char_str += 'w' 
+            self.advance()
+            if self.current_char == 'h':
+                char_str += 'h' 
                 self.advance()
-    
-                if self.current_char is not None and self.current_char in NUM_TO_6:
-                    result = self.current_char
+                if self.current_char == 'i':
+                    char_str += 'i' 
                     self.advance()
-                    if self.current_char is not None and self.current_char == 'f':
-                        result = '.' + result + 'f'
-                        self.advance()
-                        self.process_token(cur_ln, cur_col, result, TT_XP_FORMATTING, delim7, errors, tokens)
-                    else:
-                        result, error = self.make_number('.' + result)
-
-                        if error:
-                            errors.extend(error)
-                            continue  
-
-                        self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens) 
-                elif self.current_char is not None and self.current_char in NUM:
-                    result, error = self.make_number('.')
-
-                    if error:
-                        errors.extend(error)
-                        continue  
-
-                    self.process_token(cur_ln, cur_col, result.lexeme, result.token, numlit_delim, errors, tokens)    
-
-                else:
-                    self.process_token(cur_ln, cur_col, '.', TT_PERIOD, period_delim, errors, tokens)  
-            elif self.current_char in '=&|':
-                token_map = {
-                    '=': [(TT_EE, delim3)],
-                    '&': [('&&', ' ')],
-                    '|': [('||', ' ')],
-                }
-                char = self.current_char
-                self.advance()
-                for token_type, valid_delims in token_map[char]:
-                    if self.current_char == char:
+                    if self.current_char == 'l':
+                        char_str += 'l' 
                         self.advance()
-                        self.process_token(cur_ln, cur_col, char + char, token_type, valid_delims, errors, tokens)     
-                    else:
-                        errors.append(f"Lexical Error: Invalid character error at line {self.pos.ln+1}, column {self.pos.col}. Cause: ' {char} '")
-            elif self.current_char == '!':
-                char = self.current_char
+                        if self.current_char == 'e':
+                            char_str += 'e' 
+                            self.advance()
+                            self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
+                        else: 
+                            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                    else: 
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else: 
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            elif self.current_char == 'i':
+                char_str += 'i'  
                 self.advance()
-                if self.current_char == '=':
+                if self.current_char == 'p':
+                    char_str += 'p' 
                     self.advance()
-                    self.process_token(cur_ln, cur_col, '!=', TT_NE, delim3, errors, tokens)   
-                else:
-                    self.process_token(cur_ln, cur_col, '!', TT_NOT, delim6, errors, tokens)   
-            elif self.current_char == '#':
-                comments = '#'
+                    if self.current_char == 'e':
+                        char_str += 'e' 
+                        self.advance()
+                        self.tokenize_keyword(cur_ln, cur_col, char_str, '(', errors, tokens)
+                    else: 
+                        self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+                else: 
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+            else: 
+                    self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        elif self.current_char == 'x':
+            char_str += 'x' 
+            self.advance()
+            if self.current_char == 'p':
+                char_str += 'p' 
                 self.advance()
-                while self.current_char is not None:
-                    if self.current_char == '\n':
-                        self.process_token(cur_ln, cur_col, comments, TT_COMMENTS1, '\n', errors, tokens) 
-                        break
-                    comments += self.current_char
-                    self.advance()
-                    
-                if self.current_char is None:
-                    self.process_token(cur_ln, cur_col, comments, TT_COMMENTS1, '\n', errors, tokens)
-                    
-
-            elif self.current_char == '`':
-                backtick_count = 0
-                while self.current_char == '`' and backtick_count < 3:
-                    backtick_count += 1
-                    self.advance()
-
-                if backtick_count != 3:  
-                    errors.append(f"Lexical Error: Incomplete comment delimiter at line {self.pos.ln + 1}, column {self.pos.col - backtick_count}")
-                else:
-                    comment = ""
-                    while True:
-                        if self.current_char is None: 
-                            errors.append(f"Lexical Error: Unclosed multi-line comment starting at line {self.pos.ln + 1}")
-                            break
-
-                        if self.current_char == '`':  
-                            close_count = 0
-                            while self.current_char == '`' and close_count < 3:
-                                close_count += 1
-                                self.advance()
-
-                            if close_count == 3:  
-                                break
-                            else:  
-                                comment += '`' * close_count
-                        else:
-                            comment += self.current_char
-                            self.advance()
+                self.tokenize_keyword(cur_ln, cur_col, char_str, ' ', errors, tokens)
             else:
-                errors.append(f"Lexical Error: Unknown character ' {self.current_char} ' at line {self.pos.ln + 1}, column {self.pos.col + 1}")
-                self.advance()
-        
-        tokens.append(Token(TT_EOF, TT_EOF, cur_ln, cur_col))
+                self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)
+        else:
+            self.tokenize_id(cur_ln, cur_col, char_str, id_delim, errors, tokens)    
 
-        return tokens, errors
-    
     def make_number(self, num_str): 
         negate = False
         dot_count = 0
@@ -1393,6 +1628,8 @@ class Lexer:
         return Token(id_str, self.identifiers(id_str), cur_ln, cur_col), errors
 
     def identifiers(self, id_str):
+        if id_str not in self.identifier_starts:
+            self.identifier_starts[id_str] = self.step_start
         if id_str not in self.identifier_map:
             self.identifier_map[id_str] = f'id{self.current_id}'
             self.current_id += 1
@@ -1458,10 +1695,26 @@ class Lexer:
 
 ### RUN ###
 
-def run(fn, text):
+# "nested" is the hand-written lexer above, kept as the reference;
+# "dfa" swaps its keyword branches for the table in dfa_lexer.py and
+# "regex" scans with the master pattern in regex_lexer.py
+LEXER_MODES = ("regex", "dfa", "nested")
+
+def make_lexer(fn, text, mode="regex"):
+    if mode == "nested":
+        return Lexer(fn, text)
+    if mode == "dfa":
+        from .dfa_lexer import DFALexer
+        return DFALexer(fn, text)
+    if mode == "regex":
+        from .regex_lexer import RegexLexer
+        return RegexLexer(fn, text)
+    raise ValueError(f"Unknown lexer mode '{mode}'.")
+
+def run(fn, text, mode="regex"):
     if text == "":
         return [], ["No code in the module."]
-    lexer = Lexer(fn, text)
+    lexer = make_lexer(fn, text, mode)
     tokens, error = lexer.make_tokens()
 
     return tokens, error
@@ -0,0 +1,842 @@
+# Generated by `python -m ludus.tablegen` from ludus/cfg.py, do not edit.
+
+CFG_HASH = '12e76266'
+TERMINAL_COUNT = 76
+START = 76
+
+SYMBOLS = (
+    '!',
+    '!=',
+    '$',
+    '%',
+    '%=',
+    '&&',
+    '(',
+    ')',
+    '*',
+    '*=',
+    '+',
+    '+=',
+    ',',
+    '-',
+    '-=',
+    '.',
+    '/',
+    '/=',
+    ':',
+    '<',
+    '<=',
+    '==',
+    '>',
+    '>=',
+    'AND',
+    'OR',
+    '[',
+    ']',
+    '^',
+    'access',
+    'backup',
+    'build',
+    'checkpoint',
+    'choice',
+    'comms',
+    'comms_ltr',
+    'dead',
+    'drop',
+    'elif',
+    'else',
+    'flag',
+    'flag_ltr',
+    'flank',
+    'for',
+    'gameOver',
+    'generate',
+    'grind',
+    'hp',
+    'hp_ltr',
+    'id',
+    'if',
+    'immo',
+    'join',
+    'levelDown',
+    'levelUp',
+    'load',
+    'loadNum',
+    'play',
+    'recall',
+    'resume',
+    'rounds',
+    'seek',
+    'shoot',
+    'shootNxt',
+    'toComms',
+    'toHp',
+    'toXp',
+    'void',
+    'while',
+    'wipe',
+    'xp',
+    'xp_formatting',
+    'xp_ltr',
+    '{',
+    '||',
+    '}',
+    '<program>',
+    '<global_dec>',
+    '<global_dec_tail1>',
+    '<global_dec_tail2>',
+    '<global_dec_tail3>',
+    '<arr_tail1>',
+    '<arr_tail2>',
+    '<arr_tail3>',
+    '<const_tail>',
+    '<arr_size>',
+    '<id_recur>',
+    '<val_recur>',
+    '<dead_dec>',
+    '<datatype>',
+    '<value>',
+    '<numeric_ltr>',
+    '<elems_recur>',
+    '<row_recur>',
+    '<row_recur2>',
+    '<func_dec>',
+    '<struct_dec>',
+    '<params>',
+    '<def_or_recur>',
+    '<defparam>',
+    '<defparam_recur>',
+    '<common_stmts>',
+    '<main_stmts>',
+    '<body>',
+    '<body_recur>',
+    '<local_dec>',
+    '<local_dec_or_ass>',
+    '<local_immo_tail>',
+    '<dec_tail>',
+    '<dot_tail>',
+    '<dot_tail_rhs>',
+    '<bracket_tail>',
+    '<arr_rhs_tail>',
+    '<inner_bracket_tail>',
+    '<index>',
+    '<arr2d_rhs>',
+    '<arr2d_rhs_tail>',
+    '<col_or_ass>',
+    '<col_tail>',
+    '<id_tail>',
+    '<id_tail_arr>',
+    '<expr_recur>',
+    '<expr>',
+    '<expr_tail>',
+    '<relat_expr>',
+    '<relat_tail>',
+    '<arith_expr>',
+    '<arith_tail>',
+    '<factor>',
+    '<id_rhs_tail>',
+    '<xp_format>',
+    '<args>',
+    '<args_recur>',
+    '<rhs_dot_tail>',
+    '<rhs_bracket_tail>',
+    '<rhs_inner_bracket_tail>',
+    '<assign_op>',
+    '<negative>',
+    '<arith_op>',
+    '<relat_op>',
+    '<logic_op>',
+    '<builtin_no_ret>',
+    '<builtin_w_ret>',
+    '<shoot_args>',
+    '<load_args>',
+    '<rounds_args>',
+    '<id_args_tail>',
+    '<recall_stmt>',
+    '<rec_elems>',
+    '<rec_elems_recur>',
+    '<loop_control>',
+    '<local_struct>',
+    '<struct_fields>',
+    '<field_dec>',
+    '<def_recur>',
+    '<struct_fields_recur>',
+    '<struct_inst>',
+    '<inst_dec>',
+    '<instval_recur>',
+    '<conditional>',
+    '<if_stmt>',
+    '<else_elif>',
+    '<else_stmt>',
+    '<elif_stmt>',
+    '<flank_stmt>',
+    '<flank_body>',
+    '<flank_body_recur>',
+    '<valdead>',
+    '<valdead_recur>',
+    '<choice_recur>',
+    '<looping>',
+    '<for_loop>',
+    '<update>',
+    '<while_loop>',
+    '<do_while_loop>',
+    '<loop_body>',
+    '<loop_body_recur>',
+    '<loop_stmts>',
+    '<if_stmt_loop>',
+    '<else_elif_loop>',
+    '<else_stmt_loop>',
+    '<elif_stmt_loop>',
+    '<flank_stmt_loop>',
+    '<flank_body_loop>',
+    '<flank_loop_recur>',
+    '<loop_choice_recur>',
+    '<backup_loop_body>',
+    '<main_stmts_loop>',
+    '<cond_recur_loop>',
+    '<fs_body>',
+    '<func_body>',
+    '<struct_body>',
+    '<func_stmts>',
+    '<func_stmts_recur>',
+    '<flank_func>',
+    '<flank_func_body>',
+    '<flank_func_recur>',
+    '<choice_func_recur>',
+    '<backup_func_body>',
+    '<if_stmt_func>',
+    '<else_elif_func>',
+    '<else_stmt_func>',
+    '<elif_stmt_func>',
+    '<looping_func>',
+    '<for_func>',
+    '<while_func>',
+    '<do_while_func>',
+    '<loop_body_func>',
+    '<func_stmts_loop>',
+    '<if_func_loop>',
+    '<else_elif_func_loop>',
+    '<else_func_loop>',
+    '<elif_func_loop>',
+    '<func_loop_cond>',
+    '<func_loop_recur>',
+    '<flank_loop_func>',
+    '<flank_body_func_loop>',
+    '<flank_func_loop_recur>',
+    '<loop_func_choice_recur>',
+    '<backup_func_loop_body>',
+)
+
+PRODUCTIONS = (
+    (44, 189, 75, 103, 73, 7, 6, 57, 95, 77),
+    (77, 78, 49, 51),
+    (77, 79, 49),
+    (77, 80, 49, 89),
+    (),
+    (81, 27, 48, 26),
+    (84,),
+    (84,),
+    (82, 27, 85, 26),
+    (88, 86),
+    (83, 27, 85, 26),
+    (27, 92, 90, 12, 90, 26, 18),
+    (94, 27, 92, 90, 12, 90, 26, 12, 27, 92, 90, 12, 90, 26, 18, 27, 48, 26),
+    (27, 92, 90, 26, 18),
+    (93, 27, 92, 90, 26, 18, 27, 85, 26),
+    (88,),
+    (88, 27, 85, 26),
+    (90, 18, 86, 49, 12),
+    (87, 90, 18),
+    (48,),
+    (),
+    (86, 49, 12),
+    (),
+    (87, 90, 18, 49, 12),
+    (),
+    (36, 18),
+    (),
+    (47,),
+    (70,),
+    (34,),
+    (40,),
+    (91,),
+    (35,),
+    (41,),
+    (48,),
+    (72,),
+    (92, 90, 12),
+    (),
+    (93, 27, 92, 90, 26, 12),
+    (),
+    (94, 27, 92, 90, 12, 90, 26, 12),
+    (),
+    (95, 7, 97, 6, 49, 45),
+    (96,),
+    (96, 49, 31),
+    (),
+    (98, 49),
+    (),
+    (98, 49, 12),
+    (100, 90, 18),
+    (),
+    (100, 90, 18, 49),
+    (99, 12),
+    (),
+    (105,),
+    (106,),
+    (141,),
+    (151,),
+    (156,),
+    (159,),
+    (170,),
+    (101,),
+    (104, 102),
+    (103,),
+    (),
+    (107, 51),
+    (80, 49, 89),
+    (108, 49),
+    (78, 49),
+    (92, 90, 18, 49, 49, 29),
+    (117,),
+    (7, 131, 6),
+    (109, 15),
+    (111, 27, 114, 26),
+    (110, 49),
+    (7, 114, 6, 37),
+    (7, 112, 6, 52),
+    (122, 18),
+    (122, 136),
+    (112, 18),
+    (122, 136),
+    (115, 27, 114, 26),
+    (113, 15),
+    (27, 92, 90, 26),
+    (122,),
+    (7, 114, 6, 37),
+    (7, 122, 6, 52),
+    (122,),
+    (),
+    (116, 18),
+    (122, 136),
+    (93, 27, 92, 90, 26),
+    (122,),
+    (118, 18),
+    (122, 18, 86, 49, 12),
+    (122, 136),
+    (121, 122),
+    (93, 27, 92, 90, 26),
+    (49, 15),
+    (120, 27, 122, 26),
+    (),
+    (27, 122, 26),
+    (),
+    (121, 122, 18, 49, 12),
+    (),
+    (123, 124),
+    (122, 140),
+    (),
+    (125, 126),
+    (124, 139),
+    (),
+    (127, 128),
+    (126, 138),
+    (),
+    (129, 49),
+    (90,),
+    (137, 13),
+    (142,),
+    (137, 0),
+    (130, 7, 122, 6),
+    (7, 131, 6),
+    (133, 15),
+    (134, 27, 122, 26),
+    (71,),
+    (),
+    (71,),
+    (),
+    (132, 122),
+    (),
+    (132, 122, 12),
+    (),
+    (49,),
+    (7, 112, 6, 61),
+    (7, 114, 6, 37),
+    (27, 122, 26),
+    (135, 15),
+    (),
+    (7, 114, 6, 37),
+    (7, 122, 6, 61),
+    (11,),
+    (14,),
+    (9,),
+    (17,),
+    (4,),
+    (7, 122, 6),
+    (119, 49),
+    (10,),
+    (13,),
+    (16,),
+    (3,),
+    (8,),
+    (28,),
+    (19,),
+    (22,),
+    (20,),
+    (23,),
+    (21,),
+    (1,),
+    (5,),
+    (74,),
+    (24,),
+    (25,),
+    (7, 143, 6, 62),
+    (7, 143, 6, 63),
+    (7, 6, 69),
+    (7, 144, 6, 55),
+    (7, 144, 6, 56),
+    (7, 145, 6, 60),
+    (7, 146, 49, 6, 54),
+    (7, 146, 49, 6, 53),
+    (7, 122, 6, 65),
+    (7, 122, 6, 66),
+    (7, 122, 6, 64),
+    (122,),
+    (),
+    (35,),
+    (),
+    (35,),
+    (146, 49),
+    (7, 119, 49, 6, 64),
+    (119,),
+    (7, 131, 6),
+    (148, 58),
+    (149, 122),
+    (27, 26),
+    (67,),
+    (149, 122, 12),
+    (),
+    (59,),
+    (32,),
+    (75, 155, 152, 73, 49, 31),
+    (153, 49, 89),
+    (152, 12),
+    (),
+    (154, 90, 18, 49, 89, 12),
+    (),
+    (154, 90, 18),
+    (),
+    (157, 49, 49, 29),
+    (158, 90, 18),
+    (),
+    (158, 90, 12),
+    (),
+    (160,),
+    (164,),
+    (161, 75, 103, 73, 122, 50),
+    (162,),
+    (163,),
+    (),
+    (75, 103, 73, 39),
+    (161, 75, 103, 73, 122, 38),
+    (75, 165, 18, 168, 167, 33, 73, 122, 42),
+    (166, 102),
+    (169, 59),
+    (165,),
+    (169,),
+    (90,),
+    (36,),
+    (168, 167, 12),
+    (),
+    (165, 18, 168, 167, 33),
+    (103, 18, 30),
+    (171,),
+    (173,),
+    (174,),
+    (75, 175, 73, 172, 49, 12, 122, 12, 126, 18, 49, 43),
+    (126, 136),
+    (126, 18),
+    (75, 175, 73, 122, 68),
+    (122, 68, 75, 175, 73, 46),
+    (176, 177),
+    (175,),
+    (),
+    (101,),
+    (178,),
+    (182,),
+    (170,),
+    (179, 75, 187, 73, 122, 50),
+    (180,),
+    (181,),
+    (),
+    (75, 187, 73, 39),
+    (179, 75, 187, 73, 122, 38),
+    (75, 183, 18, 168, 167, 33, 73, 122, 42),
+    (184, 102),
+    (185, 150),
+    (183,),
+    (185,),
+    (183, 18, 168, 167, 33),
+    (186, 18, 30),
+    (103,),
+    (32,),
+    (188, 177),
+    (150,),
+    (187,),
+    (),
+    (190,),
+    (190, 75, 193, 73, 7, 97, 6, 49, 45),
+    (191,),
+    (191, 151),
+    (),
+    (101,),
+    (147,),
+    (199,),
+    (194,),
+    (203,),
+    (193, 192),
+    (),
+    (75, 195, 18, 168, 167, 33, 73, 122, 42),
+    (196, 102),
+    (197, 147),
+    (197, 59),
+    (195,),
+    (197,),
+    (195, 18, 168, 167, 33),
+    (198, 18, 30),
+    (198, 102),
+    (147,),
+    (200, 75, 193, 192, 73, 122, 50),
+    (201,),
+    (202,),
+    (),
+    (75, 193, 192, 73, 39),
+    (200, 75, 193, 192, 73, 122, 38),
+    (204,),
+    (205,),
+    (206,),
+    (75, 207, 73, 172, 49, 12, 122, 12, 126, 18, 49, 43),
+    (75, 207, 73, 122, 68),
+    (122, 68, 75, 207, 73, 46),
+    (176, 208),
+    (209,),
+    (101,),
+    (215,),
+    (147,),
+    (203,),
+    (210, 75, 213, 73, 122, 50),
+    (211,),
+    (),
+    (212,),
+    (75, 213, 73, 39),
+    (200, 75, 213, 73, 122, 38),
+    (214, 208),
+    (214, 150),
+    (213,),
+    (),
+    (75, 216, 18, 168, 167, 33, 73, 122, 42),
+    (217, 102),
+    (218, 147),
+    (218, 150),
+    (216,),
+    (218,),
+    (216, 18, 168, 167, 33),
+    (219, 18, 30),
+    (219, 102),
+    (147,),
+    (32,),
+)
+
+TABLE = (
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, 0, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, 0, -1, 0, -1, 0, -1, 0, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 4, -1, -1, 3, -1, -1, -1, -1, -1, 3, -1, -1, -1, -1, 4, -1, 3, -1, 2, -1, 1, -1, -1, -1, -1, -1, 4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 3, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 6, -1, -1, -1, -1, -1, 6, -1, -1, -1, -1, -1, -1, -1, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 7, -1, -1, -1, -1, -1, 7, -1, -1, -1, -1, -1, -1, -1, 8, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 9, -1, -1, -1, -1, -1, 9, -1, -1, -1, -1, -1, -1, -1, 10, -1, -1, 9, 9, 9, 9, 9, 9, -1, -1, -1, -1, -1, 9, -1, 9, 9, -1, 9, 9, 9, -1, 9, 9, 9, -1, -1, -1, -1, -1, 9, 9, 9, -1, -1, 9, 9, -1, -1, -1, -1, 9, 9, 9, -1, -1, -1, -1, 9),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 11, -1, -1, -1, -1, -1, -1, -1, 12, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 13, -1, -1, -1, -1, -1, -1, -1, 14, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 15, -1, -1, -1, -1, -1, -1, -1, 16, -1, -1, 15, 15, 15, 15, 15, 15, -1, -1, -1, -1, -1, 15, -1, 15, 15, -1, 15, 15, 15, -1, 15, 15, 15, -1, -1, -1, -1, -1, 15, 15, 15, -1, -1, 15, 15, -1, -1, -1, -1, 15, 15, 15, -1, -1, -1, -1, 15),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 17, -1, -1, -1, -1, -1, 18, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 20, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 19, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 21, -1, -1, -1, -1, -1, 22, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 22, 22, 22, 22, 22, 22, -1, -1, -1, -1, -1, 22, -1, 22, 22, -1, 22, 22, 22, -1, 22, 22, 22, -1, -1, -1, -1, -1, 22, 22, 22, -1, -1, 22, 22, -1, -1, -1, -1, 22, 22, 22, -1, -1, -1, -1, 22),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 23, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 24, 24, 24, 24, 24, 24, -1, -1, -1, -1, -1, 24, -1, 24, 24, -1, 24, 24, 24, -1, 24, 24, 24, -1, -1, -1, -1, -1, 24, 24, 24, -1, -1, 24, 24, -1, -1, -1, -1, 24, 24, 24, -1, -1, -1, -1, 24),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 25, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 26, 26, 26, 26, 26, 26, -1, -1, -1, -1, -1, 26, -1, 26, 26, -1, 26, 26, 26, -1, 26, 26, 26, -1, -1, -1, -1, -1, 26, 26, 26, -1, -1, 26, 26, -1, -1, -1, -1, 26, 26, 26, -1, -1, -1, -1, 26),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 29, -1, -1, -1, -1, -1, 30, -1, -1, -1, -1, -1, -1, 27, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 28, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 32, -1, -1, -1, -1, -1, 33, -1, -1, -1, -1, -1, -1, 31, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 31, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 34, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 35, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 36, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 37, -1, 37, 37, 37, 37, 37, 37, -1, -1, -1, -1, -1, 37, -1, 37, 37, -1, -1, 37, 37, -1, 37, 37, 37, -1, -1, -1, -1, -1, -1, 37, 37, -1, -1, 37, 37, -1, -1, -1, -1, 37, 37, 37, -1, -1, -1, -1, 37),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 38, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 39, 39, 39, 39, 39, 39, -1, -1, -1, -1, -1, 39, -1, 39, 39, -1, 39, 39, 39, -1, 39, 39, 39, -1, -1, -1, -1, -1, 39, 39, 39, -1, -1, 39, 39, -1, -1, -1, -1, 39, 39, 39, -1, -1, -1, -1, 39),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 40, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 41, 41, 41, 41, 41, 41, -1, -1, -1, -1, -1, 41, -1, 41, 41, -1, 41, 41, 41, -1, 41, 41, 41, -1, -1, -1, -1, -1, 41, 41, 41, -1, -1, 41, 41, -1, -1, -1, -1, 41, 41, 41, -1, -1, -1, -1, 41),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 43, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 42, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 43, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 44, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 45, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, 47, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 46, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, 50, -1, -1, -1, -1, 48, -1, -1, -1, -1, -1, 49, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 51, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, 53, -1, -1, -1, -1, 52, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 58, -1, 57, -1, -1, 54, -1, -1, -1, -1, -1, 54, -1, -1, -1, -1, -1, -1, 54, -1, 55, -1, 54, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 56, 56, -1, -1, -1, -1, -1, 56, 54, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 61, -1, 61, -1, -1, 61, -1, -1, -1, -1, -1, 61, -1, 59, 60, -1, -1, 60, 61, -1, 61, 59, 61, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 61, 61, -1, -1, -1, -1, 60, 61, 61, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 62, -1, 62, -1, -1, 62, -1, -1, -1, -1, -1, 62, -1, 62, 62, -1, -1, 62, 62, -1, 62, 62, 62, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 62, 62, -1, -1, -1, -1, 62, 62, 62, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 63, -1, 63, -1, -1, 63, -1, -1, -1, -1, -1, 63, -1, 63, 63, -1, -1, 63, 63, -1, 63, 63, 63, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 63, 63, -1, -1, -1, -1, 63, 63, 63, -1, -1, -1, -1, 64),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 66, -1, -1, -1, -1, -1, 66, -1, -1, -1, -1, -1, -1, 66, -1, -1, -1, 65, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 66, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 67, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 69, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 68, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, 70, -1, 71, -1, -1, 70, -1, 70, 70, -1, 70, 72, -1, 70, 70, -1, -1, -1, -1, -1, -1, -1, 73, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 75, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 74, -1, -1, 76, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, 78, -1, -1, -1, -1, 78, -1, 78, -1, -1, 78, -1, -1, 78, 77, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, 80, -1, -1, -1, -1, 80, -1, 80, -1, -1, 80, 82, -1, 80, 79, -1, -1, -1, -1, -1, -1, -1, 81, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (84, -1, -1, -1, -1, -1, 84, -1, -1, -1, -1, -1, -1, 84, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 83, -1, -1, -1, -1, -1, -1, -1, -1, 84, -1, -1, -1, -1, -1, 84, -1, -1, -1, -1, -1, -1, 84, 84, -1, -1, -1, 84, 84, 84, 84, -1, -1, -1, 84, -1, -1, -1, 84, 84, 84, -1, -1, -1, -1, -1, 84, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 85, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 86, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (87, -1, -1, -1, -1, -1, 87, 88, -1, -1, -1, -1, -1, 87, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 88, -1, -1, -1, -1, -1, -1, -1, 87, -1, -1, -1, -1, -1, 87, -1, -1, -1, -1, -1, -1, 87, 87, -1, -1, -1, 87, 87, 87, 87, -1, -1, -1, 87, -1, -1, -1, 87, 87, 87, -1, -1, -1, -1, -1, 87, -1, -1, -1),
+    (-1, -1, -1, -1, 90, -1, -1, -1, -1, 90, -1, 90, -1, -1, 90, -1, -1, 90, 89, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (92, -1, -1, -1, -1, -1, 92, -1, -1, -1, -1, -1, -1, 92, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 91, -1, -1, -1, -1, -1, -1, -1, -1, 92, -1, -1, -1, -1, -1, 92, -1, -1, -1, -1, -1, -1, 92, 92, -1, -1, -1, 92, 92, 92, 92, -1, -1, -1, 92, -1, -1, -1, 92, 92, 92, -1, -1, -1, -1, -1, 92, -1, -1, -1),
+    (-1, -1, -1, -1, 95, -1, -1, -1, -1, 95, -1, 95, 94, -1, 95, -1, -1, 95, 93, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (96, -1, -1, -1, -1, -1, 96, -1, -1, -1, -1, -1, -1, 96, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 97, -1, -1, -1, -1, -1, -1, -1, -1, 96, -1, -1, -1, -1, -1, 96, -1, -1, -1, -1, -1, -1, 96, 96, -1, -1, -1, 96, 96, 96, 96, -1, -1, -1, 96, -1, -1, -1, 96, 96, 96, -1, -1, -1, -1, -1, 96, -1, -1, -1),
+    (-1, 100, -1, 100, -1, 100, -1, 100, 100, -1, 100, -1, 100, 100, -1, 98, 100, -1, -1, 100, 100, 100, 100, 100, 100, 100, 99, 100, 100, 100, 100, 100, 100, 100, 100, -1, -1, -1, -1, -1, 100, -1, 100, 100, -1, -1, 100, 100, -1, 100, 100, 100, -1, -1, -1, -1, -1, -1, 100, 100, -1, -1, 100, 100, -1, -1, -1, -1, 100, 100, 100, -1, -1, 100, 100, 100),
+    (-1, 102, -1, 102, -1, 102, -1, 102, 102, -1, 102, -1, 102, 102, -1, -1, 102, -1, -1, 102, 102, 102, 102, 102, 102, 102, 101, 102, 102, 102, 102, 102, 102, 102, 102, -1, -1, -1, -1, -1, 102, -1, 102, 102, -1, -1, 102, 102, -1, 102, 102, 102, -1, -1, -1, -1, -1, -1, 102, 102, -1, -1, 102, 102, -1, -1, -1, -1, 102, 102, 102, -1, -1, 102, 102, 102),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 103, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 104, 104, 104, 104, 104, 104, -1, -1, -1, -1, -1, 104, -1, 104, 104, -1, -1, 104, 104, -1, 104, 104, 104, -1, -1, -1, -1, -1, -1, 104, 104, -1, -1, 104, 104, -1, -1, -1, -1, 104, 104, 104, -1, -1, -1, -1, 104),
+    (105, -1, -1, -1, -1, -1, 105, -1, -1, -1, -1, -1, -1, 105, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 105, -1, -1, -1, -1, -1, 105, -1, -1, -1, -1, -1, -1, 105, 105, -1, -1, -1, 105, 105, 105, 105, -1, -1, -1, 105, -1, -1, -1, 105, 105, 105, -1, -1, -1, -1, -1, 105, -1, -1, -1),
+    (-1, -1, -1, -1, -1, 106, -1, 107, -1, -1, -1, -1, 107, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 106, 106, -1, 107, -1, 107, 107, 107, 107, 107, 107, -1, -1, -1, -1, -1, 107, -1, 107, 107, -1, -1, 107, 107, -1, 107, 107, 107, -1, -1, -1, -1, -1, -1, 107, 107, -1, -1, 107, 107, -1, -1, -1, -1, 107, 107, 107, -1, -1, 107, 106, 107),
+    (108, -1, -1, -1, -1, -1, 108, -1, -1, -1, -1, -1, -1, 108, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 108, -1, -1, -1, -1, -1, 108, -1, -1, -1, -1, -1, -1, 108, 108, -1, -1, -1, 108, 108, 108, 108, -1, -1, -1, 108, -1, -1, -1, 108, 108, 108, -1, -1, -1, -1, -1, 108, -1, -1, -1),
+    (-1, 109, -1, -1, -1, 110, -1, 110, -1, -1, -1, -1, 110, -1, -1, -1, -1, -1, -1, 109, 109, 109, 109, 109, 110, 110, -1, 110, -1, 110, 110, 110, 110, 110, 110, -1, -1, -1, -1, -1, 110, -1, 110, 110, -1, -1, 110, 110, -1, 110, 110, 110, -1, -1, -1, -1, -1, -1, 110, 110, -1, -1, 110, 110, -1, -1, -1, -1, 110, 110, 110, -1, -1, 110, 110, 110),
+    (111, -1, -1, -1, -1, -1, 111, -1, -1, -1, -1, -1, -1, 111, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 111, -1, -1, -1, -1, -1, 111, -1, -1, -1, -1, -1, -1, 111, 111, -1, -1, -1, 111, 111, 111, 111, -1, -1, -1, 111, -1, -1, -1, 111, 111, 111, -1, -1, -1, -1, -1, 111, -1, -1, -1),
+    (-1, 113, -1, 112, -1, 113, -1, 113, 112, -1, 112, -1, 113, 112, -1, -1, 112, -1, -1, 113, 113, 113, 113, 113, 113, 113, -1, 113, 112, 113, 113, 113, 113, 113, 113, -1, -1, -1, -1, -1, 113, -1, 113, 113, -1, -1, 113, 113, -1, 113, 113, 113, -1, -1, -1, -1, -1, -1, 113, 113, -1, -1, 113, 113, -1, -1, -1, -1, 113, 113, 113, -1, -1, 113, 113, 113),
+    (118, -1, -1, -1, -1, -1, 119, -1, -1, -1, -1, -1, -1, 116, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 115, -1, -1, -1, -1, -1, 115, -1, -1, -1, -1, -1, -1, 115, 114, -1, -1, -1, 117, 117, 117, 117, -1, -1, -1, 117, -1, -1, -1, 117, 117, 117, -1, -1, -1, -1, -1, 115, -1, -1, -1),
+    (-1, 124, -1, 124, -1, 124, 120, 124, 124, -1, 124, -1, 124, 124, -1, 121, 124, -1, -1, 124, 124, 124, 124, 124, 124, 124, 122, 124, 124, 124, 124, 124, 124, 124, 124, -1, -1, -1, -1, -1, 124, -1, 124, 124, -1, -1, 124, 124, -1, 124, 124, 124, -1, -1, -1, -1, -1, -1, 124, 124, -1, -1, 124, 124, -1, -1, -1, -1, 124, 124, 124, 123, -1, 124, 124, 124),
+    (-1, 126, -1, 126, -1, 126, -1, 126, 126, -1, 126, -1, 126, 126, -1, -1, 126, -1, -1, 126, 126, 126, 126, 126, 126, 126, -1, 126, 126, 126, 126, 126, 126, 126, 126, -1, -1, -1, -1, -1, 126, -1, 126, 126, -1, -1, 126, 126, -1, 126, 126, 126, -1, -1, -1, -1, -1, -1, 126, 126, -1, -1, 126, 126, -1, -1, -1, -1, 126, 126, 126, 125, -1, 126, 126, 126),
+    (127, -1, -1, -1, -1, -1, 127, 128, -1, -1, -1, -1, -1, 127, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 127, -1, -1, -1, -1, -1, 127, -1, -1, -1, -1, -1, -1, 127, 127, -1, -1, -1, 127, 127, 127, 127, -1, -1, -1, 127, -1, -1, -1, 127, 127, 127, -1, -1, -1, -1, -1, 127, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, 130, -1, -1, -1, -1, 129, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 133, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 131, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 132, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, 136, -1, 136, -1, 136, -1, 136, 136, -1, 136, -1, 136, 136, -1, 135, 136, -1, -1, 136, 136, 136, 136, 136, 136, 136, 134, 136, 136, 136, 136, 136, 136, 136, 136, -1, -1, -1, -1, -1, 136, -1, 136, 136, -1, -1, 136, 136, -1, 136, 136, 136, -1, -1, -1, -1, -1, -1, 136, 136, -1, -1, 136, 136, -1, -1, -1, -1, 136, 136, 136, -1, -1, 136, 136, 136),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 137, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 138, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, 143, -1, -1, -1, -1, 141, -1, 139, -1, -1, 140, -1, -1, 142, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, 144, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 145, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, 149, -1, -1, -1, -1, 150, -1, 146, -1, -1, 147, -1, -1, 148, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 151, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, 157, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 152, 154, 156, 153, 155, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, 158, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 160, 161, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 159, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 162, 163, -1, -1, -1, -1, -1, 164, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 169, 168, 165, 166, -1, -1, -1, 167, -1, -1, -1, 172, 170, 171, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (173, -1, -1, -1, -1, -1, 173, 174, -1, -1, -1, -1, -1, 173, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 173, -1, -1, -1, -1, -1, 173, -1, -1, -1, -1, -1, -1, 173, 173, -1, -1, -1, 173, 173, 173, 173, -1, -1, -1, 173, -1, -1, -1, 173, 173, 173, -1, -1, -1, -1, -1, 173, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, 176, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 175, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 177, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 178, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 179, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, 181, 180, -1, -1, -1, -1, -1, -1, -1, 180, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 180, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 182, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (183, -1, -1, -1, -1, -1, 183, -1, -1, -1, -1, -1, -1, 183, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 184, -1, -1, -1, -1, -1, -1, -1, -1, 183, -1, -1, -1, -1, -1, 183, -1, -1, -1, -1, -1, -1, 183, 183, -1, -1, -1, 183, 183, 183, 183, -1, -1, -1, 183, -1, -1, -1, 183, 183, 183, 185, -1, -1, -1, -1, 183, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 186, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 187, 187, 187, 187, 187, 187, -1, -1, -1, -1, -1, 187, -1, 187, 187, -1, -1, 187, 187, -1, 187, 187, 187, -1, -1, -1, -1, -1, -1, 187, 187, -1, -1, 187, 187, -1, -1, -1, -1, 187, 187, 187, -1, -1, -1, -1, 187),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 189, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 188, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 190, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 191, -1, -1, -1, -1, -1, 191, -1, -1, -1, -1, -1, -1, 191, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 191, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 192, -1, -1, -1, -1, -1, 193, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 193),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 194, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 195),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 196, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 197),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 198, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 199, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 200, 200, 200, 200, 200, 200, -1, -1, -1, -1, -1, 200, -1, 200, 200, -1, -1, 200, 200, -1, 200, 200, 200, -1, -1, -1, -1, -1, -1, 200, 200, -1, -1, 200, 200, -1, -1, -1, -1, 200, 200, 200, -1, -1, -1, -1, 200),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 201, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 202, 202, 202, 202, 202, 202, -1, -1, -1, -1, -1, 202, -1, 202, 202, -1, -1, 202, 202, -1, 202, 202, 202, -1, -1, -1, -1, -1, -1, 202, 202, -1, -1, 202, 202, -1, -1, -1, -1, 202, 202, 202, -1, -1, -1, -1, 202),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 204, -1, -1, -1, -1, -1, -1, -1, 203, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 205, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 208, 208, 208, 208, 208, 208, -1, -1, -1, 207, 206, 208, -1, 208, 208, -1, -1, 208, 208, -1, 208, 208, 208, -1, -1, -1, -1, -1, -1, 208, 208, -1, -1, 208, 208, -1, -1, -1, -1, 208, 208, 208, -1, -1, -1, -1, 208),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 209, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 210, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 211, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 212, -1, 212, -1, -1, 212, -1, -1, -1, -1, -1, 212, -1, 212, 212, -1, -1, 212, 212, -1, 212, 212, 212, -1, -1, -1, -1, -1, -1, -1, 213, -1, -1, 212, 212, -1, -1, -1, -1, 212, 212, 212, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 214, 215, 214, -1, 215, 214, -1, -1, -1, -1, -1, 214, -1, 214, 214, -1, -1, 214, 214, -1, 214, 214, 214, -1, -1, -1, -1, -1, -1, -1, 214, -1, -1, 214, 214, -1, -1, -1, -1, 214, 214, 214, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 216, 217, -1, -1, -1, -1, 216, -1, -1, -1, -1, -1, -1, 216, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 216, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 218, -1, -1, -1, -1, -1, 219, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 221, -1, -1, 220, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 222, -1, -1, 224, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 223, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 225, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, 226, -1, -1, -1, -1, 226, -1, 226, -1, -1, 226, -1, -1, 226, 227, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 228, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 229, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 230, -1, 230, -1, -1, 230, -1, -1, -1, -1, -1, 230, -1, 230, 230, -1, -1, 230, 230, -1, 230, 230, 230, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 230, 230, -1, -1, -1, -1, 230, 230, 230, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 231, -1, 231, -1, -1, 231, -1, -1, -1, -1, -1, 231, -1, 231, 231, -1, -1, 231, 231, -1, 231, 231, 231, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 231, 231, -1, -1, -1, -1, 231, 231, 231, -1, -1, -1, -1, 232),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 233, -1, 233, -1, -1, 233, -1, -1, -1, -1, -1, 233, -1, 235, 236, -1, -1, 236, 233, -1, 233, 234, 233, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 233, 233, -1, -1, -1, -1, 236, 233, 233, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 237, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 240, -1, 240, 240, -1, 240, -1, -1, -1, 239, 238, 240, -1, 240, 240, -1, -1, 240, 240, -1, 240, 240, 240, -1, -1, -1, -1, -1, -1, -1, 240, -1, -1, 240, 240, -1, -1, -1, -1, 240, 240, 240, -1, -1, -1, -1, 240),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 241, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 242, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 243, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 244, -1, 244, 245, -1, 244, -1, -1, -1, -1, -1, 244, -1, 244, 244, -1, -1, 244, 244, -1, 244, 244, 244, -1, -1, -1, -1, -1, -1, -1, 245, -1, -1, 244, 244, -1, -1, -1, -1, 244, 244, 244, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 246, 247, 246, 246, 247, 246, -1, -1, -1, -1, -1, 246, -1, 246, 246, -1, -1, 246, 246, -1, 246, 246, 246, -1, -1, -1, -1, -1, -1, -1, 246, -1, -1, 246, 246, -1, -1, -1, -1, 246, 246, 246, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 249, -1, -1, 248, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 250, -1, 250, 251, -1, 250, -1, -1, -1, -1, -1, 250, -1, 250, 250, -1, -1, 250, 250, -1, 250, 250, 250, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 250, 250, -1, -1, -1, -1, 250, 250, 250, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 252, -1, 252, 253, -1, 252, -1, -1, -1, -1, -1, 252, -1, 252, 252, -1, -1, 252, 252, -1, 252, 252, 252, -1, -1, -1, -1, -1, -1, -1, 253, -1, -1, 252, 252, -1, -1, -1, -1, 252, 252, 252, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 254, -1, 254, 254, -1, 254, -1, -1, -1, -1, -1, 254, -1, 254, 254, -1, -1, 254, 254, -1, 254, 254, 254, -1, -1, -1, -1, -1, -1, -1, 254, -1, -1, 254, 254, -1, -1, -1, -1, 254, 254, 254, -1, -1, -1, -1, 255),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 256, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 256, 256, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 258, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 258, 257, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 259, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 260, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 261, -1, 261, -1, -1, 261, -1, -1, -1, -1, -1, 261, -1, 264, 265, -1, -1, 265, 261, -1, 261, 263, 261, -1, -1, -1, -1, -1, -1, 262, -1, -1, -1, 261, 261, -1, -1, -1, -1, 265, 261, 261, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 266, -1, 266, -1, -1, 266, -1, -1, -1, -1, -1, 266, -1, 266, 266, -1, -1, 266, 266, -1, 266, 266, 266, -1, -1, -1, -1, -1, -1, 266, -1, -1, -1, 266, 266, -1, -1, -1, -1, 266, 266, 266, -1, -1, -1, -1, 267),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 268, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 269, -1, 269, -1, -1, 269, -1, -1, -1, -1, -1, 269, -1, 269, 269, -1, -1, 269, 269, -1, 269, 269, 269, -1, -1, -1, -1, -1, -1, 270, 271, -1, -1, 269, 269, -1, -1, -1, -1, 269, 269, 269, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 272, 273, 272, -1, 273, 272, -1, -1, -1, -1, -1, 272, -1, 272, 272, -1, -1, 272, 272, -1, 272, 272, 272, -1, -1, -1, -1, -1, -1, 272, 272, -1, -1, 272, 272, -1, -1, -1, -1, 272, 272, 272, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 275, -1, -1, 274, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 276, -1, 276, -1, -1, 276, -1, -1, -1, -1, -1, 276, -1, 276, 276, -1, -1, 276, 276, -1, 276, 276, 276, -1, -1, -1, -1, -1, -1, 277, -1, -1, -1, 276, 276, -1, -1, -1, -1, 276, 276, 276, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 278, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 281, -1, 281, 281, -1, 281, -1, -1, -1, 280, 279, 281, -1, 281, 281, -1, -1, 281, 281, -1, 281, 281, 281, -1, -1, -1, -1, -1, -1, 281, 281, -1, -1, 281, 281, -1, -1, -1, -1, 281, 281, 281, -1, -1, -1, -1, 281),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 282, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 283, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 284, -1, -1, 286, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 285, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 287, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 288, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 289, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 290, -1, 290, -1, -1, 290, -1, -1, -1, -1, -1, 290, -1, 290, 290, -1, -1, 290, 290, -1, 290, 290, 290, -1, -1, -1, -1, -1, -1, 290, -1, -1, -1, 290, 290, -1, -1, -1, -1, 290, 290, 290, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 292, -1, 292, -1, -1, 292, -1, -1, -1, -1, -1, 292, -1, 293, 295, -1, -1, 295, 292, -1, 292, 291, 292, -1, -1, -1, -1, -1, -1, 294, -1, -1, -1, 292, 292, -1, -1, -1, -1, 295, 292, 292, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 296, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 298, -1, 298, 298, -1, 298, -1, -1, -1, 299, 297, 298, -1, 298, 298, -1, -1, 298, 298, -1, 298, 298, 298, -1, -1, -1, -1, -1, -1, 298, 298, -1, -1, 298, 298, -1, -1, -1, -1, 298, 298, 298, -1, -1, -1, -1, 298),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 300, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 301, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 302, -1, 302, 303, -1, 302, -1, -1, -1, -1, -1, 302, -1, 302, 302, -1, -1, 302, 302, -1, 302, 302, 302, -1, -1, -1, -1, -1, -1, 302, 303, -1, -1, 302, 302, -1, -1, -1, -1, 302, 302, 302, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 304, -1, 304, 304, -1, 304, -1, -1, -1, -1, -1, 304, -1, 304, 304, -1, -1, 304, 304, -1, 304, 304, 304, -1, -1, -1, -1, -1, -1, 304, 304, -1, -1, 304, 304, -1, -1, -1, -1, 304, 304, 304, -1, -1, -1, -1, 305),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 306, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 307, -1, 307, 309, -1, 307, -1, -1, -1, -1, -1, 307, -1, 307, 307, -1, -1, 307, 307, -1, 307, 307, 307, -1, -1, -1, -1, -1, -1, 308, 309, -1, -1, 307, 307, -1, -1, -1, -1, 307, 307, 307, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 310, 311, 310, 310, 311, 310, -1, -1, -1, -1, -1, 310, -1, 310, 310, -1, -1, 310, 310, -1, 310, 310, 310, -1, -1, -1, -1, -1, -1, 310, 310, -1, -1, 310, 310, -1, -1, -1, -1, 310, 310, 310, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 313, -1, -1, 312, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 314, -1, 314, 316, -1, 314, -1, -1, -1, -1, -1, 314, -1, 314, 314, -1, -1, 314, 314, -1, 314, 314, 314, -1, -1, -1, -1, -1, -1, 315, -1, -1, -1, 314, 314, -1, -1, -1, -1, 314, 314, 314, -1, -1, -1, -1, -1),
+)
+
+FIRST = (
+    ('build', 'comms', 'flag', 'generate', 'hp', 'id', 'immo', 'play', 'xp'),
+    ('comms', 'flag', 'hp', 'id', 'immo', 'xp', 'λ'),
+    (',', ':', '['),
+    (',', ':', '['),
+    (',', ':', '[', 'λ'),
+    (':', '['),
+    (':', '['),
+    (':', '[', 'λ'),
+    (',', ':'),
+    ('hp_ltr', 'λ'),
+    (',', 'λ'),
+    (',', 'λ'),
+    (':', 'λ'),
+    ('comms', 'flag', 'hp', 'xp'),
+    ('comms_ltr', 'flag_ltr', 'hp_ltr', 'xp_ltr'),
+    ('hp_ltr', 'xp_ltr'),
+    (',', 'λ'),
+    (',', 'λ'),
+    (',', 'λ'),
+    ('build', 'generate', 'λ'),
+    ('build', 'λ'),
+    ('id', 'λ'),
+    (',', ':', 'λ'),
+    ('id',),
+    (',', 'λ'),
+    ('access', 'build', 'comms', 'flag', 'hp', 'id', 'immo', 'shoot', 'shootNxt', 'wipe', 'xp'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'shoot', 'shootNxt', 'while', 'wipe', 'xp', 'λ'),
+    ('comms', 'flag', 'hp', 'immo', 'xp'),
+    ('id',),
+    ('access', 'id'),
+    ('%=', '(', '*=', '+=', ',', '-=', '.', '/=', ':', '['),
+    ('drop', 'id', 'join'),
+    ('%=', '*=', '+=', '-=', '/=', ':'),
+    ('%=', '*=', '+=', '-=', '.', '/=', ':', '['),
+    ('!', '(', '-', '[', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr'),
+    ('drop', 'join'),
+    ('!', '(', '-', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr', 'λ'),
+    ('%=', '*=', '+=', '-=', '/=', ':'),
+    ('!', '(', '-', '[', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr'),
+    ('%=', '*=', '+=', ',', '-=', '/=', ':'),
+    ('!', '(', '-', '[', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr'),
+    ('.', '[', 'λ'),
+    ('[', 'λ'),
+    (',', 'λ'),
+    ('!', '(', '-', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr'),
+    ('&&', 'AND', 'OR', '||', 'λ'),
+    ('!', '(', '-', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr'),
+    ('!=', '<', '<=', '==', '>', '>=', 'λ'),
+    ('!', '(', '-', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr'),
+    ('%', '*', '+', '-', '/', '^', 'λ'),
+    ('!', '(', '-', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr'),
+    ('(', '.', '[', 'xp_formatting', 'λ'),
+    ('xp_formatting', 'λ'),
+    ('!', '(', '-', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr', 'λ'),
+    (',', 'λ'),
+    ('drop', 'id', 'seek'),
+    ('.', '[', 'λ'),
+    ('drop', 'seek'),
+    ('%=', '*=', '+=', '-=', '/='),
+    ('(', 'id'),
+    ('%', '*', '+', '-', '/', '^'),
+    ('!=', '<', '<=', '==', '>', '>='),
+    ('&&', 'AND', 'OR', '||'),
+    ('shoot', 'shootNxt', 'wipe'),
+    ('levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp'),
+    ('!', '(', '-', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'xp_ltr', 'λ'),
+    ('comms_ltr', 'λ'),
+    ('comms_ltr', 'id', 'toComms'),
+    ('(', '.', '[', 'λ'),
+    ('recall',),
+    ('!', '(', '-', '[', 'comms_ltr', 'flag_ltr', 'hp_ltr', 'id', 'levelDown', 'levelUp', 'load', 'loadNum', 'rounds', 'toComms', 'toHp', 'toXp', 'void', 'xp_ltr'),
+    (',', 'λ'),
+    ('checkpoint', 'resume'),
+    ('build',),
+    ('comms', 'flag', 'hp', 'xp'),
+    (',', 'λ'),
+    (',', 'λ'),
+    (':', 'λ'),
+    ('access',),
+    (':', 'λ'),
+    (',', 'λ'),
+    ('flank', 'if'),
+    ('if',),
+    ('elif', 'else', 'λ'),
+    ('else',),
+    ('elif',),
+    ('flank',),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'backup', 'build', 'choice', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('comms_ltr', 'dead', 'flag_ltr', 'hp_ltr', 'xp_ltr'),
+    (',', 'λ'),
+    ('backup', 'choice'),
+    ('for', 'grind', 'while'),
+    ('for',),
+    ('%=', '*=', '+=', '-=', '/=', ':'),
+    ('while',),
+    ('grind',),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'shoot', 'shootNxt', 'while', 'wipe', 'xp', 'λ'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('if',),
+    ('elif', 'else', 'λ'),
+    ('else',),
+    ('elif',),
+    ('flank',),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'backup', 'build', 'checkpoint', 'choice', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('backup', 'choice'),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp', 'λ'),
+    ('build', 'generate', 'λ'),
+    ('build', 'generate', 'λ'),
+    ('build', 'λ'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'shoot', 'shootNxt', 'while', 'wipe', 'xp', 'λ'),
+    ('flank',),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'backup', 'build', 'choice', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('backup', 'choice'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('if',),
+    ('elif', 'else', 'λ'),
+    ('else',),
+    ('elif',),
+    ('for', 'grind', 'while'),
+    ('for',),
+    ('while',),
+    ('grind',),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('if',),
+    ('elif', 'else', 'λ'),
+    ('else',),
+    ('elif',),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp', 'λ'),
+    ('flank',),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('access', 'backup', 'build', 'checkpoint', 'choice', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'resume', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+    ('backup', 'choice'),
+    ('access', 'build', 'checkpoint', 'comms', 'flag', 'flank', 'for', 'grind', 'hp', 'id', 'if', 'immo', 'recall', 'shoot', 'shootNxt', 'while', 'wipe', 'xp'),
+)
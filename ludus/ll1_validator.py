@@ -0,0 +1,3257 @@
+# Generated by `python -m ludus.tablegen` from ludus/cfg.py, do not edit.
+
+CFG_HASH = '12e76266'
+
+class Failure(Exception):
+    pass
+
+def validate(toks):
+    # returns (pos, None, None) with pos just past <program>, or for a
+    # syntax error at toks[pos] (pos, terminal, None) when that terminal
+    # was expected and (pos, non_terminal, cont) when FIRST(non_terminal)
+    # and the cont under it were
+    pos = 0
+    save_pos = -1     # pos of the first λ expansion since the last match
+    save = None       # (non_terminal, cont) of that expansion
+
+    def p_program(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {31, 34, 40, 45, 47, 49, 51, 57, 70}:
+            # <program> -> <global_dec> <func_dec> play ( ) { <body> } <fs_body> gameOver
+            below = ((95, 57, 6, 7, 73, 103, 75, 189, 44), cont)
+            tail = p_global_dec(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((57, 6, 7, 73, 103, 75, 189, 44), cont)
+            tail = p_func_dec(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 57:
+                raise Failure(pos, 57)
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 189, 44), cont)
+            tail = p_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            below = ((44,), cont)
+            tail = p_fs_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 44:
+                raise Failure(pos, 44)
+            pos += 1
+        else:
+            raise Failure(pos, 76, cont)
+
+    def p_global_dec(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 51:
+            # <global_dec> -> immo id <global_dec_tail1> <global_dec>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((77,), cont)
+            tail = p_global_dec_tail1(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_global_dec
+        elif t == 49:
+            # <global_dec> -> id <global_dec_tail2> <global_dec>
+            pos += 1
+            below = ((77,), cont)
+            tail = p_global_dec_tail2(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_global_dec
+        elif t in {34, 40, 47, 70}:
+            # <global_dec> -> <datatype> id <global_dec_tail3> <global_dec>
+            p_datatype(((49, 80, 77), cont))
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((77,), cont)
+            tail = p_global_dec_tail3(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_global_dec
+        elif t in {31, 45, 57}:
+            # <global_dec> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (77, cont)
+        else:
+            raise Failure(pos, 77, cont)
+
+    def p_global_dec_tail1(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 26:
+            # <global_dec_tail1> -> [ hp_ltr ] <arr_tail1>
+            pos += 1
+            if toks[pos] != 48:
+                raise Failure(pos, 48)
+            pos += 1
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_arr_tail1
+        elif t in {12, 18}:
+            # <global_dec_tail1> -> <const_tail>
+            return p_const_tail
+        else:
+            raise Failure(pos, 78, cont)
+
+    def p_global_dec_tail2(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {12, 18}:
+            # <global_dec_tail2> -> <const_tail>
+            return p_const_tail
+        elif t == 26:
+            # <global_dec_tail2> -> [ <arr_size> ] <arr_tail2>
+            pos += 1
+            p_arr_size(((27, 82), cont))
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_arr_tail2
+        else:
+            raise Failure(pos, 79, cont)
+
+    def p_global_dec_tail3(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {12, 18, 29, 30, 31, 32, 33, 34, 40, 42, 43, 45, 46, 47, 49, 50, 51, 57, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <global_dec_tail3> -> <id_recur> <dead_dec>
+            below = ((88,), cont)
+            tail = p_id_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_dead_dec
+        elif t == 26:
+            # <global_dec_tail3> -> [ <arr_size> ] <arr_tail3>
+            pos += 1
+            p_arr_size(((27, 83), cont))
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_arr_tail3
+        else:
+            raise Failure(pos, 80, cont)
+
+    def p_arr_tail1(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 18:
+            # <arr_tail1> -> : [ <value> , <value> <elems_recur> ]
+            pos += 1
+            if toks[pos] != 26:
+                raise Failure(pos, 26)
+            pos += 1
+            below = ((12, 90, 92, 27), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            below = ((92, 27), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27,), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+        elif t == 26:
+            # <arr_tail1> -> [ hp_ltr ] : [ <value> , <value> <elems_recur> ] , [ <value> , <value> <elems_recur> ] <row_recur2>
+            pos += 1
+            if toks[pos] != 48:
+                raise Failure(pos, 48)
+            pos += 1
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            if toks[pos] != 26:
+                raise Failure(pos, 26)
+            pos += 1
+            below = ((12, 90, 92, 27, 12, 26, 90, 12, 90, 92, 27, 94), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            below = ((92, 27, 12, 26, 90, 12, 90, 92, 27, 94), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27, 12, 26, 90, 12, 90, 92, 27, 94), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            if toks[pos] != 26:
+                raise Failure(pos, 26)
+            pos += 1
+            below = ((12, 90, 92, 27, 94), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            below = ((92, 27, 94), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27, 94), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_row_recur2
+        else:
+            raise Failure(pos, 81, cont)
+
+    def p_arr_tail2(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 18:
+            # <arr_tail2> -> : [ <value> <elems_recur> ]
+            pos += 1
+            if toks[pos] != 26:
+                raise Failure(pos, 26)
+            pos += 1
+            below = ((92, 27), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27,), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+        elif t == 26:
+            # <arr_tail2> -> [ <arr_size> ] : [ <value> <elems_recur> ] <row_recur>
+            pos += 1
+            p_arr_size(((27, 18, 26, 90, 92, 27, 93), cont))
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            if toks[pos] != 26:
+                raise Failure(pos, 26)
+            pos += 1
+            below = ((92, 27, 93), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27, 93), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_row_recur
+        else:
+            raise Failure(pos, 82, cont)
+
+    def p_arr_tail3(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {18, 29, 30, 31, 32, 33, 34, 40, 42, 43, 45, 46, 47, 49, 50, 51, 57, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <arr_tail3> -> <dead_dec>
+            return p_dead_dec
+        elif t == 26:
+            # <arr_tail3> -> [ <arr_size> ] <dead_dec>
+            pos += 1
+            p_arr_size(((27, 88), cont))
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_dead_dec
+        else:
+            raise Failure(pos, 83, cont)
+
+    def p_const_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 12:
+            # <const_tail> -> , id <id_recur> : <value>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((18, 90), cont)
+            tail = p_id_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_value
+        elif t == 18:
+            # <const_tail> -> : <value> <val_recur>
+            pos += 1
+            below = ((87,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_val_recur
+        else:
+            raise Failure(pos, 84, cont)
+
+    def p_arr_size(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 48:
+            # <arr_size> -> hp_ltr
+            pos += 1
+        elif t == 27:
+            # <arr_size> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (85, cont)
+        else:
+            raise Failure(pos, 85, cont)
+
+    def p_id_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <id_recur> -> , id <id_recur>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            return p_id_recur
+        elif t in {18, 29, 30, 31, 32, 33, 34, 40, 42, 43, 45, 46, 47, 49, 50, 51, 57, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <id_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (86, cont)
+        else:
+            raise Failure(pos, 86, cont)
+
+    def p_val_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <val_recur> -> , id : <value> <val_recur>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((87,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_val_recur
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 45, 46, 47, 49, 50, 51, 57, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <val_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (87, cont)
+        else:
+            raise Failure(pos, 87, cont)
+
+    def p_dead_dec(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 18:
+            # <dead_dec> -> : dead
+            pos += 1
+            if toks[pos] != 36:
+                raise Failure(pos, 36)
+            pos += 1
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 45, 46, 47, 49, 50, 51, 57, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <dead_dec> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (88, cont)
+        else:
+            raise Failure(pos, 88, cont)
+
+    def p_datatype(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 47:
+            # <datatype> -> hp
+            pos += 1
+        elif t == 70:
+            # <datatype> -> xp
+            pos += 1
+        elif t == 34:
+            # <datatype> -> comms
+            pos += 1
+        elif t == 40:
+            # <datatype> -> flag
+            pos += 1
+        else:
+            raise Failure(pos, 89, cont)
+
+    def p_value(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {48, 72}:
+            # <value> -> <numeric_ltr>
+            return p_numeric_ltr
+        elif t == 35:
+            # <value> -> comms_ltr
+            pos += 1
+        elif t == 41:
+            # <value> -> flag_ltr
+            pos += 1
+        else:
+            raise Failure(pos, 90, cont)
+
+    def p_numeric_ltr(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 48:
+            # <numeric_ltr> -> hp_ltr
+            pos += 1
+        elif t == 72:
+            # <numeric_ltr> -> xp_ltr
+            pos += 1
+        else:
+            raise Failure(pos, 91, cont)
+
+    def p_elems_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <elems_recur> -> , <value> <elems_recur>
+            pos += 1
+            below = ((92,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_elems_recur
+        elif t in {27, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <elems_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (92, cont)
+        else:
+            raise Failure(pos, 92, cont)
+
+    def p_row_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <row_recur> -> , [ <value> <elems_recur> ] <row_recur>
+            pos += 1
+            if toks[pos] != 26:
+                raise Failure(pos, 26)
+            pos += 1
+            below = ((92, 27, 93), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27, 93), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_row_recur
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 45, 46, 47, 49, 50, 51, 57, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <row_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (93, cont)
+        else:
+            raise Failure(pos, 93, cont)
+
+    def p_row_recur2(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <row_recur2> -> , [ <value> , <value> <elems_recur> ] <row_recur2>
+            pos += 1
+            if toks[pos] != 26:
+                raise Failure(pos, 26)
+            pos += 1
+            below = ((12, 90, 92, 27, 94), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            below = ((92, 27, 94), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27, 94), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_row_recur2
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 45, 46, 47, 49, 50, 51, 57, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <row_recur2> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (94, cont)
+        else:
+            raise Failure(pos, 94, cont)
+
+    def p_func_dec(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 45:
+            # <func_dec> -> generate id ( <params> ) <func_dec>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7, 95), cont)
+            tail = p_params(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+            return p_func_dec
+        elif t in {31, 57}:
+            # <func_dec> -> <struct_dec>
+            return p_struct_dec
+        else:
+            raise Failure(pos, 95, cont)
+
+    def p_struct_dec(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 31:
+            # <struct_dec> -> build id <struct_dec>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            return p_struct_dec
+        elif t == 57:
+            # <struct_dec> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (96, cont)
+        else:
+            raise Failure(pos, 96, cont)
+
+    def p_params(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 49:
+            # <params> -> id <def_or_recur>
+            pos += 1
+            return p_def_or_recur
+        elif t == 7:
+            # <params> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (97, cont)
+        else:
+            raise Failure(pos, 97, cont)
+
+    def p_def_or_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <def_or_recur> -> , id <def_or_recur>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            return p_def_or_recur
+        elif t == 18:
+            # <def_or_recur> -> : <value> <defparam_recur>
+            pos += 1
+            below = ((100,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_defparam_recur
+        elif t == 7:
+            # <def_or_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (98, cont)
+        else:
+            raise Failure(pos, 98, cont)
+
+    def p_defparam(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 49:
+            # <defparam> -> id : <value> <defparam_recur>
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((100,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_defparam_recur
+        else:
+            raise Failure(pos, 99, cont)
+
+    def p_defparam_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <defparam_recur> -> , <defparam>
+            pos += 1
+            return p_defparam
+        elif t == 7:
+            # <defparam_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (100, cont)
+        else:
+            raise Failure(pos, 100, cont)
+
+    def p_common_stmts(cont):
+        t = toks[pos]
+        if t in {34, 40, 47, 51, 70}:
+            # <common_stmts> -> <local_dec>
+            return p_local_dec
+        elif t == 49:
+            # <common_stmts> -> <local_dec_or_ass>
+            return p_local_dec_or_ass
+        elif t in {62, 63, 69}:
+            # <common_stmts> -> <builtin_no_ret>
+            return p_builtin_no_ret
+        elif t == 31:
+            # <common_stmts> -> <local_struct>
+            return p_local_struct
+        elif t == 29:
+            # <common_stmts> -> <struct_inst>
+            return p_struct_inst
+        else:
+            raise Failure(pos, 101, cont)
+
+    def p_main_stmts(cont):
+        t = toks[pos]
+        if t in {42, 50}:
+            # <main_stmts> -> <conditional>
+            return p_conditional
+        elif t in {43, 46, 68}:
+            # <main_stmts> -> <looping>
+            return p_looping
+        elif t in {29, 31, 34, 40, 47, 49, 51, 62, 63, 69, 70}:
+            # <main_stmts> -> <common_stmts>
+            return p_common_stmts
+        else:
+            raise Failure(pos, 102, cont)
+
+    def p_body(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <body> -> <main_stmts> <body_recur>
+            below = ((104,), cont)
+            tail = p_main_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_body_recur
+        else:
+            raise Failure(pos, 103, cont)
+
+    def p_body_recur(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <body_recur> -> <body>
+            return p_body
+        elif t == 75:
+            # <body_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (104, cont)
+        else:
+            raise Failure(pos, 104, cont)
+
+    def p_local_dec(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 51:
+            # <local_dec> -> immo <local_immo_tail>
+            pos += 1
+            return p_local_immo_tail
+        elif t in {34, 40, 47, 70}:
+            # <local_dec> -> <datatype> id <global_dec_tail3>
+            p_datatype(((49, 80), cont))
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            return p_global_dec_tail3
+        else:
+            raise Failure(pos, 105, cont)
+
+    def p_local_dec_or_ass(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 49:
+            # <local_dec_or_ass> -> id <dec_tail>
+            pos += 1
+            return p_dec_tail
+        else:
+            raise Failure(pos, 106, cont)
+
+    def p_local_immo_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 49:
+            # <local_immo_tail> -> id <global_dec_tail1>
+            pos += 1
+            return p_global_dec_tail1
+        elif t == 29:
+            # <local_immo_tail> -> access id id : <value> <elems_recur>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((92,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_elems_recur
+        else:
+            raise Failure(pos, 107, cont)
+
+    def p_dec_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {4, 9, 11, 12, 14, 17, 18}:
+            # <dec_tail> -> <col_or_ass>
+            return p_col_or_ass
+        elif t == 6:
+            # <dec_tail> -> ( <args> )
+            pos += 1
+            below = ((7,), cont)
+            tail = p_args(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 15:
+            # <dec_tail> -> . <dot_tail>
+            pos += 1
+            return p_dot_tail
+        elif t == 26:
+            # <dec_tail> -> [ <index> ] <bracket_tail>
+            pos += 1
+            below = ((27, 111), cont)
+            tail = p_index(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_bracket_tail
+        else:
+            raise Failure(pos, 108, cont)
+
+    def p_dot_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 49:
+            # <dot_tail> -> id <dot_tail_rhs>
+            pos += 1
+            return p_dot_tail_rhs
+        elif t == 37:
+            # <dot_tail> -> drop ( <index> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_index(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 52:
+            # <dot_tail> -> join ( <arr_rhs_tail> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_arr_rhs_tail(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 109, cont)
+
+    def p_dot_tail_rhs(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 18:
+            # <dot_tail_rhs> -> : <expr>
+            pos += 1
+            return p_expr
+        elif t in {4, 9, 11, 14, 17}:
+            # <dot_tail_rhs> -> <assign_op> <expr>
+            p_assign_op(((122,), cont))
+            return p_expr
+        else:
+            raise Failure(pos, 110, cont)
+
+    def p_bracket_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 18:
+            # <bracket_tail> -> : <arr_rhs_tail>
+            pos += 1
+            return p_arr_rhs_tail
+        elif t in {4, 9, 11, 14, 17}:
+            # <bracket_tail> -> <assign_op> <expr>
+            p_assign_op(((122,), cont))
+            return p_expr
+        elif t == 26:
+            # <bracket_tail> -> [ <index> ] <arr2d_rhs>
+            pos += 1
+            below = ((27, 115), cont)
+            tail = p_index(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_arr2d_rhs
+        elif t == 15:
+            # <bracket_tail> -> . <inner_bracket_tail>
+            pos += 1
+            return p_inner_bracket_tail
+        else:
+            raise Failure(pos, 111, cont)
+
+    def p_arr_rhs_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 26:
+            # <arr_rhs_tail> -> [ <value> <elems_recur> ]
+            pos += 1
+            below = ((92, 27), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27,), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+        elif t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <arr_rhs_tail> -> <expr>
+            return p_expr
+        else:
+            raise Failure(pos, 112, cont)
+
+    def p_inner_bracket_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 37:
+            # <inner_bracket_tail> -> drop ( <index> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_index(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 52:
+            # <inner_bracket_tail> -> join ( <expr> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 113, cont)
+
+    def p_index(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <index> -> <expr>
+            return p_expr
+        elif t in {7, 27}:
+            # <index> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (114, cont)
+        else:
+            raise Failure(pos, 114, cont)
+
+    def p_arr2d_rhs(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 18:
+            # <arr2d_rhs> -> : <arr2d_rhs_tail>
+            pos += 1
+            return p_arr2d_rhs_tail
+        elif t in {4, 9, 11, 14, 17}:
+            # <arr2d_rhs> -> <assign_op> <expr>
+            p_assign_op(((122,), cont))
+            return p_expr
+        else:
+            raise Failure(pos, 115, cont)
+
+    def p_arr2d_rhs_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 26:
+            # <arr2d_rhs_tail> -> [ <value> <elems_recur> ] <row_recur>
+            pos += 1
+            below = ((92, 27, 93), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27, 93), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_row_recur
+        elif t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <arr2d_rhs_tail> -> <expr>
+            return p_expr
+        else:
+            raise Failure(pos, 116, cont)
+
+    def p_col_or_ass(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 18:
+            # <col_or_ass> -> : <col_tail>
+            pos += 1
+            return p_col_tail
+        elif t == 12:
+            # <col_or_ass> -> , id <id_recur> : <expr>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((18, 122), cont)
+            tail = p_id_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_expr
+        elif t in {4, 9, 11, 14, 17}:
+            # <col_or_ass> -> <assign_op> <expr>
+            p_assign_op(((122,), cont))
+            return p_expr
+        else:
+            raise Failure(pos, 117, cont)
+
+    def p_col_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <col_tail> -> <expr> <expr_recur>
+            below = ((121,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_expr_recur
+        elif t == 26:
+            # <col_tail> -> [ <value> <elems_recur> ] <row_recur>
+            pos += 1
+            below = ((92, 27, 93), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((27, 93), cont)
+            tail = p_elems_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_row_recur
+        else:
+            raise Failure(pos, 118, cont)
+
+    def p_id_tail(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 15:
+            # <id_tail> -> . id
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+        elif t == 26:
+            # <id_tail> -> [ <expr> ] <id_tail_arr>
+            pos += 1
+            below = ((27, 120), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_id_tail_arr
+        elif t in {1, 3, 5, 7, 8, 10, 12, 13, 16, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 74, 75}:
+            # <id_tail> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (119, cont)
+        else:
+            raise Failure(pos, 119, cont)
+
+    def p_id_tail_arr(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 26:
+            # <id_tail_arr> -> [ <expr> ]
+            pos += 1
+            below = ((27,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+        elif t in {1, 3, 5, 7, 8, 10, 12, 13, 16, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 74, 75}:
+            # <id_tail_arr> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (120, cont)
+        else:
+            raise Failure(pos, 120, cont)
+
+    def p_expr_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <expr_recur> -> , id : <expr> <expr_recur>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((121,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_expr_recur
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <expr_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (121, cont)
+        else:
+            raise Failure(pos, 121, cont)
+
+    def p_expr(cont):
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <expr> -> <relat_expr> <expr_tail>
+            below = ((123,), cont)
+            tail = p_relat_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_expr_tail
+        else:
+            raise Failure(pos, 122, cont)
+
+    def p_expr_tail(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {5, 24, 25, 74}:
+            # <expr_tail> -> <logic_op> <expr>
+            p_logic_op(((122,), cont))
+            return p_expr
+        elif t in {7, 12, 27, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 75}:
+            # <expr_tail> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (123, cont)
+        else:
+            raise Failure(pos, 123, cont)
+
+    def p_relat_expr(cont):
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <relat_expr> -> <arith_expr> <relat_tail>
+            below = ((125,), cont)
+            tail = p_arith_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_relat_tail
+        else:
+            raise Failure(pos, 124, cont)
+
+    def p_relat_tail(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {1, 19, 20, 21, 22, 23}:
+            # <relat_tail> -> <relat_op> <relat_expr>
+            p_relat_op(((124,), cont))
+            return p_relat_expr
+        elif t in {5, 7, 12, 24, 25, 27, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 74, 75}:
+            # <relat_tail> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (125, cont)
+        else:
+            raise Failure(pos, 125, cont)
+
+    def p_arith_expr(cont):
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <arith_expr> -> <factor> <arith_tail>
+            below = ((127,), cont)
+            tail = p_factor(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_arith_tail
+        else:
+            raise Failure(pos, 126, cont)
+
+    def p_arith_tail(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {3, 8, 10, 13, 16, 28}:
+            # <arith_tail> -> <arith_op> <arith_expr>
+            p_arith_op(((126,), cont))
+            return p_arith_expr
+        elif t in {1, 5, 7, 12, 19, 20, 21, 22, 23, 24, 25, 27, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 74, 75}:
+            # <arith_tail> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (127, cont)
+        else:
+            raise Failure(pos, 127, cont)
+
+    def p_factor(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 49:
+            # <factor> -> id <id_rhs_tail>
+            pos += 1
+            return p_id_rhs_tail
+        elif t in {35, 41, 48, 72}:
+            # <factor> -> <value>
+            return p_value
+        elif t == 13:
+            # <factor> -> - <negative>
+            pos += 1
+            return p_negative
+        elif t in {53, 54, 55, 56, 60, 64, 65, 66}:
+            # <factor> -> <builtin_w_ret>
+            return p_builtin_w_ret
+        elif t == 0:
+            # <factor> -> ! <negative>
+            pos += 1
+            return p_negative
+        elif t == 6:
+            # <factor> -> ( <expr> ) <xp_format>
+            pos += 1
+            below = ((7, 130), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+            return p_xp_format
+        else:
+            raise Failure(pos, 128, cont)
+
+    def p_id_rhs_tail(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 6:
+            # <id_rhs_tail> -> ( <args> )
+            pos += 1
+            below = ((7,), cont)
+            tail = p_args(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 15:
+            # <id_rhs_tail> -> . <rhs_dot_tail>
+            pos += 1
+            return p_rhs_dot_tail
+        elif t == 26:
+            # <id_rhs_tail> -> [ <expr> ] <rhs_bracket_tail>
+            pos += 1
+            below = ((27, 134), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+            return p_rhs_bracket_tail
+        elif t == 71:
+            # <id_rhs_tail> -> xp_formatting
+            pos += 1
+        elif t in {1, 3, 5, 7, 8, 10, 12, 13, 16, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 74, 75}:
+            # <id_rhs_tail> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (129, cont)
+        else:
+            raise Failure(pos, 129, cont)
+
+    def p_xp_format(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 71:
+            # <xp_format> -> xp_formatting
+            pos += 1
+        elif t in {1, 3, 5, 7, 8, 10, 12, 13, 16, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 74, 75}:
+            # <xp_format> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (130, cont)
+        else:
+            raise Failure(pos, 130, cont)
+
+    def p_args(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <args> -> <expr> <args_recur>
+            below = ((132,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_args_recur
+        elif t == 7:
+            # <args> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (131, cont)
+        else:
+            raise Failure(pos, 131, cont)
+
+    def p_args_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <args_recur> -> , <expr> <args_recur>
+            pos += 1
+            below = ((132,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_args_recur
+        elif t == 7:
+            # <args_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (132, cont)
+        else:
+            raise Failure(pos, 132, cont)
+
+    def p_rhs_dot_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 49:
+            # <rhs_dot_tail> -> id
+            pos += 1
+        elif t == 61:
+            # <rhs_dot_tail> -> seek ( <arr_rhs_tail> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_arr_rhs_tail(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 37:
+            # <rhs_dot_tail> -> drop ( <index> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_index(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 133, cont)
+
+    def p_rhs_bracket_tail(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 26:
+            # <rhs_bracket_tail> -> [ <expr> ]
+            pos += 1
+            below = ((27,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+        elif t == 15:
+            # <rhs_bracket_tail> -> . <rhs_inner_bracket_tail>
+            pos += 1
+            return p_rhs_inner_bracket_tail
+        elif t in {1, 3, 5, 7, 8, 10, 12, 13, 16, 19, 20, 21, 22, 23, 24, 25, 27, 28, 29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 73, 74, 75}:
+            # <rhs_bracket_tail> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (134, cont)
+        else:
+            raise Failure(pos, 134, cont)
+
+    def p_rhs_inner_bracket_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 37:
+            # <rhs_inner_bracket_tail> -> drop ( <index> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_index(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 61:
+            # <rhs_inner_bracket_tail> -> seek ( <expr> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 135, cont)
+
+    def p_assign_op(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 11:
+            # <assign_op> -> +=
+            pos += 1
+        elif t == 14:
+            # <assign_op> -> -=
+            pos += 1
+        elif t == 9:
+            # <assign_op> -> *=
+            pos += 1
+        elif t == 17:
+            # <assign_op> -> /=
+            pos += 1
+        elif t == 4:
+            # <assign_op> -> %=
+            pos += 1
+        else:
+            raise Failure(pos, 136, cont)
+
+    def p_negative(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 6:
+            # <negative> -> ( <expr> )
+            pos += 1
+            below = ((7,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 49:
+            # <negative> -> id <id_tail>
+            pos += 1
+            return p_id_tail
+        else:
+            raise Failure(pos, 137, cont)
+
+    def p_arith_op(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 10:
+            # <arith_op> -> +
+            pos += 1
+        elif t == 13:
+            # <arith_op> -> -
+            pos += 1
+        elif t == 16:
+            # <arith_op> -> /
+            pos += 1
+        elif t == 3:
+            # <arith_op> -> %
+            pos += 1
+        elif t == 8:
+            # <arith_op> -> *
+            pos += 1
+        elif t == 28:
+            # <arith_op> -> ^
+            pos += 1
+        else:
+            raise Failure(pos, 138, cont)
+
+    def p_relat_op(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 19:
+            # <relat_op> -> <
+            pos += 1
+        elif t == 22:
+            # <relat_op> -> >
+            pos += 1
+        elif t == 20:
+            # <relat_op> -> <=
+            pos += 1
+        elif t == 23:
+            # <relat_op> -> >=
+            pos += 1
+        elif t == 21:
+            # <relat_op> -> ==
+            pos += 1
+        elif t == 1:
+            # <relat_op> -> !=
+            pos += 1
+        else:
+            raise Failure(pos, 139, cont)
+
+    def p_logic_op(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 5:
+            # <logic_op> -> &&
+            pos += 1
+        elif t == 74:
+            # <logic_op> -> ||
+            pos += 1
+        elif t == 24:
+            # <logic_op> -> AND
+            pos += 1
+        elif t == 25:
+            # <logic_op> -> OR
+            pos += 1
+        else:
+            raise Failure(pos, 140, cont)
+
+    def p_builtin_no_ret(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 62:
+            # <builtin_no_ret> -> shoot ( <shoot_args> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_shoot_args(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 63:
+            # <builtin_no_ret> -> shootNxt ( <shoot_args> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_shoot_args(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 69:
+            # <builtin_no_ret> -> wipe ( )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 141, cont)
+
+    def p_builtin_w_ret(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 55:
+            # <builtin_w_ret> -> load ( <load_args> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            p_load_args(((7,), cont))
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 56:
+            # <builtin_w_ret> -> loadNum ( <load_args> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            p_load_args(((7,), cont))
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 60:
+            # <builtin_w_ret> -> rounds ( <rounds_args> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_rounds_args(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 54:
+            # <builtin_w_ret> -> levelUp ( id <id_args_tail> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_id_args_tail(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 53:
+            # <builtin_w_ret> -> levelDown ( id <id_args_tail> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_id_args_tail(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 65:
+            # <builtin_w_ret> -> toHp ( <expr> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 66:
+            # <builtin_w_ret> -> toXp ( <expr> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        elif t == 64:
+            # <builtin_w_ret> -> toComms ( <expr> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 142, cont)
+
+    def p_shoot_args(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <shoot_args> -> <expr>
+            return p_expr
+        elif t == 7:
+            # <shoot_args> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (143, cont)
+        else:
+            raise Failure(pos, 143, cont)
+
+    def p_load_args(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 35:
+            # <load_args> -> comms_ltr
+            pos += 1
+        elif t == 7:
+            # <load_args> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (144, cont)
+        else:
+            raise Failure(pos, 144, cont)
+
+    def p_rounds_args(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 35:
+            # <rounds_args> -> comms_ltr
+            pos += 1
+        elif t == 49:
+            # <rounds_args> -> id <id_args_tail>
+            pos += 1
+            return p_id_args_tail
+        elif t == 64:
+            # <rounds_args> -> toComms ( id <id_tail> )
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((7,), cont)
+            tail = p_id_tail(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 145, cont)
+
+    def p_id_args_tail(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {7, 15, 26}:
+            # <id_args_tail> -> <id_tail>
+            return p_id_tail
+        elif t == 6:
+            # <id_args_tail> -> ( <args> )
+            pos += 1
+            below = ((7,), cont)
+            tail = p_args(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+        else:
+            raise Failure(pos, 146, cont)
+
+    def p_recall_stmt(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 58:
+            # <recall_stmt> -> recall <rec_elems>
+            pos += 1
+            return p_rec_elems
+        else:
+            raise Failure(pos, 147, cont)
+
+    def p_rec_elems(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {0, 6, 13, 35, 41, 48, 49, 53, 54, 55, 56, 60, 64, 65, 66, 72}:
+            # <rec_elems> -> <expr> <rec_elems_recur>
+            below = ((149,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_rec_elems_recur
+        elif t == 26:
+            # <rec_elems> -> [ ]
+            pos += 1
+            if toks[pos] != 27:
+                raise Failure(pos, 27)
+            pos += 1
+        elif t == 67:
+            # <rec_elems> -> void
+            pos += 1
+        else:
+            raise Failure(pos, 148, cont)
+
+    def p_rec_elems_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <rec_elems_recur> -> , <expr> <rec_elems_recur>
+            pos += 1
+            below = ((149,), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_rec_elems_recur
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <rec_elems_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (149, cont)
+        else:
+            raise Failure(pos, 149, cont)
+
+    def p_loop_control(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 59:
+            # <loop_control> -> resume
+            pos += 1
+        elif t == 32:
+            # <loop_control> -> checkpoint
+            pos += 1
+        else:
+            raise Failure(pos, 150, cont)
+
+    def p_local_struct(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 31:
+            # <local_struct> -> build id { <struct_fields> <struct_fields_recur> }
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((155, 75), cont)
+            tail = p_struct_fields(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((75,), cont)
+            tail = p_struct_fields_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 151, cont)
+
+    def p_struct_fields(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {34, 40, 47, 70}:
+            # <struct_fields> -> <datatype> id <field_dec>
+            p_datatype(((49, 153), cont))
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            return p_field_dec
+        else:
+            raise Failure(pos, 152, cont)
+
+    def p_field_dec(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <field_dec> -> , <struct_fields>
+            pos += 1
+            return p_struct_fields
+        elif t in {18, 75}:
+            # <field_dec> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (153, cont)
+        else:
+            raise Failure(pos, 153, cont)
+
+    def p_def_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <def_recur> -> , <datatype> id : <value> <def_recur>
+            pos += 1
+            p_datatype(((49, 18, 90, 154), cont))
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((154,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_def_recur
+        elif t == 75:
+            # <def_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (154, cont)
+        else:
+            raise Failure(pos, 154, cont)
+
+    def p_struct_fields_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 18:
+            # <struct_fields_recur> -> : <value> <def_recur>
+            pos += 1
+            below = ((154,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_def_recur
+        elif t == 75:
+            # <struct_fields_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (155, cont)
+        else:
+            raise Failure(pos, 155, cont)
+
+    def p_struct_inst(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 29:
+            # <struct_inst> -> access id id <inst_dec>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            return p_inst_dec
+        else:
+            raise Failure(pos, 156, cont)
+
+    def p_inst_dec(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 18:
+            # <inst_dec> -> : <value> <instval_recur>
+            pos += 1
+            below = ((158,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_instval_recur
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <inst_dec> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (157, cont)
+        else:
+            raise Failure(pos, 157, cont)
+
+    def p_instval_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <instval_recur> -> , <value> <instval_recur>
+            pos += 1
+            below = ((158,), cont)
+            tail = p_value(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_instval_recur
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <instval_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (158, cont)
+        else:
+            raise Failure(pos, 158, cont)
+
+    def p_conditional(cont):
+        t = toks[pos]
+        if t == 50:
+            # <conditional> -> <if_stmt>
+            return p_if_stmt
+        elif t == 42:
+            # <conditional> -> <flank_stmt>
+            return p_flank_stmt
+        else:
+            raise Failure(pos, 159, cont)
+
+    def p_if_stmt(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 50:
+            # <if_stmt> -> if <expr> { <body> } <else_elif>
+            pos += 1
+            below = ((73, 103, 75, 161), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 161), cont)
+            tail = p_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif
+        else:
+            raise Failure(pos, 160, cont)
+
+    def p_else_elif(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t == 39:
+            # <else_elif> -> <else_stmt>
+            return p_else_stmt
+        elif t == 38:
+            # <else_elif> -> <elif_stmt>
+            return p_elif_stmt
+        elif t in {29, 30, 31, 32, 33, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <else_elif> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (161, cont)
+        else:
+            raise Failure(pos, 161, cont)
+
+    def p_else_stmt(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 39:
+            # <else_stmt> -> else { <body> }
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 162, cont)
+
+    def p_elif_stmt(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 38:
+            # <elif_stmt> -> elif <expr> { <body> } <else_elif>
+            pos += 1
+            below = ((73, 103, 75, 161), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 161), cont)
+            tail = p_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif
+        else:
+            raise Failure(pos, 163, cont)
+
+    def p_flank_stmt(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 42:
+            # <flank_stmt> -> flank <expr> { choice <valdead> <valdead_recur> : <flank_body> }
+            pos += 1
+            below = ((73, 33, 167, 168, 18, 165, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            if toks[pos] != 33:
+                raise Failure(pos, 33)
+            pos += 1
+            below = ((168, 18, 165, 75), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 165, 75), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_flank_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 164, cont)
+
+    def p_flank_body(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <flank_body> -> <main_stmts> <flank_body_recur>
+            below = ((166,), cont)
+            tail = p_main_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_flank_body_recur
+        elif t == 59:
+            # <flank_body> -> resume <choice_recur>
+            pos += 1
+            return p_choice_recur
+        else:
+            raise Failure(pos, 165, cont)
+
+    def p_flank_body_recur(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 59, 62, 63, 68, 69, 70}:
+            # <flank_body_recur> -> <flank_body>
+            return p_flank_body
+        elif t in {30, 33}:
+            # <flank_body_recur> -> <choice_recur>
+            return p_choice_recur
+        else:
+            raise Failure(pos, 166, cont)
+
+    def p_valdead(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {35, 41, 48, 72}:
+            # <valdead> -> <value>
+            return p_value
+        elif t == 36:
+            # <valdead> -> dead
+            pos += 1
+        else:
+            raise Failure(pos, 167, cont)
+
+    def p_valdead_recur(cont):
+        nonlocal pos, save, save_pos
+        t = toks[pos]
+        if t == 12:
+            # <valdead_recur> -> , <valdead> <valdead_recur>
+            pos += 1
+            below = ((168,), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_valdead_recur
+        elif t == 18:
+            # <valdead_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (168, cont)
+        else:
+            raise Failure(pos, 168, cont)
+
+    def p_choice_recur(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 33:
+            # <choice_recur> -> choice <valdead> <valdead_recur> : <flank_body>
+            pos += 1
+            below = ((168, 18, 165), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 165), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_flank_body
+        elif t == 30:
+            # <choice_recur> -> backup : <body>
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_body
+        else:
+            raise Failure(pos, 169, cont)
+
+    def p_looping(cont):
+        t = toks[pos]
+        if t == 43:
+            # <looping> -> <for_loop>
+            return p_for_loop
+        elif t == 68:
+            # <looping> -> <while_loop>
+            return p_while_loop
+        elif t == 46:
+            # <looping> -> <do_while_loop>
+            return p_do_while_loop
+        else:
+            raise Failure(pos, 170, cont)
+
+    def p_for_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 43:
+            # <for_loop> -> for id : <arith_expr> , <expr> , id <update> { <loop_body> }
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((12, 122, 12, 49, 172, 73, 175, 75), cont)
+            tail = p_arith_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            below = ((12, 49, 172, 73, 175, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((73, 175, 75), cont)
+            tail = p_update(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_loop_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 171, cont)
+
+    def p_update(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {4, 9, 11, 14, 17}:
+            # <update> -> <assign_op> <arith_expr>
+            p_assign_op(((126,), cont))
+            return p_arith_expr
+        elif t == 18:
+            # <update> -> : <arith_expr>
+            pos += 1
+            return p_arith_expr
+        else:
+            raise Failure(pos, 172, cont)
+
+    def p_while_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 68:
+            # <while_loop> -> while <expr> { <loop_body> }
+            pos += 1
+            below = ((73, 175, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_loop_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 173, cont)
+
+    def p_do_while_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 46:
+            # <do_while_loop> -> grind { <loop_body> } while <expr>
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 68, 122), cont)
+            tail = p_loop_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            if toks[pos] != 68:
+                raise Failure(pos, 68)
+            pos += 1
+            return p_expr
+        else:
+            raise Failure(pos, 174, cont)
+
+    def p_loop_body(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <loop_body> -> <loop_stmts> <loop_body_recur>
+            below = ((176,), cont)
+            tail = p_loop_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_loop_body_recur
+        else:
+            raise Failure(pos, 175, cont)
+
+    def p_loop_body_recur(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <loop_body_recur> -> <loop_body>
+            return p_loop_body
+        elif t == 75:
+            # <loop_body_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (176, cont)
+        else:
+            raise Failure(pos, 176, cont)
+
+    def p_loop_stmts(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 47, 49, 51, 62, 63, 69, 70}:
+            # <loop_stmts> -> <common_stmts>
+            return p_common_stmts
+        elif t == 50:
+            # <loop_stmts> -> <if_stmt_loop>
+            return p_if_stmt_loop
+        elif t == 42:
+            # <loop_stmts> -> <flank_stmt_loop>
+            return p_flank_stmt_loop
+        elif t in {43, 46, 68}:
+            # <loop_stmts> -> <looping>
+            return p_looping
+        else:
+            raise Failure(pos, 177, cont)
+
+    def p_if_stmt_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 50:
+            # <if_stmt_loop> -> if <expr> { <main_stmts_loop> } <else_elif_loop>
+            pos += 1
+            below = ((73, 187, 75, 179), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 179), cont)
+            tail = p_main_stmts_loop(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif_loop
+        else:
+            raise Failure(pos, 178, cont)
+
+    def p_else_elif_loop(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t == 39:
+            # <else_elif_loop> -> <else_stmt_loop>
+            return p_else_stmt_loop
+        elif t == 38:
+            # <else_elif_loop> -> <elif_stmt_loop>
+            return p_elif_stmt_loop
+        elif t in {29, 31, 32, 34, 40, 42, 43, 46, 47, 49, 50, 51, 59, 62, 63, 68, 69, 70, 75}:
+            # <else_elif_loop> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (179, cont)
+        else:
+            raise Failure(pos, 179, cont)
+
+    def p_else_stmt_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 39:
+            # <else_stmt_loop> -> else { <main_stmts_loop> }
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_main_stmts_loop(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 180, cont)
+
+    def p_elif_stmt_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 38:
+            # <elif_stmt_loop> -> elif <expr> { <main_stmts_loop> } <else_elif_loop>
+            pos += 1
+            below = ((73, 187, 75, 179), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 179), cont)
+            tail = p_main_stmts_loop(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif_loop
+        else:
+            raise Failure(pos, 181, cont)
+
+    def p_flank_stmt_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 42:
+            # <flank_stmt_loop> -> flank <expr> { choice <valdead> <valdead_recur> : <flank_body_loop> }
+            pos += 1
+            below = ((73, 33, 167, 168, 18, 183, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            if toks[pos] != 33:
+                raise Failure(pos, 33)
+            pos += 1
+            below = ((168, 18, 183, 75), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 183, 75), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_flank_body_loop(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 182, cont)
+
+    def p_flank_body_loop(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <flank_body_loop> -> <main_stmts> <flank_loop_recur>
+            below = ((184,), cont)
+            tail = p_main_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_flank_loop_recur
+        elif t in {32, 59}:
+            # <flank_body_loop> -> <loop_control> <loop_choice_recur>
+            p_loop_control(((185,), cont))
+            return p_loop_choice_recur
+        else:
+            raise Failure(pos, 183, cont)
+
+    def p_flank_loop_recur(cont):
+        t = toks[pos]
+        if t in {29, 31, 32, 34, 40, 42, 43, 46, 47, 49, 50, 51, 59, 62, 63, 68, 69, 70}:
+            # <flank_loop_recur> -> <flank_body_loop>
+            return p_flank_body_loop
+        elif t in {30, 33}:
+            # <flank_loop_recur> -> <loop_choice_recur>
+            return p_loop_choice_recur
+        else:
+            raise Failure(pos, 184, cont)
+
+    def p_loop_choice_recur(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 33:
+            # <loop_choice_recur> -> choice <valdead> <valdead_recur> : <flank_body_loop>
+            pos += 1
+            below = ((168, 18, 183), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 183), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_flank_body_loop
+        elif t == 30:
+            # <loop_choice_recur> -> backup : <backup_loop_body>
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_backup_loop_body
+        else:
+            raise Failure(pos, 185, cont)
+
+    def p_backup_loop_body(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <backup_loop_body> -> <body>
+            return p_body
+        elif t == 32:
+            # <backup_loop_body> -> checkpoint
+            pos += 1
+        else:
+            raise Failure(pos, 186, cont)
+
+    def p_main_stmts_loop(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <main_stmts_loop> -> <loop_stmts> <cond_recur_loop>
+            below = ((188,), cont)
+            tail = p_loop_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_cond_recur_loop
+        elif t in {32, 59}:
+            # <main_stmts_loop> -> <loop_control>
+            return p_loop_control
+        else:
+            raise Failure(pos, 187, cont)
+
+    def p_cond_recur_loop(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {29, 31, 32, 34, 40, 42, 43, 46, 47, 49, 50, 51, 59, 62, 63, 68, 69, 70}:
+            # <cond_recur_loop> -> <main_stmts_loop>
+            return p_main_stmts_loop
+        elif t == 75:
+            # <cond_recur_loop> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (188, cont)
+        else:
+            raise Failure(pos, 188, cont)
+
+    def p_fs_body(cont):
+        t = toks[pos]
+        if t in {31, 44, 45}:
+            # <fs_body> -> <func_body>
+            return p_func_body
+        else:
+            raise Failure(pos, 189, cont)
+
+    def p_func_body(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 45:
+            # <func_body> -> generate id ( <params> ) { <func_stmts_recur> } <func_body>
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 6:
+                raise Failure(pos, 6)
+            pos += 1
+            below = ((7, 73, 193, 75, 190), cont)
+            tail = p_params(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 7:
+                raise Failure(pos, 7)
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 190), cont)
+            tail = p_func_stmts_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_func_body
+        elif t in {31, 44}:
+            # <func_body> -> <struct_body>
+            return p_struct_body
+        else:
+            raise Failure(pos, 190, cont)
+
+    def p_struct_body(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t == 31:
+            # <struct_body> -> <local_struct> <struct_body>
+            p_local_struct(((191,), cont))
+            return p_struct_body
+        elif t == 44:
+            # <struct_body> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (191, cont)
+        else:
+            raise Failure(pos, 191, cont)
+
+    def p_func_stmts(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 47, 49, 51, 62, 63, 69, 70}:
+            # <func_stmts> -> <common_stmts>
+            return p_common_stmts
+        elif t == 58:
+            # <func_stmts> -> <recall_stmt>
+            return p_recall_stmt
+        elif t == 50:
+            # <func_stmts> -> <if_stmt_func>
+            return p_if_stmt_func
+        elif t == 42:
+            # <func_stmts> -> <flank_func>
+            return p_flank_func
+        elif t in {43, 46, 68}:
+            # <func_stmts> -> <looping_func>
+            return p_looping_func
+        else:
+            raise Failure(pos, 192, cont)
+
+    def p_func_stmts_recur(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 62, 63, 68, 69, 70}:
+            # <func_stmts_recur> -> <func_stmts> <func_stmts_recur>
+            below = ((193,), cont)
+            tail = p_func_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_func_stmts_recur
+        elif t == 75:
+            # <func_stmts_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (193, cont)
+        else:
+            raise Failure(pos, 193, cont)
+
+    def p_flank_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 42:
+            # <flank_func> -> flank <expr> { choice <valdead> <valdead_recur> : <flank_func_body> }
+            pos += 1
+            below = ((73, 33, 167, 168, 18, 195, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            if toks[pos] != 33:
+                raise Failure(pos, 33)
+            pos += 1
+            below = ((168, 18, 195, 75), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 195, 75), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_flank_func_body(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 194, cont)
+
+    def p_flank_func_body(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <flank_func_body> -> <main_stmts> <flank_func_recur>
+            below = ((196,), cont)
+            tail = p_main_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_flank_func_recur
+        elif t == 58:
+            # <flank_func_body> -> <recall_stmt> <choice_func_recur>
+            below = ((197,), cont)
+            tail = p_recall_stmt(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_choice_func_recur
+        elif t == 59:
+            # <flank_func_body> -> resume <choice_func_recur>
+            pos += 1
+            return p_choice_func_recur
+        else:
+            raise Failure(pos, 195, cont)
+
+    def p_flank_func_recur(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70}:
+            # <flank_func_recur> -> <flank_func_body>
+            return p_flank_func_body
+        elif t in {30, 33}:
+            # <flank_func_recur> -> <choice_func_recur>
+            return p_choice_func_recur
+        else:
+            raise Failure(pos, 196, cont)
+
+    def p_choice_func_recur(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 33:
+            # <choice_func_recur> -> choice <valdead> <valdead_recur> : <flank_func_body>
+            pos += 1
+            below = ((168, 18, 195), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 195), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_flank_func_body
+        elif t == 30:
+            # <choice_func_recur> -> backup : <backup_func_body>
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_backup_func_body
+        else:
+            raise Failure(pos, 197, cont)
+
+    def p_backup_func_body(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <backup_func_body> -> <main_stmts> <backup_func_body>
+            below = ((198,), cont)
+            tail = p_main_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_backup_func_body
+        elif t == 58:
+            # <backup_func_body> -> <recall_stmt>
+            return p_recall_stmt
+        else:
+            raise Failure(pos, 198, cont)
+
+    def p_if_stmt_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 50:
+            # <if_stmt_func> -> if <expr> { <func_stmts> <func_stmts_recur> } <else_elif_func>
+            pos += 1
+            below = ((73, 192, 193, 75, 200), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((193, 75, 200), cont)
+            tail = p_func_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((75, 200), cont)
+            tail = p_func_stmts_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif_func
+        else:
+            raise Failure(pos, 199, cont)
+
+    def p_else_elif_func(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t == 39:
+            # <else_elif_func> -> <else_stmt_func>
+            return p_else_stmt_func
+        elif t == 38:
+            # <else_elif_func> -> <elif_stmt_func>
+            return p_elif_stmt_func
+        elif t in {29, 31, 32, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <else_elif_func> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (200, cont)
+        else:
+            raise Failure(pos, 200, cont)
+
+    def p_else_stmt_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 39:
+            # <else_stmt_func> -> else { <func_stmts> <func_stmts_recur> }
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((193, 75), cont)
+            tail = p_func_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((75,), cont)
+            tail = p_func_stmts_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 201, cont)
+
+    def p_elif_stmt_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 38:
+            # <elif_stmt_func> -> elif <expr> { <func_stmts> <func_stmts_recur> } <else_elif_func>
+            pos += 1
+            below = ((73, 192, 193, 75, 200), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((193, 75, 200), cont)
+            tail = p_func_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((75, 200), cont)
+            tail = p_func_stmts_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif_func
+        else:
+            raise Failure(pos, 202, cont)
+
+    def p_looping_func(cont):
+        t = toks[pos]
+        if t == 43:
+            # <looping_func> -> <for_func>
+            return p_for_func
+        elif t == 68:
+            # <looping_func> -> <while_func>
+            return p_while_func
+        elif t == 46:
+            # <looping_func> -> <do_while_func>
+            return p_do_while_func
+        else:
+            raise Failure(pos, 203, cont)
+
+    def p_for_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 43:
+            # <for_func> -> for id : <arith_expr> , <expr> , id <update> { <loop_body_func> }
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((12, 122, 12, 49, 172, 73, 207, 75), cont)
+            tail = p_arith_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            below = ((12, 49, 172, 73, 207, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 12:
+                raise Failure(pos, 12)
+            pos += 1
+            if toks[pos] != 49:
+                raise Failure(pos, 49)
+            pos += 1
+            below = ((73, 207, 75), cont)
+            tail = p_update(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_loop_body_func(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 204, cont)
+
+    def p_while_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 68:
+            # <while_func> -> while <expr> { <loop_body_func> }
+            pos += 1
+            below = ((73, 207, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_loop_body_func(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 205, cont)
+
+    def p_do_while_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 46:
+            # <do_while_func> -> grind { <loop_body_func> } while <expr>
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 68, 122), cont)
+            tail = p_loop_body_func(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            if toks[pos] != 68:
+                raise Failure(pos, 68)
+            pos += 1
+            return p_expr
+        else:
+            raise Failure(pos, 206, cont)
+
+    def p_loop_body_func(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 62, 63, 68, 69, 70}:
+            # <loop_body_func> -> <func_stmts_loop> <loop_body_recur>
+            below = ((176,), cont)
+            tail = p_func_stmts_loop(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_loop_body_recur
+        else:
+            raise Failure(pos, 207, cont)
+
+    def p_func_stmts_loop(cont):
+        t = toks[pos]
+        if t == 50:
+            # <func_stmts_loop> -> <if_func_loop>
+            return p_if_func_loop
+        elif t in {29, 31, 34, 40, 47, 49, 51, 62, 63, 69, 70}:
+            # <func_stmts_loop> -> <common_stmts>
+            return p_common_stmts
+        elif t == 42:
+            # <func_stmts_loop> -> <flank_loop_func>
+            return p_flank_loop_func
+        elif t == 58:
+            # <func_stmts_loop> -> <recall_stmt>
+            return p_recall_stmt
+        elif t in {43, 46, 68}:
+            # <func_stmts_loop> -> <looping_func>
+            return p_looping_func
+        else:
+            raise Failure(pos, 208, cont)
+
+    def p_if_func_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 50:
+            # <if_func_loop> -> if <expr> { <func_loop_cond> } <else_elif_func_loop>
+            pos += 1
+            below = ((73, 213, 75, 210), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 210), cont)
+            tail = p_func_loop_cond(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif_func_loop
+        else:
+            raise Failure(pos, 209, cont)
+
+    def p_else_elif_func_loop(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t == 39:
+            # <else_elif_func_loop> -> <else_func_loop>
+            return p_else_func_loop
+        elif t == 38:
+            # <else_elif_func_loop> -> <elif_func_loop>
+            return p_elif_func_loop
+        elif t in {29, 31, 32, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70, 75}:
+            # <else_elif_func_loop> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (210, cont)
+        else:
+            raise Failure(pos, 210, cont)
+
+    def p_else_func_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 39:
+            # <else_func_loop> -> else { <func_loop_cond> }
+            pos += 1
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_func_loop_cond(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 211, cont)
+
+    def p_elif_func_loop(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 38:
+            # <elif_func_loop> -> elif <expr> { <func_loop_cond> } <else_elif_func>
+            pos += 1
+            below = ((73, 213, 75, 200), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            below = ((75, 200), cont)
+            tail = p_func_loop_cond(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+            return p_else_elif_func
+        else:
+            raise Failure(pos, 212, cont)
+
+    def p_func_loop_cond(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 62, 63, 68, 69, 70}:
+            # <func_loop_cond> -> <func_stmts_loop> <func_loop_recur>
+            below = ((214,), cont)
+            tail = p_func_stmts_loop(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_func_loop_recur
+        elif t in {32, 59}:
+            # <func_loop_cond> -> <loop_control> <func_loop_recur>
+            p_loop_control(((214,), cont))
+            return p_func_loop_recur
+        else:
+            raise Failure(pos, 213, cont)
+
+    def p_func_loop_recur(cont):
+        nonlocal save, save_pos
+        t = toks[pos]
+        if t in {29, 31, 32, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70}:
+            # <func_loop_recur> -> <func_loop_cond>
+            return p_func_loop_cond
+        elif t == 75:
+            # <func_loop_recur> -> λ
+            if save_pos != pos:
+                save_pos = pos
+                save = (214, cont)
+        else:
+            raise Failure(pos, 214, cont)
+
+    def p_flank_loop_func(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 42:
+            # <flank_loop_func> -> flank <expr> { choice <valdead> <valdead_recur> : <flank_body_func_loop> }
+            pos += 1
+            below = ((73, 33, 167, 168, 18, 216, 75), cont)
+            tail = p_expr(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 73:
+                raise Failure(pos, 73)
+            pos += 1
+            if toks[pos] != 33:
+                raise Failure(pos, 33)
+            pos += 1
+            below = ((168, 18, 216, 75), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 216, 75), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            below = ((75,), cont)
+            tail = p_flank_body_func_loop(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 75:
+                raise Failure(pos, 75)
+            pos += 1
+        else:
+            raise Failure(pos, 215, cont)
+
+    def p_flank_body_func_loop(cont):
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <flank_body_func_loop> -> <main_stmts> <flank_func_loop_recur>
+            below = ((217,), cont)
+            tail = p_main_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_flank_func_loop_recur
+        elif t == 58:
+            # <flank_body_func_loop> -> <recall_stmt> <loop_func_choice_recur>
+            below = ((218,), cont)
+            tail = p_recall_stmt(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_loop_func_choice_recur
+        elif t in {32, 59}:
+            # <flank_body_func_loop> -> <loop_control> <loop_func_choice_recur>
+            p_loop_control(((218,), cont))
+            return p_loop_func_choice_recur
+        else:
+            raise Failure(pos, 216, cont)
+
+    def p_flank_func_loop_recur(cont):
+        t = toks[pos]
+        if t in {29, 31, 32, 34, 40, 42, 43, 46, 47, 49, 50, 51, 58, 59, 62, 63, 68, 69, 70}:
+            # <flank_func_loop_recur> -> <flank_body_func_loop>
+            return p_flank_body_func_loop
+        elif t in {30, 33}:
+            # <flank_func_loop_recur> -> <loop_func_choice_recur>
+            return p_loop_func_choice_recur
+        else:
+            raise Failure(pos, 217, cont)
+
+    def p_loop_func_choice_recur(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t == 33:
+            # <loop_func_choice_recur> -> choice <valdead> <valdead_recur> : <flank_body_func_loop>
+            pos += 1
+            below = ((168, 18, 216), cont)
+            tail = p_valdead(below)
+            while tail is not None:
+                tail = tail(below)
+            below = ((18, 216), cont)
+            tail = p_valdead_recur(below)
+            while tail is not None:
+                tail = tail(below)
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_flank_body_func_loop
+        elif t == 30:
+            # <loop_func_choice_recur> -> backup : <backup_func_loop_body>
+            pos += 1
+            if toks[pos] != 18:
+                raise Failure(pos, 18)
+            pos += 1
+            return p_backup_func_loop_body
+        else:
+            raise Failure(pos, 218, cont)
+
+    def p_backup_func_loop_body(cont):
+        nonlocal pos
+        t = toks[pos]
+        if t in {29, 31, 34, 40, 42, 43, 46, 47, 49, 50, 51, 62, 63, 68, 69, 70}:
+            # <backup_func_loop_body> -> <main_stmts> <backup_func_loop_body>
+            below = ((219,), cont)
+            tail = p_main_stmts(below)
+            while tail is not None:
+                tail = tail(below)
+            return p_backup_func_loop_body
+        elif t == 58:
+            # <backup_func_loop_body> -> <recall_stmt>
+            return p_recall_stmt
+        elif t == 32:
+            # <backup_func_loop_body> -> checkpoint
+            pos += 1
+        else:
+            raise Failure(pos, 219, cont)
+
+    try:
+        p_program(None)
+    except Failure as failure:
+        if len(failure.args) == 3:
+            return failure.args
+        if save_pos == failure.args[0]:
+            # the terminal came after a λ expansion, whatever that
+            # non-terminal could have started with was expected too
+            return (save_pos,) + save
+        return failure.args + (None,)
+    return pos, None, None
@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List, Optional
 
 class NodeType:
@@ -62,9 +63,38 @@ class NodeType:
     STRING_INDEX_ARR    = "StringIndexArr"
     STR_ARR_ASS_STMT    = "StrArrAssignment"
 
+KINDS = tuple(value for name, value in vars(NodeType).items() if name.isupper())
+
+def dispatch_table(visitor_class):
+    # kind -> visit_<kind> method of a visitor class, built once so a visit
+    # is a dict lookup instead of an f-string and getattr per node
+    return {kind: getattr(visitor_class, f"visit_{kind}") for kind in KINDS if hasattr(visitor_class, f"visit_{kind}")}
+
+# Nodes keep their fields in __slots__, listed in the order __init__ sets
+# them, and positions as (line, column) tuples; huge generated programs
+# build millions of nodes. Walkers that need every field of a node go
+# through node.field_values() (or the names in node.fields).
+
 class Stmt:
+    __slots__ = ('kind', 'compiled', 'visitor', 'code', 'address')
+    fields = ()
+
     def __init__(self, kind: str):
         self.kind = kind
+        self.compiled = None    # closure set by runtime.closures, None in tree-walk mode
+        self.visitor = None     # pre-resolved SemanticAnalyzer method
+        self.code = None        # bytecode set by runtime.bytecode on Program and function bodies
+        self.address = None     # (depth, slot) set by the resolver on variable references
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = cls.fields + cls.__dict__.get('__slots__', ())
+        if len(cls.fields) > 1:
+            cls.field_values = lambda node, get=attrgetter(*cls.fields): get(node)
+        elif cls.fields:
+            cls.field_values = lambda node, get=attrgetter(*cls.fields): (get(node),)
+        else:
+            cls.field_values = lambda node: ()
 
     def __repr__(self, indent=0):
         return self.custom_repr(self, indent)
@@ -73,10 +103,13 @@ class Stmt:
         ind = ' ' * (indent * 2)
         items = []
 
-        for key, value in obj.__dict__.items():
+        for key in ('kind',) + obj.fields:
+            if key == 'operands':
+                continue
+            value = getattr(obj, key)
             if isinstance(value, Stmt):  
                 items.append(f'{ind}  {key}: {value.custom_repr(value, indent + 1)}')
-            elif isinstance(value, list):
+            elif isinstance(value, (list, tuple)):
                 if all(isinstance(item, (int, float, str, bool, type(None))) for item in value):
                     formatted_list = ', '.join(self.format_value(item) for item in value)
                     items.append(f'{ind}  {key}: [ {formatted_list} ]')
@@ -108,20 +141,28 @@ class Stmt:
             return str(value)
 
 class Program(Stmt):
+    __slots__ = ('body',)
+
     def __init__(self, body: List[Stmt]):
         super().__init__(NodeType.PROGRAM)
         self.body = body
 
 class Expr(Stmt):
+    __slots__ = ()
+
     def __init__(self, kind: str):
         super().__init__(kind)
 
 class BlockStmt(Stmt):
+    __slots__ = ('statements',)
+
     def __init__(self, statements: List[Stmt]):
         super().__init__(NodeType.BLOCK_STMT)
         self.statements = statements
 
 class BinaryExpr(Expr):
+    __slots__ = ('left', 'operator', 'right', 'pos_start', 'pos_end', 'operands')
+
     def __init__(self, left: Expr, operator: str, right: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.BINARY_EXPR)
         self.left = left
@@ -129,8 +170,11 @@ class BinaryExpr(Expr):
         self.right = right
         self.pos_start = pos_start
         self.pos_end = pos_end
+        self.operands = None    # (lhs, rhs) type names proven by typecheck.annotate, () if they vary
         
 class Identifier(Expr):
+    __slots__ = ('symbol', 'pos_start', 'pos_end')
+
     def __init__(self, symbol: str, pos_start=None, pos_end=None):
         super().__init__(NodeType.IDENTIFIER)
         self.symbol = symbol
@@ -138,6 +182,8 @@ class Identifier(Expr):
         self.pos_end = pos_end
 
 class HpLiteral(Expr):
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start=None, pos_end=None):
         super().__init__(NodeType.HP_LITERAL)
         self.value = int(value)
@@ -145,6 +191,8 @@ class HpLiteral(Expr):
         self.pos_end = pos_end
 
 class XpLiteral(Expr):
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start=None, pos_end=None):
         super().__init__(NodeType.XP_LITERAL)
         self.value = float(value)
@@ -152,6 +200,8 @@ class XpLiteral(Expr):
         self.pos_end = pos_end
 
 class CommsLiteral(Expr):
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start=None, pos_end=None):
         super().__init__(NodeType.COMMS_LITERAL)
         self.value = str(value)
@@ -159,6 +209,8 @@ class CommsLiteral(Expr):
         self.pos_end = pos_end
 
 class FormattedCommsLiteral(Expr):
+    __slots__ = ('value', 'placeholders', 'expressions', 'pos_start', 'pos_end')
+
     def __init__(self, value, placeholders, expressions, pos_start=None, pos_end=None):
         super().__init__(NodeType.FORM_COMMS_LITERAL)
         self.value = str(value)              
@@ -168,6 +220,8 @@ class FormattedCommsLiteral(Expr):
         self.pos_end = pos_end
 
 class FlagLiteral(Expr):
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value: bool, pos_start=None, pos_end=None):
         super().__init__(NodeType.FLAG_LITERAL)
         self.value = value
@@ -175,6 +229,8 @@ class FlagLiteral(Expr):
         self.pos_end = pos_end
 
 class DeadLiteral(Expr):
+    __slots__ = ('value', 'datatype', 'pos_start', 'pos_end')
+
     def __init__(self, value: None, datatype: str, pos_start=None, pos_end=None):
         super().__init__(NodeType.DEAD_LITERAL)
         self.value = value
@@ -192,6 +248,8 @@ class DeadLiteral(Expr):
         return type_map.get(self.datatype, None)
 
 class UnaryExpr(Expr):
+    __slots__ = ('operator', 'operand', 'pos_start', 'pos_end')
+
     def __init__(self, operator: str, operand: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.UNARY_EXPR)
         self.operator = operator
@@ -200,6 +258,8 @@ class UnaryExpr(Expr):
         self.pos_end = pos_end
 
 class ChainRelatExpr(Expr):
+    __slots__ = ('expressions', 'pos_start', 'pos_end')
+
     def __init__(self, expressions: List[Expr], pos_start=None, pos_end=None):
         super().__init__(NodeType.CHAIN_RELAT_EXPR)
         self.expressions = expressions
@@ -207,12 +267,16 @@ class ChainRelatExpr(Expr):
         self.pos_end = pos_end
 
 class PlayFunc(Stmt):
+    __slots__ = ('name', 'body')
+
     def __init__(self, body: BlockStmt):
         super().__init__(NodeType.PLAY_FUNC)
         self.name = 'play'
         self.body = body
 
 class FunctionDec(Stmt):
+    __slots__ = ('name', 'parameters', 'body')
+
     def __init__(self, name: Identifier, parameters: List[Identifier], body: 'BlockStmt'):
         super().__init__(NodeType.FUNCTION_DEC)
         self.name = name
@@ -220,6 +284,8 @@ class FunctionDec(Stmt):
         self.body = body
 
 class VarDec(Stmt):
+    __slots__ = ('name', 'value', 'immo', 'scope', 'pos_start', 'pos_end')
+
     def __init__(self, name: Identifier, value: Expr, immo: bool, scope: str, pos_start=None, pos_end=None):
         super().__init__(NodeType.VAR_DEC)
         self.name = name
@@ -230,6 +296,8 @@ class VarDec(Stmt):
         self.pos_end = pos_end
 
 class BatchVarDec(Stmt):
+    __slots__ = ('declarations', 'batch_ver1', 'pos_start', 'pos_end')
+
     def __init__(self, declarations: list[Stmt], batch_ver1, pos_start, pos_end):
         super().__init__(NodeType.BATCH_VAR_DEC)
         self.declarations = declarations
@@ -238,6 +306,8 @@ class BatchVarDec(Stmt):
         self.pos_end = pos_end
 
 class ArrayDec(Stmt):
+    __slots__ = ('name', 'dimensions', 'elements', 'immo', 'scope', 'datatype', 'pos_start', 'pos_end')
+
     def __init__(self, name: Identifier, dimensions: List[Optional[int]], 
                  elements: List[Expr], immo: bool, scope: str, datatype=None, pos_start=None, pos_end=None,):
         super().__init__(NodeType.ARRAY_DEC)
@@ -251,6 +321,8 @@ class ArrayDec(Stmt):
         self.pos_end = pos_end
 
 class ArrayRedec(Stmt):
+    __slots__ = ('name', 'dimensions', 'elements', 'immo', 'scope', 'pos_start', 'pos_end')
+
     def __init__(self, name: Identifier, dimensions: List[Optional[int]], 
                  elements: List[Expr], immo: bool, scope: str, pos_start=None, pos_end=None):
         super().__init__(NodeType.ARRAY_REDEC)
@@ -263,11 +335,15 @@ class ArrayRedec(Stmt):
         self.pos_end = pos_end
 
 class AssignmentStmt(Stmt):
+    __slots__ = ()
+
     def __init__(self, kind: str):
         super().__init__(NodeType.ASS_STMT)
         self.kind = kind
 
 class ArrElement(Expr):
+    __slots__ = ('left', 'index', 'pos_start', 'pos_end')
+
     def __init__(self, left: Identifier, index: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.ARR_ELEMENT)
         self.left = left
@@ -276,6 +352,8 @@ class ArrElement(Expr):
         self.pos_end = pos_end
 
 class ArrAssignment(AssignmentStmt):
+    __slots__ = ('left', 'operator', 'right', 'pos_start', 'pos_end')
+
     def __init__(self, left: ArrElement, operator: str, right: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.ARR_ASS_STMT)
         self.left = left
@@ -285,6 +363,8 @@ class ArrAssignment(AssignmentStmt):
         self.pos_end = pos_end
 
 class VarAssignment(AssignmentStmt):
+    __slots__ = ('left', 'operator', 'right', 'pos_start', 'pos_end')
+
     def __init__(self, left: Identifier, operator: str, right: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.VAR_ASS_STMT)
         self.left = left
@@ -294,6 +374,8 @@ class VarAssignment(AssignmentStmt):
         self.pos_end = pos_end
 
 class StructFields(Stmt):
+    __slots__ = ('name', 'value', 'datatype', 'pos_start', 'pos_end')
+
     def __init__(self, name: Identifier, value: Expr, datatype: str, pos_start=None, pos_end=None):
         super().__init__(NodeType.STRUCT_FIELD)
         self.name = name
@@ -303,6 +385,8 @@ class StructFields(Stmt):
         self.pos_end = pos_end
 
 class StructDec(Stmt):
+    __slots__ = ('name', 'body', 'scope')
+
     def __init__(self, name: Identifier, body: List[StructFields], scope: str):
         super().__init__(NodeType.STRUCT_DEC)
         self.name = name
@@ -310,6 +394,8 @@ class StructDec(Stmt):
         self.scope = scope
 
 class StructInst(Stmt):
+    __slots__ = ('name', 'parent', 'body', 'immo', 'pos_start', 'pos_end')
+
     def __init__(self, name: Identifier, parent: str, body: List[Expr], immo: bool, pos_start=None, pos_end=None):
         super().__init__(NodeType.STRUCT_INST)
         self.name = name
@@ -320,6 +406,8 @@ class StructInst(Stmt):
         self.pos_end = pos_end
 
 class StructInstField(Expr):
+    __slots__ = ('instance', 'field', 'pos_start', 'pos_end')
+
     def __init__(self, instance: Identifier, field: Identifier, pos_start=None, pos_end=None):
         super().__init__(NodeType.STRUCT_INST_FIELD)
         self.instance = instance
@@ -328,6 +416,8 @@ class StructInstField(Expr):
         self.pos_end = pos_end
 
 class InstAssignment(AssignmentStmt):
+    __slots__ = ('left', 'operator', 'right', 'pos_start', 'pos_end')
+
     def __init__(self, left: StructInstField, operator: str, right: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.INST_ASS_STMT)
         self.left = left
@@ -337,6 +427,8 @@ class InstAssignment(AssignmentStmt):
         self.pos_end = pos_end
 
 class ImmoInstDec(Stmt):
+    __slots__ = ('name', 'parent', 'body')
+
     def __init__(self, name: Identifier, parent: str, body: List[StructFields]):
         super().__init__(NodeType.IMMO_INST)
         self.name = name
@@ -344,6 +436,8 @@ class ImmoInstDec(Stmt):
         self.body = body
 
 class GlobalStructDec(Stmt):
+    __slots__ = ('name', 'pos_start', 'pos_end')
+
     def __init__(self, name: Identifier, pos_start, pos_end):
         super().__init__(NodeType.GLOBAL_STRUCT_DEC)
         self.name = name
@@ -351,6 +445,8 @@ class GlobalStructDec(Stmt):
         self.pos_end = pos_end
 
 class IfStmt(Stmt):
+    __slots__ = ('condition', 'then_branch', 'elif_branches', 'else_branch')
+
     def __init__(self, condition, then_branch, elif_branches=None, else_branch=None):
         super().__init__(NodeType.IF_STMT)
         self.condition = condition         
@@ -359,18 +455,24 @@ class IfStmt(Stmt):
         self.else_branch = else_branch
 
 class ElifStmt(Stmt):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition, body):
         super().__init__(NodeType.ELIF_STMT)
         self.condition = condition         
         self.body = body     
 
 class ChoiceStmts(Stmt):
+    __slots__ = ('values', 'body')
+
     def __init__(self, values: List[Expr], body):
         super().__init__(NodeType.CHOICE_STMT)
         self.values = values
         self.body = body
 
 class FlankStmt(Stmt):
+    __slots__ = ('expression', 'choices', 'backup_body')
+
     def __init__(self, expression, choices: List[ChoiceStmts], backup_body):
         super().__init__(NodeType.FLANK_STMT)
         self.expression = expression
@@ -378,14 +480,20 @@ class FlankStmt(Stmt):
         self.backup_body = backup_body
 
 class ResumeStmt(Stmt):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(NodeType.RESUME_STMT)
 
 class CheckpointStmt(Stmt):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(NodeType.CHECKPOINT_STMT)
 
 class ForStmt(Stmt):
+    __slots__ = ('initialization', 'condition', 'update', 'body', 'pos_start', 'pos_end')
+
     def __init__(self, initialization: VarAssignment, condition: Expr, 
                  update: VarAssignment, body: List[Stmt], pos_start=None, pos_end=None):
         super().__init__(NodeType.FOR_STMT)
@@ -397,6 +505,8 @@ class ForStmt(Stmt):
         self.pos_end = pos_end
 
 class GrindWhileStmt(Stmt):
+    __slots__ = ('condition', 'body', 'is_grind')
+
     def __init__(self, condition: Expr, body: List[Stmt], is_grind=False):
         super().__init__(NodeType.GRINDWHILE_STMT)
         self.condition = condition
@@ -404,17 +514,23 @@ class GrindWhileStmt(Stmt):
         self.is_grind = is_grind
 
 class Params(Stmt):
+    __slots__ = ('param', 'param_val')
+
     def __init__(self, param: str, param_val=None):
         super().__init__(NodeType.PARAMS)
         self.param = param
         self.param_val = param_val
 
 class RecallStmt(Stmt):
+    __slots__ = ('expressions',)
+
     def __init__(self, expressions: List[Expr]):
         super().__init__(NodeType.RECALL_STMT)
         self.expressions = expressions
 
 class GlobalFuncDec(Stmt):
+    __slots__ = ('name', 'params', 'pos_start', 'pos_end')
+
     def __init__(self, name: Identifier, params: List[Stmt], pos_start=None, pos_end=None):
         super().__init__(NodeType.GLOBAL_FUNC_NAME)
         self.name = name
@@ -423,6 +539,8 @@ class GlobalFuncDec(Stmt):
         self.pos_end = pos_end
 
 class GlobalFuncBody(Stmt):
+    __slots__ = ('name', 'params', 'body', 'recall_stmts')
+
     def __init__(self, name: Identifier, params: List[Stmt], body: BlockStmt, recall_stmts: List[RecallStmt]):
         super().__init__(NodeType.GLOBAL_FUNC_BODY)
         self.name = name
@@ -431,6 +549,8 @@ class GlobalFuncBody(Stmt):
         self.recall_stmts = recall_stmts
     
 class FuncCallStmt(Stmt):
+    __slots__ = ('name', 'args', 'pos_start', 'pos_end', 'arg_pos_start', 'arg_pos_end')
+
     def __init__(self, name: Identifier, args: List[Expr], pos_start=None, pos_end=None, arg_pos_start=None, arg_pos_end=None):
         super().__init__(NodeType.FUNC_CALL)
         self.name = name
@@ -441,12 +561,16 @@ class FuncCallStmt(Stmt):
         self.arg_pos_end = arg_pos_end
 
 class ArrayOrVar(Stmt):
+    __slots__ = ('lhs_name', 'statements')
+
     def __init__(self, lhs_name: str, statements: List[Stmt]):
         super().__init__(NodeType.ARR_VAR)
         self.lhs_name = lhs_name
         self.statements = statements
 
 class Load(Expr):
+    __slots__ = ('prompt_msg', 'pos_start', 'pos_end')
+
     def __init__(self, prompt_msg: str, pos_start=None, pos_end=None):
         super().__init__(NodeType.LOAD_STR)
         self.prompt_msg = prompt_msg
@@ -454,6 +578,8 @@ class Load(Expr):
         self.pos_end = pos_end
 
 class LoadNum(Expr):
+    __slots__ = ('prompt_msg', 'pos_start', 'pos_end')
+
     def __init__(self, prompt_msg: str, pos_start=None, pos_end=None):
         super().__init__(NodeType.LOAD_NUM)
         self.prompt_msg = prompt_msg
@@ -461,6 +587,8 @@ class LoadNum(Expr):
         self.pos_end = pos_end
 
 class ShootStmt(Stmt):
+    __slots__ = ('element', 'is_Next', 'pos_start', 'pos_end')
+
     def __init__(self, element, is_Next=False, pos_start=None, pos_end=None):
         super().__init__(NodeType.SHOOT)
         self.element = element
@@ -469,6 +597,8 @@ class ShootStmt(Stmt):
         self.pos_end = pos_end
 
 class XpFormatting(Expr):
+    __slots__ = ('lhs', 'digits', 'pos_start', 'pos_end')
+
     def __init__(self, lhs, digits, pos_start=None, pos_end=None):
         super().__init__(NodeType.XP_FORMAT)
         self.lhs = lhs
@@ -477,10 +607,14 @@ class XpFormatting(Expr):
         self.pos_end = pos_end
 
 class WipeStmt(Stmt):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(NodeType.WIPE)
 
 class JoinStmt(Stmt):
+    __slots__ = ('arr_name', 'value', 'dimensions', 'pos_start', 'pos_end', 'row_index')
+
     def __init__(self, arr_name, value, dimensions, pos_start, pos_end, row_index=None):
         super().__init__(NodeType.JOIN_STMT)
         self.arr_name = arr_name
@@ -491,6 +625,8 @@ class JoinStmt(Stmt):
         self.row_index = row_index
 
 class DropStmt(Stmt):
+    __slots__ = ('arr_name', 'elem_index', 'dimensions', 'pos_start', 'pos_end', 'row_index')
+
     def __init__(self, arr_name, elem_index, dimensions, pos_start, pos_end, row_index=None):
         super().__init__(NodeType.DROP_STMT)
         self.arr_name = arr_name
@@ -501,6 +637,8 @@ class DropStmt(Stmt):
         self.row_index = row_index
 
 class SeekStmt(Stmt):
+    __slots__ = ('arr_name', 'value', 'dimensions', 'pos_start', 'pos_end', 'row_index')
+
     def __init__(self, arr_name, value, dimensions, pos_start=None, pos_end=None, row_index=None):
         super().__init__(NodeType.SEEK_STMT)
         self.arr_name = arr_name
@@ -511,6 +649,8 @@ class SeekStmt(Stmt):
         self.row_index = row_index
 
 class RoundStmt(Stmt):
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start=None, pos_end=None):
         super().__init__(NodeType.ROUND_STMT)
         self.value = value
@@ -518,6 +658,8 @@ class RoundStmt(Stmt):
         self.pos_end = pos_end
 
 class LevelStmt(Stmt):
+    __slots__ = ('value', 'up_or_down', 'pos_start', 'pos_end')
+
     def __init__(self, value, up_or_down, pos_start=None, pos_end=None):
         super().__init__(NodeType.LEVEL_STMT)
         self.value = value
@@ -526,6 +668,8 @@ class LevelStmt(Stmt):
         self.pos_end = pos_end
 
 class ToNumStmt(Stmt):
+    __slots__ = ('value', 'hp_or_xp', 'pos_start', 'pos_end')
+
     def __init__(self, value, hp_or_xp, pos_start=None, pos_end=None):
         super().__init__(NodeType.TO_NUM_STMT)
         self.value = value
@@ -534,6 +678,8 @@ class ToNumStmt(Stmt):
         self.pos_end = pos_end
 
 class ToCommsStmt(Stmt):
+    __slots__ = ('value', 'pos_start', 'pos_end')
+
     def __init__(self, value, pos_start=None, pos_end=None):
         super().__init__(NodeType.TO_COMMS_STMT)
         self.value = value
@@ -541,6 +687,8 @@ class ToCommsStmt(Stmt):
         self.pos_end = pos_end
 
 class StringIndexArr(Expr):
+    __slots__ = ('left', 'index', 'pos_start', 'pos_end')
+
     def __init__(self, left: Identifier, index: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.STRING_INDEX_ARR)
         self.left = left
@@ -549,6 +697,8 @@ class StringIndexArr(Expr):
         self.pos_end = pos_end
 
 class StrArrAssignment(AssignmentStmt):
+    __slots__ = ('left', 'operator', 'right', 'pos_start', 'pos_end')
+
     def __init__(self, left: StringIndexArr, operator: str, right: Expr, pos_start=None, pos_end=None):
         super().__init__(NodeType.STR_ARR_ASS_STMT)
         self.left = left
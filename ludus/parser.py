@@ -1,6 +1,43 @@
-from .cfg import parse_table, first_set
-from .lexer import Lexer
-import re
+from . import ll1_table
+from .cfg import cfg
+from .tablegen import grammar_hash, build_tables, validator_source
+from .lexer import make_lexer, TT_EOF
+from .regex_lexer import lex_stream, CHUNK_SIZE
+
+# integer-coded LL(1) tables generated by `python -m ludus.tablegen`, or
+# built in memory when the grammar has changed since ll1_table.py was
+# written. Symbols are ids into SYMBOLS: terminals below TERMINAL_COUNT,
+# non-terminals from there on.
+CFG_HASH = grammar_hash(cfg)
+_tables = vars(ll1_table) if ll1_table.CFG_HASH == CFG_HASH else build_tables(cfg)
+SYMBOLS = _tables["SYMBOLS"]
+TERMINAL_COUNT = _tables["TERMINAL_COUNT"]
+START = _tables["START"]
+PRODUCTIONS = _tables["PRODUCTIONS"]
+TABLE = _tables["TABLE"]
+FIRST = _tables["FIRST"]
+TERMINAL_IDS = {symbol: number for number, symbol in enumerate(SYMBOLS[:TERMINAL_COUNT])}
+UNKNOWN = len(SYMBOLS)      # token kinds that are no terminal of the grammar
+NULLABLE = tuple(symbol >= TERMINAL_COUNT and "λ" in FIRST[symbol - TERMINAL_COUNT] for symbol in range(len(SYMBOLS)))
+# (top, stack symbols under it that expected_tokens() looked at) -> the
+# expected tokens of a syntax error, filled in as errors are reported
+EXPECTED = {}
+
+_validate = None
+
+def load_validator():
+    # the recursive-descent validator generated from the same tables, for
+    # checks that run start to end in one go; imported on first use
+    global _validate
+    if _validate is None:
+        from . import ll1_validator
+        if ll1_validator.CFG_HASH == CFG_HASH:
+            _validate = ll1_validator.validate
+        else:
+            namespace = {}
+            exec(validator_source(_tables), namespace)
+            _validate = namespace["validate"]
+    return _validate
 
 class Node:
     def __init__(self, tok, value=None):
@@ -13,133 +50,281 @@ class Node:
 
 
 class Parser:
-    def __init__(self, tokens, source_code):
+    def __init__(self, tokens, source_code, terminals=None):
         self.tokens = tokens
-        self.source_code = source_code.split("\n")
+        self.source_code = source_code
+        self.source_lines = None
         self.current_token_index = 0
-        self.current_token = self.get_next_token()
+        self.current_token = None
         self.save_stack = []
+        self.save_top = None
+        self.failure = None     # (token index, terminal, expected) of a syntax error
+        # a list to collect the (token index, terminal, expected) of every
+        # syntax error in, or None to stop at the first. drive() leaves the
+        # index of the token it ended at in end and the result for a text
+        # without syntax errors in ending.
+        self.failures = None
+        self.end = None
+        self.ending = None
+        # ludus/incremental.py sets these: checkpoints maps the index of each
+        # line's first token to the parser state there, and resync(index,
+        # state) may stop the parse at one of them by returning True
+        self.checkpoints = None
+        self.resync = None
+        self.resynced_at = None
+        # parse_stream() checks a block of lines at a time: parser() returns
+        # None in front of token stop_at and leaves the state to resume
+        # from in stop_state. first_line is the line number of source_code's
+        # first line.
+        self.stop_at = None
+        self.stop_state = None
+        self.first_line = 1
+        # the parser only reads the kind column of the TokenStore, mapped to
+        # terminal ids; a Token is built for the current position when
+        # reporting an error. ludus/incremental.py passes in the terminals
+        # of its last parse, so only kinds interned since then are mapped
+        self.terminals = [] if terminals is None else terminals
+        self.terminals.extend(TERMINAL_IDS.get(self.terminal(name), UNKNOWN) for name in tokens.kind_names[len(self.terminals):])
+        self.skipped = {tokens.kind_ids[name] for name in ("newline", "space") if name in tokens.kind_ids}
 
-    def get_next_token(self):
-        if self.current_token_index < len(self.tokens):
-            token = self.tokens[self.current_token_index]
-            self.current_token_index += 1
-            return token
-        return None
+    def terminal(self, token):
+        # the token list is shared with Semantic, so ids and comms literals
+        # are folded into their grammar terminals here instead of in place
+        if token.startswith('id') and token[2:].isdecimal():
+            return 'id'
+        if token.startswith('comms_ltr'):
+            return 'comms_ltr'
+        return token
     
-    def parser(self):
-        self.stack = ["<program>"]  
-        self.tokens.append("$")  
-        null_flag = False
+    def parser(self, resume=None):
+        # resume: (index, state) of a checkpoint to continue from
+        if resume is None and self.checkpoints is None and self.stop_at is None and self.failures is None:
+            return self.validate()
+        return self.drive(resume)
+
+    def validate(self):
+        # parser() through the generated validator, which has no parser
+        # state to save or resume from
+        kinds = self.tokens.kinds
+        terminals = self.terminals
+        skipped = self.skipped
+        toks = [terminals[kind] for kind in kinds if kind not in skipped]
+        try:
+            pos, top, cont = load_validator()(toks)
+        except RecursionError:
+            return self.drive()
+        if top is None:
+            # past <program> only spaces and newlines may be left before EOF
+            if pos == len(toks) - 1 and self.tokens.kind(len(kinds) - 1) == 'EOF':
+                return 'Valid syntax.'
+            return "Input not fully consumed."
+
+        self.top = top
+        index = [index for index, kind in enumerate(kinds) if kind not in skipped][pos]
+        if top < TERMINAL_COUNT:
+            return self.syntax_error(index, self.current_name(index), f"Expected token: {SYMBOLS[top]}")
+        stack = []
+        while cont is not None:
+            rest, cont = cont
+            stack.extend(rest)
+        return self.syntax_error(index, self.current_name(index), f"Expected tokens: {self.expected_tokens(top, stack[::-1])}")
 
-        while self.stack:
-            self.top = self.stack.pop()
+    def drive(self, resume=None):
+        # the table-driven LL(1) parser, for checks that save and resume
+        # parser states or recover from syntax errors
+        self.stack = [START]
+        null_flag = False
+        recovering = False      # in panic mode, from a syntax error to the next match
+        kinds = self.tokens.kinds
+        terminals = self.terminals
+        skipped = self.skipped
+        index = 0
+        checkpoints = self.checkpoints
+        recover = self.failures is not None
+        newline = self.tokens.kind_ids.get("newline", -1)
+        marked = -1
+        synced = None           # where the last synchronization resumed
+        if resume is not None:
+            index, (stack, null_flag, save_stack, self.save_top, recovering) = resume
+            self.stack, self.save_stack = list(stack), list(save_stack)
+            marked = index
+        stack = self.stack
+        line_stack = tuple(stack)   # the stack at the start of the current line
 
-            while self.current_token.token in {"newline", "space"}:
-                self.current_token = self.get_next_token()
+        while stack:
+            start = index
+            while kinds[index] in skipped:
+                index += 1
 
-            if re.match(r'^id\d+$', self.current_token.token):
-                self.current_token.token= 'id'
+            if index == self.stop_at:
+                self.stop_state = (tuple(stack), null_flag, tuple(self.save_stack), self.save_top, recovering)
+                return None
 
-            if re.match(r'^comms_ltr', self.current_token.token):
-                self.current_token.token= 'comms_ltr'
+            if (checkpoints is not None or recover) and index != start and index != marked and newline in kinds[start:index]:
+                marked = index
+                state = (tuple(stack), null_flag, tuple(self.save_stack), self.save_top, recovering)
+                line_stack = state[0]
+                if checkpoints is not None:
+                    if self.resync is not None and self.resync(index, state):
+                        self.resynced_at = index
+                        return None
+                    checkpoints[index] = state
 
-            # print(f"Current Top = {self.top}")
-            # print(f"Current Token = {self.current_token.token}")
+            top = stack.pop()
+            current = terminals[kinds[index]]
 
-            if self.top == self.current_token.token:
-                # print(f"Matched: {self.current_token.token} and {self.top}")
-                self.current_token = self.get_next_token()
+            if top == current:
+                index += 1
+                recovering = False
                 if null_flag:
                     null_flag = False
                     self.save_stack = []
-            elif self.top in parse_table:
-                # print(f"Parse Table of current top: {parse_table[self.top]}")
-                if self.current_token.token in parse_table[self.top]:
-                    production = parse_table[self.top][self.current_token.token]
-                    # print(f"Expand: {self.top} → {' '.join(production)}")
-
-                    if "λ" not in production:
-                        self.stack.extend(reversed(production))
+                continue
+            if top >= TERMINAL_COUNT:
+                production = TABLE[top - TERMINAL_COUNT][current] if current < TERMINAL_COUNT else -1
+                if production >= 0:
+                    production = PRODUCTIONS[production]
+                    if production:
+                        stack.extend(production)
                     else:
-                        if self.save_stack != []:
-                            pass
-                        else:
-                            self.save_top = self.top
-                            self.save_stack = self.stack.copy()
+                        # λ: remember where the nullable expansion started
+                        # for the error message if the next match fails
+                        if not self.save_stack:
+                            self.save_top = top
+                            self.save_stack = stack.copy()
                         null_flag = True
-                    # print(f"stack: {self.stack}")
-                    # print(f"save stack: {self.save_stack}")
-                else:
-                    expected_tokens = list(parse_table[self.top].keys()) 
-                    if self.current_token.token not in expected_tokens:
-                        if self.top in first_set:  
-                            expected_tokens = list(first_set[self.top]) 
-                        
-                        i = 1
-                        while "λ" in expected_tokens:
-                            expected_tokens.remove("λ")
-                            if self.stack:
-                                next_top = self.stack[-i]  
-                                if next_top in parse_table:
-                                    expected_tokens.extend(list(first_set[next_top]) )  
-                                else:
-                                    expected_tokens.append(next_top)
-                                i += 1
-
-
-                        expected_tokens = sorted(set(expected_tokens))
-                    
-                    error_msg = (f"Syntax Error: Unexpected token '{self.current_token.token}' at line {self.current_token.line} and column {self.current_token.column}."
-                                f" Expected tokens: {', '.join(expected_tokens)}.\n\n")
-                    error_msg += self.generate_error_message()
-                    return error_msg
+                    continue
+                expected = f"Expected tokens: {self.expected_tokens(top, stack)}"
+            elif null_flag:
+                expected = f"Expected tokens: {self.expected_tokens(self.save_top, self.save_stack)}"
             else:
-                if null_flag:
-                    # print(f"save stack: {self.save_stack}")
-                    # print(f"save top: {self.save_top}")
-                    expected_tokens = list(parse_table[self.save_top].keys()) 
-                    # print(f"yeppers: {expected_tokens}")
-                    if self.save_top in first_set:  
-                        expected_tokens = list(first_set[self.save_top]) 
-                        # print(f"yeppers2: {expected_tokens}")
-
-                    i = 1
-                    while "λ" in expected_tokens:
-                        expected_tokens.remove("λ")
-                        if self.save_stack:
-                            next_top = self.save_stack[-i]  
-                            if next_top in parse_table:
-                                expected_tokens.extend(list(first_set[next_top]) )  
-                            else:
-                                expected_tokens.append(next_top)
-                            i += 1
-
-
-                    expected_tokens = sorted(set(expected_tokens))
-
-                    error_msg = (f"Syntax Error: Unexpected token '{self.current_token.token}' at line {self.current_token.line} and column {self.current_token.column}."
-                                f" Expected tokens: {', '.join(expected_tokens)}.\n\n")
-                    error_msg += self.generate_error_message()
-                    return error_msg
-
-                error_msg = (f"Syntax Error: Unexpected token '{self.current_token.token}' at line {self.current_token.line} and column {self.current_token.column}."
-                        f" Expected token: {self.top}.\n\n")
-                error_msg += self.generate_error_message()
-                return error_msg
-
-        while self.current_token.token in {"newline", "space"}:
-                self.current_token = self.get_next_token()
-        
-        if self.current_token.token == 'EOF':
-            return 'Valid syntax.'
+                expected = f"Expected token: {SYMBOLS[top]}"
+
+            self.top = top
+            if not recover:
+                return self.syntax_error(index, self.current_name(index), expected)
+            # errors before the next match are knock-on effects of this one
+            # and aren't reported
+            if not recovering:
+                self.failures.append((index, self.current_name(index), expected))
+            recovering = True
+            stack.append(top)
+            failed = index
+            index = self.synchronize(index, stack, line_stack, index != synced)
+            if index is None:
+                self.end = failed
+                break
+            synced = index
+            line_stack = tuple(stack)
+            if checkpoints is not None:
+                # states of the lines dropped are left over from an older parse
+                for dropped in range(failed + 1, index + 1):
+                    checkpoints.pop(dropped, None)
+            null_flag = False
+            self.save_stack = []
         else:
-            return "Input not fully consumed."
+            index = self.end = self.skip(index)
+            if self.tokens.kind(index) == 'EOF':
+                self.ending = 'Valid syntax.'
+            else:
+                self.ending = "Input not fully consumed."
+
+        if self.failures:
+            return self.report(self.failures)
+        return self.ending
+
+    def report(self, failures):
+        return "\n\n".join(self.syntax_error(*failure) for failure in failures)
+
+    def skip(self, index):
+        kinds = self.tokens.kinds
+        while kinds[index] in self.skipped:
+            index += 1
+        return index
+
+    def starts_line(self, index):
+        kinds = self.tokens.kinds
+        newline = self.tokens.kind_ids.get("newline", -1)
+        while index > 0 and kinds[index - 1] in self.skipped:
+            index -= 1
+            if kinds[index] == newline:
+                return True
+        return index == 0
+
+    def next_line(self, index):
+        # the first token of the next line, or EOF
+        kinds = self.tokens.kinds
+        newline = self.tokens.kind_ids.get("newline", -1)
+        last = len(kinds) - 1
+        while index < last and kinds[index] != newline:
+            index += 1
+        return self.skip(index)
+
+    def synchronize(self, index, stack, line_stack, retry_token):
+        # panic mode after a syntax error at token index, with the failed
+        # symbol back on the stack. A token that starts a line is tried
+        # against the symbols under it first; after that whole lines are
+        # dropped until one whose first token the stack the error's line
+        # started with can take. Returns that token's index, or None if EOF
+        # comes first.
+        if retry_token and self.starts_line(index) and self.take(index, stack, len(stack) - 2):
+            return index
+        stack[:] = line_stack
+        last = len(self.tokens.kinds) - 1
+        index = self.next_line(index)
+        while index < last:
+            if self.take(index, stack, len(stack) - 1):
+                return index
+            index = self.next_line(index)
+        return None
+
+    def take(self, index, stack, depth):
+        # pops the stack down to the highest symbol from stack[depth] down
+        # that the token at index can be the next terminal of
+        current = self.terminals[self.tokens.kinds[index]]
+        if current >= TERMINAL_COUNT:
+            return False
+        for depth in range(depth, -1, -1):
+            symbol = stack[depth]
+            if symbol == current or symbol >= TERMINAL_COUNT and TABLE[symbol - TERMINAL_COUNT][current] >= 0:
+                del stack[depth + 1:]
+                return True
+        return False
+
+    def current_name(self, index):
+        return self.terminal(self.tokens.kind(index))
+
+    def expected_tokens(self, top, stack):
+        # FIRST(top), continued into the symbols under it on the stack for
+        # as long as what is collected can derive λ, as sorted names
+        key = (top,)
+        i = 1
+        while NULLABLE[key[-1]] and i <= len(stack):
+            key += (stack[-i],)
+            i += 1
+        expected = EXPECTED.get(key)
+        if expected is None:
+            names = set()
+            for symbol in key:
+                names.update(FIRST[symbol - TERMINAL_COUNT] if symbol >= TERMINAL_COUNT else (SYMBOLS[symbol],))
+            names.discard("λ")
+            expected = EXPECTED[key] = ", ".join(sorted(names))
+        return expected
+
+    def syntax_error(self, index, current, expected):
+        self.failure = (index, current, expected)
+        self.current_token = self.tokens[index]
+        error_msg = (f"Syntax Error: Unexpected token '{current}' at line {self.current_token.line} and column {self.current_token.column}."
+                    f" {expected}.\n\n")
+        error_msg += self.generate_error_message()
+        return error_msg
 
     def generate_error_message(self):
         line_num = self.current_token.line
         col_num = self.current_token.column
-        error_line = self.source_code[line_num - 1]  
+        if self.source_lines is None:
+            self.source_lines = self.source_code.split("\n")
+        error_line = self.source_lines[line_num - self.first_line]  
 
         expanded_line = error_line.replace('\t', ' ' * 4)
         adjusted_col_num = len(expanded_line[:col_num].replace('\t', ' ' * 4))
@@ -147,8 +332,9 @@ class Parser:
 
         return f"{expanded_line}\n{underline}"
 
-def parse(fn, text):
-    lexer = Lexer(fn, text)
+def parse(fn, text, lexer_mode="regex", recover=False):
+    # recover: report every syntax error, resynchronizing after each one
+    lexer = make_lexer(fn, text, lexer_mode)
     if text == "":
         return "No code in the module."
     tokens, error = lexer.make_tokens()
@@ -158,11 +344,49 @@ def parse(fn, text):
      
 
     syntax = Parser(tokens, text)
+    if recover:
+        syntax.failures = []
     result = syntax.parser() 
 
     return f"No lexical errors found!\n{result}"
-      
-
 
+def parse_stream(fn, source, chunk_size=CHUNK_SIZE):
+    # parse() for a file object or an iterable of text chunks. Blocks of
+    # lines are lexed and checked one after another, carrying the parser
+    # state across, so memory is bounded by the block size.
+    from .pipeline import LEXICAL_ERROR_MSG
+    errors = []
+    result = None
+    resume = None
+    blocks = 0
+    for tokens, block_errors, first_line in lex_stream(fn, source, chunk_size):
+        blocks += 1
+        errors.extend(block_errors)
+        if errors:
+            continue    # lexical errors are reported instead of the parse
+        if result is not None:
+            # the program ended in an earlier block, only whitespace may follow
+            index = tokens.skip(0, ("newline", "space"))
+            if result == 'Valid syntax.' and index < len(tokens) and tokens.kind(index) != TT_EOF:
+                result = "Input not fully consumed."
+            continue
+        last = len(tokens) - 1
+        stop_at = None
+        if tokens.kind(last) != TT_EOF:
+            # an EOF stands in for the next block, the parser stops in front of it
+            end = tokens.span(last)[1]
+            tokens.add(TT_EOF, TT_EOF, tokens.line(last), tokens.columns[last], end, end)
+            stop_at = last + 1
+        syntax = Parser(tokens, tokens.text)
+        syntax.first_line = first_line
+        syntax.stop_at = stop_at
+        result = syntax.parser(resume)
+        if result is None:
+            resume = (0, syntax.stop_state)
 
+    if blocks == 0:
+        return "No code in the module."
+    if errors:
+        return LEXICAL_ERROR_MSG + "\n\n".join(errors)
+    return f"No lexical errors found!\n{result}"
 
@@ -0,0 +1,65 @@
+from .lexer import make_lexer
+from .parser import Parser
+from .error import SemanticError
+
+LEXICAL_ERROR_MSG = 'Lexical errors found, cannot continue with syntax analyzing. Please check lexer tab.\n\nLexical Errors:\n'
+SYNTAX_ERROR_MSG = 'Syntax errors found, cannot continue with semantic analyzing. Please check syntax tab.\n\n'
+
+# lexes a source once and shares the same token list between the LL(1)
+# validator (Parser) and the AST builder (Semantic)
+class Compilation:
+    def __init__(self, fn, text, lexer_mode="regex", cache=None):
+        self.fn = fn
+        self.text = text
+        self.lexer_mode = lexer_mode
+        self.cache = cache      # a compile_cache.CompileCache, or None
+        self.tokens = None
+        self.lex_errors = None
+        self.syntax_result = None
+        self.program = None
+
+    def lex(self):
+        if self.tokens is None:
+            lexer = make_lexer(self.fn, self.text, self.lexer_mode)
+            self.tokens, self.lex_errors = lexer.make_tokens()
+        return self.tokens, self.lex_errors
+
+    def syntax(self):
+        if self.syntax_result is None:
+            tokens, _ = self.lex()
+            self.syntax_result = Parser(tokens, self.text).parser()
+        return self.syntax_result
+
+    def semantic(self):
+        if self.program is None:
+            from .ast import Semantic
+            tokens, _ = self.lex()
+            self.program = Semantic(tokens).produce_ast()
+        return self.program
+
+    def front_end(self):
+        # returns (program, None) on success or (None, message) on the first failing phase
+        if self.text == "":
+            return None, "No code in the module."
+
+        if self.cache is not None:
+            self.program = self.cache.load(self.text)
+            if self.program is not None:
+                return self.program, None
+
+        _, errors = self.lex()
+        if errors:
+            return None, LEXICAL_ERROR_MSG + "\n\n".join(errors)
+
+        result = self.syntax()
+        if result != 'Valid syntax.':
+            return None, SYNTAX_ERROR_MSG + result
+
+        program = self.semantic()
+        if isinstance(program, SemanticError):
+            program.source_code = self.text.splitlines()
+            return None, str(program)
+
+        if self.cache is not None:
+            self.cache.store(self.text, program)
+        return program, None
@@ -0,0 +1,284 @@
+import re
+from .lexer import *
+from .dfa_lexer import DFALexer, KEYWORDS, MAX_ID_LEN
+
+# Master-regex scanner. One compiled alternation matches the common tokens
+# (words, literals, whitespace, comments, operators) at the current offset,
+# and line/column numbers come from counting newlines between the offsets
+# asked for instead of Position.advance() running for every character. Anything the
+# pattern leaves alone (negative numbers, '.', backtick comments, malformed
+# literals, unknown characters) and every invalid delimiter falls back to one
+# iteration of the character lexer, so tokens and error messages are the same
+# as the other modes. Alternatives are ordered by how often they occur.
+
+MASTER = re.compile(r'''
+    (?P<space>\ +)
+  | (?P<word>[A-Za-z][A-Za-z0-9_]*)
+  | (?P<op>[+*/%<>!]=?|==|&&|\|\||[\^:()\[\]{},])
+  | (?P<number>(?:0|[1-9][0-9]{0,9})(?:\.[0-9]{1,7})?)(?![0-9.])
+  | (?P<newline>\n+)
+  | (?P<tab>\t+)
+  | (?P<id>_[A-Za-z0-9_]*)
+  | (?P<string>"(?:[^"\\\n]|\\[\s\S])*")
+  | (?P<comment>\#[^\n]*)
+''', re.VERBOSE)
+
+ESCAPE = re.compile(r'\\([\s\S])')
+ESCAPES = {'n': '\n', 't': '\t', '"': '"', '\\': '\\'}
+
+# lexeme -> (token, valid delimiters), as in Lexer.lex_next
+OPERATORS = {
+    '+': (TT_PLUS, delim3), '+=': (TT_PLUS_EQ, delim3),
+    '*': (TT_MUL, delim4), '*=': (TT_MUL_EQ, delim4),
+    '/': (TT_DIV, delim4), '/=': (TT_DIV_EQ, delim4),
+    '%': (TT_MOD, delim4), '%=': (TT_MOD_EQ, delim4),
+    '<': (TT_LT, delim4), '<=': (TT_LTE, delim4),
+    '>': (TT_GT, delim4), '>=': (TT_GTE, delim4),
+    '^': (TT_POW, delim4),
+    ':': (TT_COLON, delim5),
+    '(': (TT_LPAREN, lparen_delim), ')': (TT_RPAREN, rparen_delim),
+    '[': (TT_LSQUARE, lbracket_delim), ']': (TT_RSQUARE, rbracket_delim),
+    '{': (TT_LCURLY, lcurly_delim), '}': (TT_RCURLY, rcurly_delim),
+    ',': (TT_COMMA, comma_delim),
+    '==': (TT_EE, delim3), '!=': (TT_NE, delim3), '!': (TT_NOT, delim6),
+    '&&': ('&&', ' '), '||': ('||', ' '),
+}
+
+def unescape(body):
+    return ESCAPE.sub(lambda m: ESCAPES.get(m.group(1), m.group(0)), body)
+
+def number_lexeme(literal):
+    # make_number drops trailing zeros after the first decimal digit
+    whole, dot, decimal = literal.partition('.')
+    if not dot:
+        return literal, TT_HP
+    return whole + '.' + decimal[0] + decimal[1:].rstrip('0'), TT_XP
+
+class RegexLexer(DFALexer):
+    def __init__(self, fn, text):
+        super().__init__(fn, text)
+        self.error_starts = []  # offset of the step that reported each error
+        self.counted = 0        # lines_before is the newline count up to this offset
+        self.lines_before = 0
+
+    def line_number(self, idx):
+        # 0-based line of text[idx], counted on from the last offset asked for
+        if idx >= self.counted:
+            self.lines_before += self.text.count('\n', self.counted, idx)
+        else:
+            self.lines_before -= self.text.count('\n', idx, self.counted)
+        self.counted = idx
+        return self.lines_before
+
+    def line_col(self, idx):
+        # 0-based line and column of text[idx], tabs expanded like Position.advance
+        ln = self.line_number(idx)
+        start = self.text.rfind('\n', 0, idx) + 1
+        if self.text.find('\t', start, idx) == -1:
+            return ln, idx - start
+        col = 0
+        for char in self.text[start:idx]:
+            col = col + 4 - (col % 4) if char == '\t' else col + 1
+        return ln, col
+
+    def past_tabs(self, start, end):
+        # index just past the last tab of a line and its column, so columns
+        # after it are a plain offset
+        last_tab = self.text.rfind('\t', start, end)
+        if last_tab == -1:
+            return start, 0
+        return last_tab + 1, self.line_col(last_tab + 1)[1]
+
+    def sync(self, idx):
+        ln, col = self.line_col(idx)
+        self.pos = Position(idx, ln, col, self.fn, self.text)
+        self.prev_char = self.text[idx - 1] if idx > 0 else None
+        self.current_char = self.text[idx] if idx < len(self.text) else None
+
+    def make_tokens(self):
+        tokens = TokenStore(self.text)
+        errors = []
+        self.lhs_space = ''
+        _, last = self.scan(tokens, errors)
+        ln, col = self.line_col(last)
+        tokens.add(TT_EOF, TT_EOF, ln + 1, col + 1, len(self.text), len(self.text))
+
+        return tokens, errors
+
+    def scan(self, tokens, errors, idx=0, resync=None):
+        # lexes from offset idx (a line start, or 0) to the end of the text.
+        # resync(offset) is asked after each newline token and stops the scan
+        # by returning True. Returns the offset reached and the start of the
+        # last scanning step.
+        text = self.text
+        end = len(text)
+        match_at = MASTER.match
+        error_starts = self.error_starts
+        last = idx
+        # line bookkeeping, moved forward as idx passes each newline
+        line_end = -1
+
+        while idx < end:
+            if idx > line_end:
+                ln = self.line_number(idx)
+                line_start = text.rfind('\n', 0, idx) + 1
+                line_end = text.find('\n', idx)
+                if line_end == -1:
+                    line_end = end
+                tab_end, tab_col = self.past_tabs(line_start, line_end)
+            if idx >= tab_end:
+                col = tab_col + idx - tab_end
+            else:
+                col = self.line_col(idx)[1]
+
+            last = idx
+            match = match_at(text, idx)
+            kind = match.lastgroup if match else None
+
+            if kind == 'space':
+                self.lhs_space = text[idx - 1] if idx > 0 else None
+                lexeme, token, delims = ' ', TT_SPACE, space_delim
+            elif kind == 'word':
+                lexeme = match.group()
+                if lexeme in KEYWORDS:
+                    token, delims = lexeme, KEYWORDS[lexeme]
+                    if token == 'true' or token == 'false':
+                        token = TT_FLAG
+                elif len(lexeme) <= MAX_ID_LEN:
+                    self.step_start = idx
+                    token, delims = self.identifiers(lexeme), id_delim
+                else:
+                    kind = None
+            elif kind == 'op':
+                lexeme = match.group()
+                token, delims = OPERATORS[lexeme]
+            elif kind == 'number':
+                lexeme, token = number_lexeme(match.group())
+                delims = numlit_delim
+            elif kind == 'newline':
+                lexeme, token, delims = '\\n', TT_NEWLINE, nl_delim
+            elif kind == 'tab':
+                idx = match.end()
+                last = idx - 1
+                continue
+            elif kind == 'comment':
+                idx = match.end()
+                continue
+            elif kind == 'id':
+                lexeme = match.group()
+                if len(lexeme) <= MAX_ID_LEN:
+                    self.step_start = idx
+                    token, delims = self.identifiers(lexeme), id_delim
+                else:
+                    kind = None
+            elif kind == 'string':
+                lexeme = match.group()
+                if '\\' in lexeme:
+                    lexeme = '"' + unescape(lexeme[1:-1]) + '"'
+                token, delims = TT_COMMS + '\n' * lexeme.count('\n'), commslit_delim
+
+            if kind is None:
+                self.sync(idx)
+                self.step_start = idx
+                self.lex_next(ln + 1, col + 1, errors, tokens)
+                error_starts.extend([idx] * (len(errors) - len(error_starts)))
+                idx = self.pos.idx
+                continue
+
+            stop = match.end()
+            if (text[stop] if stop < end else '\n') in delims:
+                tokens.add(lexeme, token, ln + 1, col + 1, idx, stop)
+                idx = stop
+                if kind == 'newline' and resync is not None and resync(idx):
+                    break
+            else:
+                self.sync(stop)
+                self.step_start = idx
+                self.process_token(ln + 1, col + 1, lexeme, token, delims, errors, tokens)
+                error_starts.extend([idx] * (len(errors) - len(error_starts)))
+                idx = self.pos.idx
+
+        return idx, last
+
+# Streaming mode, for sources too large to hold as one string and token
+# list. Text is read in chunks and lexed a block of whole lines at a time;
+# each block is cut at a line start that a newline token has to end at, so
+# the scan stops there exactly as a full lex would pass through it. A cut
+# that lands inside a token spanning lines (a comment or string) leaves the
+# scan running past it, and the block is lexed again once more text is in.
+
+CHUNK_SIZE = 1 << 16
+
+def read_chunks(source, chunk_size):
+    # a file object is read chunk_size characters at a time, anything else
+    # is taken as an iterable of text chunks
+    if hasattr(source, 'read'):
+        return iter(lambda: source.read(chunk_size), '')
+    return iter(source)
+
+def cut_point(text, start):
+    # start of the last line after `start` that begins with a character a
+    # newline token may be followed by, or None
+    end = len(text.rstrip('\n'))
+    while True:
+        newline = text.rfind('\n', start, end)
+        if newline == -1:
+            return None
+        char = text[newline + 1]
+        if char != '\n' and char in nl_delim:
+            return newline + 1
+        end = newline
+
+def lex_stream(fn, source, chunk_size=CHUNK_SIZE):
+    # yields (tokens, errors, first_line) per block: a TokenStore over the
+    # block's text, its lexical errors and the 1-based line number of the
+    # text's first line. Every block but the last ends with a newline token,
+    # the last one with EOF. Nothing is yielded for an empty source.
+    identifier_map = {}
+    text = ''
+    start = 0       # text[:start] is the newline before the block, kept for context
+    lines = 0       # newlines before text[0]
+    retry_at = 0    # buffer length to reach before lexing a cut block again
+    chunks = read_chunks(source, chunk_size)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        if not final:
+            text += chunk
+            if len(text) < retry_at:
+                continue
+            cut = cut_point(text, start)
+            if cut is None:
+                continue
+        elif len(text) == start:
+            return
+
+        lexer = RegexLexer(fn, text)
+        lexer.identifier_map = identifier_map
+        lexer.current_id = len(identifier_map) + 1
+        lexer.lines_before = lines
+        lexer.lhs_space = ''
+        known = len(identifier_map)
+        tokens = TokenStore(text)
+        errors = []
+        if final:
+            _, last = lexer.scan(tokens, errors, start)
+            ln, col = lexer.line_col(last)
+            tokens.add(TT_EOF, TT_EOF, ln + 1, col + 1, len(text), len(text))
+            yield tokens, errors, lines + 1
+            return
+
+        idx, _ = lexer.scan(tokens, errors, start, lambda end: end == cut)
+        if idx != cut:
+            # ids are numbered by first appearance, forget the ones seen
+            # past the cut
+            for name in list(identifier_map)[known:]:
+                del identifier_map[name]
+            retry_at = 2 * len(text)
+            continue
+        yield tokens, errors, lines + 1
+        lines += text.count('\n', 0, cut - 1)
+        text = text[cut - 1:]
+        start = 1
+        retry_at = 0
@@ -0,0 +1,100 @@
+from .nodes import *
+
+# Resolver: runs over the finished AST and gives every variable reference
+# (Identifier, ArrayElement, StructInstField) an address = (depth, slot).
+# depth counts lexical scopes out from the global scope (0), slot is the
+# order the name was declared in within that scope. References to names with
+# no visible declaration keep address None and go through the plain lookup.
+
+DECLARATIONS = (VarDec, ArrayDec, ArrayRedec, StructInst, ImmoInstDec, GlobalStructDec, StructDec, GlobalFuncDec)
+
+# statement fields that are bodies of their own block scope
+BLOCK_FIELDS = {
+    'IfStmt': ('then_branch', 'else_branch'),
+    'ElifStmt': ('body',),
+    'ChoiceStmt': ('body',),
+    'FlankStmt': ('backup_body',),
+    'ForStmt': ('body',),
+    'GrindWhileStmt': ('body',),
+}
+
+class Resolver:
+    def __init__(self):
+        self.scopes = [{}]
+
+    def resolve(self, program):
+        self.visit(program.body)
+        return program
+
+    def declare(self, name):
+        scope = self.scopes[-1]
+        if name not in scope:
+            scope[name] = len(scope)
+        return len(self.scopes) - 1, scope[name]
+
+    def find(self, name):
+        for depth in range(len(self.scopes) - 1, -1, -1):
+            slot = self.scopes[depth].get(name)
+            if slot is not None:
+                return depth, slot
+        return None
+
+    def block(self, body, names=()):
+        self.scopes.append({})
+        for name in names:
+            self.declare(name)
+        self.visit(body)
+        self.scopes.pop()
+
+    def visit(self, node):
+        if isinstance(node, list):
+            for item in node:
+                self.visit(item)
+            return
+        if not isinstance(node, Stmt):
+            return
+
+        kind = node.kind
+        if kind == 'Identifier':
+            node.address = self.find(node.symbol)
+        elif kind in ('ArrayElement', 'StringIndexArr'):
+            self.visit(node.left)
+            node.address = node.left.address
+            self.visit(node.index)
+        elif kind == 'StructInstField':
+            # the field name is not a variable
+            self.visit(node.instance)
+            node.address = node.instance.address
+        elif kind == 'GlobalFuncBody':
+            for param in node.params or []:
+                self.visit(param.param_val)
+            self.block(node.body, [param.param for param in node.params or []])
+        elif kind == 'PlayFunc':
+            self.visit(node.body)
+        elif kind == 'BlockStmt':
+            self.block(node.statements)
+        elif kind == 'StructDec':
+            self.declare(node.name.symbol if isinstance(node.name, Identifier) else node.name)
+        elif isinstance(node, DECLARATIONS):
+            for key, value in zip(node.fields, node.field_values()):
+                if key != 'name':
+                    self.visit(value)
+            name = node.name.symbol if isinstance(node.name, Identifier) else node.name
+            address = self.declare(name)
+            if isinstance(node.name, Identifier):
+                node.name.address = address
+        elif kind in BLOCK_FIELDS:
+            blocks = BLOCK_FIELDS[kind]
+            for key, value in zip(node.fields, node.field_values()):
+                if key not in blocks:
+                    self.visit(value)
+            for key in blocks:
+                body = getattr(node, key)
+                if body is not None:
+                    self.block(body)
+        else:
+            for value in node.field_values():
+                self.visit(value)
+
+def resolve(program):
+    return Resolver().resolve(program)
@@ -0,0 +1,389 @@
+from ..nodes import *
+from .interpreter import specialize
+
+# Stack bytecode for the runtime. A Code object is two parallel lists (ops and
+# args) plus a constant pool; args are ints, constant indexes or jump targets.
+# Instructions that need the AST for error positions or for the semantic
+# checks shared with the tree-walker take the node from the constant pool.
+
+# expressions
+CONST               = 0     # push consts[arg]
+LOAD                = 1     # push value of the Identifier consts[arg]
+BINARY              = 2     # pop rhs, lhs; push binary_op(consts[arg], lhs, rhs)
+UNARY               = 3     # pop operand; push unary_op(consts[arg], operand)
+CHAIN_TEST          = 4     # pop; if falsy push False and jump arg
+EVAL                = 5     # push evaluate(consts[arg]) through the closure/tree backend
+EVAL_RT             = 6     # same as EVAL but keeps the analyzer's isRuntime
+CALL_VALUE          = 7     # push eval_func() of the call consts[arg]
+RAISE               = 8     # raise SemanticError(*consts[arg])
+POP                 = 9
+JUMP                = 10
+POP_JUMP_IF_FALSE   = 11
+POP_JUMP_IF_TRUE    = 12
+
+# statements
+DECLARE             = 13    # pop value, declare the VarDec consts[arg]
+ASSIGN              = 14    # pop value, assign through the VarAssignmentStmt consts[arg]
+SHOOT               = 15    # pop element, shoot it for the ShootStmt consts[arg]
+EXEC                = 16    # run consts[arg] through the SemanticAnalyzer
+CALL                = 17    # call statement consts[arg], recall values discarded
+RECALL              = 18
+JOIN                = 19
+DROP                = 20
+SEEK                = 21
+CHECKPOINT          = 22
+RESUME              = 23
+
+# control flow
+TEST_FLAG           = 24    # if/elif condition must be a flag, value stays on the stack
+TEST_LOOP           = 25    # loop condition must be a flag, value stays on the stack
+BRANCH              = 26    # arg = (n, targets, else_target); pops n conditions
+MATCH               = 27    # pop choice value, compare with flank subject below it
+ENTER_BLOCK         = 28
+ENTER_IF_TRUE       = 29    # pop condition; enter block if true; push whether it ran
+EXIT_BLOCK          = 30
+EXIT_IF_RAN         = 31    # pop it_ran; exit block if set
+BLOCK_CHECK         = 32    # if body: leave on recall, checkpoint or resume
+RECALL_CHECK        = 33    # flank body: leave on recall inside a function
+RESUME_BREAK        = 34    # flank body: on resume clear it and jump arg
+LOOP_CHECK          = 35    # for body: arg = (on_recall, on_checkpoint)
+GRIND_CHECK         = 36    # first grind pass: leave on recall or checkpoint
+WHILE_CHECK         = 37    # while body: leave on checkpoint
+BREAK_IF_NOT_RUNTIME = 38
+FOR_INIT            = 39    # initialize loop control of ForStmt consts[arg], push its old record
+FOR_RESTORE         = 40    # pop old record, restore the loop control variable
+ENTER_PLAY          = 41
+EXIT_PLAY           = 42
+RETURN_IF_RECALL    = 43
+HALT                = 44
+BINARY_FAST         = 45    # pop rhs, lhs; push consts[arg](lhs, rhs), a specialized binary_op
+
+OPNAMES = {value: name for name, value in list(globals().items())
+           if name.isupper() and isinstance(value, int)}
+
+LOAD_KINDS = {'Load', 'LoadNum'}
+LITERALS = {'HpLiteral', 'XpLiteral', 'CommsLiteral', 'FlagLiteral'}
+CONDITION_LOAD_MSG = "TypeError: Cannot use load and loadNum function as condition."
+
+class Code:
+    def __init__(self, name):
+        self.name = name
+        self.ops = []
+        self.args = []
+        self.consts = []
+
+    def __len__(self):
+        return len(self.ops)
+
+class Compiler:
+    def __init__(self, name):
+        self.code = Code(name)
+
+    def emit(self, op, arg=None):
+        self.code.ops.append(op)
+        self.code.args.append(arg)
+        return len(self.code.ops) - 1
+
+    def const(self, value):
+        self.code.consts.append(value)
+        return len(self.code.consts) - 1
+
+    def emit_const(self, op, value):
+        return self.emit(op, self.const(value))
+
+    def label(self):
+        return len(self.code.ops)
+
+    def patch(self, index, target):
+        self.code.args[index] = target
+
+    def raises(self, message, node):
+        self.emit_const(RAISE, (message, node.pos_start, node.pos_end))
+
+    ###### EXPRESSIONS #########
+    def expr(self, node, rt=False):
+        kind = node.kind
+        if kind in LITERALS:
+            self.emit_const(CONST, node.value)
+        elif kind == 'DeadLiteral':
+            self.emit_const(CONST, None)
+        elif kind == 'Identifier':
+            self.emit_const(LOAD, node)
+        elif kind == 'BinaryExpr':
+            if node.left.kind in LOAD_KINDS or node.right.kind in LOAD_KINDS:
+                self.raises("OperandError: Cannot use load or loadNum function in a binary expression.", node)
+                return
+            self.expr(node.left)
+            self.expr(node.right)
+            fast = specialize(node)
+            if fast is not None:
+                self.emit_const(BINARY_FAST, fast)
+            else:
+                self.emit_const(BINARY, node)
+        elif kind == 'ChainRelatExpr':
+            tests = []
+            for expr in node.expressions:
+                self.expr(expr)
+                tests.append(self.emit(CHAIN_TEST))
+            self.emit_const(CONST, True)
+            for test in tests:
+                self.patch(test, self.label())
+        elif kind == 'UnaryExpr':
+            if node.operand.kind in LOAD_KINDS:
+                self.raises("InvalidOperand: loadNum and load function cannot be used as unary operand.", node.operand)
+                return
+            self.operand(node.operand)
+            self.emit_const(UNARY, node)
+        else:
+            self.emit_const(EVAL_RT if rt else EVAL, node)
+
+    def operand(self, node):
+        # positions where the tree-walker unwraps calls with eval_func()
+        if node.kind == 'FuncCallStmt':
+            self.emit_const(CALL_VALUE, node)
+        else:
+            self.expr(node)
+
+    def condition(self, node, load_msg=CONDITION_LOAD_MSG):
+        if node.kind in LOAD_KINDS:
+            self.raises(load_msg, node)
+        else:
+            self.operand(node)
+
+    ###### STATEMENTS #########
+    def body(self, stmts):
+        for stmt in stmts:
+            self.stmt(stmt)
+
+    def checked_body(self, stmts, check):
+        # emits the body followed by a check per statement, returns the
+        # check indexes so the caller can patch their targets
+        checks = []
+        for stmt in stmts:
+            self.stmt(stmt)
+            checks.append(self.emit(check))
+        return checks
+
+    def stmt(self, node):
+        kind = node.kind
+        if kind == 'VarDec':
+            if node.value.kind == 'FuncCallStmt':
+                self.emit_const(EXEC, node)
+            else:
+                self.expr(node.value, True)
+                self.emit_const(DECLARE, node)
+        elif kind == 'VarAssignmentStmt':
+            self.assignment(node)
+        elif kind == 'ShootStmt':
+            if node.element.kind in LOAD_KINDS:
+                self.emit_const(EXEC, node)
+            else:
+                self.operand(node.element)
+                self.emit_const(SHOOT, node)
+        elif kind == 'IfStmt':
+            self.if_stmt(node)
+        elif kind == 'FlankStmt':
+            self.flank_stmt(node)
+        elif kind == 'ForStmt':
+            self.for_stmt(node)
+        elif kind == 'GrindWhileStmt':
+            self.grind_while_stmt(node)
+        elif kind == 'CheckpointStmt':
+            self.emit(CHECKPOINT)
+        elif kind == 'ResumeStmt':
+            self.emit(RESUME)
+        elif kind == 'FuncCallStmt':
+            self.emit_const(CALL, node)
+        elif kind == 'RecallStmt':
+            self.emit_const(RECALL, node)
+        elif kind == 'JoinStmt':
+            self.emit_const(JOIN, node)
+        elif kind == 'DropStmt':
+            self.emit_const(DROP, node)
+        elif kind == 'SeekStmt':
+            self.emit_const(SEEK, node)
+        elif kind == 'PlayFunc':
+            self.stmt(node.body)
+        elif kind == 'BlockStmt':
+            self.emit(ENTER_PLAY)
+            self.body(node.statements)
+            self.emit(EXIT_PLAY)
+        elif kind in ('GlobalFuncDec', 'GlobalFuncBody'):
+            pass
+        else:
+            self.emit_const(EXEC, node)
+
+    def assignment(self, node):
+        if node.right.kind == 'FuncCallStmt' or (node.right.kind in LOAD_KINDS and node.operator != ':'):
+            self.emit_const(EXEC, node)
+        else:
+            self.expr(node.right, True)
+            self.emit_const(ASSIGN, node)
+
+    def if_stmt(self, node):
+        self.condition(node.condition)
+        self.emit_const(TEST_FLAG, node.condition)
+        branches = [node.then_branch]
+        if node.elif_branches is not None:
+            for branch in node.elif_branches:
+                self.condition(branch.condition)
+                self.emit_const(TEST_FLAG, branch.condition)
+                branches.append(branch.body)
+        select = self.emit(BRANCH)
+
+        targets = []
+        exits = []
+        for body in branches:
+            targets.append(self.label())
+            exits.append(self.block(body))
+        else_target = self.label()
+        if node.else_branch is not None:
+            exits.append(self.block(node.else_branch))
+        self.patch(select, (len(branches), targets, else_target))
+        for jump in exits:
+            self.patch(jump, self.label())
+
+    def block(self, stmts):
+        self.emit(ENTER_BLOCK)
+        checks = self.checked_body(stmts, BLOCK_CHECK)
+        for check in checks:
+            self.patch(check, self.label())
+        self.emit(EXIT_BLOCK)
+        return self.emit(JUMP)
+
+    def flank_stmt(self, node):
+        self.condition(node.expression, "TypeError: Cannot use load and loadNum as flank expression.")
+        ends = []
+        for choice in node.choices:
+            matches = []
+            for value in choice.values:
+                self.expr(value)
+                self.emit(MATCH)
+                matches.append(self.emit(POP_JUMP_IF_TRUE))
+            next_choice = self.emit(JUMP)
+
+            for match in matches:
+                self.patch(match, self.label())
+            self.emit(ENTER_BLOCK)
+            checks = self.checked_body(choice.body, RECALL_CHECK)
+            resumed = self.emit(RESUME_BREAK)
+            for check in checks:
+                self.patch(check, self.label())
+            self.emit(EXIT_BLOCK)
+            ends.append(self.emit(JUMP))
+            self.patch(resumed, self.label())
+            self.emit(EXIT_BLOCK)
+            self.patch(next_choice, self.label())
+
+        self.emit(ENTER_BLOCK)
+        checks = self.checked_body(node.backup_body, RECALL_CHECK)
+        for check in checks:
+            self.patch(check, self.label())
+        self.emit(EXIT_BLOCK)
+        for end in ends:
+            self.patch(end, self.label())
+        self.emit(POP)
+
+    def for_stmt(self, node):
+        self.emit_const(FOR_INIT, node)
+        self.condition(node.condition)
+        self.emit_const(TEST_LOOP, node.condition)
+        skip = self.emit(POP_JUMP_IF_FALSE)
+        self.emit(ENTER_BLOCK)
+
+        loop = self.label()
+        self.operand(node.condition)
+        done = self.emit(POP_JUMP_IF_FALSE)
+        checks = self.checked_body(node.body, LOOP_CHECK)
+        self.assignment(node.update)
+        self.emit(JUMP, loop)
+
+        on_recall = self.label()
+        self.emit(EXIT_BLOCK)
+        self.emit(POP)
+        end = self.emit(JUMP)
+
+        on_checkpoint = self.label()
+        self.patch(done, on_checkpoint)
+        self.emit(EXIT_BLOCK)
+        self.patch(skip, self.label())
+        self.emit(FOR_RESTORE)
+        self.patch(end, self.label())
+        for check in checks:
+            self.patch(check, (on_recall, on_checkpoint))
+
+    def grind_while_stmt(self, node):
+        self.condition(node.condition)
+        self.emit_const(TEST_LOOP, node.condition)
+        grind_checks = []
+        if node.is_grind:
+            self.emit(POP)
+            self.emit(ENTER_BLOCK)
+            grind_checks = self.checked_body(node.body, GRIND_CHECK)
+            self.emit_const(CONST, True)
+        else:
+            self.emit(ENTER_IF_TRUE)
+
+        loop = self.label()
+        self.operand(node.condition)
+        done = self.emit(POP_JUMP_IF_FALSE)
+        checks = self.checked_body(node.body, WHILE_CHECK)
+        breaks = []
+        if node.condition.kind == 'FlagLiteral' and node.condition.value == True:
+            breaks.append(self.emit(BREAK_IF_NOT_RUNTIME))
+        self.emit(JUMP, loop)
+
+        on_checkpoint = self.label()
+        self.emit(POP)
+        self.emit(EXIT_BLOCK)
+        ends = [self.emit(JUMP)]
+
+        exit_loop = self.label()
+        self.patch(done, exit_loop)
+        for brk in breaks:
+            self.patch(brk, exit_loop)
+        self.emit(EXIT_IF_RAN)
+
+        if grind_checks:
+            ends.append(self.emit(JUMP))
+            on_grind_exit = self.label()
+            self.emit(EXIT_BLOCK)
+            for check in grind_checks:
+                self.patch(check, on_grind_exit)
+        for end in ends:
+            self.patch(end, self.label())
+        for check in checks:
+            self.patch(check, on_checkpoint)
+
+def compile_function(node):
+    compiler = Compiler(node.name.symbol)
+    returns = []
+    for stmt in node.body:
+        compiler.stmt(stmt)
+        returns.append(compiler.emit(RETURN_IF_RECALL))
+    for ret in returns:
+        compiler.patch(ret, compiler.label())
+    compiler.emit(HALT)
+    return compiler.code
+
+def compile_bytecode(program):
+    for stmt in program.body:
+        if stmt.kind == 'GlobalFuncBody':
+            stmt.code = compile_function(stmt)
+    compiler = Compiler("<program>")
+    compiler.body(program.body)
+    compiler.emit(HALT)
+    program.code = compiler.code
+    return program.code
+
+def disassemble(code):
+    lines = []
+    for i, (op, arg) in enumerate(zip(code.ops, code.args)):
+        if op in (CONST, LOAD, BINARY, BINARY_FAST, UNARY, EVAL, EVAL_RT, CALL_VALUE, RAISE, DECLARE, ASSIGN, SHOOT,
+                  EXEC, CALL, RECALL, JOIN, DROP, SEEK, TEST_FLAG, TEST_LOOP, FOR_INIT):
+            value = code.consts[arg]
+            shown = f"{arg} ({value.kind})" if isinstance(value, Stmt) else f"{arg} ({value!r})"
+        else:
+            shown = "" if arg is None else str(arg)
+        lines.append(f"{i:>5} {OPNAMES[op]:<20} {shown}")
+    return "\n".join(lines)
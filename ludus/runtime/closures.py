@@ -0,0 +1,303 @@
+from ..nodes import *
+from ..error import SemanticError
+from .interpreter import walk, eval_func, binary_op, unary_op, format_placeholder, specialize, UnresolvedNumber
+
+# Closure backend: every expression node is turned into a callable
+# run(symbol_table, isRuntime=False) once, before execution. The callables
+# keep the exact semantics of interpreter.walk(), which stays available as
+# the reference tree-walker (check(..., backend="tree")).
+
+LOAD_KINDS = {'Load', 'LoadNum'}
+
+def compile_program(program):
+    from .traverser import SemanticAnalyzer
+    for node in iter_nodes(program):
+        node.visitor = SemanticAnalyzer.DISPATCH.get(node.kind, SemanticAnalyzer.generic_visit)
+        if node.kind in COMPILERS:
+            compile_expr(node)
+    return program
+
+def iter_nodes(root):
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Stmt):
+            yield item
+            stack.extend(item.field_values())
+        elif isinstance(item, list):
+            stack.extend(item)
+
+def compile_expr(node):
+    if node.compiled is not None:
+        return node.compiled
+    compiler = COMPILERS.get(node.kind)
+    if compiler is None:
+        # calls, loads and array builtins run through the tree-walker
+        def run(symbol_table, isRuntime=False):
+            return walk(node, symbol_table, isRuntime)
+        return run
+    node.compiled = compiler(node)
+    return node.compiled
+
+def raises(message, pos_start=None, pos_end=None):
+    def run(symbol_table, isRuntime=False):
+        raise SemanticError(message, pos_start, pos_end)
+    return run
+
+def operand(expr):
+    if expr.kind == 'FuncCallStmt':
+        name = expr.name.symbol
+        def run(symbol_table, isRuntime=False):
+            return eval_func(name, expr, symbol_table)
+        return run
+    return compile_expr(expr)
+
+def index_operand(expr):
+    if expr.kind in LOAD_KINDS:
+        return raises("IndexError: loadNum and load function cannot be used as index expression.", expr.pos_start, expr.pos_end)
+    return operand(expr)
+
+def compile_literal(node):
+    value = node.value
+    def run(symbol_table, isRuntime=False):
+        return value
+    return run
+
+def lookup_of(ident, address=None):
+    # lookup(symbol_table) for a variable reference, through the resolved
+    # address when the resolver could give it one
+    symbol = ident.symbol
+    pos_start = ident.pos_start
+    pos_end = ident.pos_end
+    if address is None:
+        address = ident.address
+    if address is None:
+        def lookup(symbol_table):
+            return symbol_table.lookup(symbol, pos_start, pos_end)
+    else:
+        def lookup(symbol_table):
+            return symbol_table.lookup_address(symbol, address, pos_start, pos_end)
+    return lookup
+
+def compile_identifier(node):
+    symbol = node.symbol
+    pos_start = node.pos_start
+    pos_end = node.pos_end
+    address = node.address
+    def run(symbol_table, isRuntime=False):
+        if address is None:
+            value = symbol_table.lookup(symbol, pos_start, pos_end)
+        else:
+            value = symbol_table.lookup_address(symbol, address, pos_start, pos_end)
+        if not isinstance(value, dict):
+            return value
+        if "value" in value:
+            return value["value"]
+        elif "elements" in value or "fields" in value:
+            return value
+    return run
+
+def compile_binary(node):
+    if node.left.kind in LOAD_KINDS or node.right.kind in LOAD_KINDS:
+        return raises("OperandError: Cannot use load or loadNum function in a binary expression.", node.pos_start, node.pos_end)
+    left = compile_expr(node.left)
+    right = compile_expr(node.right)
+    fast = specialize(node)
+    if fast is not None:
+        def run(symbol_table, isRuntime=False):
+            return fast(left(symbol_table), right(symbol_table))
+        return run
+    def run(symbol_table, isRuntime=False):
+        return binary_op(node, left(symbol_table), right(symbol_table))
+    return run
+
+def compile_chain_relat(node):
+    exprs = [compile_expr(expr) for expr in node.expressions]
+    def run(symbol_table, isRuntime=False):
+        for expr in exprs:
+            if not expr(symbol_table):
+                return False
+        return True
+    return run
+
+def compile_unary(node):
+    if node.operand.kind in LOAD_KINDS:
+        return raises("InvalidOperand: loadNum and load function cannot be used as unary operand.", node.operand.pos_start, node.operand.pos_end)
+    value_of = operand(node.operand)
+    def run(symbol_table, isRuntime=False):
+        return unary_op(node, value_of(symbol_table))
+    return run
+
+def compile_array_access(node):
+    # returns access(symbol_table, arr) for an already looked-up array
+    arr_name = node.left.symbol
+    index = node.index
+    getters = [index_operand(idx) for idx in index]
+    inner = list(zip(index[:-1], getters[:-1]))
+    final_idx = index[-1]
+    final_get = getters[-1]
+    def access(symbol_table, arr):
+        if not isinstance(arr, dict) or "dimensions" not in arr:
+            raise SemanticError(f"TypeError: '{arr_name}' is not an array.",
+                                node.left.pos_start, node.left.pos_end)
+        if len(index) != len(arr["dimensions"]):
+            raise SemanticError(f"ArrayIndexError: Incorrect number of dimensions for {arr_name}.",
+                                node.pos_start, node.pos_end)
+
+        target = arr["elements"]
+        for i, (idx, get) in enumerate(inner):
+            idx_val = get(symbol_table)
+            if isinstance(idx_val, UnresolvedNumber):
+                idx_val = 0
+            if not isinstance(idx_val, int):
+                raise SemanticError(f"IndexError: Array index must always evaluate to a positive hp value.", idx.pos_start, idx.pos_end)
+            if idx_val < 0 or idx_val >= len(target):
+                raise SemanticError(f"ArrayIndexError: Index {idx_val} out of bounds for dimension {i} of array '{arr_name}'.", idx.pos_start, idx.pos_end)
+            target = target[idx_val]
+
+        final_idx_val = final_get(symbol_table)
+        if isinstance(final_idx_val, UnresolvedNumber):
+            final_idx_val = 0
+        if not isinstance(final_idx_val, int):
+            raise SemanticError(f"IndexError: Array index must always evaluate to a positive hp value.", final_idx.pos_start, final_idx.pos_end)
+        if final_idx_val < 0 or final_idx_val >= len(target):
+            raise SemanticError(f"ArrayIndexError: Index {final_idx_val} out of bounds for final dimension of array '{arr_name}'.", final_idx.pos_start, final_idx.pos_end)
+
+        return target[final_idx_val]
+    return access
+
+def compile_array_element(node):
+    lookup = lookup_of(node.left, node.address)
+    access = compile_array_access(node)
+    def run(symbol_table, isRuntime=False):
+        return access(symbol_table, lookup(symbol_table))
+    return run
+
+def compile_string_index(node):
+    left = node.left
+    name = left.symbol
+    array_access = compile_array_access(node)
+    index = node.index
+    getters = [index_operand(idx) for idx in index]
+    inner = list(zip(index[:-1], getters[:-1]))
+    final_idx = index[-1]
+    final_get = getters[-1]
+    lookup = lookup_of(left, node.address)
+    def run(symbol_table, isRuntime=False):
+        value = lookup(symbol_table)
+        if isinstance(value, dict):
+            if "dimensions" in value:
+                node.kind = "ArrayElement"
+                return array_access(symbol_table, value)
+            if "type" not in value:
+                raise SemanticError(f"TypeError: '{name}' is not a variable.",
+                                    left.pos_start, left.pos_end)
+            if value["type"] != "comms":
+                raise SemanticError(f"TypeError: '{name}' is not a comms variable.",
+                                    left.pos_start, left.pos_end)
+            value = value["value"]
+        elif isinstance(value, str):
+            pass
+        else:
+            raise SemanticError(f"TypeError: '{name}' is not a variable.",
+                                left.pos_start, left.pos_end)
+
+        target = list(value)
+        for i, (idx, get) in enumerate(inner):
+            idx_val = get(symbol_table)
+            if isinstance(idx_val, UnresolvedNumber):
+                idx_val = 0
+            if not isinstance(idx_val, int):
+                raise SemanticError(f"IndexError: Variable index must always evaluate to a positive hp value.", idx.pos_start, idx.pos_end)
+            if idx_val < 0 or idx_val >= len(target):
+                raise SemanticError(f"IndexError: Variable {idx_val} out of bounds for size {i} of comms '{name}'.", idx.pos_start, idx.pos_end)
+            target = target[idx_val]
+
+        final_idx_val = final_get(symbol_table)
+        if isinstance(final_idx_val, UnresolvedNumber):
+            final_idx_val = 0
+        if not isinstance(final_idx_val, int):
+            raise SemanticError(f"IndexError: Index must always evaluate to a positive hp value.", final_idx.pos_start, final_idx.pos_end)
+        if final_idx_val < 0 or final_idx_val >= len(target):
+            raise SemanticError(f"IndexError: Index {final_idx_val} out of bounds for final dimension of variable '{name}'.", final_idx.pos_start, final_idx.pos_end)
+
+        return target[final_idx_val]
+    return run
+
+def compile_struct_field(node):
+    instance = node.instance
+    field = node.field
+    lookup = lookup_of(instance, node.address)
+    def run(symbol_table, isRuntime=False):
+        structinst = lookup(symbol_table)
+        if not isinstance(structinst, dict) or "fields" not in structinst:
+            raise SemanticError(f"TypeError: '{instance.symbol}' is not a struct instance.",
+                                instance.pos_start, instance.pos_end)
+        for fld in structinst["fields"]:
+            if fld["name"] == field.symbol:
+                return fld["value"]
+        raise SemanticError(f"NameError: Field '{field.symbol}' is not defined in struct instance '{instance.symbol}'.",
+                            field.pos_start, field.pos_end)
+    return run
+
+def compile_xp_format(node):
+    if node.lhs.kind in LOAD_KINDS:
+        return raises("FormatError: 'load' and 'loadNum' function are not allowed in xp formatting.", node.pos_start, node.pos_end)
+    value_of = operand(node.lhs)
+    formatted_digits = f".{node.digits}f"
+    pos_start = node.pos_start
+    pos_end = node.pos_end
+    def run(symbol_table, isRuntime=False):
+        value = value_of(symbol_table)
+        if isinstance(value, UnresolvedNumber):
+            value = 0.0
+
+        if not isinstance(value, dict):
+            if value is None:
+                raise SemanticError("FormatError: Cannot use xp formatting on a dead value.", pos_start, pos_end)
+            elif not isinstance(value, float):
+                raise SemanticError("FormatError: Using xp formatting on a non-xp value.", pos_start, pos_end)
+        else:
+            if "elements" in value or "fields" in value:
+                raise SemanticError("FormatError: Using xp formatting on a non-xp value.", pos_start, pos_end)
+            elif value["type"] != "xp":
+                raise SemanticError("FormatError: Using xp formatting on a non-xp value.", pos_start, pos_end)
+            elif value["value"] is None:
+                raise SemanticError("FormatError: Cannot use xp formatting on a dead value.", pos_start, pos_end)
+
+        return f"{value:{formatted_digits}}"
+    return run
+
+def compile_form_comms(node):
+    parts = []
+    for expr in node.expressions:
+        if expr.kind in LOAD_KINDS:
+            parts.append((expr, raises("FormatError: 'load' and 'loadNum' function are not allowed as placeholders.", expr.pos_start, expr.pos_end)))
+        else:
+            parts.append((expr, operand(expr)))
+    template = node.value
+    keys = [f"{{{placeholder}}}" for placeholder in node.placeholders]
+    def run(symbol_table, isRuntime=False):
+        evaluated_values = [str(format_placeholder(get(symbol_table), expr)) for expr, get in parts]
+        formatted = template
+        for key, result in zip(keys, evaluated_values):
+            formatted = formatted.replace(key, result, 1)
+        return formatted
+    return run
+
+COMPILERS = {
+    NodeType.HP_LITERAL: compile_literal,
+    NodeType.XP_LITERAL: compile_literal,
+    NodeType.COMMS_LITERAL: compile_literal,
+    NodeType.FLAG_LITERAL: compile_literal,
+    NodeType.DEAD_LITERAL: compile_literal,
+    NodeType.IDENTIFIER: compile_identifier,
+    NodeType.BINARY_EXPR: compile_binary,
+    NodeType.CHAIN_RELAT_EXPR: compile_chain_relat,
+    NodeType.UNARY_EXPR: compile_unary,
+    NodeType.ARR_ELEMENT: compile_array_element,
+    NodeType.STRING_INDEX_ARR: compile_string_index,
+    NodeType.STRUCT_INST_FIELD: compile_struct_field,
+    NodeType.XP_FORMAT: compile_xp_format,
+    NodeType.FORM_COMMS_LITERAL: compile_form_comms,
+}
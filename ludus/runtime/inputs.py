@@ -0,0 +1,57 @@
+import queue
+from ..error import SemanticError
+
+# Input providers for load/loadNum. interpreter.read_input() asks the
+# current provider for one line per call. QueueInput blocks on a queue until
+# the frontend pushes a value (no polling); StreamInput reads pre-supplied
+# lines from a stream and never waits.
+
+class InputProvider:
+    def read(self, prompt):
+        raise NotImplementedError
+
+    def cancel(self):
+        # called by interpreter.reset_interpreter() when a new run starts
+        pass
+
+class StreamInput(InputProvider):
+    def __init__(self, stream, echo=None):
+        self.stream = stream
+        self.echo = echo    # output sink the prompt is written to, if any
+
+    def read(self, prompt):
+        if self.echo is not None:
+            if prompt:
+                self.echo.write(str(prompt))
+            self.echo.flush()
+        line = self.stream.readline()
+        if line == "":
+            raise SemanticError("InputError: No more input available for load or loadNum.")
+        return line.rstrip("\r\n")
+
+class QueueInput(InputProvider):
+    # make_queue lets the eel frontend use gevent.queue.Queue so waiting
+    # yields to the websocket loop instead of blocking it
+    def __init__(self, make_queue=queue.Queue, on_prompt=None):
+        self.queue = make_queue()
+        self.on_prompt = on_prompt
+        self.run_id = 0
+
+    def push(self, value):
+        self.queue.put((self.run_id, value))
+
+    def cancel(self):
+        # wakes a waiting read; values pushed for older runs are dropped
+        self.run_id += 1
+        self.queue.put((None, None))
+
+    def read(self, prompt):
+        run_id = self.run_id
+        if self.on_prompt is not None:
+            self.on_prompt(prompt)
+        while True:
+            value_run_id, value = self.queue.get()
+            if self.run_id != run_id:
+                raise SemanticError("InputError: Waiting for input was cancelled by a new run.")
+            if value_run_id == run_id:
+                return value
@@ -1,13 +1,16 @@
+import operator
 from .symbol_table import SymbolTable
 from ..error import SemanticError
-import eel
-import time
+from . import output, trace
+try:
+    import eel
+except ImportError:     # headless runs (python -m ludus) don't need the GUI
+    eel = None
 
 symbol_table = SymbolTable()
-input_value = None
-stopper = False
 current_run_id = 0
 test_flag = False
+input_provider = None   # inputs.InputProvider used by load/loadNum
 
 class UnresolvedNumber:
     def __init__(self, possible_types=("int", "float")):
@@ -16,23 +19,30 @@ class UnresolvedNumber:
     def __repr__(self):
         return "0 or 0.0"
 
-@eel.expose
 def pass_input(value): # receives input from js
-    global input_value
-    print(f"Received input from frontend: {value}")
-    input_value = value  
+    if trace.io:
+        trace.record("io", f"received input from frontend: {value!r}")
+    input_provider.push(value)
 
-@eel.expose
 def get_input_from_frontend(prompt="Enter value"): # pass input to js
-    print(f"Prompting user: {prompt}")
+    if trace.io:
+        trace.record("io", f"prompting user: {prompt!r}")
     eel.requestInput(prompt)  
 
-@eel.expose
 def reset_interpreter():
-    global input_value, stopper, current_run_id
-    input_value = None
-    stopper = False
+    global current_run_id
     current_run_id += 1
+    if input_provider is not None:
+        input_provider.cancel()
+
+def read_input(prompt):
+    if input_provider is None:
+        raise SemanticError("InputError: No input source available for load and loadNum.")
+    output.flush()  # earlier shoots must show before the prompt
+    val = input_provider.read(prompt)
+    if trace.io:
+        trace.record("io", f"received input: {val!r}")
+    return val
 
 def eval_func(name, node, symbol_table):
     return_values = evaluate(node, symbol_table)
@@ -47,10 +57,14 @@ def eval_func(name, node, symbol_table):
     return value
 
 def evaluate(ast_node, symbol_table, isRuntime=False):
+    compiled = ast_node.compiled
+    if compiled is not None:
+        return compiled(symbol_table, isRuntime)
+    return walk(ast_node, symbol_table, isRuntime)
+
+def walk(ast_node, symbol_table, isRuntime=False): # reference tree-walking evaluator
     from .traverser import SemanticAnalyzer 
     traverser = SemanticAnalyzer(symbol_table, isRuntime)
-    global input_value
-    global stopper
     global test_flag
     
     TYPE_MAP = {
@@ -101,14 +115,15 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
     elif ast_node.kind == 'ArrayElement':
         arr_name = ast_node.left.symbol
         arr = symbol_table.lookup(arr_name, ast_node.left.pos_start, ast_node.left.pos_end)
-        print(f"arr: {arr}")
+        if trace.arrays:
+            trace.record("arrays", f"{arr_name}: {arr}")
 
         if not isinstance(arr, dict) or "dimensions" not in arr:
             raise SemanticError(f"TypeError: '{arr_name}' is not an array.", 
                                 ast_node.left.pos_start, ast_node.left.pos_end)
         if len(ast_node.index) != len(arr["dimensions"]):
             raise SemanticError(f"ArrayIndexError: Incorrect number of dimensions for {arr_name}.", 
-                                ast_node.index.pos_start, ast_node.index.pos_end)
+                                ast_node.pos_start, ast_node.pos_end)
         
         target = arr["elements"]
         for i, idx in enumerate(ast_node.index[:-1]):
@@ -222,23 +237,11 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
         else:    
             value = evaluate(ast_node.operand, symbol_table)
         
-        operand = value
-        op_type = TYPE_MAP.get(type(operand), str(type(operand)))
-        if ast_node.operator == '-':
-            if isinstance(operand, UnresolvedNumber):
-                return 0
-            if not isinstance(operand, (int, float, bool)):
-                raise SemanticError(f"TypeError: Cannot apply '-' to non-numeric type: {op_type}", ast_node.operand.pos_start, ast_node.operand.pos_end) 
-            return -operand
-        elif ast_node.operator == '!':
-            if not isinstance(operand, bool):
-                raise SemanticError(f"TypeError: Cannot apply '!' to non-flag type: {op_type}", ast_node.operand.pos_start, ast_node.operand.pos_end)
-            return not operand
-        else:
-            raise SemanticError(f"Unknown unary operator: {ast_node.operator}")
+        return unary_op(ast_node, value)
     
     elif ast_node.kind == "FuncCallStmt":
-        print(f"funccallstmt in interpreter runtime is {isRuntime}")
+        if trace.calls:
+            trace.record("calls", f"evaluate {ast_node.name.symbol}(), runtime {isRuntime}")
         value = symbol_table.lookup(ast_node.name.symbol, ast_node.name.pos_start, ast_node.name.pos_end)
         recall = value["recall"]
         if recall == []:
@@ -251,58 +254,29 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
         return result
     
     elif ast_node.kind == "Load":
-        print(f"loadnode = {ast_node} in loadNUm")
+        if trace.io:
+            trace.record("io", f"{ast_node.kind} at {ast_node.pos_start}, runtime {isRuntime}")
         if isRuntime:
             if ast_node.prompt_msg is not None:
                 prompt = evaluate(ast_node.prompt_msg, symbol_table)
             else:
                 prompt = ""
             
-            run_id_snapshot = current_run_id  # snapshot of the current run ID before waiting for input
-            get_input_from_frontend(prompt)
-
-            print(f"before sleep {input_value} and {stopper}")
-
-            while input_value is None and stopper is False:
-                if current_run_id != run_id_snapshot:  # this checks if runtime was clicked
-                    print("Cancelled waiting for input due to new run.")
-                    raise SemanticError("test")
-                eel.sleep(0)
-
-            print(f"Received input: {input_value}")
-
-            val = input_value
-            input_value = None  
-            
-            return val
+            return read_input(prompt)
         else:
             return ""
     
     elif ast_node.kind == "LoadNum":
         
-        print(f"loadnode = {ast_node} in loadNUm")
+        if trace.io:
+            trace.record("io", f"{ast_node.kind} at {ast_node.pos_start}, runtime {isRuntime}")
         if isRuntime:
             if ast_node.prompt_msg is not None:
                 prompt = evaluate(ast_node.prompt_msg, symbol_table)
             else:
                 prompt = ""
             
-            run_id_snapshot = current_run_id  
-            get_input_from_frontend(prompt)
-
-            print(f"before sleep {input_value} and {stopper}")
-
-            while input_value is None and stopper is False:
-                if current_run_id != run_id_snapshot:  # this checks if runtime was clicked
-                    print("Cancelled waiting for input due to new run.")
-                    raise SemanticError("test")
-                eel.sleep(0)
-            
-            print(f"Received input: {input_value}")
-            
-            val = input_value
-            input_value = None
-            
+            val = read_input(prompt)
 
             try:
                 stripped_val = val.strip()
@@ -342,7 +316,8 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
         if isinstance(value, UnresolvedNumber):
             value = 0.0
 
-        print (f"xp format val = {value}")
+        if trace.values:
+            trace.record("values", f"xp format {value!r}")
         
         if not isinstance(value, dict):
             if value is None:
@@ -352,7 +327,8 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
             
             formatted_digits = f".{ast_node.digits}f"
             formatted = f"{value:{formatted_digits}}"  
-            print(f"formatted {formatted}")
+            if trace.values:
+                trace.record("values", f"formatted {formatted}")
             
             return formatted
         
@@ -366,7 +342,8 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
             
             formatted_digits = f".{ast_node.digits}f"
             formatted = f"{value:{formatted_digits}}"  
-            print(f"formatted {formatted}")
+            if trace.values:
+                trace.record("values", f"formatted {formatted}")
             
             return formatted
     
@@ -381,58 +358,9 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
                 result = eval_func(expr.name.symbol, expr, symbol_table) 
             else:    
                 result = evaluate(expr, symbol_table)
-            print(f"res {result}")
-            
-            if not isinstance(result, dict):
-                if result is None:
-                    result = 'dead'
-                elif isinstance(result, UnresolvedNumber):
-                    result = '0 or 0.0'
-                elif isinstance(result, float):
-                    whole_part = str(int(abs(result)))
-                    if len(whole_part) > 10:
-                        raise SemanticError("TypeError: Whole number part of xp exceeds 10 digits.", expr.pos_start, expr.pos_end)
-                    
-                    result = round(result, 7)
-                    result = f"{result:.7f}".rstrip('0').rstrip('.') if '.' in f"{result:.7f}" else f"{result:.7f}"
-                elif isinstance(result, int):
-                    if len(str(abs(result))) > 10:
-                        raise SemanticError("TypeError: Hp exceeds 10 digits.", expr.pos_start, expr.pos_end)
-                    result = str(result)
-                elif isinstance(result, str):
-                    result=result
-                elif result == False:
-                    result = 'false'
-                elif result == True:
-                    result='true'  
-                else:
-                    raise SemanticError("Cannot unpack placeholder.", expr.pos_start, expr.pos_end)
-            elif "value" in result:
-                if result is None:
-                    result = 'dead'
-                elif isinstance(result, UnresolvedNumber):
-                    result = '0 or 0.0'
-                elif isinstance(result, float):
-                    whole_part = str(int(abs(result)))
-                    if len(whole_part) > 10:
-                        raise SemanticError("TypeError: Whole number part of xp exceeds 10 digits.", expr.pos_start, expr.pos_end)
-                    result = round(result, 7)
-                    result = f"{result:.7f}".rstrip('0').rstrip('.') if '.' in f"{result:.7f}" else f"{result:.7f}"
-                elif isinstance(result, int):
-                    if len(str(abs(result))) > 10:
-                        raise SemanticError("TypeError: Hp exceeds 10 digits.", expr.pos_start, expr.pos_end)
-                    result = str(result)
-                elif isinstance(result, str):
-                    result=result
-                elif result == False:
-                    result = 'false'
-                elif result == True:
-                    result='true'  
-                else:
-                    raise SemanticError("Cannot unpack placeholder.", expr.pos_start, expr.pos_end)
-            elif "elements" in result or "fields" in result:
-                raise SemanticError("TypeError: Cannot format a list object within a comms literal.", expr.pos_start, expr.pos_end)
-            
+            if trace.values:
+                trace.record("values", f"placeholder {result!r}")
+            result = format_placeholder(result, expr)
             evaluated_values.append(str(result))  
 
         formatted = ast_node.value
@@ -460,13 +388,91 @@ def evaluate(ast_node, symbol_table, isRuntime=False):
     else:
         raise SemanticError(f"Unknown node kind: {ast_node.kind}")
 
+def format_placeholder(result, expr):
+    if not isinstance(result, dict):
+        if result is None:
+            result = 'dead'
+        elif isinstance(result, UnresolvedNumber):
+            result = '0 or 0.0'
+        elif isinstance(result, float):
+            whole_part = str(int(abs(result)))
+            if len(whole_part) > 10:
+                raise SemanticError("TypeError: Whole number part of xp exceeds 10 digits.", expr.pos_start, expr.pos_end)
+            
+            result = round(result, 7)
+            result = f"{result:.7f}".rstrip('0').rstrip('.') if '.' in f"{result:.7f}" else f"{result:.7f}"
+        elif isinstance(result, int):
+            if len(str(abs(result))) > 10:
+                raise SemanticError("TypeError: Hp exceeds 10 digits.", expr.pos_start, expr.pos_end)
+            result = str(result)
+        elif isinstance(result, str):
+            result=result
+        elif result == False:
+            result = 'false'
+        elif result == True:
+            result='true'  
+        else:
+            raise SemanticError("Cannot unpack placeholder.", expr.pos_start, expr.pos_end)
+    elif "value" in result:
+        if result is None:
+            result = 'dead'
+        elif isinstance(result, UnresolvedNumber):
+            result = '0 or 0.0'
+        elif isinstance(result, float):
+            whole_part = str(int(abs(result)))
+            if len(whole_part) > 10:
+                raise SemanticError("TypeError: Whole number part of xp exceeds 10 digits.", expr.pos_start, expr.pos_end)
+            result = round(result, 7)
+            result = f"{result:.7f}".rstrip('0').rstrip('.') if '.' in f"{result:.7f}" else f"{result:.7f}"
+        elif isinstance(result, int):
+            if len(str(abs(result))) > 10:
+                raise SemanticError("TypeError: Hp exceeds 10 digits.", expr.pos_start, expr.pos_end)
+            result = str(result)
+        elif isinstance(result, str):
+            result=result
+        elif result == False:
+            result = 'false'
+        elif result == True:
+            result='true'  
+        else:
+            raise SemanticError("Cannot unpack placeholder.", expr.pos_start, expr.pos_end)
+    elif "elements" in result or "fields" in result:
+        raise SemanticError("TypeError: Cannot format a list object within a comms literal.", expr.pos_start, expr.pos_end)
+    return result
+
+TYPE_MAP = {
+    int: "hp",
+    float: "xp",
+    str: "comms",
+    bool: "flag",
+    dict: "array",
+    type(None): "dead"
+}
+
+def unary_op(unop, operand):
+    op_type = TYPE_MAP.get(type(operand), str(type(operand)))
+    if unop.operator == '-':
+        if isinstance(operand, UnresolvedNumber):
+            return 0
+        if not isinstance(operand, (int, float, bool)):
+            raise SemanticError(f"TypeError: Cannot apply '-' to non-numeric type: {op_type}", unop.operand.pos_start, unop.operand.pos_end) 
+        return -operand
+    elif unop.operator == '!':
+        if not isinstance(operand, bool):
+            raise SemanticError(f"TypeError: Cannot apply '!' to non-flag type: {op_type}", unop.operand.pos_start, unop.operand.pos_end)
+        return not operand
+    else:
+        raise SemanticError(f"Unknown unary operator: {unop.operator}")
+
 def eval_binary_expr(binop, symbol_table):
     if binop.left.kind in {'Load', 'LoadNum'} or binop.right.kind in {'Load', 'LoadNum'}:
         raise SemanticError("OperandError: Cannot use load or loadNum function in a binary expression.", binop.pos_start, binop.pos_end)
     
     lhs = evaluate(binop.left, symbol_table)
     rhs = evaluate(binop.right, symbol_table)
-    
+    return binary_op(binop, lhs, rhs)
+
+def binary_op(binop, lhs, rhs):
     if isinstance(lhs, UnresolvedNumber) and not isinstance(rhs, UnresolvedNumber):
         if isinstance(rhs, int) or isinstance(rhs, bool):
             lhs = 0
@@ -524,7 +530,8 @@ def eval_binary_expr(binop, symbol_table):
     if isinstance(lhs, str) and isinstance(rhs, str):
         if binop.operator != '+':
             raise SemanticError("TypeError: Only valid operator between comms is '+'.", binop.pos_start, binop.pos_end)
-        print(f"lhs -> {lhs}, rhs -> {rhs}")
+        if trace.values:
+            trace.record("values", f"{lhs!r} + {rhs!r}")
         return lhs + rhs
 
     return eval_numeric_binary_expr(lhs, rhs, binop.operator, binop)
@@ -614,3 +621,59 @@ def eval_logic_expr(lhs, rhs, operator):
     else:
         raise SemanticError(f"Unknown logical operator: {operator}.")
 
+
+# Type-specialized binary operations for the closure and VM backends. The
+# static type checker tags a BinaryExpr with the operand types it can prove
+# (BinaryExpr.operands, set by typecheck.annotate before the run); for those
+# specialize() returns op(lhs, rhs) doing only the arithmetic or comparison.
+# It still checks the operands' exact types, and anything else, including
+# every case binary_op would raise on (division by zero, dead values), goes
+# through binary_op, so a wrong tag only costs the fast path.
+PY_TYPES = {"hp": int, "xp": float, "comms": str, "flag": bool}
+ARITHMETIC_OPS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '^': operator.pow}
+RELATIONAL_OPS = {'<': operator.lt, '>': operator.gt, '<=': operator.le, '>=': operator.ge,
+                  '==': operator.eq, '!=': operator.ne}
+LOGICAL_OPS = {'AND': operator.and_, '&&': operator.and_, 'OR': operator.or_, '||': operator.or_}
+
+def specialize(binop):
+    if not binop.operands:
+        return None
+    lhs_type, rhs_type = PY_TYPES[binop.operands[0]], PY_TYPES[binop.operands[1]]
+    op = binop.operator
+
+    if lhs_type is str and rhs_type is str:
+        if op == '+':
+            fn = operator.add
+        elif op in ('==', '!='):
+            fn = RELATIONAL_OPS[op]
+        else:
+            return None
+    elif lhs_type is bool and rhs_type is bool:
+        if op in LOGICAL_OPS:
+            fn = LOGICAL_OPS[op]
+        elif op in ('==', '!='):
+            fn = RELATIONAL_OPS[op]
+        else:
+            return None
+    elif lhs_type is not str and rhs_type is not str and bool not in (lhs_type, rhs_type):
+        if op in ARITHMETIC_OPS:
+            fn = ARITHMETIC_OPS[op]
+        elif op in RELATIONAL_OPS:
+            fn = RELATIONAL_OPS[op]
+        elif op == '/' or (op == '%' and lhs_type is int and rhs_type is int):
+            fn = operator.truediv if op == '/' else operator.mod
+            def run(lhs, rhs):
+                if type(lhs) is lhs_type and type(rhs) is rhs_type and rhs:
+                    return fn(lhs, rhs)
+                return binary_op(binop, lhs, rhs)
+            return run
+        else:
+            return None
+    else:
+        return None
+
+    def run(lhs, rhs):
+        if type(lhs) is lhs_type and type(rhs) is rhs_type:
+            return fn(lhs, rhs)
+        return binary_op(binop, lhs, rhs)
+    return run
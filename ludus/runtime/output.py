@@ -0,0 +1,113 @@
+import sys, time
+
+# Output channel for shoot/shootNxt. The runtime writes every value to the
+# current sink; a BufferedSink collects them and hands batched chunks to its
+# target once enough text is buffered or enough time has passed, so the GUI
+# gets one eel call per chunk instead of one per value. max_delay is a
+# deadline, not only checked on the next write: the first value in an empty
+# buffer arms a timer through `schedule` (gevent.spawn_later for eel), and
+# the runtime calls tick() once per loop iteration, because a loop that
+# never yields to gevent would keep that timer from running.
+
+class OutputSink:
+    def write(self, text):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def tick(self):
+        pass
+
+class StreamSink(OutputSink):
+    # stdout, stderr or any open text file
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write(self, text):
+        (self.stream or sys.stdout).write(text)
+
+    def flush(self):
+        (self.stream or sys.stdout).flush()
+
+class MemorySink(OutputSink):
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+
+    def getvalue(self):
+        return "".join(self.chunks)
+
+    def clear(self):
+        self.chunks = []
+
+class BufferedSink(OutputSink):
+    def __init__(self, target, max_chars=4096, max_delay=0.05, schedule=None):
+        self.target = target        # callable receiving each flushed chunk
+        self.max_chars = max_chars
+        self.max_delay = max_delay  # seconds a value may wait in the buffer
+        self.schedule = schedule    # schedule(delay, fn) calls fn once, delay seconds later
+        self.armed = False
+        self.buffer = []
+        self.size = 0
+        self.started = None
+
+    def write(self, text):
+        if not self.buffer:
+            self.started = time.monotonic()
+            if self.schedule is not None and not self.armed:
+                self.armed = True
+                self.schedule(self.max_delay, self.deadline)
+        self.buffer.append(text)
+        self.size += len(text)
+        if self.size >= self.max_chars or time.monotonic() - self.started >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            chunk = "".join(self.buffer)
+            self.buffer = []
+            self.size = 0
+            self.target(chunk)
+
+    def tick(self):
+        if self.buffer and time.monotonic() - self.started >= self.max_delay:
+            self.flush()
+
+    def deadline(self):
+        # the timer armed by write(); the buffer may have been flushed and
+        # refilled since, then its own deadline is still ahead
+        self.armed = False
+        if self.buffer:
+            remaining = self.max_delay - (time.monotonic() - self.started)
+            if remaining > 0:
+                self.armed = True
+                self.schedule(remaining, self.deadline)
+            else:
+                self.flush()
+
+def eel_sink(max_chars=4096, max_delay=0.05):
+    # batched printShoot calls for the eel frontend, which runs on gevent
+    import eel, gevent
+    return BufferedSink(lambda chunk: eel.printShoot(chunk), max_chars, max_delay, gevent.spawn_later)
+
+sink = StreamSink()
+
+def set_sink(new_sink):
+    global sink
+    flush()
+    previous = sink
+    sink = new_sink
+    return previous
+
+def write(text):
+    sink.write(text)
+
+def flush():
+    sink.flush()
+
+def tick():
+    # called by the runtime once per loop iteration
+    sink.tick()
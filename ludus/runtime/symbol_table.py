@@ -1,5 +1,6 @@
 from ..nodes import *
 from ..error import SemanticError
+from . import trace
 
 class SymbolTable:
     def __init__(self):
@@ -10,14 +11,23 @@ class SymbolTable:
         self.func_flag = False
         self.shoot_elements = []
         self.loads = [{}]
+        # lookup cache for resolved (depth, slot) addresses, see find_scope
+        self.epoch = 0
+        self.slots = {}
+
+    def invalidate(self):
+        # called whenever a scope is pushed/popped or a new name is bound
+        self.epoch += 1
     
     def enter_scope(self):
         new_scope = {}
         self.scope_stack.append(new_scope)
+        self.epoch += 1
     
     def enter_scope_func(self):
         new_scope = {}
         self.scope_stack.append(new_scope)
+        self.epoch += 1
         self.saved_scopes_func = [{}]
     
     def exit_scope(self, actual_exit=False):
@@ -29,6 +39,7 @@ class SymbolTable:
             return
         
         current_scope = self.scope_stack.pop()
+        self.epoch += 1
         # for scope in reversed(self.scope_stack):
         #     print("scope: ", scope)
 
@@ -38,7 +49,8 @@ class SymbolTable:
             if actual_exit:
                 return
             self.saved_scopes.insert(1, current_scope.copy())
-            print(f"exit scope -> {self.saved_scopes}")
+            if trace.scopes:
+                trace.record("scopes", f"exit scope -> {self.saved_scopes}")
         
     def exit_scope_func(self, func_name):
         self.function_scopes[func_name] = {
@@ -46,6 +58,7 @@ class SymbolTable:
             "saved_scopes": [scope.copy() for scope in self.saved_scopes_func]
         }
         self.scope_stack.pop()
+        self.epoch += 1
 
     
     def restore_scope(self, scope_index=None):
@@ -55,30 +68,49 @@ class SymbolTable:
             else:
                 restored_scope = self.saved_scopes[1]  
             self.scope_stack.append(restored_scope)
+            self.epoch += 1
         else:
             raise SemanticError("No saved scope available to restore.")
         # print("Restore Scope:")
         # for scope in reversed(self.scope_stack):
         #     print(scope)
 
-    def restore_scope_func(self, func_name):
+    def enter_frame(self, func_name):
+        # activation record for a call: the global scope is shared by reference
+        # and only the function's own scope is copied, so a call costs
+        # O(params + locals). Blocks inside the body start from empty scopes.
+        # Returns the caller's stack for exit_frame.
         if func_name not in self.function_scopes:
             raise SemanticError(f"Function '{func_name}' has no saved scope.")
 
         func_data = self.function_scopes[func_name]
-        self.scope_stack = [scope.copy() for scope in func_data["scope_stack"]]
-        self.saved_scopes = [scope.copy() for scope in func_data["saved_scopes"]]
+        caller = self.scope_stack
+        self.scope_stack = [self.scope_stack[0]] + [scope.copy() for scope in func_data["scope_stack"][1:]]
+        self.epoch += 1
+        return caller
+
+    def exit_frame(self, caller):
+        self.scope_stack = caller
+        self.epoch += 1
     
     def define(self, name: str, value):
         current_scope = self.scope_stack[-1]
+        if name not in current_scope:
+            self.epoch += 1
         current_scope[name] = value
 
-    def define_var(self, name: str, value, datatype, immo):
-        current_scope = self.scope_stack[-1]
-        for scope in reversed(self.scope_stack):
-            if name in scope:
-                current_scope = scope
-                break
+    def define_var(self, name: str, value, datatype, immo, address=None):
+        current_scope = None
+        if address is not None:
+            current_scope = self.find_scope(name, address)
+        else:
+            for scope in reversed(self.scope_stack):
+                if name in scope:
+                    current_scope = scope
+                    break
+        if current_scope is None:
+            current_scope = self.scope_stack[-1]
+            self.epoch += 1
         
         current_scope[name] = {
             "type": datatype,
@@ -92,6 +124,8 @@ class SymbolTable:
             if name in scope:
                 current_scope = scope
                 break
+        else:
+            self.epoch += 1
             
         current_scope[name] = {
             "dimensions": dimensions,
@@ -102,18 +136,23 @@ class SymbolTable:
 
     def define_structinst(self, name: str, parent: str, values, immo):
         current_scope = self.scope_stack[-1]
+        if name not in current_scope:
+            self.epoch += 1
         current_scope[name] = {
             "parent": parent,
             "fields": values,
             "immo": immo
         }
 
-    def define_func(self, name, params, body, recall_stmts):
+    def define_func(self, name, params, body, recall_stmts, code=None):
         current_scope = self.scope_stack[-1]
+        if name not in current_scope:
+            self.epoch += 1
         current_scope[name] = {
             "params": params,
             "body": body,
-            "recall": recall_stmts
+            "recall": recall_stmts,
+            "code": code
         }
     
     def lookup(self, name: str, start=None, end=None, scope_to_check=None):
@@ -135,6 +174,29 @@ class SymbolTable:
                 return value  
 
         raise SemanticError(f"NameError: Identifier '{name}' is not defined.", start, end)
+
+    def find_scope(self, name, address):
+        # innermost scope holding name. The resolver gives every variable
+        # reference a (depth, slot) address; saved scopes are restored by
+        # position so the address can't index the stack directly, instead it
+        # keys a cache of the dict that held the name, valid for one epoch.
+        entry = self.slots.get(address)
+        if entry is not None and entry[0] == self.epoch and entry[1] == name:
+            return entry[2]
+        for scope in reversed(self.scope_stack):
+            if name in scope:
+                self.slots[address] = (self.epoch, name, scope)
+                return scope
+        return None
+
+    def lookup_address(self, name: str, address, start=None, end=None):
+        scope = self.find_scope(name, address)
+        if scope is None:
+            raise SemanticError(f"NameError: Identifier '{name}' is not defined.", start, end)
+        value = scope[name]
+        if isinstance(value, Expr):
+            raise SemanticError(f"NameError: Identifier '{name}' is not defined before use.", start, end)
+        return value
     
     def save_shoot_elems(self, element):
         self.shoot_elements.append(element)
@@ -0,0 +1,59 @@
+import sys
+from collections import deque
+
+# Debug tracing for the front end and the runtime. Every trace point is
+# guarded by the module flag of its category,
+#
+#     if trace.scopes:
+#         trace.record("scopes", f"exit scope -> {saved_scopes}")
+#
+# so while a category is off its trace points cost one attribute load and
+# the message is never formatted. Records of the enabled categories go to a
+# ring buffer that keeps the last `size` of them, nothing is printed.
+#
+#   trace.enable("calls", "scopes")    # trace.enable() turns on all of them
+#   ... run ...
+#   trace.dump(sys.stderr)
+#   trace.disable()
+
+CATEGORIES = ("scopes", "calls", "arrays", "io", "values", "statements", "parse", "optimizer")
+DEFAULT_SIZE = 10000
+
+# one flag per category, read directly by the trace points
+scopes = calls = arrays = io = values = statements = parse = optimizer = False
+
+buffer = deque(maxlen=DEFAULT_SIZE)     # (category, message)
+
+def enable(*categories, size=None):
+    global buffer
+    for category in categories or CATEGORIES:
+        if category not in CATEGORIES:
+            raise ValueError(f"unknown trace category '{category}', expected one of {', '.join(CATEGORIES)}")
+        globals()[category] = True
+    if size is not None and size != buffer.maxlen:
+        buffer = deque(buffer, maxlen=size)
+
+def disable(*categories):
+    for category in categories or CATEGORIES:
+        if category not in CATEGORIES:
+            raise ValueError(f"unknown trace category '{category}', expected one of {', '.join(CATEGORIES)}")
+        globals()[category] = False
+
+def enabled():
+    return [category for category in CATEGORIES if globals()[category]]
+
+def record(category, message):
+    buffer.append((category, message))
+
+def records(category=None):
+    if category is None:
+        return list(buffer)
+    return [entry for entry in buffer if entry[0] == category]
+
+def clear():
+    buffer.clear()
+
+def dump(stream=None):
+    stream = stream or sys.stderr
+    for category, message in buffer:
+        stream.write(f"[{category}] {message}\n")
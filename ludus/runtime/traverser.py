@@ -3,12 +3,15 @@ from ..nodes import *
 from .symbol_table import SymbolTable
 from .interpreter import evaluate, eval_func, UnresolvedNumber
 from ..error import SemanticError
-import eel
+from . import output, trace
 import math
 
-@eel.expose
+def run_code(analyzer, code):
+    from .vm import VM
+    return VM(analyzer).run(code)
+
 def print_shoot(element):
-    eel.printShoot(element)
+    output.write(element)
 
 class ASTVisitor:
     TYPE_MAP = {
@@ -21,14 +24,19 @@ class ASTVisitor:
     def __init__(self):
         self.symbol_table = SymbolTable()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.DISPATCH = dispatch_table(cls)
+
     def visit(self, node: Stmt):
-        method_name = f"visit_{node.kind}"
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        visitor = self.DISPATCH.get(node.kind)
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(self, node)
 
     def generic_visit(self, node: Stmt):
-        if hasattr(node, '__dict__'):
-            for value in node.__dict__.values():
+        if isinstance(node, Stmt):
+            for value in node.field_values():
                 if isinstance(value, Stmt):
                     self.visit(value)
                 elif isinstance(value, list):
@@ -185,9 +193,11 @@ class ASTVisitor:
             self.visit(stmt)
             body.append(stmt)
         self.symbol_table.func_flag = False
-        self.symbol_table.define_func(node.name.symbol, node.params, body, node.recall_stmts)
+        self.symbol_table.define_func(node.name.symbol, node.params, body, node.recall_stmts, node.code)
         self.symbol_table.exit_scope_func(node.name.symbol)
-        self.symbol_table.define_func(node.name.symbol, node.params, body, node.recall_stmts)
+        self.symbol_table.define_func(node.name.symbol, node.params, body, node.recall_stmts, node.code)
+
+ASTVisitor.DISPATCH = dispatch_table(ASTVisitor)
 
 ########################################
 ####### 2ND RUN OF TRAVERSER ###########
@@ -213,13 +223,27 @@ class SemanticAnalyzer(ASTVisitor):
         self.isRuntime = isRuntime
 
     def visit(self, node: Stmt, is_runtime=False):
-        print(f"runtime is {is_runtime} and self.isruntime is {self.isRuntime}")
         if is_runtime:
             self.isRuntime = True
-        print(f"runtime is currently {self.isRuntime}")
-        method_name = f"visit_{node.kind}"
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        if trace.statements:
+            trace.record("statements", f"{node.kind} at {getattr(node, "pos_start", None)}, runtime {self.isRuntime}")
+        if node.visitor is not None:
+            return node.visitor(self, node)
+        visitor = self.DISPATCH.get(node.kind)
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(self, node)
+
+    def visit_Program(self, node: Program):
+        if node.code is not None:
+            return run_code(self, node.code)
+        for stmt in node.body:
+            self.visit(stmt)
+
+    def enter_block(self):
+        # if/flank/loop bodies get a fresh scope that exit_scope(True) drops,
+        # so only the block's own bindings go away when it is left
+        self.symbol_table.enter_scope()
 
     ###### VARIABLES #########
     def visit_VarDec(self, node: VarDec):
@@ -235,8 +259,11 @@ class SemanticAnalyzer(ASTVisitor):
                 value = value[0]
         else:    
             value = evaluate(node.value, self.symbol_table, self.isRuntime)
-            print(f"value is {value}")
-            
+            if trace.values:
+                trace.record("values", f"{node.name.symbol} = {value!r}")
+        self.declare_var(node, value)
+
+    def declare_var(self, node: VarDec, value):
         if isinstance(value, UnresolvedNumber):
             val_type = "hp or xp" 
         elif isinstance(value, dict):
@@ -267,7 +294,9 @@ class SemanticAnalyzer(ASTVisitor):
             raise SemanticError(f"ValueError: loadNum and load function cannot be used in compound assignment statements.", node.right.pos_start, node.right.pos_end)
         else:
             new_val = evaluate(node.right, self.symbol_table, self.isRuntime)
+        self.assign_var(node, new_val)
 
+    def assign_var(self, node: VarAssignment, new_val):
         if isinstance(new_val, dict):
             if "dimensions" in new_val:
                 raise SemanticError(f"ValueError: Trying to assign an array to a variable: '{node.left.symbol}'.", node.right.pos_start, node.right.pos_end)
@@ -275,7 +304,11 @@ class SemanticAnalyzer(ASTVisitor):
                 raise SemanticError(f"ValueError: Trying to assign a struct instance to a variable: '{node.left.symbol}'.", node.right.pos_start, node.right.pos_end)
 
         #print(f"new_val is {new_val}")
-        value = self.symbol_table.lookup(node.left.symbol, node.left.pos_start, node.left.pos_end)
+        address = node.left.address
+        if address is not None:
+            value = self.symbol_table.lookup_address(node.left.symbol, address, node.left.pos_start, node.left.pos_end)
+        else:
+            value = self.symbol_table.lookup(node.left.symbol, node.left.pos_start, node.left.pos_end)
         
         if not isinstance(value, dict):
             datatype = self.TYPE_MAP.get(type(value), str(type(value)))
@@ -364,7 +397,7 @@ class SemanticAnalyzer(ASTVisitor):
         if new_val_type != value_type:
             raise SemanticError(f"TypeError: Type mismatch for variable '{node.left.symbol}'. Expected '{value_type}', got '{new_val_type}'.", node.pos_start, node.pos_end)
         
-        self.symbol_table.define_var(node.left.symbol, new_val, new_val_type, value["immo"])
+        self.symbol_table.define_var(node.left.symbol, new_val, new_val_type, value["immo"], address)
 
     def visit_BatchVarDec(self, node: BatchVarDec):
         variable_type = None
@@ -660,7 +693,8 @@ class SemanticAnalyzer(ASTVisitor):
             self.symbol_table.define_arr(arr_name, rhs_arr["dimensions"], values, node.immo, arr_type)
         elif isinstance(node.elements, FuncCallStmt):
             return_values = evaluate(node.elements, self.symbol_table)
-            print(return_values)
+            if trace.arrays:
+                trace.record("arrays", f"{arr_name} from {node.elements.name.symbol}(): {return_values}")
             if len(return_values) > 1:
                 raise SemanticError(f"ValueError: Function '{node.elements.name.symbol}' recalls more than one value, but only one was expected.", node.elements.pos_start, node.elements.pos_end)
             rhs_arr = return_values[0]
@@ -960,7 +994,8 @@ class SemanticAnalyzer(ASTVisitor):
     def visit_DropStmt(self, node: DropStmt, is_Return=False):
         arr_name = node.arr_name.symbol   
         arr_info = self.symbol_table.lookup(arr_name, node.arr_name.pos_start, node.arr_name.pos_end)
-        print(arr_info)
+        if trace.arrays:
+            trace.record("arrays", f"drop {arr_name}: {arr_info}")
         if isinstance(arr_info, dict): 
             if "dimensions" not in arr_info and arr_info["type"] == "comms":
                 if is_Return:
@@ -1129,8 +1164,8 @@ class SemanticAnalyzer(ASTVisitor):
         
         elif len(arr_dimensions) == 2:  # 2D array
             if row_index is not None:   # id: id[expr].seek(expr)
-                start = [node.row_index.pos_start[0], node.row_index.pos_start[1]-1]
-                end = [node.row_index.pos_end[0], node.row_index.pos_end[1]+(len(str(row_index)))]
+                start = (node.row_index.pos_start[0], node.row_index.pos_start[1]-1)
+                end = (node.row_index.pos_end[0], node.row_index.pos_end[1]+(len(str(row_index))))
                 if row_index >= len(arr_elements) or row_index < 0:
                     raise SemanticError(f"IndexError: Row index {row_index} out of bounds.", start, end)
                 if not isinstance(arr_elements[row_index], list):
@@ -1158,7 +1193,8 @@ class SemanticAnalyzer(ASTVisitor):
         if isinstance(info, UnresolvedNumber):
             raise SemanticError(f"TypeError: Can only use rounds function on comms and arrays.", node.pos_start, node.pos_end)
 
-        print(f"rounds info -> {info}")
+        if trace.arrays:
+            trace.record("arrays", f"rounds of {info}")
         if isinstance(info, dict):
             if "dimensions" not in info:
                 raise SemanticError(f"TypeError: Can only use rounds function on comms and arrays.", node.pos_start, node.pos_end)
@@ -1335,17 +1371,7 @@ class SemanticAnalyzer(ASTVisitor):
         
         for cond in conditions:
             if cond[0] == True:
-                prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-                if self.in_func_flag:
-                    self.symbol_table.restore_scope(len(self.symbol_table.saved_scopes) - 1)
-                else:
-                    self.symbol_table.restore_scope(len(self.symbol_table.scope_stack))
-                
-                new_scope = self.symbol_table.scope_stack    
-                for scope in prev_stack:
-                    for name, value in scope.items():
-                        if name in new_scope[-1]:
-                            new_scope[-1][name] = value  
+                self.enter_block()
                 
                 for stmt in cond[1]:
                     self.visit(stmt, is_runtime=self.isRuntime)
@@ -1364,17 +1390,7 @@ class SemanticAnalyzer(ASTVisitor):
                 return
         
         if node.else_branch is not None:
-            prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-            if self.in_func_flag:
-                self.symbol_table.restore_scope(len(self.symbol_table.saved_scopes) - 1)
-            else:
-                self.symbol_table.restore_scope(len(self.symbol_table.scope_stack))
-                
-            new_scope = self.symbol_table.scope_stack    
-            for scope in prev_stack:
-                 for name, value in scope.items():
-                    if name in new_scope[-1]:
-                        new_scope[-1][name] = value  
+            self.enter_block()
 
             for stmt in node.else_branch:
                 self.visit(stmt, is_runtime=self.isRuntime)
@@ -1403,17 +1419,7 @@ class SemanticAnalyzer(ASTVisitor):
             for choice_value in choice.values:
                 value = evaluate(choice_value, self.symbol_table)
                 if value == expression or ((value == 0 or value == 0.0) and isinstance(expression, UnresolvedNumber)):
-                    prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-                    if self.in_func_flag:
-                        self.symbol_table.restore_scope(len(self.symbol_table.saved_scopes) - 1)
-                    else:
-                        self.symbol_table.restore_scope(len(self.symbol_table.scope_stack))
-                    
-                    new_scope = self.symbol_table.scope_stack    
-                    for scope in prev_stack:
-                        for scope_name, scope_val in scope.items():
-                            if scope_name in new_scope[-1]:
-                                new_scope[-1][scope_name] = scope_val  
+                    self.enter_block()
 
                     for stmt in choice.body:
                         #print(f"runtime before flank: {self.isRuntime}")
@@ -1428,17 +1434,7 @@ class SemanticAnalyzer(ASTVisitor):
                     self.symbol_table.exit_scope(True)
                     return
 
-        prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-        if self.in_func_flag:
-            self.symbol_table.restore_scope(len(self.symbol_table.saved_scopes) - 1)
-        else:
-            self.symbol_table.restore_scope(len(self.symbol_table.scope_stack))
-                    
-        new_scope = self.symbol_table.scope_stack    
-        for scope in prev_stack:
-            for scope_name, scope_val in scope.items():
-                if scope_name in new_scope[-1]:
-                    new_scope[-1][scope_name] = scope_val  
+        self.enter_block()
 
         for stmt in node.backup_body:
             self.visit(stmt, is_runtime=self.isRuntime)
@@ -1487,25 +1483,16 @@ class SemanticAnalyzer(ASTVisitor):
             raise SemanticError(f"LoopConditionError: Loop condition does not evaluate to a flag value.", node.condition.pos_start, node.condition.pos_end)
         
         if condition:
-            prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-            if self.in_func_flag:
-                self.symbol_table.restore_scope(len(self.symbol_table.saved_scopes) - 1)
-            else:
-                self.symbol_table.restore_scope(len(self.symbol_table.scope_stack))
+            self.enter_block()
             
             def eval_cond(cond):
                 if cond.kind == 'FuncCallStmt':
                     return eval_func(cond.name.symbol, cond, self.symbol_table) 
                 else:    
                     return evaluate(cond, self.symbol_table)
-                
-            new_scope = self.symbol_table.scope_stack    
-            for scope in prev_stack:
-                 for scope_name, scope_val in scope.items():
-                    if scope_name in new_scope[-1]:
-                        new_scope[-1][scope_name] = scope_val
             
             while eval_cond(node.condition):
+                output.tick()
                 for stmt in node.body:
                     self.visit(stmt, is_runtime=self.isRuntime)
                     if self.recall_flag and self.in_func_flag:
@@ -1538,17 +1525,7 @@ class SemanticAnalyzer(ASTVisitor):
         
         if node.is_grind:
             it_ran = True
-            prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-            if self.in_func_flag:
-                self.symbol_table.restore_scope(len(self.symbol_table.saved_scopes) - 1)
-            else:
-                self.symbol_table.restore_scope(len(self.symbol_table.scope_stack))
-            
-            new_scope = self.symbol_table.scope_stack    
-            for scope in prev_stack:
-                 for name, value in scope.items():
-                    if name in new_scope[-1]:
-                        new_scope[-1][name] = value  
+            self.enter_block()
 
             for stmt in node.body:
                 self.visit(stmt, is_runtime=self.isRuntime)
@@ -1563,17 +1540,7 @@ class SemanticAnalyzer(ASTVisitor):
                     self.resume_flag = False
         elif not node.is_grind and condition:
             it_ran = True
-            prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-            if self.in_func_flag:
-                self.symbol_table.restore_scope(len(self.symbol_table.saved_scopes) - 1)
-            else:
-                self.symbol_table.restore_scope(len(self.symbol_table.scope_stack))
-            
-            new_scope = self.symbol_table.scope_stack    
-            for scope in prev_stack:
-                 for name, value in scope.items():
-                    if name in new_scope[-1]:
-                        new_scope[-1][name] = value  
+            self.enter_block()
             
         def eval_cond(cond):
             if cond.kind == 'FuncCallStmt':
@@ -1582,6 +1549,7 @@ class SemanticAnalyzer(ASTVisitor):
                 return evaluate(cond, self.symbol_table)
 
         while eval_cond(node.condition):
+            output.tick()
             for stmt in node.body:
                 self.visit(stmt, is_runtime=self.isRuntime)
                 if self.checkpoint_flag:
@@ -1619,13 +1587,11 @@ class SemanticAnalyzer(ASTVisitor):
         pass
 
     def visit_FuncCallStmt(self, node: FuncCallStmt, being_assigned = False, func_is_runtime=False):
-        print(f"in func call and runtime is {self.isRuntime}")
         if func_is_runtime:
             self.isRuntime = func_is_runtime
-        print(f"in func call and runtime is now {self.isRuntime}")
+        if trace.calls:
+            trace.record("calls", f"call {node.name.symbol}() at {node.pos_start}, runtime {self.isRuntime}")
         self.recall_values = []
-        prev_stack = [scope.copy() for scope in self.symbol_table.scope_stack]
-        prev_saved_stack = [scope.copy() for scope in self.symbol_table.saved_scopes]
         args = []
         if node.args:
             for arg in node.args:
@@ -1638,7 +1604,7 @@ class SemanticAnalyzer(ASTVisitor):
                 
                 args.append(value)
         
-        self.symbol_table.restore_scope_func(node.name.symbol)
+        caller = self.symbol_table.enter_frame(node.name.symbol)
        
         info = self.symbol_table.lookup(node.name.symbol, node.name.pos_start, node.name.pos_end)
         if not info:
@@ -1657,7 +1623,8 @@ class SemanticAnalyzer(ASTVisitor):
             for i, param in enumerate(params):
                 if i < len(args):  
                     arg_value = args[i]
-                    print(f"arg value -> {arg_value}") 
+                    if trace.calls:
+                        trace.record("calls", f"  {param.param} = {arg_value!r}")
                 elif param.param_val is not None:
                     arg_value = evaluate(param.param_val, self.symbol_table)
                 else:
@@ -1667,27 +1634,19 @@ class SemanticAnalyzer(ASTVisitor):
             
         if param_scope:
             self.symbol_table.scope_stack.append(param_scope)
-            
-        global_scope = prev_stack[0]  
-        func_global_scope = self.symbol_table.scope_stack[0]  
-
-        for name, value in global_scope.items():
-            if name in func_global_scope:
-                func_global_scope[name] = value  
+            self.symbol_table.invalidate()
         
         self.in_func_flag = True
         
-        for stmt in info["body"]:
-            self.visit(stmt, is_runtime=self.isRuntime)
-            if self.recall_flag:
-                break
+        if info.get("code") is not None:
+            run_code(self, info["code"])
+        else:
+            for stmt in info["body"]:
+                self.visit(stmt, is_runtime=self.isRuntime)
+                if self.recall_flag:
+                    break
 
-        for name, value in func_global_scope.items():
-            if name in global_scope:  
-                global_scope[name] = value
-        
-        self.symbol_table.scope_stack = prev_stack.copy()
-        self.symbol_table.saved_scopes = prev_saved_stack.copy()
+        self.symbol_table.exit_frame(caller)
 
         self.in_func_flag = False
         self.recall_flag = False
@@ -1730,7 +1689,9 @@ class SemanticAnalyzer(ASTVisitor):
             element = eval_func(node.element.name.symbol, node.element, self.symbol_table) 
         else:    
             element = evaluate(node.element, self.symbol_table)
-        
+        self.shoot(node, element)
+
+    def shoot(self, node: ShootStmt, element):
         #print(f"shoot element is {element} before and node element is {node.element}")
         if isinstance(element, UnresolvedNumber):
             element = '0 or 0.0'
@@ -1743,7 +1704,8 @@ class SemanticAnalyzer(ASTVisitor):
         elif "elements" in element or "fields" in element:
             raise SemanticError("UnsupportedArgumentError: Cannot use a list object as a shoot argument.", node.pos_start, node.pos_end)
             
-        print(f"shoot element -> {element}.")
+        if trace.values:
+            trace.record("values", f"shoot {element!r}")
         if self.isRuntime:
             if isinstance(element, float):
                 whole_part = str(int(abs(element)))
@@ -1777,7 +1739,8 @@ class SemanticAnalyzer(ASTVisitor):
     def visit_ToNumStmt(self, node: ToNumStmt):
         info = evaluate(node.value, self.symbol_table)
 
-        print(f"info -> {info}")
+        if trace.values:
+            trace.record("values", f"toNum of {info!r}")
         
         if isinstance(info, UnresolvedNumber):
             return 0 if node.hp_or_xp else 0.0
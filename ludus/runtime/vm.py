@@ -0,0 +1,217 @@
+from ..error import SemanticError
+from .interpreter import evaluate, eval_func, binary_op, unary_op, UnresolvedNumber
+from .bytecode import *
+from . import output
+
+class VM:
+    ops_executed = 0    # running total over every VM, read by the benchmarks
+
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+
+    def run(self, code):
+        analyzer = self.analyzer
+        st = analyzer.symbol_table
+        ops = code.ops
+        args = code.args
+        consts = code.consts
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        executed = 0
+
+        while True:
+            op = ops[pc]
+            arg = args[pc]
+            pc += 1
+            executed += 1
+
+            if op == LOAD:
+                node = consts[arg]
+                if node.address is None:
+                    value = st.lookup(node.symbol, node.pos_start, node.pos_end)
+                else:
+                    value = st.lookup_address(node.symbol, node.address, node.pos_start, node.pos_end)
+                if isinstance(value, dict):
+                    if "value" in value:
+                        value = value["value"]
+                    elif not ("elements" in value or "fields" in value):
+                        value = None
+                push(value)
+            elif op == CONST:
+                push(consts[arg])
+            elif op == BINARY_FAST:
+                rhs = pop()
+                push(consts[arg](pop(), rhs))
+            elif op == BINARY:
+                rhs = pop()
+                push(binary_op(consts[arg], pop(), rhs))
+            elif op == POP_JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif op == JUMP:
+                if arg < pc:
+                    output.tick()   # loop back edge
+                pc = arg
+            elif op == ASSIGN:
+                analyzer.assign_var(consts[arg], pop())
+            elif op == LOOP_CHECK:
+                if analyzer.recall_flag and analyzer.in_func_flag:
+                    pc = arg[0]
+                elif analyzer.checkpoint_flag:
+                    analyzer.checkpoint_flag = False
+                    pc = arg[1]
+                elif analyzer.resume_flag:
+                    analyzer.resume_flag = False
+            elif op == BLOCK_CHECK:
+                if (analyzer.recall_flag and analyzer.in_func_flag) or analyzer.checkpoint_flag or analyzer.resume_flag:
+                    pc = arg
+            elif op == WHILE_CHECK:
+                if analyzer.checkpoint_flag:
+                    analyzer.checkpoint_flag = False
+                    pc = arg
+                elif analyzer.resume_flag:
+                    analyzer.resume_flag = False
+            elif op == EVAL:
+                push(evaluate(consts[arg], st))
+            elif op == EVAL_RT:
+                push(evaluate(consts[arg], st, analyzer.isRuntime))
+            elif op == CALL_VALUE:
+                node = consts[arg]
+                push(eval_func(node.name.symbol, node, st))
+            elif op == CHAIN_TEST:
+                if not pop():
+                    push(False)
+                    pc = arg
+            elif op == UNARY:
+                push(unary_op(consts[arg], pop()))
+            elif op == DECLARE:
+                analyzer.declare_var(consts[arg], pop())
+            elif op == SHOOT:
+                analyzer.shoot(consts[arg], pop())
+            elif op == TEST_FLAG:
+                if not isinstance(stack[-1], bool):
+                    node = consts[arg]
+                    raise SemanticError("TypeError: The condition used does not evaluate to a flag value.", node.pos_start, node.pos_end)
+            elif op == BRANCH:
+                count, targets, pc = arg
+                conditions = stack[-count:]
+                del stack[-count:]
+                for target, condition in zip(targets, conditions):
+                    if condition == True:
+                        pc = target
+                        break
+            elif op == ENTER_BLOCK:
+                st.enter_scope()
+            elif op == EXIT_BLOCK:
+                st.exit_scope(True)
+            elif op == EXEC:
+                analyzer.visit(consts[arg], is_runtime=analyzer.isRuntime)
+            elif op == CALL:
+                analyzer.visit_FuncCallStmt(consts[arg])
+            elif op == RECALL:
+                analyzer.visit_RecallStmt(consts[arg])
+            elif op == RETURN_IF_RECALL:
+                if analyzer.recall_flag:
+                    pc = arg
+            elif op == POP_JUMP_IF_TRUE:
+                if pop():
+                    pc = arg
+            elif op == POP:
+                pop()
+            elif op == MATCH:
+                value = pop()
+                subject = stack[-1]
+                push(value == subject or ((value == 0 or value == 0.0) and isinstance(subject, UnresolvedNumber)))
+            elif op == RECALL_CHECK:
+                if analyzer.recall_flag and analyzer.in_func_flag:
+                    pc = arg
+            elif op == RESUME_BREAK:
+                if analyzer.resume_flag:
+                    analyzer.resume_flag = False
+                    pc = arg
+            elif op == TEST_LOOP:
+                if not isinstance(stack[-1], bool):
+                    node = consts[arg]
+                    raise SemanticError(f"LoopConditionError: Loop condition does not evaluate to a flag value.", node.pos_start, node.pos_end)
+            elif op == FOR_INIT:
+                push(self.for_init(consts[arg]))
+            elif op == FOR_RESTORE:
+                val_name, value = pop()
+                st.define_var(val_name, value["value"], value["type"], value["immo"])
+            elif op == ENTER_IF_TRUE:
+                if pop():
+                    st.enter_scope()
+                    push(True)
+                else:
+                    push(False)
+            elif op == EXIT_IF_RAN:
+                if pop():
+                    st.exit_scope(True)
+            elif op == GRIND_CHECK:
+                if analyzer.recall_flag and analyzer.in_func_flag:
+                    pc = arg
+                elif analyzer.checkpoint_flag:
+                    analyzer.checkpoint_flag = False
+                    pc = arg
+                elif analyzer.resume_flag:
+                    analyzer.resume_flag = False
+            elif op == BREAK_IF_NOT_RUNTIME:
+                if not analyzer.isRuntime:
+                    pc = arg
+            elif op == CHECKPOINT:
+                analyzer.checkpoint_flag = True
+            elif op == RESUME:
+                analyzer.resume_flag = True
+            elif op == JOIN:
+                analyzer.visit_JoinStmt(consts[arg])
+            elif op == DROP:
+                analyzer.visit_DropStmt(consts[arg])
+            elif op == SEEK:
+                analyzer.visit_SeekStmt(consts[arg])
+            elif op == ENTER_PLAY:
+                st.restore_scope(len(st.scope_stack))
+            elif op == EXIT_PLAY:
+                st.play_scope = st.scope_stack.copy()
+                st.exit_scope(True)
+            elif op == RAISE:
+                raise SemanticError(*consts[arg])
+            elif op == HALT:
+                VM.ops_executed += executed
+                return
+            else:
+                raise SemanticError(f"Unknown opcode: {op}")
+
+    def for_init(self, node):
+        # loop control initialization of visit_ForStmt; returns the old record
+        # of the control variable so FOR_RESTORE can put it back
+        analyzer = self.analyzer
+        st = analyzer.symbol_table
+        val_name = node.initialization.left.symbol
+        value = st.lookup(val_name, node.initialization.left.pos_start, node.initialization.left.pos_end)
+
+        if not isinstance(value, dict):
+            datatype = analyzer.TYPE_MAP.get(type(value), str(type(value)))
+            st.define_var(val_name, value, datatype, False)
+            value = st.lookup(node.left.symbol, node.left.pos_start, node.left.pos_end)
+
+        if "value" not in value:
+            raise SemanticError(f"ValueError: Mismatched types — trying to assign a single value from to a list object, '{val_name}'",
+                                node.initialization.pos_start, node.initialization.pos_end)
+
+        value_type = value["type"]
+        if value["immo"]==True:
+            raise SemanticError(f"TypeError: '{val_name}' is declared as an immutable variable.", node.initialization.pos_start, node.initialization.pos_end)
+
+        if node.initialization.right.kind == 'FuncCallStmt':
+            new_val = eval_func(node.initialization.right.name.symbol, node.initialization.right, st)
+        elif node.initialization.right.kind in {'Load', 'LoadNum'}:
+            raise SemanticError(f"LoopControlError: Cannot use load and loadNum in loop control initialization.", node.initialization.right.pos_start, node.initialization.right.pos_end)
+        else:
+            new_val = evaluate(node.initialization.right, st)
+
+        if value_type != "hp" or not isinstance(new_val, int):
+            raise SemanticError(f"LoopControlError: Only hp variables can be used for loop control.", node.initialization.pos_start, node.initialization.pos_end)
+        st.define_var(val_name, new_val, value_type, value["immo"])
+        return val_name, value
@@ -0,0 +1,202 @@
+import os, sys, zlib
+
+# Offline generator for ludus/ll1_table.py:  python -m ludus.tablegen
+# Computing the FIRST/FOLLOW/predict sets from ludus/cfg.py takes longer
+# than the rest of the front end's import, so the LL(1) table is generated
+# once and committed. Terminals are numbered first and non-terminals after
+# them, productions are tuples of those ids (reversed, in the order the
+# parser pushes them) and each non-terminal has a row of production ids per
+# terminal. The module records the hash of the grammar it was built from;
+# ludus/parser.py rebuilds the tables in memory if cfg no longer matches.
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ll1_table.py")
+VALIDATOR_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ll1_validator.py")
+
+def grammar_hash(cfg):
+    return f"{zlib.crc32(repr(cfg).encode('utf-8')):08x}"
+
+def build_tables(cfg, start_symbol="<program>"):
+    from .cfg import compute_first_set, compute_follow_set, compute_predict_set
+
+    first_set = compute_first_set(cfg)
+    follow_set = compute_follow_set(cfg, start_symbol, first_set)
+    predict_set = compute_predict_set(cfg, first_set, follow_set)
+
+    terminals = sorted({symbol for productions in cfg.values() for production in productions
+                        for symbol in production if symbol not in cfg and symbol != "λ"} | {"$"})
+    symbols = terminals + list(cfg)
+    ids = {symbol: number for number, symbol in enumerate(symbols)}
+
+    productions = []
+    table = []
+    for non_terminal, alternatives in cfg.items():
+        row = [-1] * len(terminals)
+        for production in alternatives:
+            if production != ["λ"]:
+                productions.append(tuple(ids[symbol] for symbol in reversed(production)))
+            else:
+                productions.append(())
+            for terminal in predict_set[(non_terminal, tuple(production))]:
+                row[ids[terminal]] = len(productions) - 1
+        table.append(tuple(row))
+
+    return {
+        "CFG_HASH": grammar_hash(cfg),
+        "SYMBOLS": tuple(symbols),
+        "TERMINAL_COUNT": len(terminals),
+        "START": ids[start_symbol],
+        "PRODUCTIONS": tuple(productions),
+        "TABLE": tuple(table),
+        # FIRST sets by non-terminal, by name, for syntax error messages
+        "FIRST": tuple(tuple(sorted(first_set[non_terminal])) for non_terminal in cfg),
+    }
+
+def write_module(tables, path=OUTPUT):
+    lines = [
+        "# Generated by `python -m ludus.tablegen` from ludus/cfg.py, do not edit.",
+        "",
+        f"CFG_HASH = {tables['CFG_HASH']!r}",
+        f"TERMINAL_COUNT = {tables['TERMINAL_COUNT']}",
+        f"START = {tables['START']}",
+        "",
+        "SYMBOLS = (",
+        *(f"    {symbol!r}," for symbol in tables["SYMBOLS"]),
+        ")",
+        "",
+        "PRODUCTIONS = (",
+        *(f"    {production!r}," for production in tables["PRODUCTIONS"]),
+        ")",
+        "",
+        "TABLE = (",
+        *(f"    {row!r}," for row in tables["TABLE"]),
+        ")",
+        "",
+        "FIRST = (",
+        *(f"    {first!r}," for first in tables["FIRST"]),
+        ")",
+    ]
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+
+# The same tables compiled to a recursive-descent validator, one nested
+# function per non-terminal with a branch per production. validate(toks)
+# takes the terminal ids of the tokens with spaces and newlines left out.
+# What the table-driven parser keeps on its stack below a non-terminal is
+# passed down as cont, a linked list (symbols after the call, parent cont)
+# that is only walked when building an error message. A function whose
+# productions end in a non-terminal returns that non-terminal's function
+# instead of calling it, and the caller runs it with the same cont, so long
+# statement lists and operator chains don't nest Python frames.
+
+def function_name(symbol):
+    return "p_" + "".join(char if char.isalnum() else "_" for char in symbol.strip("<>"))
+
+def validator_source(tables):
+    symbols = tables["SYMBOLS"]
+    terminal_count = tables["TERMINAL_COUNT"]
+    productions = tables["PRODUCTIONS"]
+    non_terminals = symbols[terminal_count:]
+    names = [function_name(symbol) for symbol in non_terminals]
+    # non-terminals that have a production ending in a non-terminal
+    tail_calls = set()
+    for number, row in enumerate(tables["TABLE"]):
+        if any(productions[production] and productions[production][0] >= terminal_count for production in row if production >= 0):
+            tail_calls.add(number)
+
+    def call(symbol, cont, indent):
+        name = names[symbol - terminal_count]
+        if symbol - terminal_count not in tail_calls:
+            return [f"{indent}{name}({cont})"]
+        return [f"{indent}below = {cont}",
+                f"{indent}tail = {name}(below)",
+                f"{indent}while tail is not None:",
+                f"{indent}    tail = tail(below)"]
+
+    def condition(terminals):
+        if len(terminals) == 1:
+            return f"t == {terminals[0]}"
+        return f"t in {{{', '.join(map(str, terminals))}}}"
+
+    lines = [
+        "# Generated by `python -m ludus.tablegen` from ludus/cfg.py, do not edit.",
+        "",
+        f"CFG_HASH = {tables['CFG_HASH']!r}",
+        "",
+        "class Failure(Exception):",
+        "    pass",
+        "",
+        "def validate(toks):",
+        "    # returns (pos, None, None) with pos just past <program>, or for a",
+        "    # syntax error at toks[pos] (pos, terminal, None) when that terminal",
+        "    # was expected and (pos, non_terminal, cont) when FIRST(non_terminal)",
+        "    # and the cont under it were",
+        "    pos = 0",
+        "    save_pos = -1     # pos of the first λ expansion since the last match",
+        "    save = None       # (non_terminal, cont) of that expansion",
+    ]
+    for number, row in enumerate(tables["TABLE"]):
+        symbol = number + terminal_count
+        alternatives = {}
+        for terminal, production in enumerate(row):
+            if production >= 0:
+                alternatives.setdefault(production, []).append(terminal)
+        # λ goes last, it is the only production that doesn't move on
+        order = sorted(alternatives, key=lambda production: (not productions[production], production))
+        assigned = {"pos"} if any(symbol < terminal_count for production in order for symbol in productions[production]) else set()
+        if any(not productions[production] for production in order):
+            assigned |= {"save_pos", "save"}
+        lines += ["", f"    def {names[number]}(cont):"]
+        if assigned:
+            lines.append(f"        nonlocal {', '.join(sorted(assigned))}")
+        lines.append("        t = toks[pos]")
+        keyword = "if"
+        for production in order:
+            body = productions[production][::-1]
+            lines.append(f"        {keyword} {condition(alternatives[production])}:")
+            lines.append(f"            # {symbols[symbol]} -> {' '.join(symbols[item] for item in body) or 'λ'}")
+            keyword = "elif"
+            if not body:
+                lines += ["            if save_pos != pos:",
+                          "                save_pos = pos",
+                          f"                save = ({symbol}, cont)"]
+                continue
+            for position, item in enumerate(body):
+                if item < terminal_count:
+                    if position:
+                        lines += [f"            if toks[pos] != {item}:",
+                                  f"                raise Failure(pos, {item})"]
+                    lines.append("            pos += 1")
+                elif position == len(body) - 1:
+                    lines.append(f"            return {names[item - terminal_count]}")
+                else:
+                    lines += call(item, f"({body[position + 1:]!r}, cont)", "            ")
+        lines += ["        else:",
+                  f"            raise Failure(pos, {symbol}, cont)"]
+    lines += [
+        "",
+        "    try:",
+        *call(tables["START"], "None", "        "),
+        "    except Failure as failure:",
+        "        if len(failure.args) == 3:",
+        "            return failure.args",
+        "        if save_pos == failure.args[0]:",
+        "            # the terminal came after a λ expansion, whatever that",
+        "            # non-terminal could have started with was expected too",
+        "            return (save_pos,) + save",
+        "        return failure.args + (None,)",
+        "    return pos, None, None",
+    ]
+    return "\n".join(lines) + "\n"
+
+def main():
+    from .cfg import cfg
+
+    tables = build_tables(cfg)
+    write_module(tables)
+    sys.stdout.write(f"wrote {OUTPUT} ({len(tables['SYMBOLS'])} symbols, {len(tables['PRODUCTIONS'])} productions)\n")
+    with open(VALIDATOR_OUTPUT, "w", encoding="utf-8") as file:
+        file.write(validator_source(tables))
+    sys.stdout.write(f"wrote {VALIDATOR_OUTPUT}\n")
+
+if __name__ == "__main__":
+    main()
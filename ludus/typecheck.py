@@ -0,0 +1,1303 @@
+from .nodes import *
+from .error import SemanticError
+
+# Static type checker behind check(..., isRuntime=False). The older semantic
+# pass (runtime.traverser.SemanticAnalyzer without isRuntime) is a dry run:
+# it executes the program with loadNum standing in as 0, so it iterates
+# loops, takes one branch of each if and calls functions for real. This one
+# visits every statement once instead, over types rather than values:
+#
+#   "hp", "xp", "comms", "flag", "dead"   what a value evaluates to
+#   NUMERIC                               loadNum, hp or xp once input is in
+#   None                                  not known statically (parameters
+#                                         that are never passed anything)
+#
+# An identifier naming an array or struct instance evaluates to its symbol
+# entry and a function call to the list of its recall types, as the
+# evaluator returns the element dict and the recall values. Function bodies
+# are checked once per distinct tuple of argument types, and once with
+# unknown parameters if they are never called. Errors use the messages of
+# the executing analyzer; checks that need actual values (division by zero,
+# negative indexes, comms conversions) only fire on constants, so input
+# standing in as 0 no longer reports a division by zero.
+
+NUMERIC = "hp or xp"
+EMPTY_ARRAY = "[]"      # recall []
+LOADS = {'Load', 'LoadNum'}
+COMPOUND = {'+=', '-=', '*=', '/=', '%='}
+RELATIONAL = {'<', '>', '<=', '>=', '==', '!='}
+LOGICAL = {'AND', 'OR', '&&', '||'}
+INTEGRAL = {"hp", "flag"}       # bool is an int to the evaluator
+LITERALS = {'HpLiteral': "hp", 'XpLiteral': "xp", 'CommsLiteral': "comms", 'FlagLiteral': "flag"}
+NOT_CONSTANT = object()
+MAX_SIGNATURES = 16     # per function, past that calls share the unknown one
+SCALARS = {"hp", "xp", "comms", "flag"}
+
+def is_object(value):
+    return isinstance(value, dict)
+
+def type_name(value):
+    # the evaluator's TYPE_MAP name of a value
+    if is_object(value):
+        return "array"
+    return value
+
+class TypeChecker:
+    def __init__(self, annotate=False):
+        self.annotate = annotate    # tag BinaryExprs with their operand types
+        self.scopes = [{}]
+        self.structs = {}       # struct name -> {field: datatype}
+        self.functions = {}     # function name -> GlobalFuncBody
+        self.signatures = {}    # (function, argument types) -> recall types, None while checking
+        self.counts = {}        # function -> signatures checked
+        self.recalls = None     # recall types of the function being checked
+        self.assigned = {}      # id(loop) -> names assigned in it
+        self.function_assigned = set()
+
+    def check(self, program: Program):
+        for stmt in program.body:
+            if stmt.kind == 'StructDec':
+                self.visit_StructDec(stmt)
+            elif stmt.kind == 'GlobalFuncBody':
+                self.functions[stmt.name.symbol] = stmt
+                self.function_assigned |= self.assigned_names(stmt.body)
+        for stmt in program.body:
+            self.visit(stmt)
+        for name, func in self.functions.items():
+            if not self.counts.get(name):
+                self.function_recalls(func, tuple((None, None) for _ in func.params or []))
+
+    def visit(self, node):
+        visitor = self.DISPATCH.get(node.kind)
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(self, node)
+
+    def generic_visit(self, node):
+        for value in node.field_values():
+            if isinstance(value, Stmt):
+                self.visit(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, Stmt):
+                        self.visit(item)
+
+    def body(self, stmts):
+        self.scopes.append({})
+        for stmt in stmts:
+            self.visit(stmt)
+        self.scopes.pop()
+
+    ###### SYMBOLS #########
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def define(self, name, entry):
+        # like SymbolTable.define_var, an existing name is rebound where it lives
+        for scope in reversed(self.scopes):
+            if name in scope:
+                scope[name] = entry
+                return
+        self.scopes[-1][name] = entry
+
+    def tracked(self, name):
+        # whether a global can be dead or have a known length, not if any
+        # function assigns or resizes it
+        return len(self.scopes) > 1 or name not in self.function_assigned
+
+    def assigned_names(self, stmts):
+        names = set()
+        def walk(node):
+            if isinstance(node, list):
+                for item in node:
+                    walk(item)
+                return
+            if not isinstance(node, Stmt):
+                return
+            if node.kind == 'VarAssignmentStmt':
+                names.add(node.left.symbol)
+            elif node.kind in ('VarDec', 'ArrayDec', 'ArrayRedec'):
+                names.add(node.name.symbol)
+            elif node.kind in ('JoinStmt', 'DropStmt'):
+                names.add(node.arr_name.symbol)
+            for value in node.field_values():
+                walk(value)
+        walk(stmts)
+        return names
+
+    def enter_loop(self, node, stmts):
+        # whatever the loop assigns is alive from the second iteration on,
+        # and whatever it resizes has no known length
+        names = self.assigned.get(id(node))
+        if names is None:
+            names = self.assigned[id(node)] = self.assigned_names(stmts)
+        for name in names:
+            entry = self.lookup(name)
+            if entry is not None:
+                if entry.get("dead"):
+                    entry["dead"] = False
+                entry.pop("length", None)
+
+    ###### CONSTANTS #########
+    def constant(self, node):
+        kind = node.kind
+        if kind in LITERALS:
+            return node.value
+        if kind == 'Identifier':
+            entry = self.lookup(node.symbol)
+            if entry is not None and "constant" in entry:
+                return entry["constant"]
+        elif kind == 'UnaryExpr' and node.operator == '-':
+            value = self.constant(node.operand)
+            if isinstance(value, (int, float)):
+                return -value
+        elif kind == 'BinaryExpr' and node.operator in ('+', '-', '*'):
+            lhs = self.constant(node.left)
+            rhs = self.constant(node.right)
+            if isinstance(lhs, (int, float)) and isinstance(rhs, (int, float)):
+                if node.operator == '+':
+                    return lhs + rhs
+                if node.operator == '-':
+                    return lhs - rhs
+                return lhs * rhs
+        return NOT_CONSTANT
+
+    def outside(self, value, length):
+        # a constant index known to be out of bounds
+        return value is not NOT_CONSTANT and (value < 0 or length is not None and value >= length)
+
+    def is_zero(self, node):
+        value = self.constant(node)
+        return value is not NOT_CONSTANT and not isinstance(value, str) and value == 0
+
+    ###### EXPRESSIONS #########
+    def expr(self, node):
+        kind = node.kind
+        if kind in LITERALS:
+            return LITERALS[kind]
+        if kind == 'DeadLiteral':
+            return "dead"
+        if kind == 'Identifier':
+            entry = self.lookup(node.symbol)
+            if entry is None or entry.get("unknown"):
+                return None
+            if "dimensions" in entry or "fields" in entry:
+                return entry
+            if entry.get("dead"):
+                return "dead"
+            return entry.get("type")
+        if kind == 'BinaryExpr':
+            return self.binary(node)
+        if kind == 'ChainRelatExpr':
+            for expr in node.expressions:
+                self.binary(expr)
+            return "flag"
+        if kind == 'UnaryExpr':
+            return self.unary(node)
+        if kind == 'FuncCallStmt':
+            return self.call_value(node)
+        if kind == 'Load':
+            if node.prompt_msg is not None:
+                self.expr(node.prompt_msg)
+            return "comms"
+        if kind == 'LoadNum':
+            if node.prompt_msg is not None:
+                self.expr(node.prompt_msg)
+            return NUMERIC
+        if kind == 'StructInstField':
+            return self.struct_field(node)
+        if kind == 'ArrayElement':
+            return self.array_element(node)
+        if kind == 'StringIndexArr':
+            return self.string_index(node)
+        if kind == 'XpFormatting':
+            return self.xp_formatting(node)
+        if kind == 'FormCommsLiteral':
+            return self.formatted_comms(node)
+        if kind == 'DropStmt':
+            return self.visit_DropStmt(node, True)
+        if kind == 'SeekStmt':
+            return self.visit_SeekStmt(node)
+        if kind == 'RoundStmt':
+            return self.visit_RoundStmt(node)
+        if kind == 'LevelStmt':
+            return self.visit_LevelStmt(node)
+        if kind == 'ToNumStmt':
+            return self.visit_ToNumStmt(node)
+        if kind == 'ToCommsStmt':
+            return self.visit_ToCommsStmt(node)
+        return None
+
+    def value(self, node):
+        # an operand read through eval_func: a call has to recall exactly
+        # one value that isn't an array
+        if node.kind != 'FuncCallStmt':
+            return self.expr(node)
+        recalls = self.call_value(node)
+        if recalls is None:
+            return None
+        name = node.name.symbol
+        if len(recalls) > 1:
+            raise SemanticError(f"ValueError: Function '{name}' recalls more than one value, but only one was expected.", node.pos_start, node.pos_end)
+        if not recalls:
+            return None
+        if recalls[0] == EMPTY_ARRAY:
+            raise SemanticError(f"ValueError: Function '{name}' is recalling an array.", node.pos_start, node.pos_end)
+        return recalls[0]
+
+    def single_recall(self, node, many_message, array_message):
+        # the one value a call on the right of a declaration or assignment recalls
+        recalls = self.call_value(node)
+        if recalls is None:
+            return None
+        if len(recalls) > 1:
+            raise SemanticError(many_message, node.pos_start, node.pos_end)
+        if not recalls:
+            return None
+        if recalls[0] == EMPTY_ARRAY:
+            raise SemanticError(array_message, node.pos_start, node.pos_end)
+        return recalls[0]
+
+    def binary(self, node):
+        if node.left.kind in LOADS or node.right.kind in LOADS:
+            raise SemanticError("OperandError: Cannot use load or loadNum function in a binary expression.", node.pos_start, node.pos_end)
+        lhs = self.operand(node, self.expr(node.left))
+        rhs = self.operand(node, self.expr(node.right))
+        operator = node.operator
+        if self.annotate:
+            self.tag(node, lhs, rhs)
+
+        if lhs is None or rhs is None:
+            return "flag" if operator in RELATIONAL or operator in LOGICAL else None
+
+        if lhs == NUMERIC or rhs == NUMERIC:
+            other = rhs if lhs == NUMERIC else lhs
+            if other == "comms" or other == "dead" or is_object(other):
+                raise SemanticError("TypeError: Cannot mix comms and numeric types in an expression.", node.pos_start, node.pos_end)
+            if operator in LOGICAL:
+                raise SemanticError("TypeError: Only flag values can be used as operands on logical expressions.", node.pos_start, node.pos_end)
+            if operator in RELATIONAL:
+                return "flag"
+            if operator == '/':
+                if rhs != NUMERIC and self.is_zero(node.right):
+                    raise SemanticError("ZeroDivisionError: Division by zero is not allowed", node.pos_start, node.pos_end)
+                return "xp"
+            if operator == '%':
+                if other == "xp":
+                    raise SemanticError("ModuloError: Only hp values can be used in modulo operation.", node.pos_start, node.pos_end)
+                if rhs != NUMERIC and self.is_zero(node.right):
+                    raise SemanticError("ZeroDivisionError: Modulo by zero is not allowed.", node.pos_start, node.pos_end)
+                return NUMERIC
+            return "xp" if other == "xp" else NUMERIC
+
+        if is_object(lhs) or is_object(rhs):
+            raise SemanticError("TypeError: Trying to use a list object in an expression.", node.pos_start, node.pos_end)
+
+        if operator in LOGICAL:
+            if lhs == "flag" and rhs == "flag":
+                return "flag"
+            raise SemanticError("TypeError: Only flag values can be used as operands on logical expressions.", node.pos_start, node.pos_end)
+
+        if {lhs, rhs} == {"comms", "flag"}:
+            raise SemanticError("TypeError: Cannot mix comms and flags in an expression.")
+        if (lhs == "comms") != (rhs == "comms"):
+            raise SemanticError("TypeError: Cannot mix comms and numeric types in an expression.", node.pos_start, node.pos_end)
+
+        if operator in RELATIONAL:
+            if lhs == "comms":
+                if operator not in ('==', '!='):
+                    raise SemanticError("TypeError: Only valid relational operator between comms is '==' and '!='.", node.pos_start, node.pos_end)
+            elif (lhs == "dead" or rhs == "dead") and operator not in ('==', '!='):
+                raise SemanticError(f"TypeError: 'dead' types cannot be used as an operand in '{operator}' operation.", node.pos_start, node.pos_end)
+            return "flag"
+
+        if lhs == "dead" or rhs == "dead":
+            raise SemanticError("TypeError: 'dead' types cannot be used as an operand.", node.pos_start, node.pos_end)
+
+        if lhs == "comms":
+            if operator != '+':
+                raise SemanticError("TypeError: Only valid operator between comms is '+'.", node.pos_start, node.pos_end)
+            return "comms"
+
+        return self.arithmetic(node, lhs, rhs, operator)
+
+    def tag(self, node, lhs, rhs):
+        # a function body is checked once per signature, its nodes keep
+        # their types only if every signature agrees
+        scalar = isinstance(lhs, str) and isinstance(rhs, str) and lhs in SCALARS and rhs in SCALARS
+        types = (lhs, rhs) if scalar else ()
+        if node.operands is None:
+            node.operands = types
+        elif node.operands != types:
+            node.operands = ()
+
+    def arithmetic(self, node, lhs, rhs, operator):
+        integral = lhs in INTEGRAL and rhs in INTEGRAL
+        if operator == '/':
+            if self.is_zero(node.right):
+                raise SemanticError("ZeroDivisionError: Division by zero is not allowed", node.pos_start, node.pos_end)
+            return "xp"
+        if operator == '%':
+            if not integral:
+                raise SemanticError("ModuloError: Only hp values can be used in modulo operation.", node.pos_start, node.pos_end)
+            if self.is_zero(node.right):
+                raise SemanticError("ZeroDivisionError: Modulo by zero is not allowed.", node.pos_start, node.pos_end)
+            return "hp"
+        if operator == '^' and integral:
+            # int ** int is an int unless the exponent is negative
+            exponent = self.constant(node.right)
+            if exponent is NOT_CONSTANT:
+                return NUMERIC
+            return "hp" if exponent >= 0 else "xp"
+        return "hp" if integral else "xp"
+
+    def operand(self, node, value):
+        # a call's recall list is unpacked when it holds one value
+        if isinstance(value, list):
+            if len(value) > 1:
+                raise SemanticError("TypeError: Cannot use list in an expression.", node.pos_start, node.pos_end)
+            value = value[0] if value else None
+            if value == EMPTY_ARRAY:
+                raise SemanticError("TypeError: Trying to use a list object in an expression.", node.pos_start, node.pos_end)
+        return value
+
+    def unary(self, node):
+        if node.operand.kind in LOADS:
+            raise SemanticError(f"InvalidOperand: loadNum and load function cannot be used as unary operand.", node.operand.pos_start, node.operand.pos_end)
+        value = self.value(node.operand)
+        if value is None:
+            return None
+        if node.operator == '-':
+            if value in (NUMERIC, "hp", "xp"):
+                return value
+            if value == "flag":
+                return "hp"
+            raise SemanticError(f"TypeError: Cannot apply '-' to non-numeric type: {type_name(value)}", node.operand.pos_start, node.operand.pos_end)
+        if node.operator == '!':
+            if value != "flag":
+                raise SemanticError(f"TypeError: Cannot apply '!' to non-flag type: {type_name(value)}", node.operand.pos_start, node.operand.pos_end)
+            return "flag"
+        return None
+
+    def index(self, idx, message):
+        # an index expression has to be an hp value, negative constants are out of bounds
+        if idx.kind in LOADS:
+            raise SemanticError(f"IndexError: loadNum and load function cannot be used as index expression.", idx.pos_start, idx.pos_end)
+        value = self.value(idx)
+        if value is None or value == NUMERIC:
+            return NOT_CONSTANT
+        if value not in INTEGRAL:
+            raise SemanticError(message, idx.pos_start, idx.pos_end)
+        return self.constant(idx)
+
+    def array_element(self, node):
+        arr_name = node.left.symbol
+        arr = self.lookup(arr_name)
+        if arr is not None and not arr.get("unknown") and "dimensions" not in arr:
+            raise SemanticError(f"TypeError: '{arr_name}' is not an array.", node.left.pos_start, node.left.pos_end)
+        if arr is not None and "dimensions" in arr and len(node.index) != len(arr["dimensions"]):
+            raise SemanticError(f"ArrayIndexError: Incorrect number of dimensions for {arr_name}.", node.pos_start, node.pos_end)
+        for i, idx in enumerate(node.index):
+            position = f"dimension {i}" if i < len(node.index) - 1 else "final dimension"
+            value = self.index(idx, "IndexError: Array index must always evaluate to a positive hp value.")
+            length = arr.get("length") if arr is not None and i == len(node.index) - 1 else None
+            if self.outside(value, length):
+                raise SemanticError(f"ArrayIndexError: Index {value} out of bounds for {position} of array '{arr_name}'.", idx.pos_start, idx.pos_end)
+        if arr is None or arr.get("unknown"):
+            return None
+        return arr["type"]
+
+    def string_index(self, node):
+        name = node.left.symbol
+        entry = self.lookup(name)
+        if entry is not None and "dimensions" in entry:
+            return self.array_element(node)
+        if entry is not None and not entry.get("unknown"):
+            if "type" not in entry or "fields" in entry:
+                raise SemanticError(f"TypeError: '{name}' is not a variable.", node.left.pos_start, node.left.pos_end)
+            if entry["type"] not in ("comms", None):
+                raise SemanticError(f"TypeError: '{name}' is not a comms variable.", node.left.pos_start, node.left.pos_end)
+        for idx in node.index[:-1]:
+            self.index(idx, "IndexError: Variable index must always evaluate to a positive hp value.")
+        final_idx = node.index[-1]
+        value = self.index(final_idx, "IndexError: Index must always evaluate to a positive hp value.")
+        if self.outside(value, entry.get("length") if entry is not None else None):
+            raise SemanticError(f"IndexError: Index {value} out of bounds for final dimension of variable '{name}'.", final_idx.pos_start, final_idx.pos_end)
+        return "comms"
+
+    def struct_field(self, node):
+        name = node.instance.symbol
+        entry = self.lookup(name)
+        if entry is None or entry.get("unknown"):
+            return None
+        if "fields" not in entry:
+            raise SemanticError(f"TypeError: '{name}' is not a struct instance.", node.instance.pos_start, node.instance.pos_end)
+        if node.field.symbol not in entry["fields"]:
+            raise SemanticError(f"NameError: Field '{node.field.symbol}' is not defined in struct instance '{name}'.",
+                                node.field.pos_start, node.field.pos_end)
+        return entry["fields"][node.field.symbol]
+
+    def xp_formatting(self, node):
+        if node.lhs.kind in LOADS:
+            raise SemanticError(f"FormatError: 'load' and 'loadNum' function are not allowed in xp formatting.", node.pos_start, node.pos_end)
+        value = self.value(node.lhs)
+        if value == "dead":
+            raise SemanticError("FormatError: Cannot use xp formatting on a dead value.", node.pos_start, node.pos_end)
+        if value not in (None, NUMERIC, "xp"):
+            raise SemanticError("FormatError: Using xp formatting on a non-xp value.", node.pos_start, node.pos_end)
+        return "comms"
+
+    def formatted_comms(self, node):
+        for expr in node.expressions:
+            if expr.kind in LOADS:
+                raise SemanticError(f"FormatError: 'load' and 'loadNum' function are not allowed as placeholders.", expr.pos_start, expr.pos_end)
+            if is_object(self.value(expr)):
+                raise SemanticError("TypeError: Cannot format a list object within a comms literal.", expr.pos_start, expr.pos_end)
+        return "comms"
+
+    ###### FUNCS #########
+    def call_value(self, node):
+        # a call whose recall values are used
+        func = self.functions.get(node.name.symbol)
+        if func is not None:
+            recall = func.recall_stmts
+            if recall == [] or all(rec.expressions == ["void"] for rec in recall):
+                raise SemanticError(f"RecallError: Function '{node.name.symbol}' does not return a value.", node.pos_start, node.pos_end)
+        return self.call(node, True)
+
+    def call(self, node, being_assigned):
+        args = []
+        for arg in node.args or []:
+            if arg.kind in LOADS:
+                raise SemanticError("UnsupportedArgumentError: Cannot use load and loadNum function as a function argument.", arg.pos_start, arg.pos_end)
+            args.append(self.value(arg))
+            if is_object(args[-1]):
+                # arrays are passed by reference, the callee may resize them
+                args[-1].pop("length", None)
+
+        name = node.name.symbol
+        func = self.functions.get(name)
+        if func is None:
+            return None
+        params = func.params or []
+        if node.args and not params:
+            raise SemanticError(f"TypeError: Function '{name}' does not take any arguments, but {len(node.args)} were provided.", node.arg_pos_start, node.arg_pos_end)
+        if len(args) > len(params):
+            raise SemanticError(f"TypeError: Function '{name}' expects {len(params)} arguments, got {len(args)}.", node.arg_pos_start, node.arg_pos_end)
+        bound = []
+        for i, param in enumerate(params):
+            if i < len(args):
+                bound.append(args[i])
+            elif param.param_val is not None:
+                bound.append(self.expr(param.param_val))
+            else:
+                raise SemanticError(f"TypeError: Missing argument for parameter '{param.param}' and no default value provided.", node.pos_start, node.pos_end)
+
+        signature = tuple((self.describe(value), value) for value in bound)
+        recalls = self.function_recalls(func, signature)
+
+        if not being_assigned and func.recall_stmts and all(rec.expressions != ["void"] for rec in func.recall_stmts):
+            raise SemanticError(f"RecallError: Function '{name}' has a recall value but is not being assigned anywhere.", node.pos_start, node.pos_end)
+        return recalls
+
+    def describe(self, value):
+        # hashable form of an argument's type
+        if not is_object(value):
+            return value
+        if "dimensions" in value:
+            return ("array", len(value["dimensions"]), value["type"], value["immo"], value.get("dead", False))
+        return ("struct", value["parent"], value["immo"])
+
+    def function_recalls(self, func, signature):
+        name = func.name.symbol
+        key = (name, tuple(kind for kind, _ in signature))
+        if key not in self.signatures and self.counts.get(name, 0) >= MAX_SIGNATURES:
+            signature = tuple((None, None) for _ in signature)
+            key = (name, tuple(kind for kind, _ in signature))
+        if key in self.signatures:
+            # None while the body is being checked, a recursive call's
+            # recall types aren't known yet
+            return self.signatures[key]
+        self.signatures[key] = None
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+        param_scope = {}
+        for param, (kind, value) in zip(func.params or [], signature):
+            if is_object(value):
+                param_scope[param.param] = value
+            elif kind is None:
+                param_scope[param.param] = {"unknown": True}
+            else:
+                param_scope[param.param] = {"type": value, "immo": False, "dead": value == "dead"}
+
+        scopes, recalls = self.scopes, self.recalls
+        self.scopes = [scopes[0], param_scope]
+        self.recalls = []
+        try:
+            for stmt in func.body:
+                self.visit(stmt)
+            result = self.merge_recalls(self.recalls)
+        finally:
+            self.scopes, self.recalls = scopes, recalls
+        self.signatures[key] = result
+        return result
+
+    def merge_recalls(self, recalls):
+        if not recalls or any(recall is None for recall in recalls):
+            return None
+        first = recalls[0]
+        if any(len(recall) != len(first) for recall in recalls):
+            return None
+        merged = []
+        for values in zip(*recalls):
+            # a recursive call recalls None, whatever else is recalled decides
+            known = [value for value in values if value is not None]
+            kinds = {self.describe(value) for value in known}
+            merged.append(known[0] if len(kinds) == 1 else None)
+        return merged
+
+    def visit_FuncCallStmt(self, node):
+        self.call(node, False)
+
+    def visit_RecallStmt(self, node):
+        values = []
+        if len(node.expressions) == 1 and node.expressions[0] == "void":
+            values = None
+        else:
+            for expr in node.expressions:
+                if expr == []:
+                    values.append(EMPTY_ARRAY)
+                    break
+                if expr.kind in LOADS:
+                    raise SemanticError(f"ValueError: Using load and loadNum in recall is not allowed.", expr.pos_start, expr.pos_end)
+                values.append(self.value(expr))
+        if self.recalls is not None:
+            self.recalls.append(values)
+
+    def visit_GlobalFuncDec(self, node):
+        pass
+
+    def visit_GlobalFuncBody(self, node):
+        pass
+
+    def visit_GlobalStructDec(self, node):
+        pass
+
+    def visit_PlayFunc(self, node):
+        self.visit(node.body)
+
+    def visit_BlockStmt(self, node):
+        self.body(node.statements)
+
+    ###### VARIABLES #########
+    def visit_VarDec(self, node):
+        name = node.name.symbol
+        if node.value.kind == 'FuncCallStmt':
+            value = self.single_recall(node.value,
+                                       f"ValueError: Function '{node.value.name.symbol}' recalls more than one value, but only one was expected.",
+                                       f"ValueError: Trying to declare an array to a variable: '{name}'.")
+        else:
+            value = self.expr(node.value)
+        if is_object(value):
+            if "dimensions" in value:
+                raise SemanticError(f"ValueError: Trying to declare an array to a variable: '{name}'.", node.value.pos_start, node.value.pos_end)
+            raise SemanticError(f"ValueError: Trying to declare a struct instance to a variable: '{name}'.", node.value.pos_start, node.value.pos_end)
+        entry = {"immo": node.immo}
+        if node.value.kind == 'DeadLiteral':
+            entry["type"] = node.value.datatype
+            entry["dead"] = self.tracked(name)
+        else:
+            entry["type"] = value
+        constant = self.constant(node.value)
+        if node.immo and constant is not NOT_CONSTANT:
+            entry["constant"] = constant
+        if isinstance(constant, str) and self.tracked(name):
+            entry["length"] = len(constant)
+        self.define(name, entry)
+
+    def visit_VarAssignmentStmt(self, node):
+        name = node.left.symbol
+        if node.right.kind == 'FuncCallStmt':
+            new_val = self.single_recall(node.right,
+                                         f"ValueError: Function '{node.right.name.symbol}' recalls more than one value, but only one was expected.",
+                                         f"ValueError: Trying to assign an array to a variable: '{name}'.")
+        elif node.right.kind in LOADS and node.operator != ':':
+            raise SemanticError(f"ValueError: loadNum and load function cannot be used in compound assignment statements.", node.right.pos_start, node.right.pos_end)
+        else:
+            new_val = self.expr(node.right)
+
+        if is_object(new_val):
+            if "dimensions" in new_val:
+                raise SemanticError(f"ValueError: Trying to assign an array to a variable: '{name}'.", node.right.pos_start, node.right.pos_end)
+            raise SemanticError(f"ValueError: Trying to assign a struct instance to a variable: '{name}'.", node.right.pos_start, node.right.pos_end)
+
+        entry = self.lookup(name)
+        if entry is None or entry.get("unknown"):
+            return
+        if "type" not in entry or "dimensions" in entry or "fields" in entry:
+            raise SemanticError(f"ValueError: Mismatched values — trying to assign a single value to a list object: '{name}'.", node.pos_start, node.pos_end)
+        if entry["immo"]:
+            raise SemanticError(f"ImmoError: '{name}' is declared as an immutable variable.", node.left.pos_start, node.left.pos_end)
+
+        value_type = entry["type"]
+        dead = entry.get("dead")
+        entry["dead"] = False
+        entry.pop("length", None)
+        if value_type is None or new_val is None:
+            return
+        if new_val == NUMERIC:
+            if value_type not in ("hp", "xp", NUMERIC):
+                raise SemanticError("TypeError: Using a non-numeric value to assign a non-numeric variable.", node.right.pos_start, node.right.pos_end)
+            return
+
+        if node.operator in COMPOUND:
+            if value_type == NUMERIC:
+                if new_val in ("comms", "dead"):
+                    raise SemanticError("TypeError: Cannot mix comms and numeric type in an expression.", node.pos_start, node.pos_end)
+                return
+            if dead or new_val == "dead":
+                return
+            new_val = self.compound(node, value_type, new_val)
+        elif value_type == NUMERIC:
+            if new_val not in ("hp", "xp"):
+                raise SemanticError(f"TypeError: Invalid type for variable '{name}'. Expected numeric but got '{new_val}'.", node.pos_start, node.pos_end)
+            return
+
+        if new_val is not None and new_val != value_type:
+            raise SemanticError(f"TypeError: Type mismatch for variable '{name}'. Expected '{value_type}', got '{new_val}'.", node.pos_start, node.pos_end)
+
+    def compound(self, node, old, new):
+        # type of `old <op>= new`, with the checks assign_var makes
+        if {old, new} == {"comms", "flag"}:
+            raise SemanticError("TypeError: Cannot mix comms and flags in an expression.", node.pos_start, node.pos_end)
+        if (old == "comms") != (new == "comms"):
+            raise SemanticError("TypeError: Cannot mix comms and numeric types in an expression.", node.pos_start, node.pos_end)
+        if old == "comms":
+            if node.operator != '+=':
+                raise SemanticError("TypeError: Only valid assignment operator between comms is '+='.", node.pos_start, node.pos_end)
+            return "comms"
+        integral = old in INTEGRAL and new in INTEGRAL
+        if node.operator == '/=':
+            if self.is_zero(node.right):
+                raise SemanticError("ZeroDivisionError: Division by zero is not allowed.", node.pos_start, node.pos_end)
+            return "hp" if integral else "xp"
+        if node.operator == '%=':
+            if not integral:
+                raise SemanticError("ModuloError: Only hp values can be used in modulo operation.", node.pos_start, node.pos_end)
+            if self.is_zero(node.right):
+                raise SemanticError("ZeroDivisionError: Modulo by zero is not allowed.", node.pos_start, node.pos_end)
+            return "hp"
+        return "hp" if integral else "xp"
+
+    def visit_BatchVarDec(self, node):
+        for var_dec in node.declarations:
+            value_node = var_dec.right if var_dec.kind == 'VarAssignmentStmt' else var_dec.value
+            if value_node.kind in LOADS:
+                raise SemanticError("ValueError: Cannot use loadNum and load function in batch declaration.", value_node.pos_start, value_node.pos_end)
+
+        variable_type = None
+        first_var = None
+        for var_dec in node.declarations:
+            name_node = var_dec.left if var_dec.kind == 'VarAssignmentStmt' else var_dec.name
+            value_node = var_dec.right if var_dec.kind == 'VarAssignmentStmt' else var_dec.value
+
+            if value_node.kind == 'FuncCallStmt':
+                recalls = self.call_value(value_node)
+                if recalls is not None and len(recalls) > 1:
+                    if not node.batch_ver1:
+                        raise SemanticError(f"ValueError: Function '{value_node.name.symbol}' recalls more than one value.", value_node.pos_start, value_node.pos_end)
+                    if len(node.declarations) != len(recalls):
+                        raise SemanticError(f"ValueError: Expected {len(node.declarations)} return values, got {len(recalls)}.", value_node.pos_start, value_node.pos_end)
+                    for declaration, value in zip(node.declarations, recalls):
+                        self.assign_value(declaration, value, node)
+                    return
+
+            self.visit(var_dec)
+            entry = self.lookup(name_node.symbol)
+            value_type = entry.get("type") if entry is not None else None
+            if value_type is None:
+                continue
+            if variable_type and variable_type != value_type:
+                message = (f"TypeError: Type mismatch in batch declarations. '{first_var}' is declared as {variable_type}, "
+                           f"but '{name_node.symbol}' is declared as {value_type}.")
+                if not node.batch_ver1:
+                    raise SemanticError(message, value_node.pos_start, value_node.pos_end)
+                raise SemanticError(message, node.pos_start, node.pos_end)
+            variable_type = value_type
+            first_var = name_node.symbol
+
+    def assign_value(self, declaration, value, node):
+        if declaration.kind == 'VarDec':
+            var_name, var_right = declaration.name, declaration.value
+        else:
+            var_name, var_right = declaration.left, declaration.right
+        if is_object(value):
+            if "dimensions" in value:
+                raise SemanticError(f"ValueError: Trying to assign an array to variable '{var_name.symbol}'.", var_right.pos_start, var_right.pos_end)
+            raise SemanticError(f"ValueError: Trying to assign a struct instance to variable '{var_name.symbol}'.", var_right.pos_start, var_right.pos_end)
+        if declaration.kind == 'VarDec':
+            self.define(var_name.symbol, {"type": value, "immo": declaration.immo})
+            return
+        entry = self.lookup(var_name.symbol)
+        if entry is None or "type" not in entry:
+            return
+        if entry["immo"]:
+            raise SemanticError(f"ImmoError: '{var_name.symbol}' is declared as an immutable variable.", var_name.pos_start, var_name.pos_end)
+        entry["dead"] = False
+        if value is not None and entry["type"] is not None and value != entry["type"]:
+            raise SemanticError(f"TypeError: Type mismatch for variable '{var_name.symbol}'. Expected '{entry['type']}', got '{value}'.", node.pos_start, node.pos_end)
+
+    def visit_StrArrAssignment(self, node):
+        if node.right.kind in LOADS and node.operator != ':':
+            raise SemanticError(f"ValueError: loadNum and load function cannot be used in compound assignment statements.", node.right.pos_start, node.right.pos_end)
+        name = node.left.left.symbol
+        entry = self.lookup(name)
+        if entry is not None and not entry.get("unknown"):
+            if entry.get("type") != "comms" or "dimensions" in entry:
+                raise SemanticError(f"TypeError: '{name}' is not a comms variable.", node.left.pos_start, node.left.pos_end)
+            if entry["immo"]:
+                raise SemanticError(f"ImmoError: '{name}' is declared as an immutable variable.", node.left.left.pos_start, node.left.left.pos_end)
+
+        idx = node.left.index[0]
+        value = self.index(idx, "IndexError: Comms index must always evaluate to a positive hp value.")
+        if self.outside(value, entry.get("length") if entry is not None else None):
+            raise SemanticError(f"IndexError: Index {value} out of bounds for comms '{name}'.", idx.pos_start, idx.pos_end)
+
+        if node.right.kind == 'FuncCallStmt':
+            message = "ValueError: Mismatched values — Trying to assign a list object inside a comms variable."
+            value = self.single_recall(node.right,
+                                       f"ValueError: Function '{node.right.name.symbol}' recalls more than one value, but only one was expected.",
+                                       message)
+        else:
+            value = self.expr(node.right)
+        if is_object(value):
+            raise SemanticError(f"ValueError: Mismatched values — Trying to assign a list object inside a comms variable.", node.right.pos_start, node.right.pos_end)
+        if value is not None and value != "comms":
+            raise SemanticError(f"TypeError: Comms variable '{name}' can only be given a string value.", node.right.pos_start, node.right.pos_end)
+        constant = self.constant(node.right)
+        if isinstance(constant, str) and len(constant) > 1:
+            raise SemanticError(f"ValueError: Comms variable '{name}' can only be given a single character value.", node.right.pos_start, node.right.pos_end)
+        if node.operator != ":":
+            raise SemanticError(f"TypeError: Invalid operator '{node.operator}' in comms character assignment statement.", node.pos_start, node.pos_end)
+
+    ###### ARRAYS #########
+    def visit_ArrayDec(self, node):
+        name = node.name.symbol
+        elem_type = None
+        if node.elements is None:
+            self.define(name, {"dimensions": node.dimensions, "type": node.datatype, "immo": node.immo, "dead": self.tracked(name)})
+            return
+        rows = node.elements if len(node.dimensions) != 1 else [node.elements]
+        is_empty = node.elements == [] if len(node.dimensions) == 1 else node.elements == [[], []]
+        for row in rows:
+            for val in row:
+                new_type = type_name(self.expr(val))
+                if new_type is None:
+                    continue
+                if elem_type and elem_type != new_type:
+                    raise SemanticError(f"TypeError: All elements in an array declaration must have the same type. Found types: '{elem_type}' and '{new_type}'.",
+                                        val.pos_start, val.pos_end)
+                elem_type = new_type
+        datatype = node.datatype if is_empty else elem_type
+        entry = {"dimensions": node.dimensions, "type": datatype, "immo": node.immo}
+        if len(node.dimensions) == 1 and self.tracked(name):
+            entry["length"] = len(node.elements)
+        self.define(name, entry)
+
+    def array(self, name_node, verb="array"):
+        # the entry of an array being changed, None if not known
+        name = name_node.symbol
+        entry = self.lookup(name)
+        if entry is None or entry.get("unknown"):
+            return None
+        if "dimensions" not in entry:
+            raise SemanticError(f"TypeError: '{name}' is not an array.", name_node.pos_start, name_node.pos_end)
+        return entry
+
+    def visit_ArrayAssignmentStmt(self, node):
+        if node.right.kind in LOADS and node.operator != ':':
+            raise SemanticError(f"ValueError: loadNum and load function cannot be used in compound assignment statements.", node.right.pos_start, node.right.pos_end)
+        name = node.left.left.symbol
+        entry = self.lookup(name)
+        if entry is not None and not entry.get("unknown"):
+            if "dimensions" not in entry:
+                raise SemanticError(f"TypeError: '{name}' is not an array.", node.left.pos_start, node.left.pos_end)
+            if entry["immo"]:
+                raise SemanticError(f"ImmoError: '{name}' is declared as an immutable array.", node.left.left.pos_start, node.left.left.pos_end)
+            if entry.get("dead"):
+                raise SemanticError(f"TypeError: Array '{name}' is a dead array.", node.left.left.pos_start, node.left.left.pos_end)
+            if len(entry["dimensions"]) != len(node.left.index):
+                raise SemanticError(f"DimensionError: Mismatched dimensions for array '{name}'. Expected {len(entry['dimensions'])}, but got {len(node.left.index)}.",
+                                    node.left.pos_start, node.left.pos_end)
+        else:
+            entry = None
+
+        for i, idx in enumerate(node.left.index):
+            position = f"dimension {i}" if i < len(node.left.index) - 1 else "final dimension"
+            value = self.index(idx, "IndexError: Array index must always evaluate to a positive hp value.")
+            length = entry.get("length") if entry is not None and i == len(node.left.index) - 1 else None
+            if self.outside(value, length):
+                raise SemanticError(f"IndexError: Index {value} out of bounds for {position} of array '{name}'.", idx.pos_start, idx.pos_end)
+
+        message = "ValueError: Mismatched values — Trying to assign a list object to an array element."
+        if node.right.kind == 'FuncCallStmt':
+            value = self.single_recall(node.right,
+                                       f"ValueError: Function '{node.right.name.symbol}' recalls more than one value, but only one was expected.",
+                                       message)
+        else:
+            value = self.expr(node.right)
+        if is_object(value):
+            raise SemanticError(message, node.right.pos_start, node.right.pos_end)
+        if entry is None or entry["type"] is None or value is None:
+            return
+        lhs_type = entry["type"]
+        if value == NUMERIC:
+            if lhs_type not in ("hp", "xp"):
+                raise SemanticError("TypeError: Trying to assign a numeric value into a non-numeric array.", node.right.pos_start, node.right.pos_end)
+            return
+        if node.operator in COMPOUND:
+            if value == "dead":
+                return
+            value = self.compound(node, lhs_type, value)
+        if value != lhs_type:
+            raise SemanticError(f"TypeError: Array '{name}' expects '{lhs_type}' data type, not '{value}'.", node.left.left.pos_start, node.left.left.pos_end)
+
+    def visit_ArrayRedec(self, node):
+        arr_name = node.name.symbol
+        entry = self.array(node.name)
+        if entry is not None and entry["immo"]:
+            raise SemanticError(f"ImmoError: '{arr_name}' is declared as an immutable array.", node.name.pos_start, node.name.pos_end)
+        arr_type = entry["type"] if entry is not None else None
+
+        if isinstance(node.elements, Identifier):
+            rhs = self.lookup(node.elements.symbol)
+            if rhs is not None and not rhs.get("unknown"):
+                if "dimensions" not in rhs:
+                    raise SemanticError(f"ValueError: '{node.elements.symbol}' is not an array.", node.elements.pos_start, node.elements.pos_end)
+                if rhs.get("dead"):
+                    raise SemanticError(f"TypeError: Array '{node.elements.symbol}' is a dead array.", node.elements.pos_start, node.elements.pos_end)
+                if entry is not None:
+                    if len(entry["dimensions"]) != len(rhs["dimensions"]):
+                        raise SemanticError(f"DimensionsError: Incorrect number of dimensions.", node.pos_start, node.pos_end)
+                    if rhs["type"] is not None and arr_type is not None and rhs["type"] != arr_type:
+                        raise SemanticError(f"TypeError: Array '{arr_name}' expects '{arr_type}' datatype. Found '{rhs['type']}'", node.pos_start, node.pos_end)
+        elif isinstance(node.elements, FuncCallStmt):
+            recalls = self.call_value(node.elements)
+            if recalls is not None and len(recalls) > 1:
+                raise SemanticError(f"ValueError: Function '{node.elements.name.symbol}' recalls more than one value, but only one was expected.", node.elements.pos_start, node.elements.pos_end)
+            rhs = recalls[0] if recalls else None
+            if rhs is not None and rhs != EMPTY_ARRAY:
+                if not is_object(rhs) or "dimensions" not in rhs:
+                    raise SemanticError(f"ValueError: Function '{node.elements.name.symbol}' does not recall an array.", node.elements.pos_start, node.elements.pos_end)
+                if entry is not None:
+                    if len(entry["dimensions"]) != len(rhs["dimensions"]):
+                        raise SemanticError(f"DimensionsError: Incorrect number of dimensions.", node.elements.pos_start, node.elements.pos_end)
+                    if rhs["type"] is not None and arr_type is not None and rhs["type"] != arr_type:
+                        raise SemanticError(f"TypeError: Array '{arr_name}' expects '{arr_type}' datatype. Found '{rhs['type']}'", node.pos_start, node.pos_end)
+        else:
+            if entry is not None and len(node.dimensions) != len(entry["dimensions"]):
+                raise SemanticError(f"DimensionsError: Incorrect number of dimensions.", node.pos_start, node.pos_end)
+            rows = node.elements if len(node.dimensions) != 1 else [node.elements]
+            for row in rows:
+                for val in row:
+                    val_type = type_name(self.expr(val))
+                    if val_type is not None and arr_type is not None and val_type != arr_type:
+                        raise SemanticError(f"TypeError: Array '{arr_name}' expects '{arr_type}' datatype. Found '{val_type}'", val.pos_start, val.pos_end)
+        if entry is not None:
+            entry["dead"] = False
+            entry["immo"] = node.immo
+            entry.pop("length", None)
+            if isinstance(node.elements, list) and len(node.dimensions) == 1 and self.tracked(arr_name):
+                entry["length"] = len(node.elements)
+
+    def element(self, value, arr_name, arr_type, node, is_seek=False):
+        # _evaluate_element: one value joined to or sought in an array
+        if value.kind == 'FuncCallStmt':
+            recalls = self.call_value(value)
+            if recalls is not None and len(recalls) > 1:
+                raise SemanticError(f"ValueError: Function '{value.name.symbol}' recalls more than one value.", value.pos_start, value.pos_end)
+            elem = recalls[0] if recalls else None
+            if elem == EMPTY_ARRAY:
+                if is_seek:
+                    raise SemanticError(f"ValueError: Trying to seek a whole array, must be an element or a row only.", value.pos_start, value.pos_end)
+                raise SemanticError(f"ValueError: Trying to append an array to an array element.", value.pos_start, value.pos_end)
+        elif value.kind in LOADS:
+            if is_seek:
+                raise SemanticError(f"UnsupportedArgumentError: loadNum and load function cannot be used as an argument to seek function.", value.pos_start, value.pos_end)
+            raise SemanticError(f"ValueError: loadNum and load function cannot be used to append an element to an array.", value.pos_start, value.pos_end)
+        else:
+            elem = self.expr(value)
+
+        if elem is None or arr_type is None:
+            return
+        if elem == NUMERIC:
+            if arr_type not in ('hp', 'xp'):
+                if is_seek:
+                    raise SemanticError(f"TypeError: Seeking a non-numeric element from a numeric array", value.pos_start, value.pos_end)
+                raise SemanticError(f"TypeError: Appending a non-numeric element into a numeric array", value.pos_start, value.pos_end)
+            return
+        if is_object(elem):
+            if is_seek:
+                raise SemanticError(f"ValueError: Trying to seek a list object, must be an element or a row only.", value.pos_start, value.pos_end)
+            raise SemanticError(f"ValueError: Trying to append a list object to an array.", node.pos_start, node.pos_end)
+        if arr_type != elem:
+            raise SemanticError(f"TypeError: Array '{arr_name}' expects '{arr_type}' but got '{elem}'.", value.pos_start, value.pos_end)
+
+    def row_index(self, node):
+        if node.row_index:
+            self.index(node.row_index, "IndexError: Array index must always evaluate to a positive hp value.")
+
+    def comms_target(self, node, entry, check_immo=True):
+        # join/drop on a comms variable
+        name = node.arr_name.symbol
+        if entry.get("dead"):
+            raise SemanticError(f"TypeError: Comms variable '{name}' is a dead variable and must be defined with a value first.", node.arr_name.pos_start, node.arr_name.pos_end)
+        if check_immo and entry["immo"]:
+            raise SemanticError(f"ImmoError: Comms variable '{name}' is declared as an immutable variable.", node.arr_name.pos_start, node.arr_name.pos_end)
+        if node.row_index:
+            raise SemanticError(f"TypeError: Trying to use comms variable '{name}' like a two-dimensional array.", node.arr_name.pos_start, node.arr_name.pos_end)
+
+    def comms_char(self, node, value, messages):
+        # the single character joined to or sought in a comms variable
+        if isinstance(value, list):
+            raise SemanticError(messages["list"], node.arr_name.pos_start, node.arr_name.pos_end)
+        if value.kind == 'FuncCallStmt':
+            recalls = self.call_value(value)
+            if recalls is not None and len(recalls) > 1:
+                raise SemanticError(f"ValueError: Function '{value.name.symbol}' recalls more than one value.", value.pos_start, value.pos_end)
+            elem = recalls[0] if recalls else None
+            if elem == EMPTY_ARRAY:
+                raise SemanticError(messages["array"], value.pos_start, value.pos_end)
+        elif value.kind in LOADS:
+            raise SemanticError(messages["load"], value.pos_start, value.pos_end)
+        else:
+            elem = self.expr(value)
+        if is_object(elem) and "object" in messages:
+            raise SemanticError(messages["object"], node.pos_start, node.pos_end)
+        if elem is not None and elem != "comms":
+            raise SemanticError(messages["type"], node.pos_start, node.pos_end)
+        constant = self.constant(value)
+        if isinstance(constant, str) and len(constant) > 1:
+            raise SemanticError(messages["length"], node.pos_start, node.pos_end)
+
+    def visit_JoinStmt(self, node):
+        arr_name = node.arr_name.symbol
+        entry = self.lookup(arr_name)
+        if entry is None or entry.get("unknown"):
+            return
+        if "dimensions" not in entry and "type" in entry:
+            if entry["type"] != "comms":
+                raise SemanticError(f"TypeError: '{arr_name}' is not an comms variable.", node.arr_name.pos_start, node.arr_name.pos_end)
+            self.comms_target(node, entry)
+            entry.pop("length", None)
+            self.comms_char(node, node.value, {
+                "list": f"TypeError: Trying to join a list; only one character can be joined in a comms variable.",
+                "array": f"ValueError: Trying to append an array to an comms variable.",
+                "load": f"ValueError: loadNum and load function cannot be used to append an element to a comms variable.",
+                "object": f"ValueError: Trying to append a list object to a comms variable.",
+                "type": f"TypeError: Comms variable '{arr_name}' can only be appended with a single character value.",
+                "length": f"ValueError: Comms variable '{arr_name}' can only be appended with a single character value.",
+            })
+            return
+        entry = self.array(node.arr_name)
+        entry.pop("length", None)
+        if entry.get("dead"):
+            raise SemanticError(f"TypeError: Array '{arr_name}' is a dead array and must be defined with a value first.", node.arr_name.pos_start, node.arr_name.pos_end)
+        if entry["immo"]:
+            raise SemanticError(f"ImmoError: Array '{arr_name}' is declared as an immutable array.", node.arr_name.pos_start, node.arr_name.pos_end)
+        if node.dimensions and node.dimensions != len(entry["dimensions"]):
+            raise SemanticError(f"DimensionsError: Incorrect number of dimensions.", node.pos_start, node.pos_end)
+        self.row_index(node)
+        if isinstance(node.value, list):
+            for value in node.value:
+                for v in value:
+                    self.element(v, arr_name, entry["type"], node)
+        else:
+            self.element(node.value, arr_name, entry["type"], node)
+        if len(entry["dimensions"]) == 1 and isinstance(node.value, list):
+            raise SemanticError("ValueError: Cannot append nested lists to a 1D array.", node.pos_start, node.pos_end)
+        if len(entry["dimensions"]) == 2 and not node.row_index and not isinstance(node.value, list):
+            raise SemanticError("ValueError: Appending non-row values to a 2D array.", node.pos_start, node.pos_end)
+
+    def visit_DropStmt(self, node, is_Return=False):
+        arr_name = node.arr_name.symbol
+        entry = self.lookup(arr_name)
+        if entry is None or entry.get("unknown"):
+            self.row_index(node)
+            if node.elem_index:
+                self.index(node.elem_index, "IndexError: Array index must always evaluate to a positive hp value.")
+            return None
+        if "dimensions" not in entry and "type" in entry:
+            if entry["type"] != "comms":
+                raise SemanticError(f"TypeError: '{arr_name}' is not an comms variable.", node.arr_name.pos_start, node.arr_name.pos_end)
+            self.comms_target(node, entry)
+            if node.elem_index:
+                value = self.index(node.elem_index, "IndexError: Array index must always evaluate to a positive hp value.")
+                if self.outside(value, entry.get("length")):
+                    raise SemanticError(f"IndexError: Index {value} out of bounds for comms variable '{arr_name}'.", node.elem_index.pos_start, node.elem_index.pos_end)
+            entry.pop("length", None)
+            return "comms"
+        entry = self.array(node.arr_name)
+        if entry.get("dead"):
+            raise SemanticError(f"TypeError: Array '{arr_name}' is a dead array and must be defined with a value first.", node.arr_name.pos_start, node.arr_name.pos_end)
+        if entry["immo"]:
+            raise SemanticError(f"ImmoError: Array '{arr_name}' is declared as an immutable array.", node.arr_name.pos_start, node.arr_name.pos_end)
+        if node.dimensions and node.dimensions != len(entry["dimensions"]):
+            raise SemanticError(f"DimensionsError: Incorrect number of dimensions.", node.pos_start, node.pos_end)
+        self.row_index(node)
+        if node.elem_index:
+            value = self.index(node.elem_index, "IndexError: Array index must always evaluate to a positive hp value.")
+            if len(entry["dimensions"]) == 1 and self.outside(value, entry.get("length")):
+                raise SemanticError(f"IndexError: Index {value} out of bounds for array '{arr_name}'.", node.elem_index.pos_start, node.elem_index.pos_end)
+        entry.pop("length", None)
+        if len(entry["dimensions"]) == 2 and not node.row_index and is_Return:
+            raise SemanticError("ReturnError: Cannot remove and return an entire row of a 2D array.", node.pos_start, node.pos_end)
+        return entry["type"]
+
+    def visit_SeekStmt(self, node):
+        arr_name = node.arr_name.symbol
+        entry = self.lookup(arr_name)
+        if entry is None or entry.get("unknown"):
+            return "hp"
+        if "dimensions" not in entry and "type" in entry:
+            if entry["type"] != "comms":
+                raise SemanticError(f"TypeError: '{arr_name}' is not an comms variable.", node.arr_name.pos_start, node.arr_name.pos_end)
+            if entry.get("dead"):
+                raise SemanticError(f"TypeError: Comms variable '{arr_name}' is a dead variable and must be defined with a value first.", node.arr_name.pos_start, node.arr_name.pos_end)
+            if entry.get("constant") == "":
+                raise SemanticError(f"ImmoError: Comms variable '{arr_name}' is an empty variable, there is no character to be seeked.", node.arr_name.pos_start, node.arr_name.pos_end)
+            if node.row_index:
+                raise SemanticError(f"TypeError: Trying to use comms variable '{arr_name}' like a two-dimensional array.", node.arr_name.pos_start, node.arr_name.pos_end)
+            self.comms_char(node, node.value, {
+                "list": f"TypeError: Trying to seek a list; only one character can be seeked in a comms variable.",
+                "array": f"ValueError: Trying to seek an array from a comms variable.",
+                "load": f"ValueError: loadNum and load function cannot be used to seek a character from a comms variable.",
+                "type": f"TypeError: Trying to seek a non-character value from a comms variable.",
+                "length": f"TypeError: Trying to seek a non-single character value from a comms variable.",
+            })
+            return "hp"
+        if "dimensions" not in entry:
+            return "hp"
+        if entry.get("dead"):
+            raise SemanticError(f"TypeError: Array '{arr_name}' is a dead array and must be defined with a value first.", node.arr_name.pos_start, node.arr_name.pos_end)
+        if node.dimensions and node.dimensions != len(entry["dimensions"]):
+            raise SemanticError(f"DimensionsError: Incorrect number of dimensions.", node.pos_start, node.pos_end)
+        self.row_index(node)
+        if isinstance(node.value, list):
+            for value in node.value:
+                for v in value:
+                    self.element(v, arr_name, entry["type"], node, True)
+            if len(entry["dimensions"]) == 1:
+                raise SemanticError("ValueError: Cannot seek multiple values in a 1d array.", node.pos_start, node.pos_end)
+        else:
+            self.element(node.value, arr_name, entry["type"], node, True)
+        return "hp"
+
+    ###### BUILT-IN #########
+    def visit_RoundStmt(self, node):
+        info = self.value(node.value)
+        if info is None:
+            return "hp"
+        if is_object(info):
+            if "dimensions" not in info:
+                raise SemanticError(f"TypeError: Can only use rounds function on comms and arrays.", node.pos_start, node.pos_end)
+        elif info != "comms":
+            raise SemanticError(f"TypeError: Can only use rounds function on comms and arrays.", node.pos_start, node.pos_end)
+        return "hp"
+
+    def visit_LevelStmt(self, node):
+        info = self.value(node.value)
+        if info is not None and info != "comms":
+            function_name = "levelUp" if node.up_or_down else "levelDown"
+            raise SemanticError(f"TypeError: Can only use {function_name} function on comms.", node.pos_start, node.pos_end)
+        return "comms"
+
+    def visit_ToNumStmt(self, node):
+        info = self.operand(node, self.expr(node.value))
+        if is_object(info):
+            raise SemanticError(f"TypeError: Cannot convert a list object to a number.", node.pos_start, node.pos_end)
+        constant = self.constant(node.value)
+        if isinstance(constant, str):
+            if node.hp_or_xp:
+                if not constant.isdigit():
+                    raise SemanticError(f"TypeError: Cannot convert '{constant}' to an hp — must be a whole number.", node.pos_start, node.pos_end)
+            else:
+                try:
+                    float(constant)
+                except ValueError:
+                    raise SemanticError(f"TypeError: Cannot convert '{constant}' to an xp — must be a valid floating-point number.", node.pos_start, node.pos_end)
+        return "hp" if node.hp_or_xp else "xp"
+
+    def visit_ToCommsStmt(self, node):
+        info = self.operand(node, self.expr(node.value))
+        if is_object(info):
+            raise SemanticError(f"TypeError: Cannot convert a list object to comms.", node.pos_start, node.pos_end)
+        return "comms"
+
+    def visit_ShootStmt(self, node):
+        if node.element.kind in LOADS:
+            raise SemanticError("UnsupportedArgumentError: load and loadNum function are an invalid argument for shoot and shootNxt function.", node.element.pos_start, node.element.pos_end)
+        if is_object(self.value(node.element)):
+            raise SemanticError("UnsupportedArgumentError: Cannot use a list object as a shoot argument.", node.pos_start, node.pos_end)
+
+    ###### STRUCTS #########
+    def visit_StructDec(self, node):
+        default_types = {'hp', 'xp', 'comms', 'flag'}
+        fields = {}
+        for field in node.body:
+            if field.datatype not in default_types:
+                raise SemanticError(f"Unknown data type '{field.datatype}'.")
+            if field.value is not None:
+                val_type = type_name(self.expr(field.value))
+                if val_type is not None and val_type != NUMERIC and field.datatype != val_type:
+                    raise SemanticError(f"TypeError: Type mismatch for field '{field.name.symbol}'."
+                                        f" Expected '{field.datatype}', but got '{val_type}'.",
+                                        field.value.pos_start, field.value.pos_end)
+            fields[field.name.symbol] = field.datatype
+        name = node.name.symbol if isinstance(node.name, Identifier) else node.name
+        self.structs[name] = fields
+
+    def visit_StructInst(self, node):
+        fields = self.structs.get(node.parent)
+        if fields is None:
+            for value in node.body:
+                self.expr(value)
+            self.define(node.name.symbol, {"unknown": True})
+            return
+        if len(node.body) > len(fields):
+            raise SemanticError(f"FieldError: Too many values provided for struct '{node.parent}'."
+                                f" Expected {len(fields)}, got {len(node.body)}.", node.body[0].pos_start, node.body[-1].pos_end)
+        for (field, expected_type), value in zip(fields.items(), node.body):
+            actual_type = type_name(self.expr(value))
+            if actual_type is None or (actual_type == NUMERIC and expected_type in ('hp', 'xp')):
+                continue
+            if actual_type != expected_type:
+                raise SemanticError(f"TypeError: Type mismatch for field '{field}'."
+                                    f" Expected '{expected_type}', but got '{'None' if actual_type == 'dead' else actual_type}'.",
+                                    value.pos_start, value.pos_end)
+        self.define(node.name.symbol, {"parent": node.parent, "fields": dict(fields), "immo": node.immo})
+
+    def visit_InstAssignmentStmt(self, node):
+        if node.right.kind in LOADS and node.operator != ':':
+            raise SemanticError(f"ValueError: loadNum and load function cannot be used in compound assignment statements.", node.right.pos_start, node.right.pos_end)
+        instance = node.left.instance
+        entry = self.lookup(instance.symbol)
+        known = entry is not None and not entry.get("unknown")
+        if known:
+            if "fields" not in entry:
+                raise SemanticError(f"TypeError: '{instance.symbol}' is not a struct instance.", instance.pos_start, instance.pos_end)
+            if entry["immo"]:
+                raise SemanticError(f"ImmoError: '{instance.symbol}' is declared as an immutable struct instance.", instance.pos_start, instance.pos_end)
+            if node.left.field.symbol not in entry["fields"]:
+                raise SemanticError(f"NameError: Field '{node.left.field.symbol}' does not exist "
+                                    f"in struct instance '{instance.symbol}'.", node.left.field.pos_start, node.left.field.pos_end)
+
+        message = "ValueError: Mismatched values — Trying to assign a list object to a struct instance field."
+        if node.right.kind == 'FuncCallStmt':
+            value = self.single_recall(node.right,
+                                       f"ValueError: Function '{node.right.name.symbol}' recalls more than one value, but only one was expected.",
+                                       message)
+        else:
+            value = self.expr(node.right)
+        if is_object(value):
+            raise SemanticError(message, node.right.pos_start, node.right.pos_end)
+        if not known or value is None:
+            return
+        field = node.left.field.symbol
+        old_type = entry["fields"][field]
+        if value == NUMERIC:
+            if old_type not in ("hp", "xp"):
+                raise SemanticError("TypeError: Using loadNum function to assign a non-numeric instance field.", node.right.pos_start, node.right.pos_end)
+            return
+        if node.operator in COMPOUND:
+            if value == "dead":
+                return
+            value = self.compound(node, old_type, value)
+        if old_type != value:
+            raise SemanticError(f"TypeError: Type mismatch for field '{field}'."
+                                f" Expected '{old_type}', but got '{value}'.", node.pos_start, node.pos_end)
+
+    ###### COND #########
+    def condition(self, cond, message, load_message="TypeError: Cannot use load and loadNum function as condition."):
+        if cond.kind in LOADS:
+            raise SemanticError(load_message, cond.pos_start, cond.pos_end)
+        value = self.value(cond)
+        if value is not None and value != "flag":
+            raise SemanticError(message, cond.pos_start, cond.pos_end)
+
+    def visit_IfStmt(self, node):
+        message = "TypeError: The condition used does not evaluate to a flag value."
+        self.condition(node.condition, message)
+        for branch in node.elif_branches or []:
+            self.condition(branch.condition, message)
+        self.body(node.then_branch)
+        for branch in node.elif_branches or []:
+            self.body(branch.body)
+        if node.else_branch is not None:
+            self.body(node.else_branch)
+
+    def visit_FlankStmt(self, node):
+        if node.expression.kind in LOADS:
+            raise SemanticError(f"TypeError: Cannot use load and loadNum as flank expression.", node.expression.pos_start, node.expression.pos_end)
+        self.value(node.expression)
+        for choice in node.choices:
+            for choice_value in choice.values:
+                self.expr(choice_value)
+        for choice in node.choices:
+            self.body(choice.body)
+        self.body(node.backup_body)
+
+    ###### LOOP #########
+    def visit_ForStmt(self, node):
+        init = node.initialization
+        val_name = init.left.symbol
+        entry = self.lookup(val_name)
+        known = entry is not None and not entry.get("unknown")
+        if known:
+            if "type" not in entry or "dimensions" in entry or "fields" in entry:
+                raise SemanticError(f"ValueError: Mismatched types — trying to assign a single value from to a list object, '{val_name}'",
+                                    init.pos_start, init.pos_end)
+            if entry["immo"]:
+                raise SemanticError(f"TypeError: '{val_name}' is declared as an immutable variable.", init.pos_start, init.pos_end)
+        if init.right.kind in LOADS:
+            raise SemanticError(f"LoopControlError: Cannot use load and loadNum in loop control initialization.", init.right.pos_start, init.right.pos_end)
+        new_val = self.value(init.right)
+        if known and entry["type"] is not None and new_val not in (None, NUMERIC):
+            if entry["type"] != "hp" or new_val not in INTEGRAL:
+                raise SemanticError(f"LoopControlError: Only hp variables can be used for loop control.", init.pos_start, init.pos_end)
+        if known:
+            entry["dead"] = False
+
+        self.scopes.append({})
+        self.enter_loop(node, [node.body, node.update])
+        self.condition(node.condition, "LoopConditionError: Loop condition does not evaluate to a flag value.")
+        for stmt in node.body:
+            self.visit(stmt)
+        self.visit(node.update)
+        self.scopes.pop()
+
+    def visit_GrindWhileStmt(self, node):
+        self.scopes.append({})
+        if not node.is_grind:
+            # a while's condition comes before the body on the first pass
+            self.condition(node.condition, "LoopConditionError: Loop condition does not evaluate to a flag value.")
+        self.enter_loop(node, node.body)
+        if node.is_grind:
+            self.condition(node.condition, "LoopConditionError: Loop condition does not evaluate to a flag value.")
+        for stmt in node.body:
+            self.visit(stmt)
+        self.scopes.pop()
+
+TypeChecker.DISPATCH = dispatch_table(TypeChecker)
+
+def annotate(program):
+    # tags for runtime.interpreter.specialize; a program the checker rejects
+    # still runs, with the tags made before the error
+    try:
+        TypeChecker(annotate=True).check(program)
+    except SemanticError:
+        pass
+    return program
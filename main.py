@@ -2,12 +2,31 @@ import eel
 import os, sys
 import tkinter as tk
 from tkinter import filedialog
-from ludus import ast, lexer, parser
+from ludus import ast, incremental
+from ludus.compile_cache import CompileCache
+from ludus.runtime import output, interpreter, inputs
+from gevent.queue import Queue
 import time
 
 eel.init('web')
+output.set_sink(output.eel_sink())
+interpreter.input_provider = inputs.QueueInput(Queue, on_prompt=interpreter.get_input_from_frontend)
+eel.expose(interpreter.pass_input)
+eel.expose(interpreter.get_input_from_frontend)
+eel.expose(interpreter.reset_interpreter)
 
 current_file = None
+document = incremental.Document(current_file)
+compile_cache = CompileCache()     # front end results of earlier Runs
+
+def edited(input_text):
+    # the open file's Document, brought up to date with the editor text
+    global document
+    if document.fn != current_file:
+        document = incremental.Document(current_file)
+    document.update(input_text)
+    return document
+
 #Option 1: Clear same window and update editor
 @eel.expose
 def create_new_file():
@@ -63,15 +82,15 @@ def save_file_as(content):
 
 @eel.expose
 def lexical_analyzer(input_text):
-    tokens, error = lexer.run(current_file, input_text)
+    tokens, error = edited(input_text).lexical()
 
     if error:
         eel.updateError("\n\n".join(error))
     else:
         eel.updateError("No lexical errors found!")
     
-    if tokens:
-        tokens.pop()
+    # the document keeps its token store between edits, leave out EOF on a copy
+    tokens = list(tokens)[:-1]
     
     linenumbers = [token.line for token in tokens]
     colnumbers = [token.column for token in tokens]
@@ -84,7 +103,7 @@ def lexical_analyzer(input_text):
 
 @eel.expose
 def syntax_analyzer(input_text):
-    result = parser.parse(current_file, input_text)
+    result = edited(input_text).syntax_report()
 
     eel.updateTerminal(result)
 
@@ -93,7 +112,7 @@ def semantic_analyzer(input_text):
     #result, table = ast.check(current_file, input_text)
     # output = str(result) + "\n" + str(table) 
 
-    result = ast.check(current_file, input_text)
+    result = ast.check(current_file, input_text, cache=compile_cache)
     output = str(result)  
 
     eel.updateTerminal(output)
@@ -105,7 +124,7 @@ def runtime_backend(input_text):
 
     print("running runtime again")
     #time.sleep(0.2)
-    result = ast.check(current_file, input_text, True)
+    result = ast.check(current_file, input_text, True, cache=compile_cache)
     
     eel.updateTerminal(result)
 
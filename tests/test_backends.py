@@ -0,0 +1,138 @@
+import contextlib, glob, io, os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+from ludus.__main__ import run_file
+
+# The tree-walker is the reference, closure and vm must give the same
+# output, errors and exit code for every program.
+
+BACKENDS = ("tree", "closure", "vm")
+SCRIPTS = os.path.join(ROOT, "Ludus test scripts")
+SCRIPT_INPUT = "5\n" * 40      # load/loadNum read 5 until it runs out
+
+def run(path, backend, stdin):
+    # run_file writes to sys.stdout like the CLI, so a stray print() in the
+    # runtime shows up in the output being compared
+    stderr = io.StringIO()
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        code = run_file(path, backend, io.StringIO(stdin), stderr=stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+def sample_scripts():
+    return sorted(glob.glob(os.path.join(SCRIPTS, "**", "*.lds"), recursive=True))
+
+def test_sample_scripts_found():
+    assert len(sample_scripts()) > 50
+
+@pytest.mark.parametrize("path", sample_scripts(), ids=lambda path: os.path.relpath(path, SCRIPTS))
+def test_sample_script_backends_agree(path):
+    expected = run(path, "tree", SCRIPT_INPUT)
+    for backend in BACKENDS[1:]:
+        assert run(path, backend, SCRIPT_INPUT) == expected, backend
+
+# runtime errors, with the values read from stdin so nothing is folded or
+# caught before the program runs: (name, source, stdin, line, message)
+RUNTIME_ERRORS = [
+    ("division by zero", """play() {
+    hp a, b
+    a: loadNum()
+    b: loadNum()
+    shoot(a / b)
+}
+
+gameOver""", "5\n0\n", 5, "ZeroDivisionError: Division by zero is not allowed"),
+    ("modulo by zero", """play() {
+    hp a, b
+    a: loadNum()
+    b: loadNum()
+    shoot(a % b)
+}
+
+gameOver""", "5\n0\n", 5, "ZeroDivisionError: Modulo by zero is not allowed."),
+    ("division by zero in a recursive call", """generate f(n)
+
+play() {
+    hp k
+    k: loadNum()
+    shoot(f(k))
+}
+
+generate f(n) {
+    if n == 0 {
+        recall 10 / n
+    }
+    recall f(n - 1)
+}
+
+gameOver""", "5\n", 11, "ZeroDivisionError: Division by zero is not allowed"),
+    ("hp over 10 digits", """play() {
+    hp a, i
+    a: loadNum()
+    for i: 0, i < 12, i += 1 {
+        a *= 10
+        shoot("{a} ")
+    }
+}
+
+gameOver""", "5\n", 6, "TypeError: Hp exceeds 10 digits."),
+    ("xp over 10 digits", """play() {
+    xp a
+    hp i
+    a: loadNum()
+    for i: 0, i < 12, i += 1 {
+        a *= 10.0
+    }
+    shoot(a)
+}
+
+gameOver""", "5.5\n", 8, "TypeError: Whole number part of xp exceeds 10 digits."),
+    ("array index out of bounds", """play() {
+    hp i
+    arr[]: [1, 2, 3]
+    i: loadNum()
+    shoot(arr[i])
+}
+
+gameOver""", "5\n", 5, "ArrayIndexError: Index 5 out of bounds for final dimension of array 'arr'."),
+    ("comms plus hp", """play() {
+    comms s
+    hp n
+    s: load()
+    n: loadNum()
+    shoot(s + n)
+}
+
+gameOver""", "a\n5\n", 6, "TypeError: Cannot mix comms and numeric types in an expression."),
+    ("loop condition not a flag", """play() {
+    hp n
+    n: loadNum()
+    while n {
+        n -= 1
+    }
+}
+
+gameOver""", "5\n", 4, "LoopConditionError: Loop condition does not evaluate to a flag value."),
+    ("input runs out", """play() {
+    hp n
+    n: loadNum()
+    shoot(n)
+}
+
+gameOver""", "", None, "InputError: No more input available for load or loadNum."),
+]
+
+@pytest.mark.parametrize("name, source, stdin, line, message", RUNTIME_ERRORS, ids=[case[0] for case in RUNTIME_ERRORS])
+def test_runtime_error_backends_agree(tmp_path, name, source, stdin, line, message):
+    path = tmp_path / "error.lds"
+    path.write_text(source, encoding="utf-8")
+    expected = run(str(path), "tree", stdin)
+    code, _, error = expected
+    assert code == 1
+    assert error.rstrip("\n").endswith(message)
+    if line is not None:
+        assert error.startswith(f"Semantic Error found on line {line}:")
+    for backend in BACKENDS[1:]:
+        assert run(str(path), backend, stdin) == expected, backend
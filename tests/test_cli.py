@@ -0,0 +1,42 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ludus.__main__ import main, EXIT_OK, EXIT_USAGE
+
+NOT_UTF8 = b'play() {\n    shoot("\x94quoted\x94")\n}\n\ngameOver'     # cp1252 curly quotes
+
+def write_program(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+def test_run_ok(tmp_path, capsys):
+    path = write_program(tmp_path, "ok.lds", b'play() {\n    shoot("hi")\n}\n\ngameOver')
+    assert main(["run", path]) == EXIT_OK
+    assert capsys.readouterr().out == "hi"
+
+def test_run_not_utf8(tmp_path, capsys):
+    path = write_program(tmp_path, "cp1252.lds", NOT_UTF8)
+    assert main(["run", path]) == EXIT_USAGE
+    err = capsys.readouterr().err
+    assert err == f"ludus: cannot read '{path}': not UTF-8 text (invalid byte 0x94)\n"
+
+def test_check_not_utf8(tmp_path, capsys):
+    path = write_program(tmp_path, "cp1252.lds", NOT_UTF8)
+    assert main(["check", path]) == EXIT_USAGE
+    assert "not UTF-8 text" in capsys.readouterr().err
+
+def test_run_missing_file(tmp_path, capsys):
+    path = str(tmp_path / "missing.lds")
+    assert main(["run", path]) == EXIT_USAGE
+    assert capsys.readouterr().err.startswith(f"ludus: cannot read '{path}':")
+
+def test_run_tree_stdout_is_program_output(tmp_path, capsys, monkeypatch):
+    # the tree backend's xp formatting used to print a debug line to stdout
+    path = write_program(tmp_path, "xp.lds", b'play() {\n    x: 10.0 / 4\n    shoot(x.2f)\n    shootNxt()\n    shoot("{x.3f}")\n}\n\ngameOver')
+    for backend in ("tree", "closure", "vm"):
+        assert main(["run", path, "--backend", backend]) == EXIT_OK
+        captured = capsys.readouterr()
+        assert captured.out == "2.50\n2.500", backend
+        assert captured.err == "", backend
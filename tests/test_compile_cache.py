@@ -0,0 +1,90 @@
+import os, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ludus import ast
+from ludus.compile_cache import CompileCache, MAGIC
+from ludus.pipeline import Compilation
+from ludus.runtime import output
+
+PROGRAM = 'play() {\n    x: 2 * 3\n    shoot("x is {x}")\n}\n\ngameOver'
+EDITED = PROGRAM.replace("2 * 3", "2 * 4")
+
+def front_end(text):
+    program, _ = Compilation("<test>", text).front_end()
+    return program
+
+def entries(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".ast"))
+
+def test_hit_returns_stored_tree(tmp_path):
+    program = front_end(PROGRAM)
+    CompileCache(str(tmp_path)).store(PROGRAM, program)
+    cache = CompileCache(str(tmp_path))
+    assert repr(cache.load(PROGRAM)) == repr(program)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+def test_changed_source_misses(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    cache.store(PROGRAM, front_end(PROGRAM))
+    assert cache.load(EDITED) is None
+    assert cache.path(EDITED) != cache.path(PROGRAM)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+def test_corrupted_entry_is_a_miss_and_removed(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    cache.store(PROGRAM, front_end(PROGRAM))
+    path = cache.path(PROGRAM)
+    with open(path, "wb") as file:
+        file.write(b"not a cache entry")
+    assert cache.load(PROGRAM) is None
+    assert not os.path.exists(path)
+    # a good magic over garbage fails to decompress the same way
+    with open(path, "wb") as file:
+        file.write(MAGIC + b"\x00garbage")
+    assert cache.load(PROGRAM) is None
+    assert not os.path.exists(path)
+    assert cache.misses == 2
+
+def test_truncated_entry_is_a_miss_and_removed(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    cache.store(PROGRAM, front_end(PROGRAM))
+    path = cache.path(PROGRAM)
+    with open(path, "rb") as file:
+        data = file.read()
+    with open(path, "wb") as file:
+        file.write(data[:len(data) // 2])
+    assert cache.load(PROGRAM) is None
+    assert not os.path.exists(path)
+    # and the next store writes it again
+    cache.store(PROGRAM, front_end(PROGRAM))
+    assert repr(cache.load(PROGRAM)) == repr(front_end(PROGRAM))
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    texts = [PROGRAM.replace("2 * 3", f"2 * {n}") for n in range(4)]
+    cache = CompileCache(str(tmp_path), limit=1 << 30)
+    now = time.time()
+    for age, text in enumerate(texts):
+        cache.store(text, front_end(text))
+        # mtimes a minute apart, oldest first, whatever the clock resolution
+        os.utime(cache.path(text), (now - 600 + age * 60, now - 600 + age * 60))
+    assert cache.load(texts[0]) is not None     # a hit makes the oldest the newest
+    sizes = [os.path.getsize(cache.path(text)) for text in texts]
+    cache.limit = sum(sizes) - sizes[1]     # room for all but one entry
+    cache.evict()
+    kept = [text for text in texts if os.path.exists(cache.path(text))]
+    assert kept == [texts[0], texts[2], texts[3]]
+    assert len(entries(tmp_path)) == 3
+
+def test_check_uses_cache(tmp_path):
+    cache = CompileCache(str(tmp_path))
+    sink = output.MemorySink()
+    previous = output.set_sink(sink)
+    try:
+        results = [ast.check("<test>", PROGRAM, True, cache=cache) for _ in range(2)]
+    finally:
+        output.set_sink(previous)
+    assert results == ["Code Gen successful!"] * 2
+    assert sink.getvalue() == "x is 6x is 6"
+    assert (cache.hits, cache.misses) == (1, 1)
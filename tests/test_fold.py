@@ -0,0 +1,49 @@
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ludus import ast
+from ludus.fold import fold
+from ludus.pipeline import Compilation
+from ludus.runtime import output, trace
+
+DEAD_IF = """play() {
+    x: 1
+    if 1 > 2 {
+        x: 2
+    }
+    shoot(x)
+}
+
+gameOver"""
+
+# the if (1), its condition 1 > 2 (4) and the assignment x: 2 (3)
+DEAD_IF_REMOVED = 8
+
+def test_fold_counts_dead_if_branch():
+    program, _ = Compilation("<test>", DEAD_IF).front_end()
+    assert fold(program) == DEAD_IF_REMOVED
+
+def test_check_reports_fold_count():
+    sink = output.MemorySink()
+    previous = output.set_sink(sink)
+    trace.clear()
+    trace.enable("optimizer")
+    try:
+        assert ast.check("<test>", DEAD_IF, True) == "Code Gen successful!"
+    finally:
+        trace.disable()
+        output.set_sink(previous)
+    assert trace.records("optimizer") == [("optimizer", f"fold removed {DEAD_IF_REMOVED} nodes from <test>")]
+    assert sink.getvalue() == "1"
+
+def test_unoptimized_check_reports_nothing():
+    previous = output.set_sink(output.MemorySink())
+    trace.clear()
+    trace.enable("optimizer")
+    try:
+        ast.check("<test>", DEAD_IF, True, optimize=False)
+    finally:
+        trace.disable()
+        output.set_sink(previous)
+    assert trace.records("optimizer") == []
@@ -0,0 +1,56 @@
+import glob, os, random, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+from ludus.incremental import Document
+from ludus.parser import parse
+from ludus.regex_lexer import RegexLexer
+
+SCRIPTS = os.path.join(ROOT, "Ludus test scripts")
+
+# pieces of Ludus an edit inserts, including ones that open or close a
+# comms literal or a comment and so change how the rest of the line lexes
+SNIPPETS = ["\n", " ", "    ", "x", "total", "hp ", "5", "3.25", "12345678901", '"', '"hi {x}"', "#", "+", "-", ":",
+            "(", ")", "{", "}", "[", "]", "shoot(x)\n", "if x > 1 {\n", "}\n", "for i: 0, i < 3, i += 1 {\n",
+            "recall ", "\t", "$", ",", "x: 1\n", "generate f(n)\n"]
+
+def full_lex(text):
+    tokens, errors = RegexLexer("<test>", text).make_tokens()
+    return [(token.lexeme, token.token, token.line, token.column) for token in tokens], list(errors)
+
+def document_lex(document):
+    tokens, errors = document.lexical()
+    return [(token.lexeme, token.token, token.line, token.column) for token in tokens], list(errors)
+
+def random_edit(rng, text):
+    offset = rng.randint(0, len(text))
+    removed = min(rng.choice((0, 0, 1, 2, 5, 20)), len(text) - offset)
+    inserted = "".join(rng.choice(SNIPPETS) for _ in range(rng.choice((0, 1, 1, 2, 3))))
+    return text[:offset] + inserted + text[offset + removed:]
+
+def starting_texts():
+    paths = sorted(glob.glob(os.path.join(SCRIPTS, "syntax + semantic", "*.lds")))
+    return [(os.path.basename(path), open(path, encoding="utf-8").read()) for path in paths[:6]]
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("name, text", starting_texts(), ids=[name for name, _ in starting_texts()])
+def test_edits_match_full_lex(name, text, seed):
+    # 60 edits in a row, more than MAX_SHIFTS, so compact() runs too
+    rng = random.Random(f"{name}:{seed}")
+    document = Document("<test>", text)
+    for step in range(60):
+        text = random_edit(rng, text)
+        document.update(text)
+        assert document_lex(document) == full_lex(text), f"edit {step}"
+        if step % 6 == 0 and text:
+            # the syntax tab's report, from parser checkpoints kept across edits
+            assert document.syntax_report() == parse("<test>", text, recover=True), f"edit {step}"
+
+def test_edit_to_and_from_empty():
+    document = Document("<test>", "play() {\n}\n\ngameOver")
+    document.update("")
+    assert document.syntax_report() == "No code in the module."
+    document.update("play() {\n    shoot(1)\n}\n\ngameOver")
+    assert document_lex(document) == full_lex("play() {\n    shoot(1)\n}\n\ngameOver")
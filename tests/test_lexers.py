@@ -0,0 +1,46 @@
+import glob, os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+from ludus.lexer import make_lexer
+
+# The hand-nested Lexer is the reference; the DFA and master-regex lexers
+# must give the same tokens (lexeme, kind, line, column) and the same errors.
+
+SCRIPTS = os.path.join(ROOT, "Ludus test scripts")
+
+LEXICAL_ERRORS = {
+    "identifier starting with a digit": "play() {\n    1abc: 5\n}\ngameOver",
+    "identifier with a bad character": "play() {\n    ab$c: 2\n    _x: 1\n}\ngameOver",
+    "identifier too long": "play() {\n    " + "a" * 40 + ": 5\n}\ngameOver",
+    "unterminated comms": 'play() {\n    shoot("abc)\n}\ngameOver',
+    "unterminated comms at eof": 'play() {\n    shoot("abc',
+    "hp over 10 digits": "play() {\n    x: 12345678901\n    y: -99999999999\n}\ngameOver",
+    "xp over 10 digits": "play() {\n    x: 12345678901.5\n    y: 1.12345678\n}\ngameOver",
+    "bad number delimiters": "play() {\n    x: 5a\n    y: 3..2\n    z: hp+\n}\ngameOver",
+    "stray characters": "play() {\n    x: 5 @ 3 ` ~\n}\ngameOver",
+}
+
+def lex(text, mode):
+    tokens, errors = make_lexer("<test>", text, mode).make_tokens()
+    return [(token.lexeme, token.token, token.line, token.column) for token in tokens], list(errors)
+
+def sample_scripts():
+    paths = sorted(glob.glob(os.path.join(SCRIPTS, "**", "*.lds"), recursive=True))
+    # "reserved words.lds" is saved as cp1252
+    return [(os.path.relpath(path, SCRIPTS), open(path, encoding="cp1252").read()) for path in paths]
+
+CASES = sample_scripts() + sorted(LEXICAL_ERRORS.items())
+
+@pytest.mark.parametrize("name, text", CASES, ids=[name for name, _ in CASES])
+def test_lexers_agree(name, text):
+    expected = lex(text, "nested")
+    assert lex(text, "dfa") == expected
+    assert lex(text, "regex") == expected
+
+@pytest.mark.parametrize("name", sorted(LEXICAL_ERRORS))
+def test_lexical_error_reported(name):
+    _, errors = lex(LEXICAL_ERRORS[name], "regex")
+    assert errors and all(error.startswith("Lexical Error: ") for error in errors)
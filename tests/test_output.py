@@ -0,0 +1,76 @@
+import os, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gevent
+from ludus import ast
+from ludus.runtime import output
+
+MAX_DELAY = 0.05
+
+def never(delay, fn):
+    # a timer that can't run, like one under a loop that never yields to gevent
+    pass
+
+def buffered(max_chars=4096, schedule=gevent.spawn_later):
+    # a BufferedSink and the (time, chunk) pairs it delivers
+    chunks = []
+    sink = output.BufferedSink(lambda chunk: chunks.append((time.monotonic(), chunk)), max_chars, MAX_DELAY, schedule)
+    return sink, chunks
+
+def test_single_write_delivered_within_max_delay():
+    sink, chunks = buffered()
+    written = time.monotonic()
+    sink.write("hello")
+    assert chunks == []
+    gevent.sleep(MAX_DELAY * 4)     # no further writes
+    assert [chunk for _, chunk in chunks] == ["hello"]
+    assert chunks[0][0] - written < MAX_DELAY * 2
+
+def test_refilled_buffer_keeps_its_own_deadline():
+    sink, chunks = buffered(max_chars=5)
+    sink.write("12345")             # flushed by size, its timer is still armed
+    gevent.sleep(MAX_DELAY / 2)
+    sink.write("x")
+    gevent.sleep(MAX_DELAY * 4)
+    assert [chunk for _, chunk in chunks] == ["12345", "x"]
+
+def test_tick_delivers_without_timer():
+    sink, chunks = buffered(schedule=never)
+    previous = output.set_sink(sink)
+    try:
+        sink.write("before loop")
+        start = time.monotonic()
+        while not chunks and time.monotonic() - start < 1.0:
+            output.tick()
+    finally:
+        output.set_sink(previous)
+    assert [chunk for _, chunk in chunks] == ["before loop"]
+    assert chunks[0][0] - start < MAX_DELAY * 2
+
+LONG_LOOP = """total: 0
+hp i
+
+play() {
+    shoot("started")
+    for i: 0, i < 30000, i += 1 {
+        total += i
+    }
+    shoot(" done")
+}
+
+gameOver"""
+
+def test_shoot_before_long_loop_delivered_while_it_runs():
+    for backend in ("tree", "closure", "vm"):
+        sink, chunks = buffered(schedule=never)
+        previous = output.set_sink(sink)
+        try:
+            start = time.monotonic()
+            assert ast.check("<test>", LONG_LOOP, True, backend=backend) == "Code Gen successful!"
+            finished = time.monotonic()
+        finally:
+            output.set_sink(previous)
+        assert finished - start > MAX_DELAY * 4, backend
+        assert [chunk for _, chunk in chunks] == ["started", " done"], backend
+        assert chunks[0][0] - start < finished - start - MAX_DELAY, backend
@@ -0,0 +1,124 @@
+import glob, io, os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+from ludus import cfg as grammar, ll1_table, ll1_validator, tablegen
+from ludus.lexer import make_lexer
+from ludus.parser import Parser, parse, parse_stream
+
+SCRIPTS = os.path.join(ROOT, "Ludus test scripts")
+NO_LEXICAL_ERRORS = "No lexical errors found!\n"
+
+def test_generated_modules_up_to_date(tmp_path):
+    # fails after ludus/cfg.py changes until `python -m ludus.tablegen` is run
+    tables = tablegen.build_tables(grammar.cfg)
+    assert ll1_table.CFG_HASH == ll1_validator.CFG_HASH == tablegen.grammar_hash(grammar.cfg)
+    path = tmp_path / "ll1_table.py"
+    tablegen.write_module(tables, str(path))
+    with open(tablegen.OUTPUT, encoding="utf-8") as file:
+        assert path.read_text(encoding="utf-8") == file.read()
+    with open(tablegen.VALIDATOR_OUTPUT, encoding="utf-8") as file:
+        assert tablegen.validator_source(tables) == file.read()
+
+def reference_parse(text):
+    # the original string-keyed LL(1) parser over cfg.parse_table, which the
+    # generated table and validator replaced
+    parse_table, first_set = grammar.parse_table, grammar.first_set
+    tokens, errors = make_lexer("<test>", text, "nested").make_tokens()
+    assert not errors
+    tokens = [(token.lexeme, token.token, token.line, token.column) for token in tokens]
+    tokens = [token for token in tokens if token[1] not in ("newline", "space")]
+    lines = text.split("\n")
+
+    def kind(token):
+        if token[1].startswith("id") and token[1][2:].isdecimal():
+            return "id"
+        if token[1].startswith("comms_ltr"):
+            return "comms_ltr"
+        return token[1]
+
+    def expected_after(top, stack):
+        expected = list(first_set[top]) if top in first_set else list(parse_table[top])
+        i = 1
+        while "λ" in expected:
+            expected.remove("λ")
+            if i <= len(stack):
+                next_top = stack[-i]
+                expected.extend(first_set[next_top] if next_top in parse_table else [next_top])
+                i += 1
+        return f"Expected tokens: {', '.join(sorted(set(expected)))}"
+
+    def error(token, expected):
+        lexeme, _, line, column = token
+        error_line = lines[line - 1].replace('\t', ' ' * 4)
+        column = len(error_line[:column].replace('\t', ' ' * 4))
+        return (f"Syntax Error: Unexpected token '{kind(token)}' at line {line} and column {token[3]}. {expected}.\n\n"
+                f"{error_line}\n{' ' * (column - 1)}{'^' * len(lexeme)}")
+
+    stack = ["<program>"]
+    save_top, save_stack, null_flag = None, [], False
+    index = 0
+    while stack:
+        top = stack.pop()
+        token = tokens[index]
+        if top == kind(token):
+            index += 1
+            if null_flag:
+                null_flag, save_stack = False, []
+        elif top in parse_table:
+            production = parse_table[top].get(kind(token))
+            if production is None:
+                return error(token, expected_after(top, stack))
+            if "λ" not in production:
+                stack.extend(reversed(production))
+            else:
+                if not save_stack:
+                    save_top, save_stack = top, stack.copy()
+                null_flag = True
+        elif null_flag:
+            return error(token, expected_after(save_top, save_stack))
+        else:
+            return error(token, f"Expected token: {top}")
+    return "Valid syntax." if tokens[index][1] == "EOF" else "Input not fully consumed."
+
+def lexes(text):
+    return not make_lexer("<test>", text).make_tokens()[1]
+
+def programs():
+    # the sample scripts that lex, each also with one line dropped at a few
+    # places to get syntax errors all over the grammar
+    cases = []
+    for path in sorted(glob.glob(os.path.join(SCRIPTS, "**", "*.lds"), recursive=True)):
+        text = open(path, encoding="cp1252").read()
+        if not lexes(text):
+            continue
+        name = os.path.relpath(path, SCRIPTS)
+        cases.append((name, text))
+        lines = text.split("\n")
+        for dropped in range(1, len(lines) - 1, 5):
+            mutated = "\n".join(lines[:dropped] + lines[dropped + 1:])
+            if lexes(mutated):
+                cases.append((f"{name} without line {dropped + 1}", mutated))
+    return cases
+
+PROGRAMS = programs()
+
+def test_programs_cover_valid_and_invalid():
+    results = [reference_parse(text) for _, text in PROGRAMS]
+    assert results.count("Valid syntax.") > 30
+    assert sum(result.startswith("Syntax Error") for result in results) > 100
+
+@pytest.mark.parametrize("name, text", PROGRAMS, ids=[name for name, _ in PROGRAMS])
+def test_parsers_agree_with_reference(name, text):
+    expected = reference_parse(text)
+    # generated validator
+    assert parse("<test>", text) == NO_LEXICAL_ERRORS + expected
+    # table-driven parser
+    tokens, _ = make_lexer("<test>", text).make_tokens()
+    assert Parser(tokens, text).drive() == expected
+    # table-driven parser with recovery, up to the first error
+    assert parse("<test>", text, recover=True).startswith(NO_LEXICAL_ERRORS + expected)
+    # streamed in blocks of a few lines, the parser state carried across
+    assert parse_stream("<test>", io.StringIO(text), chunk_size=64) == NO_LEXICAL_ERRORS + expected
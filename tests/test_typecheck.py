@@ -0,0 +1,87 @@
+import glob, os, re, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pytest
+from ludus import ast
+
+# check() runs typecheck.TypeChecker by default (checker="static") and the
+# executing SemanticAnalyzer dry run with checker="exec". Both have to report
+# the same error class, message and line for every error program.
+
+SUCCESS = "Semantic analyzing successful, no lexical, syntax, and semantic errors found!"
+SCRIPTS = os.path.join(ROOT, "Ludus test scripts")
+BACKENDS = ("tree", "closure", "vm")
+
+# the dry run reads loadNum as 0 and reports the division by it, the static
+# checker only reports division by constant zero
+INPUT_DIVISORS = {
+    os.path.join("LAB activity", "No. 1 - MDAS.lds"),
+    os.path.join("LAB activity", "No. 2 - MDAS.lds"),
+    os.path.join("LAB activity", "No. 3 - MDAS .lds"),
+    os.path.join("school acts", "lcm frac.lds"),
+}
+
+# (name, source, line, error class)
+ERRORS = [
+    ("undeclared variable", "play() {\n    x: 1\n    shoot(y)\n}\n\ngameOver", 3, "NameError"),
+    ("redeclared variable", "play() {\n    hp x\n    hp x\n}\n\ngameOver", 3, "NameError"),
+    ("undefined function", "play() {\n    shoot(g(1))\n}\n\ngameOver", 2, "NameError"),
+    ("array assigned to variable", "play() {\n    arr[]: [1, 2]\n    x: 1\n    x: arr\n}\n\ngameOver", 4, "NameError"),
+    ("type mismatch", "play() {\n    x: 1\n    x: \"a\"\n}\n\ngameOver", 3, "TypeError"),
+    ("declared type mismatch", "play() {\n    xp x\n    x: 5\n}\n\ngameOver", 3, "TypeError"),
+    ("comms plus hp", "play() {\n    s: \"a\"\n    n: 1\n    t: s + n\n}\n\ngameOver", 4, "TypeError"),
+    ("mixed array", "play() {\n    arr[]: [1, \"a\"]\n}\n\ngameOver", 2, "TypeError"),
+    ("array element type mismatch", "play() {\n    arr[]: [1, 2]\n    arr[0]: \"a\"\n}\n\ngameOver", 3, "TypeError"),
+    ("non-flag condition", "play() {\n    x: 1\n    if x {\n        shoot(x)\n    }\n}\n\ngameOver", 3, "TypeError"),
+    ("not an array", "play() {\n    x: 1\n    shoot(x[0])\n}\n\ngameOver", 3, "TypeError"),
+    ("wrong argument count", "generate f(n)\n\nplay() {\n    shoot(f(1, 2))\n}\n\ngenerate f(n) {\n    recall n\n}\n\ngameOver", 4, "TypeError"),
+    ("rounds on hp", "play() {\n    x: 1\n    n: rounds(x)\n}\n\ngameOver", 3, "TypeError"),
+    ("comms and flag", "play() {\n    s: \"a\"\n    t: s + true\n}\n\ngameOver", None, "TypeError"),
+    ("constant division by zero", "play() {\n    x: 1\n    y: x / 0\n}\n\ngameOver", 3, "ZeroDivisionError"),
+    ("constant modulo by zero", "play() {\n    x: 1\n    y: x % 0\n}\n\ngameOver", 3, "ZeroDivisionError"),
+    ("index out of bounds", "play() {\n    arr[]: [1, 2, 3]\n    shoot(arr[5])\n}\n\ngameOver", 3, "ArrayIndexError"),
+    ("negative index", "play() {\n    arr[]: [1, 2, 3]\n    shoot(arr[-1])\n}\n\ngameOver", 3, "ArrayIndexError"),
+    ("wrong number of indexes", "play() {\n    arr[]: [1, 2]\n    shoot(arr[0][1])\n}\n\ngameOver", 3, "ArrayIndexError"),
+    ("immo assignment", "play() {\n    immo x: 1\n    x: 2\n}\n\ngameOver", 3, "ImmoError"),
+    ("non-flag loop condition", "play() {\n    x: 1\n    while x {\n        x -= 1\n    }\n}\n\ngameOver", 3, "LoopConditionError"),
+    ("xp format on hp", "play() {\n    x: 1\n    shoot(x.2f)\n}\n\ngameOver", 3, "FormatError"),
+    ("modulo on xp", "play() {\n    x: 1.5\n    y: x % 2\n}\n\ngameOver", 3, "ModuloError"),
+    ("load in shoot", "play() {\n    shoot(load(\"a\"))\n}\n\ngameOver", 2, "UnsupportedArgumentError"),
+    ("recall array", "generate f()\n\nplay() {\n    x: f()\n}\n\ngenerate f() {\n    arr[]: [1]\n    recall arr\n}\n\ngameOver", 4, "ValueError"),
+]
+
+def parse_error(result):
+    match = re.match(r"Semantic Error found on line (\d+):", result)
+    message = result.splitlines()[-1]
+    if message.startswith("Semantic Error: "):
+        message = message[len("Semantic Error: "):]
+    return int(match.group(1)) if match else None, message.split(":")[0], message
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name, text, line, error", ERRORS, ids=[case[0] for case in ERRORS])
+def test_checkers_agree_on_error(name, text, line, error, backend):
+    static = ast.check("<test>", text)
+    analyzer = ast.check("<test>", text, backend=backend, checker="exec")
+
+    assert static.startswith("Semantic Error"), static
+    assert parse_error(static)[:2] == (line, error)
+    assert parse_error(analyzer) == parse_error(static)
+
+def sample_scripts():
+    return sorted(glob.glob(os.path.join(SCRIPTS, "**", "*.lds"), recursive=True))
+
+@pytest.mark.parametrize("path", sample_scripts(), ids=lambda path: os.path.relpath(path, SCRIPTS))
+def test_checkers_agree_on_sample_script(path):
+    with open(path, encoding="cp1252") as f:
+        text = f.read()
+
+    static = ast.check(path, text)
+    analyzer = ast.check(path, text, checker="exec")
+
+    if os.path.relpath(path, SCRIPTS) in INPUT_DIVISORS:
+        assert static == SUCCESS
+        assert parse_error(analyzer)[1] == "ZeroDivisionError"
+    else:
+        assert static == analyzer